@@ -28,6 +28,7 @@ import { BaselineAssumptionsSection } from "@/components/baseline-assumptions-se
 import { BaselineDiagnosticsSection } from "@/components/baseline-diagnostics-section";
 import { HomeOverview } from "@/components/home-overview";
 import { ComparisonTable } from "@/components/comparison-table";
+import { DiscountRateSensitivity } from "@/components/discount-rate-sensitivity";
 import { DistributionalSection } from "@/components/distributional-section";
 import { toCsvLine } from "@/lib/csv";
 import { MethodologySection } from "@/components/methodology-section";
@@ -554,9 +555,12 @@ export function DashboardShell() {
   const scoringType: ScoringType = "static";
   const viewMode: ViewMode = "75year";
 
+  // Only the selected reform is on screen, so fetch only its shards.
   useEffect(() => {
     let active = true;
-    loadDashboardData(scoringType, allocationMode, baselineScenario)
+    loadDashboardData(scoringType, allocationMode, baselineScenario, [
+      selectedReform,
+    ])
       .then((result) => {
         if (!active) return;
         setData(result);
@@ -576,7 +580,7 @@ export function DashboardShell() {
     return () => {
       active = false;
     };
-  }, [allocationMode, baselineScenario, scoringType]);
+  }, [allocationMode, baselineScenario, scoringType, selectedReform]);
 
   function handleAllocationModeChange(next: AllocationMode) {
     if (next === allocationMode) return; // no-op click: don't strand the spinner
@@ -687,6 +691,10 @@ export function DashboardShell() {
 
   function handleReformSelect(nextReform: string) {
     setActiveTab("reforms");
+    if (nextReform !== selectedReform) {
+      setLoading(true);
+      setError(null);
+    }
     if (!BALANCED_FIX_ELIGIBLE_OPTIONS.includes(nextReform)) {
       setBaselineScenario("currentLaw");
     }
@@ -1203,6 +1211,16 @@ export function DashboardShell() {
                 </div>
               </section>
 
+              {/* PV under shifted discount rates — the precomputed cube covers
+                  the scheduled-benefits baseline only. */}
+              {baselineScenario === "currentLaw" && (
+                <DiscountRateSensitivity
+                  reformId={effectiveReformId}
+                  scoringType={scoringType}
+                  allocationMode={allocationMode}
+                />
+              )}
+
               {/* Distributional impact by income decile, with year selector */}
               <DistributionalSection
                 reformId={effectiveReformId}
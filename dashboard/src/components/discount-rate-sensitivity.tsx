@@ -0,0 +1,113 @@
+"use client";
+
+import { useEffect, useState } from "react";
+
+import type { AllocationMode, ScoringType } from "@/lib/dashboard-data";
+import {
+  loadSensitivityCube,
+  sensitivitySeries,
+  type SensitivityCube,
+} from "@/lib/sensitivity-cube";
+
+const MEASURES = [
+  { id: "pv75_total_billions", label: "75-year total" },
+  { id: "pv75_oasdi_billions", label: "OASDI" },
+  { id: "pv75_medicare_hi_billions", label: "HI" },
+] as const;
+
+function formatBillions(value: number | null) {
+  if (value === null) return "n/a";
+  const rounded = Math.abs(value) >= 100 ? value.toFixed(0) : value.toFixed(1);
+  return `${value >= 0 ? "$" : "-$"}${Math.abs(Number(rounded)).toLocaleString()}B`;
+}
+
+function formatShift(shift: number) {
+  if (shift === 0) return "Trustees rates";
+  return `${shift > 0 ? "+" : "-"}${Math.abs(shift).toFixed(1)} pp`;
+}
+
+// The cube is built against the scheduled-benefits baseline only, so the
+// shell shows this section under the current-law baseline alone.
+export function DiscountRateSensitivity({
+  reformId,
+  scoringType,
+  allocationMode,
+}: {
+  reformId: string;
+  scoringType: ScoringType;
+  allocationMode: AllocationMode;
+}) {
+  const [cube, setCube] = useState<SensitivityCube | null>(null);
+  const [error, setError] = useState<string | null>(null);
+
+  useEffect(() => {
+    loadSensitivityCube().then(setCube, (e) => setError(String(e)));
+  }, []);
+
+  if (error || !cube || !cube.index.labels.reform.includes(reformId)) {
+    return null;
+  }
+
+  const fixed = {
+    reform: reformId,
+    scoring_type: scoringType,
+    allocation_mode: allocationMode,
+  };
+  const columns = MEASURES.map((measure) =>
+    sensitivitySeries(cube, "rate_shift_pct", { ...fixed, measure: measure.id }),
+  );
+  const shifts = cube.index.labels.rate_shift_pct.map(Number);
+
+  return (
+    <section className="rounded-[var(--pe-radius-feature)] border border-[var(--pe-color-border-light)] bg-white px-6 py-5">
+      <h4 className="text-lg font-semibold tracking-[-0.02em] text-[var(--pe-color-text-title)]">
+        Sensitivity to the discount rate
+      </h4>
+      <p className="mt-1 text-sm text-[var(--pe-color-text-secondary)]">
+        75-year present values with the Trustees effective trust-fund rates
+        shifted by the same amount in every year.
+      </p>
+      <div className="mt-4 overflow-x-auto">
+        <table className="min-w-full text-sm">
+          <thead className="text-[var(--pe-color-text-secondary)]">
+            <tr className="border-b border-[var(--pe-color-border-light)]">
+              <th className="px-5 py-2 text-left text-xs font-medium uppercase tracking-wide">
+                Rate shift
+              </th>
+              {MEASURES.map((measure) => (
+                <th
+                  key={measure.id}
+                  className="px-5 py-2 text-right text-xs font-medium uppercase tracking-wide"
+                >
+                  {measure.label}
+                </th>
+              ))}
+            </tr>
+          </thead>
+          <tbody>
+            {shifts.map((shift, row) => (
+              <tr
+                key={shift}
+                className={`border-b border-[var(--pe-color-border-light)] last:border-b-0 ${
+                  shift === 0 ? "bg-[var(--pe-color-primary-50)]/60 font-semibold" : ""
+                }`}
+              >
+                <td className="px-5 py-2 text-[var(--pe-color-text-primary)]">
+                  {formatShift(shift)}
+                </td>
+                {columns.map((series, column) => (
+                  <td
+                    key={MEASURES[column].id}
+                    className="px-5 py-2 text-right tabular-nums text-[var(--pe-color-text-primary)]"
+                  >
+                    {formatBillions(series[row].value)}
+                  </td>
+                ))}
+              </tr>
+            ))}
+          </tbody>
+        </table>
+      </div>
+    </section>
+  );
+}
@@ -0,0 +1,42 @@
+import { describe, expect, test } from "bun:test";
+
+import { decodeResultShard, type ResultShardEntry } from "./dashboard-data";
+
+const entry: ResultShardEntry = {
+  scoring_type: "static",
+  reform: "option1",
+  file: "results/static/option1.json",
+  rows: 2,
+  bytes: 0,
+  sha256: "",
+};
+
+describe("decodeResultShard", () => {
+  test("turns columns into rows tagged with the shard's keys", () => {
+    expect(
+      decodeResultShard(entry, {
+        year: [2026, 2027],
+        revenue_impact: [-108.8, null],
+      }),
+    ).toEqual([
+      {
+        reform_name: "option1",
+        scoring_type: "static",
+        year: 2026,
+        revenue_impact: -108.8,
+      },
+      {
+        reform_name: "option1",
+        scoring_type: "static",
+        year: 2027,
+        revenue_impact: null,
+      },
+    ]);
+  });
+
+  test("rejects columns that disagree with the index row count", () => {
+    expect(() =>
+      decodeResultShard(entry, { year: [2026], revenue_impact: [1] }),
+    ).toThrow("expected 2");
+  });
+});
@@ -100,8 +100,33 @@ export const DATA_VINTAGE = "2026-07-23";
 
 export const BALANCED_FIX_ELIGIBLE_OPTIONS = [...balancedFixEligibleOptions];
 
+// Mirrors scripts/build_dashboard_shards.py: results rows split into one
+// columnar JSON shard per dataset x scoring type x reform, listed in a small
+// index, so a view fetches and parses only the rows it shows.
+export type ShardDataset = "results" | "ss_solvent";
+export type ShardRow = Record<string, string | number | null>;
+
+export interface ResultShardEntry {
+  scoring_type: string;
+  reform: string;
+  file: string;
+  rows: number;
+  bytes: number;
+  sha256: string;
+}
+
+export interface ResultShardIndex {
+  schema: string;
+  datasets: Record<
+    ShardDataset,
+    { columns: string[]; shards: ResultShardEntry[] }
+  >;
+}
+
 let projectionCache: Promise<Map<number, EconomicProjection>> | null = null;
+let shardIndexCache: Promise<ResultShardIndex> | null = null;
 const csvCache = new Map<string, Promise<string>>();
+const shardCache = new Map<string, Promise<ShardRow[]>>();
 
 function asNumber(value: unknown): number {
   if (typeof value === "number" && Number.isFinite(value)) return value;
@@ -131,6 +156,82 @@ async function fetchCsv(path: string): Promise<string> {
   return csvCache.get(path)!;
 }
 
+async function fetchJson<T>(path: string): Promise<T> {
+  const resolvedPath =
+    path.startsWith("/") && basePath ? `${basePath}${path}` : path;
+  const response = await fetch(resolvedPath);
+  if (!response.ok) {
+    throw new Error(`Failed to fetch ${resolvedPath}: ${response.status}`);
+  }
+  return (await response.json()) as T;
+}
+
+function loadShardIndex(): Promise<ResultShardIndex> {
+  if (!shardIndexCache) {
+    shardIndexCache = fetchJson<ResultShardIndex>("/data/shards/index.json");
+    shardIndexCache.catch(() => {
+      shardIndexCache = null;
+    });
+  }
+  return shardIndexCache;
+}
+
+export function decodeResultShard(
+  entry: ResultShardEntry,
+  columns: Record<string, (number | string | null)[]>,
+): ShardRow[] {
+  const names = Object.keys(columns);
+  for (const name of names) {
+    if (columns[name].length !== entry.rows) {
+      throw new Error(
+        `${entry.file} column ${name} has ${columns[name].length} rows; ` +
+          `expected ${entry.rows}`,
+      );
+    }
+  }
+  return Array.from({ length: entry.rows }, (_, position) => {
+    const row: ShardRow = {
+      reform_name: entry.reform,
+      scoring_type: entry.scoring_type,
+    };
+    for (const name of names) {
+      row[name] = columns[name][position];
+    }
+    return row;
+  });
+}
+
+function loadShard(entry: ResultShardEntry): Promise<ShardRow[]> {
+  let rows = shardCache.get(entry.file);
+  if (!rows) {
+    rows = fetchJson<{ columns: Record<string, (number | string | null)[]> }>(
+      `/data/shards/${entry.file}`,
+    ).then((shard) => decodeResultShard(entry, shard.columns));
+    rows.catch(() => {
+      shardCache.delete(entry.file);
+    });
+    shardCache.set(entry.file, rows);
+  }
+  return rows;
+}
+
+// Rows of one dataset and scoring type, optionally limited to some reforms.
+// Each shard is fetched once per page and shared across views.
+export async function loadResultRows(
+  dataset: ShardDataset,
+  scoringType: ScoringType,
+  reforms?: Iterable<string>,
+): Promise<ShardRow[]> {
+  const index = await loadShardIndex();
+  const wanted = reforms ? new Set(reforms) : null;
+  const entries = index.datasets[dataset].shards.filter(
+    (entry) =>
+      entry.scoring_type === scoringType &&
+      (wanted === null || wanted.has(entry.reform)),
+  );
+  return (await Promise.all(entries.map(loadShard))).flat();
+}
+
 async function loadHiTaxablePayroll(): Promise<Map<number, number>> {
   const csvContent = await fetchCsv("/data/hi_taxable_payroll.csv");
   const parsed = Papa.parse<Record<string, string>>(csvContent, {
@@ -339,6 +440,7 @@ export async function loadDashboardData(
   scoringType: ScoringType,
   allocationMode: AllocationMode,
   baselineScenario: BaselineScenario = "currentLaw",
+  reforms?: readonly string[],
 ): Promise<Record<string, YearlyImpact[]>> {
   const projections = await loadEconomicProjections();
 
@@ -347,32 +449,25 @@ export async function loadDashboardData(
   // so 2026-2034 are scored against current law (spliced from results.csv) and
   // 2035-2100 against the solvent baseline.
   const SOLVENT_START_YEAR = 2035;
-  const parse = (csv: string) =>
-    Papa.parse<Record<string, string>>(csv, {
-      header: true,
-      skipEmptyLines: true,
-    }).data;
-  const sourced: { row: Record<string, string>; isSolvent: boolean }[] = [];
+  const sourced: { row: ShardRow; isSolvent: boolean }[] = [];
   if (baselineScenario === "ssSolvent") {
-    const [solventCsv, currentLawCsv] = await Promise.all([
-      fetchCsv("/data/balanced_fix_results.csv"),
-      fetchCsv("/data/results.csv"),
+    const eligible = [...balancedFixEligibleOptions].filter(
+      (reform) => !reforms || reforms.includes(reform),
+    );
+    const [solventRows, currentLawRows] = await Promise.all([
+      loadResultRows("ss_solvent", scoringType, reforms),
+      loadResultRows("results", scoringType, eligible),
     ]);
-    for (const row of parse(solventCsv)) {
-      if (row.baseline_scenario === "ss_solvent") {
-        sourced.push({ row, isSolvent: true });
-      }
+    for (const row of solventRows) {
+      sourced.push({ row, isSolvent: true });
     }
-    for (const row of parse(currentLawCsv)) {
-      if (
-        asNumber(row.year) < SOLVENT_START_YEAR &&
-        balancedFixEligibleOptions.has(row.reform_name ?? "")
-      ) {
+    for (const row of currentLawRows) {
+      if (asNumber(row.year) < SOLVENT_START_YEAR) {
         sourced.push({ row, isSolvent: false });
       }
     }
   } else {
-    for (const row of parse(await fetchCsv("/data/results.csv"))) {
+    for (const row of await loadResultRows("results", scoringType, reforms)) {
       sourced.push({ row, isSolvent: false });
     }
   }
@@ -380,9 +475,9 @@ export async function loadDashboardData(
   const result: Record<string, YearlyImpact[]> = {};
 
   for (const { row, isSolvent } of sourced) {
-    if ((row.scoring_type ?? "") !== scoringType) continue;
+    if (String(row.scoring_type ?? "") !== scoringType) continue;
 
-    const reformName = row.reform_name ?? "";
+    const reformName = String(row.reform_name ?? "");
     if (!reformName) continue;
 
     const year = asNumber(row.year);
@@ -0,0 +1,80 @@
+import { describe, expect, test } from "bun:test";
+
+import {
+  decodeSensitivityCube,
+  sensitivitySeries,
+  sensitivityValue,
+  type SensitivityCubeIndex,
+} from "./sensitivity-cube";
+
+const index: SensitivityCubeIndex = {
+  schema: "crfb_sensitivity_cube/v1",
+  data_file: "sensitivity_cube.bin",
+  dtype: "float32",
+  byte_order: "little",
+  axes: ["reform", "scoring_type", "allocation_mode", "rate_shift_pct", "measure"],
+  shape: [2, 1, 1, 2, 1],
+  labels: {
+    reform: ["option1", "option2"],
+    scoring_type: ["static"],
+    allocation_mode: ["baselineShares"],
+    rate_shift_pct: [0, 1],
+    measure: ["pv75_total_billions"],
+  },
+  sha256: "",
+};
+
+const cube = decodeSensitivityCube(
+  index,
+  new Float32Array([1, 2, 3, Number.NaN]).buffer,
+);
+
+describe("sensitivityValue", () => {
+  test("indexes the cube in C order", () => {
+    expect(
+      sensitivityValue(cube, {
+        reform: "option2",
+        scoring_type: "static",
+        allocation_mode: "baselineShares",
+        rate_shift_pct: 0,
+        measure: "pv75_total_billions",
+      }),
+    ).toBe(3);
+  });
+
+  test("returns null for combinations without rows", () => {
+    expect(
+      sensitivityValue(cube, {
+        reform: "option2",
+        scoring_type: "static",
+        allocation_mode: "baselineShares",
+        rate_shift_pct: 1,
+        measure: "pv75_total_billions",
+      }),
+    ).toBeNull();
+  });
+});
+
+describe("sensitivitySeries", () => {
+  test("walks one axis with the others fixed", () => {
+    expect(
+      sensitivitySeries(cube, "rate_shift_pct", {
+        reform: "option1",
+        scoring_type: "static",
+        allocation_mode: "baselineShares",
+        measure: "pv75_total_billions",
+      }),
+    ).toEqual([
+      { label: 0, value: 1 },
+      { label: 1, value: 2 },
+    ]);
+  });
+});
+
+describe("decodeSensitivityCube", () => {
+  test("rejects a payload that does not match the shape", () => {
+    expect(() =>
+      decodeSensitivityCube(index, new Float32Array(3).buffer),
+    ).toThrow();
+  });
+});
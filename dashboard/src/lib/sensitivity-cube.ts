@@ -0,0 +1,111 @@
+import { sitePath } from "@/lib/site-path";
+
+// Mirrors scripts/build_sensitivity_cube.py: a dense float32 cube indexed by
+// reform x scoring type x allocation mode x rate shift x measure, with the
+// axis labels in a small JSON index.
+export type SensitivityAxis =
+  | "reform"
+  | "scoring_type"
+  | "allocation_mode"
+  | "rate_shift_pct"
+  | "measure";
+
+export interface SensitivityCubeIndex {
+  schema: string;
+  data_file: string;
+  dtype: "float32";
+  byte_order: "little";
+  axes: SensitivityAxis[];
+  shape: number[];
+  labels: Record<SensitivityAxis, (string | number)[]>;
+  sha256: string;
+}
+
+export interface SensitivityCube {
+  index: SensitivityCubeIndex;
+  values: Float32Array;
+}
+
+export type SensitivitySelection = Record<SensitivityAxis, string | number>;
+
+const indexHref = sitePath("/data/sensitivity_cube.json");
+let cubeCache: Promise<SensitivityCube> | null = null;
+
+export function loadSensitivityCube(): Promise<SensitivityCube> {
+  if (!cubeCache) {
+    cubeCache = (async () => {
+      const indexResponse = await fetch(indexHref);
+      if (!indexResponse.ok) {
+        throw new Error(`Failed to fetch ${indexHref}: ${indexResponse.status}`);
+      }
+      const index = (await indexResponse.json()) as SensitivityCubeIndex;
+      const dataHref = sitePath(`/data/${index.data_file}`);
+      const dataResponse = await fetch(dataHref);
+      if (!dataResponse.ok) {
+        throw new Error(`Failed to fetch ${dataHref}: ${dataResponse.status}`);
+      }
+      return decodeSensitivityCube(index, await dataResponse.arrayBuffer());
+    })();
+    cubeCache.catch(() => {
+      cubeCache = null;
+    });
+  }
+  return cubeCache;
+}
+
+export function decodeSensitivityCube(
+  index: SensitivityCubeIndex,
+  buffer: ArrayBuffer,
+): SensitivityCube {
+  const size = index.shape.reduce((product, length) => product * length, 1);
+  if (buffer.byteLength !== size * Float32Array.BYTES_PER_ELEMENT) {
+    throw new Error(
+      `sensitivity cube has ${buffer.byteLength} bytes; expected ${size * 4}`,
+    );
+  }
+  // Float32Array reads platform byte order; every browser target is
+  // little-endian, which is what the builder writes.
+  return { index, values: new Float32Array(buffer) };
+}
+
+function axisPosition(
+  cube: SensitivityCube,
+  axis: SensitivityAxis,
+  label: string | number,
+): number {
+  const position = cube.index.labels[axis].indexOf(label);
+  if (position < 0) {
+    throw new Error(`Unknown ${axis} label in sensitivity cube: ${label}`);
+  }
+  return position;
+}
+
+// One cell of the cube; null where no rows exist for the combination
+// (e.g. behavioral scoring for static-only reforms).
+export function sensitivityValue(
+  cube: SensitivityCube,
+  selection: SensitivitySelection,
+): number | null {
+  let offset = 0;
+  cube.index.axes.forEach((axis, dimension) => {
+    offset =
+      offset * cube.index.shape[dimension] +
+      axisPosition(cube, axis, selection[axis]);
+  });
+  const value = cube.values[offset];
+  return Number.isNaN(value) ? null : value;
+}
+
+// The values along one axis with every other axis fixed, e.g. PV across the
+// rate-shift grid for a reform/scoring/allocation choice.
+export function sensitivitySeries<A extends SensitivityAxis>(
+  cube: SensitivityCube,
+  axis: A,
+  fixed: Omit<SensitivitySelection, A>,
+): { label: string | number; value: number | null }[] {
+  return cube.index.labels[axis].map((label) => {
+    const selection = { ...fixed } as SensitivitySelection;
+    selection[axis] = label;
+    return { label, value: sensitivityValue(cube, selection) };
+  });
+}
@@ -6,10 +6,12 @@ compute baseline aggregates and does not call the legacy reform scorer.
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 import json
 import os
 from pathlib import Path
+import signal
 import sys
 from typing import Any
 
@@ -35,6 +37,7 @@ for candidate in (
 from src.reform_full_h5_contract import (  # noqa: E402
     ApprovalGuardError,
     R2ConditionalApprovalStore,
+    WORKER_ENTRYPOINT,
     ReformCell,
     compute_code_bundle_sha,
     file_sha256 as contract_file_sha256,
@@ -46,7 +49,19 @@ from src.reform_full_h5_contract import (  # noqa: E402
     write_ledger,
 )
 from src.reform_full_h5_artifacts import file_sha256, load_expected_schema_manifest  # noqa: E402
-from src.reform_full_h5_worker import WORKER_ENTRYPOINT  # noqa: E402
+from src.cell_scheduler import (  # noqa: E402
+    TieredSpawner,
+    load_launch_plan,
+    order_by_plan,
+    planned_tiers,
+)
+from src.launch_monitor import (  # noqa: E402
+    ProgressStream,
+    RetryPolicy,
+    ThreadedCellExecutor,
+    run_cells,
+)
+from src.reform_full_h5_output_manifest import FULL_H5_PRECISION_POLICY_NAMES  # noqa: E402
 
 
 APP_NAME = "crfb-reform-full-h5"
@@ -272,15 +287,21 @@ def _canonical_submit_command(
     dataset_template: str,
     expected_schema_manifest: str,
     baseline_dataset_manifest: str,
+    precision_policy: str = "",
 ) -> str:
     cell_key = ",".join(cell.key() for cell in cells)
-    return (
+    command = (
         "modal_batch/reform_full_h5.py::submit_reform_full_h5 "
         f"launch_mode={launch_mode} cells={cell_key} run_prefix={run_prefix} "
         f"dataset_template={dataset_template} "
         f"expected_schema_manifest={expected_schema_manifest} "
         f"baseline_dataset_manifest={baseline_dataset_manifest}"
     )
+    # The stored dtypes change the artifact bytes, so a non-default policy is
+    # part of what the approver signs off on.
+    if precision_policy:
+        command += f" precision_policy={precision_policy}"
+    return command
 
 
 def _write_json(path: str | Path, payload: dict[str, Any]) -> None:
@@ -507,6 +528,7 @@ modal_secrets = [modal.Secret.from_name(name) for name in _modal_secret_names()]
 def _compute_reform_full_h5_payload(payload: dict[str, Any]) -> dict[str, Any]:
     sys.path.insert(0, "/app")
 
+    from src.h5_precision import PrecisionPolicy
     from src.reform_full_h5_worker import (
         object_store_config_from_env,
         run_reform_full_h5_cell,
@@ -557,6 +579,14 @@ def _compute_reform_full_h5_payload(payload: dict[str, Any]) -> dict[str, Any]:
         reservation_token=str(payload["reservation_token"]),
         submitter_runtime_fingerprint=payload["runtime_fingerprint"],
         expected_pip_freeze_sha256=payload.get("expected_pip_freeze_sha256"),
+        # Stage checkpoints live on the results volume; committing after each
+        # stage lets a retried container resume instead of starting over.
+        checkpoint_commit=results_volume.commit,
+        precision_policy=(
+            PrecisionPolicy.named(str(payload["precision_policy"]))
+            if payload.get("precision_policy")
+            else None
+        ),
     )
 
 
@@ -587,6 +617,170 @@ def compute_reform_full_h5_cell_from_json(payload_json: str) -> str:
     return json.dumps(_json_safe(result), sort_keys=True)
 
 
+class _ModalCellExecutor(ThreadedCellExecutor):
+    """``launch_monitor`` executor that spawns reserved cells on Modal.
+
+    Only a cell's first call is written to the ledger's spawned records; a
+    retry reuses the same reservation token and is recorded in the
+    submission manifest alone. Ledger writes stay on the event loop thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        spawner: TieredSpawner,
+        launches: dict[str, tuple[dict[str, Any], dict[str, Any], Any]],
+        ledger_file: Path,
+        on_spawn: Any,
+        max_in_flight: int,
+    ) -> None:
+        super().__init__(self._spawn_cell, max_in_flight)
+        self.spawner = spawner
+        self.launches = launches
+        self.ledger_file = ledger_file
+        self.on_spawn = on_spawn
+        self.call_records: dict[str, dict[str, Any]] = {}
+
+    def _spawn_cell(self, cell: str, attempt: int) -> Any:
+        _, payload, tier = self.launches[cell]
+        return self.spawner.spawn(payload, tier)
+
+    async def start(self, cell: str, attempt: int) -> Any:
+        base_record = self.launches[cell][0]
+        call = await super().start(cell, attempt)
+        if attempt == 1:
+            call_record = {**base_record, "call_id": call.object_id}
+            record_spawned_call(ledger_path=self.ledger_file, call_record=call_record)
+            self.call_records[cell] = call_record
+        else:
+            self.call_records[cell].setdefault("retry_call_ids", []).append(
+                call.object_id
+            )
+        self.on_spawn()
+        return call
+
+
+async def _monitor_panel(
+    cells: list[str],
+    executor: _ModalCellExecutor,
+    *,
+    stream: ProgressStream,
+    max_in_flight: int,
+    retry_policy: RetryPolicy,
+    fail_fast: bool,
+) -> dict[str, Any]:
+    cancel = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGINT, cancel.set)
+    except (NotImplementedError, RuntimeError):  # pragma: no cover - non-main thread.
+        pass
+    try:
+        return await run_cells(
+            cells,
+            executor,
+            stream=stream,
+            max_in_flight=max_in_flight,
+            retry_policy=retry_policy,
+            cancel=cancel,
+            fail_fast=fail_fast,
+        )
+    finally:
+        executor.close()
+        try:
+            loop.remove_signal_handler(signal.SIGINT)
+        except (NotImplementedError, RuntimeError):  # pragma: no cover
+            pass
+
+
+def _run_monitored_launch(
+    monitored: dict[str, tuple[dict[str, Any], dict[str, Any], Any]],
+    *,
+    spawner: TieredSpawner,
+    ledger_file: Path,
+    manifest_path: Path,
+    launch_materials: dict[str, Any],
+    progress_log: Path,
+    max_in_flight: int,
+    retry_policy: RetryPolicy,
+    fail_fast: bool,
+) -> None:
+    """Launch reserved cells ``max_in_flight`` at a time and stream progress."""
+
+    def write_manifest(status: str, **extra: Any) -> None:
+        _write_json(
+            manifest_path,
+            {
+                **launch_materials,
+                "status": status,
+                "submitted_at": datetime.now().isoformat(),
+                "progress_log": str(progress_log),
+                "calls": list(executor.call_records.values()),
+                **extra,
+            },
+        )
+
+    executor = _ModalCellExecutor(
+        spawner=spawner,
+        launches=monitored,
+        ledger_file=ledger_file,
+        on_spawn=lambda: write_manifest("running"),
+        max_in_flight=max_in_flight,
+    )
+    write_manifest("spawning")
+    print(
+        f"Launching {len(monitored)} full-H5 reform cells, at most "
+        f"{max_in_flight} at once. Progress log: {progress_log}"
+    )
+    outcomes = asyncio.run(
+        _monitor_panel(
+            list(monitored),
+            executor,
+            stream=ProgressStream(progress_log, total=len(monitored)),
+            max_in_flight=max_in_flight,
+            retry_policy=retry_policy,
+            fail_fast=fail_fast,
+        )
+    )
+    submitted_calls = list(executor.call_records.values())
+    # A cancelled panel leaves cells unspawned; launched_call_ids is only
+    # recorded once every reserved cell has a call.
+    if len(submitted_calls) == len(monitored):
+        record_launched_call_ids(
+            ledger_path=ledger_file,
+            call_ids=[str(record["call_id"]) for record in submitted_calls],
+        )
+    completed_calls = []
+    failed_calls = []
+    for cell, outcome in outcomes.items():
+        call_record = executor.call_records.get(cell, monitored[cell][0])
+        if outcome.state == "validated":
+            completed_calls.append(
+                {**call_record, "result": _json_safe(outcome.result)}
+            )
+        else:
+            failed_calls.append(
+                {
+                    **call_record,
+                    "state": outcome.state,
+                    "attempts": outcome.attempts,
+                    "error": outcome.error,
+                }
+            )
+    write_manifest(
+        "failed" if failed_calls else "completed",
+        completed_calls=completed_calls,
+        failed_calls=failed_calls,
+    )
+    if failed_calls:
+        raise RuntimeError(
+            f"{len(failed_calls)} of {len(monitored)} full-H5 reform cells did not "
+            f"validate. Submission manifest: {manifest_path}"
+        )
+    print(f"Completed {len(completed_calls)} full-H5 reform cells.")
+    print(f"Submission manifest: {manifest_path}")
+
+
 @app.local_entrypoint()
 def submit_reform_full_h5(
     reforms: str = "option10",
@@ -602,6 +796,12 @@ def submit_reform_full_h5(
     submission_manifest: str = "",
     submit_command: str = "",
     wait_for_completion: bool = True,
+    launch_plan: str = "",
+    max_in_flight: int = 0,
+    max_attempts: int = 1,
+    fail_fast: bool = False,
+    progress_log: str = "",
+    precision_policy: str = "",
     dry_run: bool = False,
 ) -> None:
     if _MODAL_IMPORT_FAILED:
@@ -631,6 +831,16 @@ def submit_reform_full_h5(
             "until spawned calls finish; --no-wait-for-completion terminates the "
             "ephemeral app before detached production artifacts are durable."
         )
+    if precision_policy and precision_policy not in FULL_H5_PRECISION_POLICY_NAMES:
+        raise ValueError(
+            f"Unknown precision_policy {precision_policy!r}; expected one of "
+            + ", ".join(FULL_H5_PRECISION_POLICY_NAMES)
+        )
+    if max_in_flight > 0 and not wait_for_completion:
+        raise ApprovalGuardError(
+            "--max-in-flight launches queued cells as earlier ones finish, so it "
+            "requires the local entrypoint to wait for completion."
+        )
     ledger = load_ledger(ledger_file)
     dataset_template = dataset_template or os.environ.get(
         "CRFB_REFORM_FULL_H5_DATASET_TEMPLATE",
@@ -652,6 +862,7 @@ def submit_reform_full_h5(
         dataset_template=dataset_template,
         expected_schema_manifest=expected_schema_manifest,
         baseline_dataset_manifest=baseline_dataset_manifest,
+        precision_policy=precision_policy,
     )
     if submit_command and submit_command != canonical_command:
         raise ApprovalGuardError(
@@ -724,6 +935,11 @@ def submit_reform_full_h5(
             )
     durable_storage_target = str(ledger.get("approved_durable_storage_target") or "")
     approval_nonce = str(ledger.get("approval_nonce") or "")
+    # A launch plan (scripts/plan_full_h5_launch.py) only changes container
+    # resources and submission order, never what a cell computes.
+    plan = load_launch_plan(_resolve_repo_path(launch_plan)) if launch_plan else None
+    tiers = planned_tiers(plan) if plan is not None else {}
+    spawner = TieredSpawner(compute_reform_full_h5_cell_remote)
 
     manifest_path = (
         Path(submission_manifest)
@@ -755,6 +971,13 @@ def submit_reform_full_h5(
         "dataset_template": dataset_template,
         "run_prefix": run_prefix,
         "wait_for_completion": wait_for_completion,
+        "launch_plan": launch_plan or None,
+        "launch_plan_predicted_cost_usd": (
+            plan["predicted_cost_usd"] if plan is not None else None
+        ),
+        "max_in_flight": max_in_flight or None,
+        "max_attempts": max_attempts,
+        "precision_policy": precision_policy or None,
         "cells": [cell.to_ledger() for cell in requested_cells],
     }
     if dry_run:
@@ -784,11 +1007,18 @@ def submit_reform_full_h5(
         approval_nonce=approval_nonce,
         consumed_by="modal_batch/reform_full_h5.py::submit_reform_full_h5",
         store=store,
+        # One conditional write for the whole panel instead of one per cell.
+        batch=True,
     )
     ledger_snapshot = load_ledger(ledger_file)
+    if plan is not None:
+        reservations = order_by_plan(
+            reservations, plan, key=lambda reservation: reservation.cell.key()
+        )
 
     submitted_calls: list[dict[str, Any]] = []
     remote_calls: list[tuple[dict[str, Any], Any]] = []
+    monitored: dict[str, tuple[dict[str, Any], dict[str, Any], Any]] = {}
     _write_json(
         manifest_path,
         {
@@ -802,6 +1032,7 @@ def submit_reform_full_h5(
         raise ApprovalGuardError("Sentinel launch must have exactly one reservation.")
     for reservation in reservations:
         dataset_path = dataset_template.format(year=reservation.cell.year)
+        tier = tiers.get(reservation.cell.key())
         payload = {
             "year": reservation.cell.year,
             "reform_id": reservation.cell.reform,
@@ -824,6 +1055,7 @@ def submit_reform_full_h5(
             "expected_pip_freeze_sha256": ledger_snapshot.get(
                 "approved_pip_freeze_sha256"
             ),
+            "precision_policy": precision_policy,
         }
         if launch_mode == "sentinel":
             call_record = {
@@ -833,6 +1065,7 @@ def submit_reform_full_h5(
                 "call_id": f"remote-direct:{run_prefix}:{reservation.cell.key()}",
                 "dashboard_url": None,
                 "execution_mode": "remote",
+                "resource_tier": tier.to_dict() if tier is not None else None,
             }
             record_spawned_call(
                 ledger_path=ledger_file,
@@ -858,7 +1091,10 @@ def submit_reform_full_h5(
                 f"Running {reservation.cell.key()} via synchronous Modal remote call."
             )
             try:
-                result = compute_reform_full_h5_cell_remote.remote(payload)
+                if tier is None:
+                    result = compute_reform_full_h5_cell_remote.remote(payload)
+                else:
+                    result = spawner.function_for(tier).remote(payload)
             except Exception as error:
                 failed_call = {
                     **call_record,
@@ -892,13 +1128,29 @@ def submit_reform_full_h5(
             print("Completed 1 full-H5 reform cell.")
             print(f"Submission manifest: {manifest_path}")
             return
-        call = compute_reform_full_h5_cell_remote.spawn(payload)
+        if max_in_flight > 0:
+            monitored[reservation.cell.key()] = (
+                {
+                    **reservation.cell.to_ledger(),
+                    "dataset_path": dataset_path,
+                    "reservation_token_hash": reservation.token_hash,
+                    "resource_tier": tier.to_dict() if tier is not None else None,
+                },
+                payload,
+                tier,
+            )
+            continue
+        if tier is None:
+            call = compute_reform_full_h5_cell_remote.spawn(payload)
+        else:
+            call = spawner.spawn(payload, tier)
         call_record = {
             **reservation.cell.to_ledger(),
             "dataset_path": dataset_path,
             "reservation_token_hash": reservation.token_hash,
             "call_id": call.object_id,
             "dashboard_url": None,
+            "resource_tier": tier.to_dict() if tier is not None else None,
         }
         record_spawned_call(
             ledger_path=ledger_file,
@@ -923,6 +1175,22 @@ def submit_reform_full_h5(
         suffix = f" -> {dashboard_url}" if dashboard_url else ""
         print(f"Submitted {reservation.cell.key()}: {call.object_id}{suffix}")
 
+    if monitored:
+        _run_monitored_launch(
+            monitored,
+            spawner=spawner,
+            ledger_file=ledger_file,
+            manifest_path=manifest_path,
+            launch_materials=launch_materials,
+            progress_log=Path(progress_log)
+            if progress_log
+            else manifest_path.with_suffix(".progress.jsonl"),
+            max_in_flight=max_in_flight,
+            retry_policy=RetryPolicy(max_attempts=max(1, max_attempts)),
+            fail_fast=fail_fast,
+        )
+        return
+
     record_launched_call_ids(
         ledger_path=ledger_file,
         call_ids=[str(record["call_id"]) for record in submitted_calls],
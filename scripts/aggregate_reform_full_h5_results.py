@@ -4,13 +4,18 @@ import argparse
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import json
-import os
 from pathlib import Path
 from typing import Any
 
 import microdf as mdf
 import pandas as pd
 
+from src.object_store import (
+    DEFAULT_ARTIFACT_WORKERS,
+    ArtifactCache,
+    ArtifactRequest,
+    r2_client_from_env,
+)
 from src.year_runner import (
     BaselineResult,
     MODAL_EMPLOYER_NET_REFORMS,
@@ -25,6 +30,7 @@ DEFAULT_LIVE_STATUS = REPO / "dashboard" / "public" / "data" / "live_reform_stat
 DEFAULT_EXISTING_RESULTS = REPO / "results.csv"
 DEFAULT_BASELINE_DIR = REPO / "projected_datasets_v2pop"
 DEFAULT_CACHE_DIR = REPO / "tmp" / "reform_full_h5_r2_cache_v2pop"
+DEFAULT_CACHE_MAX_GB = 200.0
 DEFAULT_OUTPUT = REPO / "results" / "modal_runs_production" / "static_cells.csv"
 DEFAULT_SUMMARY = (
     REPO / "results" / "modal_runs_production" / "static_cells_summary.json"
@@ -56,44 +62,7 @@ def _parse_bool(value: Any) -> bool:
 
 
 def _r2_client_from_env() -> Any:
-    endpoint_url = os.environ.get("CRFB_R2_ENDPOINT_URL")
-    account_id = os.environ.get("CRFB_R2_ACCOUNT_ID")
-    if not endpoint_url and account_id:
-        endpoint_url = f"https://{account_id}.r2.cloudflarestorage.com"
-    access_key_id = os.environ.get("CRFB_R2_ACCESS_KEY_ID") or os.environ.get(
-        "AWS_ACCESS_KEY_ID"
-    )
-    secret_access_key = os.environ.get("CRFB_R2_SECRET_ACCESS_KEY") or os.environ.get(
-        "AWS_SECRET_ACCESS_KEY"
-    )
-    missing = [
-        name
-        for name, value in {
-            "CRFB_R2_ENDPOINT_URL or CRFB_R2_ACCOUNT_ID": endpoint_url,
-            "CRFB_R2_ACCESS_KEY_ID": access_key_id,
-            "CRFB_R2_SECRET_ACCESS_KEY": secret_access_key,
-        }.items()
-        if not value
-    ]
-    if missing:
-        raise RuntimeError("Missing R2 credentials: " + ", ".join(missing))
-
-    import boto3
-
-    from botocore.config import Config
-
-    return boto3.client(
-        "s3",
-        endpoint_url=endpoint_url,
-        region_name=os.environ.get("AWS_DEFAULT_REGION") or "auto",
-        aws_access_key_id=access_key_id,
-        aws_secret_access_key=secret_access_key,
-        config=Config(
-            retries={"max_attempts": 10, "mode": "adaptive"},
-            connect_timeout=30,
-            read_timeout=300,
-        ),
-    )
+    return r2_client_from_env()
 
 
 def _parse_r2_uri(uri: str) -> R2Object:
@@ -104,30 +73,14 @@ def _parse_r2_uri(uri: str) -> R2Object:
     return R2Object(bucket=bucket, key=key)
 
 
-def _cache_path_for_r2_object(cache_dir: Path, obj: R2Object) -> Path:
-    return cache_dir / obj.bucket / obj.key
-
-
-def _download_r2_object(
-    *,
-    client: Any,
-    obj: R2Object,
-    cache_dir: Path,
-    expected_sha256: str | None,
-) -> Path:
-    from src.reform_full_h5_artifacts import file_sha256
-
-    path = _cache_path_for_r2_object(cache_dir, obj)
-    if path.exists():
-        if expected_sha256 is None or file_sha256(path) == expected_sha256:
-            return path
-        path.unlink()
-    path.parent.mkdir(parents=True, exist_ok=True)
-    client.download_file(obj.bucket, obj.key, str(path))
-    if expected_sha256 is not None and file_sha256(path) != expected_sha256:
-        path.unlink(missing_ok=True)
-        raise RuntimeError(f"Downloaded SHA mismatch for {obj.key}")
-    return path
+def _fetch_scenarios(
+    cache: ArtifactCache,
+    pending: list[tuple[dict[str, Any], BaselineResult, R2Object, str | None]],
+) -> list[Path]:
+    return cache.fetch_many(
+        ArtifactRequest(bucket=obj.bucket, key=obj.key, expected_sha256=sha)
+        for _, _, obj, sha in pending
+    )
 
 
 def _aggregate_full_output_h5(path: Path) -> ScenarioAggregate:
@@ -211,6 +164,8 @@ def aggregate_live_full_h5_results(
     summary_path: Path,
     compute_missing_baselines: bool,
     limit: int | None,
+    cache_max_bytes: int | None = None,
+    download_workers: int = DEFAULT_ARTIFACT_WORKERS,
 ) -> dict[str, Any]:
     status = pd.read_csv(live_status_path)
     completed = status.loc[
@@ -221,11 +176,16 @@ def aggregate_live_full_h5_results(
     if limit is not None:
         completed = completed.head(limit)
 
-    client = _r2_client_from_env()
+    cache = ArtifactCache(
+        _r2_client_from_env(),
+        cache_dir,
+        max_bytes=cache_max_bytes,
+        max_workers=download_workers,
+    )
     baselines = _baseline_from_existing_results(existing_results_path)
-    initial_baseline_years = set(baselines)
     rows: list[dict[str, Any]] = []
     skipped: list[dict[str, Any]] = []
+    pending: list[tuple[dict[str, Any], BaselineResult, R2Object, str | None]] = []
 
     for record in completed.to_dict(orient="records"):
         year = int(record["year"])
@@ -245,37 +205,40 @@ def aggregate_live_full_h5_results(
                 }
             )
             continue
-
         scenario_obj = _parse_r2_uri(str(record["scenario_h5_uri"]))
         expected_sha = str(record.get("output_h5_sha256") or "") or None
-        scenario_path = _download_r2_object(
-            client=client,
-            obj=scenario_obj,
-            cache_dir=cache_dir,
-            expected_sha256=expected_sha,
-        )
-        reform_totals = _aggregate_full_output_h5(scenario_path)
-        row = build_reform_result_from_aggregates(
-            reform_id=reform_id,
-            year=year,
-            baseline=baseline,
-            reform_totals=reform_totals,
-            employer_net_reforms=MODAL_EMPLOYER_NET_REFORMS,
-            default_net_impact_mode="direct",
-            scoring_type=str(record.get("scoring_type") or "static"),
-        )
-        row.update(
-            {
-                "source": "reform_full_h5_r2",
-                "scenario_h5_uri": record["scenario_h5_uri"],
-                "metadata_uri": record.get("metadata_uri", ""),
-                "complete_uri": record.get("complete_uri", ""),
-                "output_h5_sha256": record.get("output_h5_sha256", ""),
-                "run_prefix": record.get("run_prefix", ""),
-                "baseline_source": BASELINE_SOURCE,
-            }
-        )
-        rows.append(row)
+        pending.append((record, baseline, scenario_obj, expected_sha))
+
+    # Fetch in windows of ``download_workers`` concurrent downloads, then
+    # aggregate the window, so the cache budget only has to hold one window of
+    # scenarios that are in use.
+    for start in range(0, len(pending), download_workers):
+        window = pending[start : start + download_workers]
+        for (record, baseline, _, _), scenario_path in zip(
+            window, _fetch_scenarios(cache, window)
+        ):
+            reform_totals = _aggregate_full_output_h5(scenario_path)
+            row = build_reform_result_from_aggregates(
+                reform_id=str(record["reform_name"]),
+                year=int(record["year"]),
+                baseline=baseline,
+                reform_totals=reform_totals,
+                employer_net_reforms=MODAL_EMPLOYER_NET_REFORMS,
+                default_net_impact_mode="direct",
+                scoring_type=str(record.get("scoring_type") or "static"),
+            )
+            row.update(
+                {
+                    "source": "reform_full_h5_r2",
+                    "scenario_h5_uri": record["scenario_h5_uri"],
+                    "metadata_uri": record.get("metadata_uri", ""),
+                    "complete_uri": record.get("complete_uri", ""),
+                    "output_h5_sha256": record.get("output_h5_sha256", ""),
+                    "run_prefix": record.get("run_prefix", ""),
+                    "baseline_source": BASELINE_SOURCE,
+                }
+            )
+            rows.append(row)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     frame = pd.DataFrame(rows)
@@ -293,6 +256,7 @@ def aggregate_live_full_h5_results(
         "output_path": _display_path(output_path),
         "manual_weight_aggregation_used": False,
         "aggregation_method": "microdf.MicroDataFrame weighted .sum() operations",
+        "artifact_cache": dict(cache.stats),
     }
     summary_path.parent.mkdir(parents=True, exist_ok=True)
     summary_path.write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
@@ -309,6 +273,15 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--baseline-dir", type=Path, default=DEFAULT_BASELINE_DIR)
     parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR)
+    parser.add_argument(
+        "--cache-max-gb",
+        type=float,
+        default=DEFAULT_CACHE_MAX_GB,
+        help="Evict least recently used scenario H5s beyond this size; 0 disables.",
+    )
+    parser.add_argument(
+        "--download-workers", type=int, default=DEFAULT_ARTIFACT_WORKERS
+    )
     parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
     parser.add_argument("--summary", type=Path, default=DEFAULT_SUMMARY)
     parser.add_argument("--compute-missing-baselines", action="store_true")
@@ -327,6 +300,10 @@ def main() -> int:
         summary_path=args.summary,
         compute_missing_baselines=args.compute_missing_baselines,
         limit=args.limit,
+        cache_max_bytes=(
+            int(args.cache_max_gb * 1024**3) if args.cache_max_gb > 0 else None
+        ),
+        download_workers=args.download_workers,
     )
     print(
         "Aggregated "
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+import pandas as pd
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+
+from src.vintage_attribution import (  # noqa: E402
+    DEFAULT_VARIABLES,
+    DIMENSIONS,
+    attribute_vintages,
+    segment_table,
+    top_unit_table,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Attribute a cell's change between two full-output H5 vintages to "
+            "variables, household segments and individual units."
+        )
+    )
+    parser.add_argument("--from-h5", required=True, type=Path)
+    parser.add_argument("--to-h5", required=True, type=Path)
+    parser.add_argument(
+        "--variables",
+        default=",".join(DEFAULT_VARIABLES),
+        help="Comma-separated output variables to attribute.",
+    )
+    parser.add_argument(
+        "--dimensions",
+        default=",".join(DIMENSIONS),
+        help="Comma-separated segment dimensions.",
+    )
+    parser.add_argument(
+        "--top-units",
+        type=int,
+        default=20,
+        help="Largest per-unit contributions to list for each variable.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=REPO / "tmp" / "vintage_attribution.csv",
+        help="Segment CSV; the unit CSV and summary JSON are written beside it.",
+    )
+    return parser.parse_args()
+
+
+def print_summary(summary: dict, segments: pd.DataFrame) -> None:
+    for record in summary["variables"]:
+        print(
+            f"{record['variable']}: {record['delta'] / 1e9:+.3f}B "
+            f"(value {record['value_change'] / 1e9:+.3f}B, "
+            f"weight {record['weight_change'] / 1e9:+.3f}B, "
+            f"entered {record['entered'] / 1e9:+.3f}B, "
+            f"exited {record['exited'] / 1e9:+.3f}B)"
+        )
+        rows = segments[segments["variable"] == record["variable"]]
+        for dimension, group in rows.groupby("dimension", sort=False):
+            largest = group.reindex(
+                group["total"].abs().sort_values(ascending=False).index
+            ).head(3)
+            parts = ", ".join(
+                f"{row.segment} {row.total / 1e9:+.3f}B" for row in largest.itertuples()
+            )
+            print(f"  {dimension}: {parts}")
+    for item in summary["skipped_variables"]:
+        print(f"skipped {item['variable']}: {item['reason']}")
+
+
+def main() -> None:
+    args = parse_args()
+    variables = [name.strip() for name in args.variables.split(",") if name.strip()]
+    dimensions = [name.strip() for name in args.dimensions.split(",") if name.strip()]
+    attributions, summary = attribute_vintages(
+        args.from_h5,
+        args.to_h5,
+        variables=variables,
+        dimensions=dimensions,
+        top_units=args.top_units,
+    )
+    segments = segment_table(attributions)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    segments.to_csv(args.output, index=False)
+    units_path = args.output.with_name(f"{args.output.stem}_units.csv")
+    top_unit_table(attributions).to_csv(units_path, index=False)
+    summary_path = args.output.with_suffix(".summary.json")
+    summary_path.write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+    print(f"Wrote {args.output}, {units_path} and {summary_path}")
+
+    print_summary(summary, segments)
+
+
+if __name__ == "__main__":
+    main()
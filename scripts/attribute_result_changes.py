@@ -2,9 +2,14 @@ from __future__ import annotations
 
 import argparse
 from pathlib import Path
+import sys
 
 import pandas as pd
 
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+
+from src.results_store import load_results as load_typed_results  # noqa: E402
 
 KEY_COLUMNS = ["reform_name", "year"]
 VALUE_COLUMNS = [
@@ -35,7 +40,7 @@ def parse_args() -> argparse.Namespace:
 
 
 def load_results(path: Path) -> pd.DataFrame:
-    df = pd.read_csv(path)
+    df = load_typed_results(path)
     missing = [
         column for column in [*KEY_COLUMNS, *VALUE_COLUMNS] if column not in df.columns
     ]
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 from pathlib import Path
+import sys
 
 import pandas as pd
 
-
 REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+
+from src.results_store import load_results  # noqa: E402
+
 DASHBOARD_DATA = REPO / "dashboard" / "public" / "data"
 STATIC = REPO / "results.csv"
 OASDI_PAYROLL = DASHBOARD_DATA / "ssa_economic_projections.csv"
@@ -50,9 +54,9 @@ def markdown_table(headers: list[str], rows: list[list[str]]) -> str:
 
 
 def load_inputs() -> pd.DataFrame:
-    static = pd.read_csv(STATIC)
-    static = static[static["scoring_type"].eq("static")].copy()
-    static = static[static["reform_name"].isin(PUBLICATION_REFORMS)].copy()
+    static = load_results(
+        STATIC, scoring_types=("static",), reforms=PUBLICATION_REFORMS
+    )
     oasdi = pd.read_csv(OASDI_PAYROLL)[["year", "taxable_payroll", "gdp"]]
     hi = pd.read_csv(HI_PAYROLL)[["year", "hi_taxable_payroll"]]
 
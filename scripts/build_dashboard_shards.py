@@ -0,0 +1,192 @@
+"""Split the dashboard results into per-reform, per-scoring-type JSON shards.
+
+The dashboard used to fetch and parse all of ``results.csv`` (and, for the
+solvency view, ``balanced_fix_results.csv``) on every page load, although a
+view only ever shows one scoring type. This writes the same rows as small
+columnar JSON files the loader in ``dashboard/src/lib/dashboard-data.ts``
+fetches on demand:
+
+- ``dashboard/public/data/shards/<dataset>/<scoring_type>/<reform>.json`` --
+  ``{"columns": {name: [values...]}}`` holding only the columns the loader
+  reads, in year order; blank CSV cells are ``null``;
+- ``dashboard/public/data/shards/index.json`` -- the shard list per dataset
+  with row counts, byte sizes and SHA256s, plus the input CSV hashes.
+
+Datasets are ``results`` (the published panel) and ``ss_solvent`` (the
+solvent-baseline rows of the balanced-fix panel). ``publish_dashboard_results``
+rebuilds the shards after writing ``results.csv``; rerun this script after
+republishing the balanced-fix panel. tests/test_dashboard_shards.py fails if
+the committed shards go stale.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import shutil
+import sys
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+
+from src.results_store import read_results_csv  # noqa: E402
+
+DATA = REPO / "dashboard" / "public" / "data"
+RESULTS_CSV = DATA / "results.csv"
+BALANCED_FIX_CSV = DATA / "balanced_fix_results.csv"
+OUTPUT_DIR = DATA / "shards"
+INDEX_NAME = "index.json"
+INDEX_SCHEMA = "crfb_dashboard_shards/v1"
+SHARD_SCHEMA = "crfb_dashboard_shard/v1"
+
+# The columns dashboard-data.ts reads from each dataset.
+RESULT_COLUMNS = (
+    "year",
+    "revenue_impact",
+    "baseline_revenue",
+    "reform_revenue",
+    "baseline_tob_oasdi",
+    "baseline_tob_medicare_hi",
+    "tob_oasdi_impact",
+    "tob_medicare_hi_impact",
+    "oasdi_net_impact",
+    "hi_net_impact",
+)
+SOLVENT_COLUMNS = (
+    *RESULT_COLUMNS,
+    "solvent_oasdi_impact",
+    "solvent_medicare_hi_impact",
+    "solvent_general_fund_impact",
+)
+
+
+def _sha256(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _display_path(path: Path) -> str:
+    try:
+        return path.resolve().relative_to(REPO).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def _source_frames(
+    results_path: Path, balanced_fix_path: Path
+) -> dict[str, tuple[Path, pd.DataFrame, tuple[str, ...]]]:
+    balanced = read_results_csv(balanced_fix_path)
+    return {
+        "results": (results_path, read_results_csv(results_path), RESULT_COLUMNS),
+        "ss_solvent": (
+            balanced_fix_path,
+            balanced[balanced["baseline_scenario"].astype(str).eq("ss_solvent")],
+            SOLVENT_COLUMNS,
+        ),
+    }
+
+
+def _shard_payload(group: pd.DataFrame, columns: tuple[str, ...]) -> bytes:
+    ordered = group.sort_values("year", kind="stable")
+    values = {
+        column: [
+            None if pd.isna(value) else value
+            for value in ordered[column].astype("object").tolist()
+        ]
+        for column in columns
+    }
+    shard = {"schema": SHARD_SCHEMA, "columns": values}
+    return (json.dumps(shard, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def build(
+    results_path: Path = RESULTS_CSV,
+    balanced_fix_path: Path = BALANCED_FIX_CSV,
+) -> tuple[dict[str, Any], dict[str, bytes]]:
+    """The shard index and ``{relative path: payload}`` for every shard."""
+    payloads: dict[str, bytes] = {}
+    datasets: dict[str, Any] = {}
+    inputs: dict[str, str] = {}
+    for dataset, (path, frame, columns) in _source_frames(
+        results_path, balanced_fix_path
+    ).items():
+        inputs[_display_path(path)] = _sha256(path.read_bytes())
+        shards = []
+        for (scoring_type, reform), group in frame.groupby(
+            ["scoring_type", "reform_name"], sort=True
+        ):
+            relative = f"{dataset}/{scoring_type}/{reform}.json"
+            payload = _shard_payload(group, columns)
+            payloads[relative] = payload
+            shards.append(
+                {
+                    "scoring_type": str(scoring_type),
+                    "reform": str(reform),
+                    "file": relative,
+                    "rows": len(group),
+                    "bytes": len(payload),
+                    "sha256": _sha256(payload),
+                }
+            )
+        datasets[dataset] = {"columns": list(columns), "shards": shards}
+    index = {"schema": INDEX_SCHEMA, "datasets": datasets, "inputs": inputs}
+    return index, payloads
+
+
+def write(
+    index: dict[str, Any], payloads: dict[str, bytes], output_dir: Path = OUTPUT_DIR
+) -> None:
+    """Replace ``output_dir`` with this shard set, so removed shards go too."""
+    staging = output_dir.with_name(f".{output_dir.name}.tmp")
+    shutil.rmtree(staging, ignore_errors=True)
+    for relative, payload in payloads.items():
+        path = staging / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(payload)
+    (staging / INDEX_NAME).write_text(
+        json.dumps(index, indent=2) + "\n", encoding="utf-8"
+    )
+    shutil.rmtree(output_dir, ignore_errors=True)
+    staging.replace(output_dir)
+
+
+def load(
+    output_dir: Path = OUTPUT_DIR,
+) -> tuple[dict[str, Any], dict[str, pd.DataFrame]]:
+    """The committed index and each shard as a frame, keyed by file."""
+    index = json.loads((output_dir / INDEX_NAME).read_text(encoding="utf-8"))
+    frames: dict[str, pd.DataFrame] = {}
+    for dataset in index["datasets"].values():
+        for shard in dataset["shards"]:
+            payload = (output_dir / shard["file"]).read_bytes()
+            if _sha256(payload) != shard["sha256"]:
+                raise ValueError(f"{shard['file']} does not match its index sha256")
+            frames[shard["file"]] = pd.DataFrame(json.loads(payload)["columns"])
+    return index, frames
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--results", type=Path, default=RESULTS_CSV)
+    parser.add_argument("--balanced-fix", type=Path, default=BALANCED_FIX_CSV)
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    index, payloads = build(args.results, args.balanced_fix)
+    write(index, payloads, args.output_dir)
+    total = sum(len(payload) for payload in payloads.values())
+    print(
+        f"wrote {len(payloads)} shards ({total} bytes) + {INDEX_NAME} to {args.output_dir}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
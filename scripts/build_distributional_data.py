@@ -11,7 +11,8 @@ each baseline income decile.
 
 All weighting goes through MicroSeries/MicroDataFrame. The script never fetches
 PolicyEngine weight variables directly; weights are carried from the exported
-baseline into the joined distributional table.
+baseline onto each reform's households (src/distributional.py). Years run in
+parallel worker processes (--workers).
 
 Usage:
     uv run python scripts/build_distributional_data.py \
@@ -21,17 +22,24 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import gc
 import json
+import os
 import sys
 from pathlib import Path
 
-import microdf as mdf
-import pandas as pd
-
 REPO = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(REPO))
 
+from src.distributional import (  # noqa: E402
+    BaselineDeciles,
+    YearJob,
+    decile_impacts,
+    load_baseline_export,
+    run_years,
+)
+
+__all__ = ["decile_impacts"]
+
 ANCHOR_YEARS = [2026, 2028, 2029, 2030] + list(range(2035, 2101, 5))
 
 # Reforms scored on the certified-reproduction environment pair with
@@ -116,7 +124,7 @@ def scenario_path(year: int, reform: str) -> Path:
     )
 
 
-def certrepro_baseline_households(year: int) -> pd.DataFrame:
+def certrepro_baseline_households(year: int) -> BaselineDeciles:
     """Per-household baseline from the certified-env exports — the one
     baseline every reform pairs with (audit H-03: reform legs and baseline
     must come from the same runtime for per-household diffs to mean
@@ -130,65 +138,7 @@ def certrepro_baseline_households(year: int) -> pd.DataFrame:
         raise FileNotFoundError(
             f"{path} — run crfb-cert/tmp/export_baseline_households.py {year}"
         )
-    raw = pd.read_csv(path)
-    frame = mdf.MicroDataFrame(
-        {
-            "household_id": raw["household_id"].reset_index(drop=True),
-            "baseline_net_income": raw["baseline_net_income"].reset_index(drop=True),
-        },
-        weights=raw["weight"].reset_index(drop=True),
-    )
-    frame["decile"] = frame["baseline_net_income"].decile_rank().astype(int)
-    return frame
-
-
-def reform_net_income(year: int, reform: str) -> pd.DataFrame:
-    path = scenario_path(year, reform)
-    if not path.exists():
-        raise FileNotFoundError(path)
-    with pd.HDFStore(path, mode="r") as store:
-        hh = store["household"]
-    return hh[["household_id", "household_net_income"]].rename(
-        columns={"household_net_income": "reform_net_income"}
-    )
-
-
-def decile_impacts(baseline: pd.DataFrame, reform: pd.DataFrame) -> list[dict]:
-    merged = baseline.merge(
-        reform, on="household_id", how="inner", validate="one_to_one"
-    )
-    merged["change"] = merged["reform_net_income"] - merged["baseline_net_income"]
-    rows: list[dict] = []
-    for decile in range(1, 11):
-        group = merged.loc[merged["decile"] == decile]
-        if group.empty:
-            rows.append(
-                {
-                    "decile": decile,
-                    "avg_change": 0.0,
-                    "pct_change": None,
-                    "total_change_billions": 0.0,
-                }
-            )
-            continue
-        total_change = float(group["change"].sum())
-        total_baseline = float(group["baseline_net_income"].sum())
-        avg_change = float(group["change"].mean())
-        rows.append(
-            {
-                "decile": decile,
-                "avg_change": round(avg_change, 2),
-                # A percentage change is only meaningful when the decile's
-                # aggregate baseline net income is positive. The bottom decile
-                # can be negative (business losses, etc.), where dividing by it
-                # flips the sign and fabricates an outlier, so suppress it.
-                "pct_change": round(100.0 * total_change / total_baseline, 3)
-                if total_baseline > 0
-                else None,
-                "total_change_billions": round(total_change / 1e9, 3),
-            }
-        )
-    return rows
+    return load_baseline_export(path)
 
 
 def main() -> int:
@@ -207,6 +157,12 @@ def main() -> int:
             "output file are preserved (per-reform merge)."
         ),
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="Years scored in parallel; each worker holds one year's baseline.",
+    )
     args = parser.parse_args()
 
     years = (
@@ -225,29 +181,27 @@ def main() -> int:
         for reform, by_year in existing.get("data", {}).items():
             data.setdefault(reform, {}).update(by_year)
 
-    for year in years:
-        baselines: dict[str, pd.DataFrame] = {}
-
-        def baseline_for(reform: str) -> pd.DataFrame:
-            # One certified-env export baseline per year for every reform.
-            if "export" not in baselines:
-                print(f"baseline {year} (certified export)…", flush=True)
-                baselines["export"] = certrepro_baseline_households(year)
-            return baselines["export"]
-
-        for reform in reforms:
-            try:
-                reform_frame = reform_net_income(year, reform)
-            except FileNotFoundError:
-                print(f"  {reform} {year}: scenario missing, skipping", file=sys.stderr)
-                continue
-            data[reform][str(year)] = decile_impacts(baseline_for(reform), reform_frame)
+    jobs = [
+        YearJob(
+            year=year,
+            load_baseline=certrepro_baseline_households,
+            scenarios={reform: scenario_path(year, reform) for reform in reforms},
+        )
+        for year in years
+    ]
+    for result in run_years(jobs, workers=args.workers):
+        for reform in result.missing:
+            print(
+                f"  {reform} {result.year}: scenario missing, skipping",
+                file=sys.stderr,
+            )
+        for reform, records in result.records.items():
+            data[reform][str(result.year)] = records
         print(
-            f"  {year}: {sum(str(year) in data[r] for r in reforms)} reforms",
+            f"  {result.year}: "
+            f"{sum(str(result.year) in data[r] for r in reforms)} reforms",
             flush=True,
         )
-        baselines.clear()
-        gc.collect()
 
     # The header must describe the merged artifact, not this invocation: a
     # per-reform merge run with a year subset previously clobbered the
@@ -3,7 +3,8 @@
 The dashboard computes present values client-side, which the paper cannot cite
 and pytest cannot regression-test. This script reproduces the dashboard's
 default view server-side — the default trust-fund split per reform and
-per-fund discounting at the Trustees effective interest rates — and writes:
+per-fund discounting at the Trustees effective interest rates, both computed
+as column operations by ``src/fiscal_summary.py`` — and writes:
 
 - ``dashboard/public/data/headline_summary.csv`` — one row per
   (baseline_scenario, reform) with the four summary-card figures plus the
@@ -25,11 +26,20 @@ from __future__ import annotations
 import csv
 import sys
 from pathlib import Path
+from typing import Iterable
+
+import pandas as pd
 
 REPO = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(REPO))
 
-from src.trust_fund_allocation import load_allocation_rules  # noqa: E402
+from src.fiscal_summary import (  # noqa: E402
+    SUMMARY_COLUMNS,
+    load_discount_factors,
+    split_panel,
+    summarize_split,
+)
+from src.results_store import load_results  # noqa: E402
 
 DATA = REPO / "dashboard" / "public" / "data"
 OUTPUT_CSV = DATA / "headline_summary.csv"
@@ -60,128 +70,73 @@ REFORM_LABELS: dict[str, str] = {
 SOLVENCY_REFORMS = ("option1", "option2", "option8", "option12")
 
 
-def _rows(path: Path) -> list[dict[str, str]]:
-    with path.open() as file:
-        return [row for row in csv.DictReader(file)]
-
-
-def discount_factors() -> tuple[dict[int, float], dict[int, float]]:
-    oasdi: dict[int, float] = {}
-    hi: dict[int, float] = {}
-    oasdi_cumulative = hi_cumulative = 1.0
-    for row in sorted(
-        _rows(DATA / "effective_interest_rates.csv"), key=lambda r: int(r["year"])
-    ):
-        year = int(row["year"])
-        oasdi_cumulative /= 1 + float(row["oasdi_effective_rate_pct"]) / 100
-        hi_cumulative /= 1 + float(row["hi_effective_rate_pct"]) / 100
-        oasdi[year] = oasdi_cumulative
-        hi[year] = hi_cumulative
-    return oasdi, hi
-
-
-def default_split(row: dict[str, str]) -> tuple[float, float, float, float]:
-    """Replicate splitRevenueImpacts at the dashboard's default mode
-    ("baselineShares"): returns (revenue, oasdi, hi, general_fund)."""
-    rules = load_allocation_rules()
-    reform = row["reform_name"]
-    value = lambda key: float(row[key])  # noqa: E731
-
-    if reform in rules["directBranchingOptions"] or reform in rules["netImpactOptions"]:
-        oasdi = value("oasdi_net_impact")
-        hi = value("hi_net_impact")
-        return oasdi + hi, oasdi, hi, 0.0
-    if reform == "reverse_roth":
-        revenue = value("revenue_impact")
-        hi = value("tob_medicare_hi_impact")
-        return revenue, revenue - hi, hi, 0.0
-    revenue = value("revenue_impact")
-    if (
-        reform in rules["baselineShareOptions"]
-        or reform in rules["allocationEligibleOptions"]
-    ):
-        baseline_total = value("baseline_tob_oasdi") + value("baseline_tob_medicare_hi")
-        if baseline_total <= 0:
-            return revenue, 0.0, 0.0, revenue
-        oasdi = revenue * value("baseline_tob_oasdi") / baseline_total
-        return revenue, oasdi, revenue - oasdi, 0.0
-    oasdi = value("tob_oasdi_impact")
-    hi = value("tob_medicare_hi_impact")
-    return revenue, oasdi, hi, revenue - oasdi - hi
+def _static_rows(path: Path) -> pd.DataFrame:
+    return load_results(path, scoring_types=("static",))
+
+
+def solvent_split(balanced: pd.DataFrame) -> pd.DataFrame:
+    """The solvent baseline carries its own split columns; reshape them into
+    the split-frame layout used by src.fiscal_summary."""
+    rows = balanced[balanced["baseline_scenario"].astype(str).eq("ss_solvent")]
+    return pd.DataFrame(
+        {
+            "year": rows["year"].astype("int64"),
+            "reform_name": rows["reform_name"].astype(str),
+            "scoring_type": rows["scoring_type"].astype(str),
+            "allocation_mode": "baselineShares",
+            "revenue_impact": rows["revenue_impact"].astype(float),
+            "oasdi_impact": rows["solvent_oasdi_impact"].astype(float),
+            "hi_impact": rows["solvent_medicare_hi_impact"].astype(float),
+            "general_fund_impact": rows["solvent_general_fund_impact"].astype(float),
+        }
+    )
 
 
-def summarize(
-    yearly: list[tuple[int, float, float, float, float]],
-    factor_oasdi: dict[int, float],
-    factor_hi: dict[int, float],
-) -> dict[str, float]:
-    ten_year = sum(rev for year, rev, *_ in yearly if year <= TEN_YEAR_END)
-    pv_oasdi = sum(o * factor_oasdi[year] for year, _, o, _, _ in yearly)
-    pv_hi = sum(h * factor_hi[year] for year, _, _, h, _ in yearly)
-    pv_general_fund = sum(g * factor_oasdi[year] for year, _, _, _, g in yearly)
-    return {
-        "ten_year_nominal_billions": ten_year,
-        "pv75_total_billions": pv_oasdi + pv_hi + pv_general_fund,
-        "pv75_oasdi_billions": pv_oasdi,
-        "pv75_medicare_hi_billions": pv_hi,
-        "pv75_general_fund_billions": pv_general_fund,
-    }
+def _records(
+    summary: pd.DataFrame, scenario: str, reforms: Iterable[str]
+) -> list[dict[str, object]]:
+    by_reform = summary.set_index("reform_name")
+    return [
+        {
+            "baseline_scenario": scenario,
+            "reform": reform,
+            **{
+                column: float(by_reform.at[reform, column])
+                for column in SUMMARY_COLUMNS
+            },
+        }
+        for reform in reforms
+        if reform in by_reform.index
+    ]
 
 
 def build() -> list[dict[str, object]]:
-    factor_oasdi, factor_hi = discount_factors()
-    static = [
-        row
-        for row in _rows(DATA / "results.csv")
-        if row.get("scoring_type") == "static"
-    ]
-    solvent = [
-        row
-        for row in _rows(DATA / "balanced_fix_results.csv")
-        if row.get("scoring_type") == "static"
-        and row.get("baseline_scenario") == "ss_solvent"
+    factors = load_discount_factors(DATA / "effective_interest_rates.csv")
+    static = _static_rows(DATA / "results.csv")
+    scheduled = split_panel(static, allocation_modes=("baselineShares",))
+    spliced = pd.concat(
+        [
+            scheduled[
+                scheduled["reform_name"].isin(SOLVENCY_REFORMS)
+                & (scheduled["year"] < SOLVENT_START_YEAR)
+            ],
+            solvent_split(_static_rows(DATA / "balanced_fix_results.csv")),
+        ],
+        ignore_index=True,
+    )
+    return [
+        *_records(
+            summarize_split(scheduled, factors, ten_year_end=TEN_YEAR_END),
+            "scheduled_benefits",
+            REFORM_LABELS,
+        ),
+        *_records(
+            summarize_split(spliced, factors, ten_year_end=TEN_YEAR_END),
+            "ss_solvent",
+            SOLVENCY_REFORMS,
+        ),
     ]
 
-    records: list[dict[str, object]] = []
-    for reform in REFORM_LABELS:
-        yearly = [
-            (int(row["year"]), *default_split(row))
-            for row in static
-            if row["reform_name"] == reform
-        ]
-        if not yearly:
-            continue
-        records.append(
-            {
-                "baseline_scenario": "scheduled_benefits",
-                "reform": reform,
-                **summarize(sorted(yearly), factor_oasdi, factor_hi),
-            }
-        )
-
-    for reform in SOLVENCY_REFORMS:
-        spliced = [
-            (int(row["year"]), *default_split(row))
-            for row in static
-            if row["reform_name"] == reform and int(row["year"]) < SOLVENT_START_YEAR
-        ]
-        for row in solvent:
-            if row["reform_name"] != reform:
-                continue
-            revenue = float(row["revenue_impact"])
-            oasdi = float(row["solvent_oasdi_impact"])
-            hi = float(row["solvent_medicare_hi_impact"])
-            general_fund = float(row["solvent_general_fund_impact"])
-            spliced.append((int(row["year"]), revenue, oasdi, hi, general_fund))
-        records.append(
-            {
-                "baseline_scenario": "ss_solvent",
-                "reform": reform,
-                **summarize(sorted(spliced), factor_oasdi, factor_hi),
-            }
-        )
-    return records
-
 
 def write_csv(records: list[dict[str, object]]) -> None:
     columns = [
@@ -6,18 +6,28 @@ import json
 import os
 from pathlib import Path
 import re
+import sys
 from typing import Any
 
 import pandas as pd
 
 
 REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+
+from src.object_store import (  # noqa: E402
+    ObjectStoreReader,
+    object_cache_dir_from_env,
+    r2_client_from_env,
+)
+
 DASHBOARD_DATA = REPO / "dashboard" / "public" / "data"
 DEFAULT_BASELINE_AGGREGATES = DASHBOARD_DATA / "baseline_aggregates.csv"
 DEFAULT_SENTINEL_GLOB = "tmp/reform_full_h5_result_*.json"
 DEFAULT_SUBMISSION_GLOB = "results/modal_submissions/reform_full_h5_*.json"
 DEFAULT_R2_BUCKET = "axiom-corpus"
 DEFAULT_R2_PREFIX_ROOT = "crfb/reform_full_h5"
+COMPLETION_KEY_PATTERN = re.compile(r"/year=(\d{4})/reform=([^/]+)/complete\.json$")
 
 STANDARD_REFORMS = tuple(f"option{i}" for i in range(1, 13)) + (
     "reverse_roth",
@@ -330,28 +340,7 @@ def _r2_uri(bucket: Any, key: Any) -> str:
 
 
 def _r2_client_from_env() -> Any | None:
-    endpoint_url = os.environ.get("CRFB_R2_ENDPOINT_URL")
-    account_id = os.environ.get("CRFB_R2_ACCOUNT_ID")
-    if not endpoint_url and account_id:
-        endpoint_url = f"https://{account_id}.r2.cloudflarestorage.com"
-    access_key_id = os.environ.get("CRFB_R2_ACCESS_KEY_ID") or os.environ.get(
-        "AWS_ACCESS_KEY_ID"
-    )
-    secret_access_key = os.environ.get("CRFB_R2_SECRET_ACCESS_KEY") or os.environ.get(
-        "AWS_SECRET_ACCESS_KEY"
-    )
-    if not (endpoint_url and access_key_id and secret_access_key):
-        return None
-
-    import boto3
-
-    return boto3.client(
-        "s3",
-        endpoint_url=endpoint_url,
-        region_name=os.environ.get("AWS_DEFAULT_REGION") or "auto",
-        aws_access_key_id=access_key_id,
-        aws_secret_access_key=secret_access_key,
-    )
+    return r2_client_from_env(required=False)
 
 
 def _run_prefixes_from_manifests(submission_glob: str) -> list[str]:
@@ -392,65 +381,65 @@ def _scan_r2_completion_records(
     root = (
         os.environ.get("CRFB_REFORM_FULL_H5_R2_PREFIX_ROOT") or DEFAULT_R2_PREFIX_ROOT
     ).strip("/")
+    reader = ObjectStoreReader(client, cache_dir=object_cache_dir_from_env())
+    prefixes = {
+        f"{root}/{run_prefix}/reform_full_h5/": run_prefix
+        for run_prefix in _run_prefixes_from_manifests(submission_glob)
+    }
+    listings_by_prefix = reader.list_many(
+        bucket, prefixes, suffixes=("/complete.json",)
+    )
+    completions = reader.get_json_many(
+        listing
+        for listings in listings_by_prefix.values()
+        for listing in listings
+        if COMPLETION_KEY_PATTERN.search(listing.key)
+    )
     records: dict[tuple[str, int], dict[str, Any]] = {}
 
-    for run_prefix in _run_prefixes_from_manifests(submission_glob):
-        prefix = f"{root}/{run_prefix}/reform_full_h5/"
-        token = None
-        while True:
-            kwargs: dict[str, Any] = {"Bucket": bucket, "Prefix": prefix}
-            if token:
-                kwargs["ContinuationToken"] = token
-            response = client.list_objects_v2(**kwargs)
-            for item in response.get("Contents", []):
-                key = str(item.get("Key") or "")
-                match = re.search(
-                    r"/year=(\d{4})/reform=([^/]+)/complete\.json$",
-                    key,
-                )
-                if match is None:
-                    continue
-                year = int(match.group(1))
-                reform_id = match.group(2)
-                completion = {}
-                try:
-                    obj = client.get_object(Bucket=bucket, Key=key)
-                    completion = json.loads(obj["Body"].read().decode("utf-8"))
-                except Exception as error:  # noqa: BLE001 - status builder must not fail hard
-                    completion = {"completion_read_error": str(error)}
-                scenario_key = completion.get("scenario_key") or key.replace(
-                    "/complete.json", "/scenario.h5"
-                )
-                metadata_key = completion.get("metadata_key") or key.replace(
-                    "/complete.json", "/metadata.json"
-                )
-                validation = completion.get("validation", {})
-                scenario_head = (
-                    validation.get("scenario_head", {})
-                    if isinstance(validation, dict)
-                    else {}
-                )
-                _record_reform_status(
-                    records,
-                    reform_id=reform_id,
-                    year=year,
-                    status="complete",
-                    record={
-                        "result_path": "r2:complete.json",
-                        "run_prefix": run_prefix,
-                        "scenario_h5_uri": _r2_uri(bucket, scenario_key),
-                        "metadata_uri": _r2_uri(bucket, metadata_key),
-                        "complete_uri": _r2_uri(bucket, key),
-                        "output_h5_sha256": completion.get("scenario_sha256", ""),
-                        "output_h5_size_bytes": scenario_head.get("content_length", ""),
-                        "duration_seconds": "",
-                        "baseline_aggregate_metrics_computed_before_h5_save": "",
-                        "manual_weight_aggregation_used": "",
-                    },
-                )
-            if not response.get("IsTruncated"):
-                break
-            token = response.get("NextContinuationToken")
+    for prefix, listings in listings_by_prefix.items():
+        run_prefix = prefixes[prefix]
+        for listing in listings:
+            key = listing.key
+            match = COMPLETION_KEY_PATTERN.search(key)
+            if match is None:
+                continue
+            year = int(match.group(1))
+            reform_id = match.group(2)
+            completion = completions[key]
+            if isinstance(completion, Exception):
+                # Status builder must not fail hard on one unreadable marker.
+                completion = {"completion_read_error": str(completion)}
+            scenario_key = completion.get("scenario_key") or key.replace(
+                "/complete.json", "/scenario.h5"
+            )
+            metadata_key = completion.get("metadata_key") or key.replace(
+                "/complete.json", "/metadata.json"
+            )
+            validation = completion.get("validation", {})
+            scenario_head = (
+                validation.get("scenario_head", {})
+                if isinstance(validation, dict)
+                else {}
+            )
+            _record_reform_status(
+                records,
+                reform_id=reform_id,
+                year=year,
+                status="complete",
+                record={
+                    "result_path": "r2:complete.json",
+                    "run_prefix": run_prefix,
+                    "scenario_h5_uri": _r2_uri(bucket, scenario_key),
+                    "metadata_uri": _r2_uri(bucket, metadata_key),
+                    "complete_uri": _r2_uri(bucket, key),
+                    "output_h5_sha256": completion.get("scenario_sha256", ""),
+                    "output_h5_size_bytes": scenario_head.get("content_length", ""),
+                    "duration_seconds": "",
+                    "baseline_aggregate_metrics_computed_before_h5_save": "",
+                    "manual_weight_aggregation_used": "",
+                },
+            )
 
     return records
 
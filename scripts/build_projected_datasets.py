@@ -7,6 +7,13 @@ Usage:
 
 Year specs accept comma-separated entries; each entry is a year, a range
 ``A-B``, or a stepped range ``A-B:STEP``.
+
+Years are built in order as one calibration chain: each year's entropy and
+alpha solves start from the previous year's solutions
+(src/calibration_chain.py). Pass ``--cold-start`` to solve every year from
+scratch. The gamma probe search starts cold unless ``--warm-gamma`` is
+given, since a seeded search can settle on a different in-tolerance gamma
+and make a year's dataset depend on the other years in the run.
 """
 
 from __future__ import annotations
@@ -52,8 +59,22 @@ def main() -> int:
         action="store_true",
         help="Continue with remaining years if one year fails.",
     )
+    parser.add_argument(
+        "--cold-start",
+        action="store_true",
+        help="Do not warm-start each year's calibration from the previous year.",
+    )
+    parser.add_argument(
+        "--warm-gamma",
+        action="store_true",
+        help=(
+            "Also seed each year's gamma probe search from the previous year. "
+            "Faster, but a year's gamma then depends on the years before it."
+        ),
+    )
     args = parser.parse_args()
 
+    from src.calibration_chain import CalibrationChain
     from src.engine import certified_base_uri
     from src.pipeline import build_year
 
@@ -72,6 +93,7 @@ def main() -> int:
     print(f"building {len(years)} years -> {output_dir}")
     print(f"base dataset: {base_dataset}")
 
+    chain = None if args.cold_start else CalibrationChain(seed_gamma=args.warm_gamma)
     sentinels: list[dict] = []
     failures: dict[int, str] = {}
     for year in years:
@@ -82,6 +104,7 @@ def main() -> int:
                 output_dir,
                 base_dataset_label=base_dataset,
                 policyengine_us_version=pe_us_version,
+                chain=chain,
             )
             sentinels.append(sentinel)
         except Exception as error:
@@ -116,6 +139,7 @@ def main() -> int:
         "years_built": [s["year"] for s in sentinels],
         "failures": failures,
         "policyengine_us_version": pe_us_version,
+        "calibration_chain": chain.summary() if chain is not None else None,
         "datasets": {},
     }
     for year in [s["year"] for s in sentinels]:
@@ -0,0 +1,151 @@
+"""Build the discount-rate and allocation-mode sensitivity cube.
+
+Precomputes 10-year and 75-year PV summaries for every reform x scoring type
+x trust-fund allocation mode x interest-rate scenario, so the dashboard can
+slice sensitivity views client-side instead of each scenario being a rerun of
+``build_headline_summary.py``. Interest-rate scenarios are parallel shifts (in
+percentage points) applied to both Trustees effective-rate series.
+
+Writes:
+
+- ``dashboard/public/data/sensitivity_cube.bin`` — a dense little-endian
+  float32 array in C order, shaped by the index's ``shape``. Combinations with
+  no rows (e.g. behavioral scoring for static-only reforms) are NaN.
+- ``dashboard/public/data/sensitivity_cube.json`` — the axis labels, dtype,
+  payload SHA256, and input hashes.
+
+Scored against scheduled benefits only: the dashboard hides the allocation
+toggle under the solvency baseline. Inputs are checked in, so regeneration is
+deterministic; tests/test_sensitivity_cube.py fails if the outputs go stale.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+
+from src.fiscal_summary import (  # noqa: E402
+    SUMMARY_COLUMNS,
+    load_discount_factors,
+    rate_shift_grid,
+    split_panel,
+    summary_cube,
+)
+from src.trust_fund_allocation import ALLOCATION_MODES  # noqa: E402
+
+DATA = REPO / "dashboard" / "public" / "data"
+RESULTS_CSV = DATA / "results.csv"
+RATES_CSV = DATA / "effective_interest_rates.csv"
+OUTPUT_BIN = DATA / "sensitivity_cube.bin"
+OUTPUT_INDEX = DATA / "sensitivity_cube.json"
+SCHEMA = "crfb_sensitivity_cube/v1"
+DTYPE = "<f4"
+SCORING_TYPES = ("static", "behavioral")
+RATE_SHIFTS_PCT = (-2.0, -1.5, -1.0, -0.5, 0.0, 0.5, 1.0, 1.5, 2.0)
+AXES = ("reform", "scoring_type", "allocation_mode", "rate_shift_pct", "measure")
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def build(
+    results_path: Path = RESULTS_CSV,
+    rates_path: Path = RATES_CSV,
+    rate_shifts_pct: tuple[float, ...] = RATE_SHIFTS_PCT,
+) -> tuple[np.ndarray, dict[str, list]]:
+    results = pd.read_csv(results_path)
+    reforms = list(dict.fromkeys(results["reform_name"].astype(str)))
+    split = split_panel(results, ALLOCATION_MODES)
+    groups, values = summary_cube(
+        split,
+        rate_shift_grid(
+            lambda shift: load_discount_factors(rates_path, rate_shift_pct=shift),
+            rate_shifts_pct,
+        ),
+    )
+
+    axes: dict[str, list] = {
+        "reform": reforms,
+        "scoring_type": list(SCORING_TYPES),
+        "allocation_mode": list(ALLOCATION_MODES),
+        "rate_shift_pct": list(rate_shifts_pct),
+        "measure": list(SUMMARY_COLUMNS),
+    }
+    cube = np.full(tuple(len(axes[axis]) for axis in AXES), np.nan)
+    reform_index = groups["reform_name"].map(reforms.index).to_numpy()
+    scoring_index = groups["scoring_type"].map(list(SCORING_TYPES).index).to_numpy()
+    mode_index = groups["allocation_mode"].map(list(ALLOCATION_MODES).index)
+    cube[reform_index, scoring_index, mode_index.to_numpy()] = values
+    return cube, axes
+
+
+def write(cube: np.ndarray, axes: dict[str, list]) -> dict[str, object]:
+    payload = np.ascontiguousarray(cube, dtype=DTYPE).tobytes(order="C")
+    OUTPUT_BIN.write_bytes(payload)
+    index: dict[str, object] = {
+        "schema": SCHEMA,
+        "data_file": OUTPUT_BIN.name,
+        "dtype": "float32",
+        "byte_order": "little",
+        "units": "billions of nominal dollars (PV to the start of 2026)",
+        "baseline_scenario": "scheduled_benefits",
+        "rate_shift_definition": (
+            "Percentage points added to both the OASDI and HI effective "
+            "interest-rate series in every year."
+        ),
+        "axes": list(AXES),
+        "shape": list(cube.shape),
+        "labels": axes,
+        "sha256": hashlib.sha256(payload).hexdigest(),
+        "inputs": {
+            RESULTS_CSV.relative_to(REPO).as_posix(): _sha256(RESULTS_CSV),
+            RATES_CSV.relative_to(REPO).as_posix(): _sha256(RATES_CSV),
+        },
+    }
+    OUTPUT_INDEX.write_text(json.dumps(index, indent=2) + "\n", encoding="utf-8")
+    return index
+
+
+def load(index_path: Path = OUTPUT_INDEX) -> tuple[np.ndarray, dict[str, object]]:
+    index = json.loads(index_path.read_text(encoding="utf-8"))
+    payload = (index_path.parent / index["data_file"]).read_bytes()
+    if hashlib.sha256(payload).hexdigest() != index["sha256"]:
+        raise ValueError(f"{index['data_file']} does not match its index sha256")
+    cube = np.frombuffer(payload, dtype=DTYPE).reshape(index["shape"])
+    return cube, index
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rate-shifts",
+        default=",".join(str(shift) for shift in RATE_SHIFTS_PCT),
+        help="Comma-separated percentage-point shifts to the effective rates.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    shifts = tuple(float(value) for value in args.rate_shifts.split(","))
+    cube, axes = build(rate_shifts_pct=shifts)
+    index = write(cube, axes)
+    print(
+        f"wrote {OUTPUT_BIN} ({OUTPUT_BIN.stat().st_size} bytes, "
+        f"shape={index['shape']}) + {OUTPUT_INDEX.name}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
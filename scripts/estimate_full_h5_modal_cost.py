@@ -5,10 +5,19 @@ from datetime import datetime, timezone
 import json
 import os
 from pathlib import Path
+import sys
 from typing import Any
 
 
 REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+
+from src.object_store import (  # noqa: E402
+    ObjectStoreReader,
+    object_cache_dir_from_env,
+    r2_client_from_env,
+)
+
 DEFAULT_OUTPUT = REPO / "tmp" / "full_h5_modal_cost_estimate.json"
 DEFAULT_BUCKET = "axiom-corpus"
 DEFAULT_PREFIX = "crfb/reform_full_h5/"
@@ -24,59 +33,13 @@ CLOUDFLARE_R2_PRICING_URL = "https://developers.cloudflare.com/r2/pricing/"
 
 
 def _r2_client_from_env() -> Any:
-    endpoint_url = os.environ.get("CRFB_R2_ENDPOINT_URL")
-    account_id = os.environ.get("CRFB_R2_ACCOUNT_ID")
-    if not endpoint_url and account_id:
-        endpoint_url = f"https://{account_id}.r2.cloudflarestorage.com"
-    access_key_id = os.environ.get("CRFB_R2_ACCESS_KEY_ID") or os.environ.get(
-        "AWS_ACCESS_KEY_ID"
-    )
-    secret_access_key = os.environ.get("CRFB_R2_SECRET_ACCESS_KEY") or os.environ.get(
-        "AWS_SECRET_ACCESS_KEY"
-    )
-    missing = [
-        name
-        for name, value in {
-            "CRFB_R2_ENDPOINT_URL or CRFB_R2_ACCOUNT_ID": endpoint_url,
-            "CRFB_R2_ACCESS_KEY_ID": access_key_id,
-            "CRFB_R2_SECRET_ACCESS_KEY": secret_access_key,
-        }.items()
-        if not value
-    ]
-    if missing:
-        raise RuntimeError("Missing R2 credentials: " + ", ".join(missing))
-
-    import boto3
-
-    return boto3.client(
-        "s3",
-        endpoint_url=endpoint_url,
-        region_name=os.environ.get("AWS_DEFAULT_REGION") or "auto",
-        aws_access_key_id=access_key_id,
-        aws_secret_access_key=secret_access_key,
-    )
-
+    return r2_client_from_env()
 
-def _list_keys(client: Any, *, bucket: str, prefix: str, suffix: str) -> list[str]:
-    keys: list[str] = []
-    token = None
-    while True:
-        kwargs: dict[str, Any] = {"Bucket": bucket, "Prefix": prefix}
-        if token:
-            kwargs["ContinuationToken"] = token
-        response = client.list_objects_v2(**kwargs)
-        for item in response.get("Contents", []):
-            key = str(item["Key"])
-            if key.endswith(suffix):
-                keys.append(key)
-        if not response.get("IsTruncated"):
-            return keys
-        token = response.get("NextContinuationToken")
 
-
-def _load_json_object(client: Any, *, bucket: str, key: str) -> dict[str, Any]:
-    body = client.get_object(Bucket=bucket, Key=key)["Body"].read()
-    return json.loads(body)
+def _raise_if_failed(payload: Any) -> dict[str, Any]:
+    if isinstance(payload, Exception):
+        raise payload
+    return payload
 
 
 def collect_completed_metadata(
@@ -84,19 +47,40 @@ def collect_completed_metadata(
     *,
     bucket: str,
     prefix: str,
+    cache_dir: Path | None = None,
 ) -> list[dict[str, Any]]:
+    """One listing pass, then concurrent ETag-cached GETs of every completion
+    marker and the metadata it points to."""
+    reader = ObjectStoreReader(client, cache_dir=cache_dir)
+    listings = reader.list(
+        bucket, prefix, suffixes=("/complete.json", "/metadata.json")
+    )
+    listing_by_key = {listing.key: listing for listing in listings}
+    completion_listings = [
+        listing for listing in listings if listing.key.endswith("/complete.json")
+    ]
+    completions = {
+        key: _raise_if_failed(payload)
+        for key, payload in reader.get_json_many(completion_listings).items()
+    }
+    metadata_keys = [
+        str(completion["metadata_key"])
+        for completion in completions.values()
+        if completion.get("metadata_key")
+    ]
+    metadata_by_key = {
+        key: _raise_if_failed(payload)
+        for key, payload in reader.get_json_many(
+            listing_by_key.get(key) or (bucket, key) for key in metadata_keys
+        ).items()
+    }
+
     records = []
-    for completion_key in _list_keys(
-        client,
-        bucket=bucket,
-        prefix=prefix,
-        suffix="/complete.json",
-    ):
-        completion = _load_json_object(client, bucket=bucket, key=completion_key)
+    for completion_key, completion in completions.items():
         metadata_key = completion.get("metadata_key")
         if not metadata_key:
             continue
-        metadata = _load_json_object(client, bucket=bucket, key=str(metadata_key))
+        metadata = metadata_by_key[str(metadata_key)]
         records.append(
             {
                 "completion_key": completion_key,
@@ -106,6 +90,7 @@ def collect_completed_metadata(
                 "scoring_type": metadata.get("scoring_type"),
                 "run_prefix": metadata.get("run_prefix"),
                 "duration_seconds": metadata.get("duration_seconds"),
+                "peak_rss_bytes": (metadata.get("profile") or {}).get("peak_rss_bytes"),
                 "output_h5_size_bytes": metadata.get("output_h5_size_bytes")
                 or completion.get("validation", {})
                 .get("scenario_head", {})
@@ -195,6 +180,7 @@ def main() -> int:
         client,
         bucket=args.bucket,
         prefix=args.prefix,
+        cache_dir=object_cache_dir_from_env(),
     )
     estimate = estimate_cost(
         records=records,
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 from pathlib import Path
+import sys
 
 import pandas as pd
 
-
 REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+
+from src.results_store import load_results  # noqa: E402
+
 RESULTS = REPO / "results"
 EXHIBITS = REPO / "paper" / "exhibits"
 SECTION_EXHIBITS = REPO / "paper" / "sections" / "exhibits"
@@ -33,8 +37,7 @@ def markdown_table(headers: list[str], rows: list[list[str]]) -> str:
 def load_static() -> pd.DataFrame:
     # New certified-base panel (dashboard results.csv is the canonical surface).
     src = REPO / "dashboard" / "public" / "data" / "results.csv"
-    df = pd.read_csv(src)
-    df = df[df["scoring_type"] == "static"].copy()
+    df = load_results(src, scoring_types=("static",))
     # Provenance columns the rebuilt pipeline does not yet capture per cell
     # (saved-microdata lineage is a cleanup item) — placeholders so number
     # exhibits render and lineage exhibits degrade gracefully rather than crash.
@@ -389,8 +392,7 @@ household aggregation pass is complete.
 def build_full_h5_summary(static_df: pd.DataFrame) -> str:
     """Current-release replacement for the retired May run-status exhibit."""
     src = REPO / "dashboard" / "public" / "data" / "results.csv"
-    full = pd.read_csv(src)
-    behavioral = full[full["scoring_type"] == "behavioral"].copy()
+    behavioral = load_results(src, scoring_types=("behavioral",))
 
     exact = static_df[static_df["full_h5_result_type"] == "exact_full_h5"]
     n_exact = len(exact)
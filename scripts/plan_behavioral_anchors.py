@@ -0,0 +1,175 @@
+"""Propose the extra behavioral anchor cells that keep interpolation error in tolerance.
+
+Reads the published panel (``results.csv``): static rows, behavioral rows
+and which of them are exact anchors. Writes a ``reform_id,year,scoring_type``
+cells CSV plus a ``.metadata.json`` with each segment's worst year,
+error/tolerance ratio and planned anchors, and prints the behavioral cell
+keys to pass to ``modal_batch/reform_full_h5.py --cells``. See
+``src/anchor_planner.py`` for the error model.
+
+Without ``--sampled`` the plan uses the static-curvature estimate. With
+``--sampled`` (a results-shaped CSV of cheap sampled-dataset static and
+behavioral scores) it uses the sampled behavioral/static ratios, linearly
+interpolated across any years the sample skipped.
+
+Usage:
+    python scripts/plan_behavioral_anchors.py --max-cells 12
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+
+from src.anchor_planner import (  # noqa: E402
+    DEFAULT_ABS_TOLERANCE,
+    DEFAULT_COLUMNS,
+    DEFAULT_REL_TOLERANCE,
+    ReformSeries,
+    plan_reform,
+    write_anchor_plan,
+)
+from src.behavioral_interpolation import ZERO_STATIC_TOLERANCE  # noqa: E402
+from src.results_store import load_results  # noqa: E402
+
+DEFAULT_RESULTS = REPO / "results.csv"
+DEFAULT_OUTPUT = REPO / "tmp" / "behavioral_anchor_plan.csv"
+EXACT_STATIC_TYPE = "exact_full_h5"
+EXACT_BEHAVIORAL_TYPE = "exact_behavioral_endpoint_full_h5"
+
+
+def _sampled_ratios(
+    sampled: pd.DataFrame, years: np.ndarray, columns: tuple[str, ...]
+) -> np.ndarray:
+    """Sampled behavioral/static ratios on ``years``, interpolated between samples."""
+    by_type = {
+        scoring: group.set_index("year")[list(columns)].astype(float)
+        for scoring, group in sampled.groupby("scoring_type")
+    }
+    if set(by_type) != {"static", "behavioral"}:
+        raise ValueError("--sampled needs both static and behavioral rows")
+    static, behavioral = by_type["static"].align(by_type["behavioral"], join="inner")
+    ratios = (behavioral / static.where(static.abs() > ZERO_STATIC_TOLERANCE)).dropna()
+    if ratios.empty:
+        raise ValueError("--sampled has no usable behavioral/static ratios")
+    return np.column_stack(
+        [
+            np.interp(years, ratios.index.to_numpy(float), ratios[column].to_numpy())
+            for column in columns
+        ]
+    )
+
+
+def build_series(
+    results: pd.DataFrame,
+    *,
+    columns: tuple[str, ...],
+    sampled: pd.DataFrame | None = None,
+) -> list[ReformSeries]:
+    series = []
+    for reform, group in results.groupby("reform_name", sort=True):
+        static = group[group["scoring_type"] == "static"].set_index("year").sort_index()
+        behavioral = (
+            group[group["scoring_type"] == "behavioral"].set_index("year").sort_index()
+        )
+        if behavioral.empty:
+            continue
+        years = static.index.intersection(behavioral.index).to_numpy()
+        static, behavioral = static.loc[years], behavioral.loc[years]
+        anchors = behavioral.index[
+            behavioral["full_h5_result_type"] == EXACT_BEHAVIORAL_TYPE
+        ]
+        static_values = static[list(columns)].to_numpy(float)
+        reference = behavioral[list(columns)].to_numpy(float)
+        if sampled is not None:
+            reform_sample = sampled[sampled["reform_name"] == reform]
+            if reform_sample.empty:
+                continue
+            estimate = static_values * _sampled_ratios(reform_sample, years, columns)
+            reference = np.where(np.isin(years, anchors)[:, None], reference, estimate)
+        series.append(
+            ReformSeries(
+                reform=str(reform),
+                years=years,
+                columns=columns,
+                static=static_values,
+                reference=reference,
+                anchors=tuple(int(year) for year in anchors),
+                candidates=tuple(
+                    int(year)
+                    for year in static.index[
+                        static["full_h5_result_type"] == EXACT_STATIC_TYPE
+                    ]
+                ),
+            )
+        )
+    return series
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--results", type=Path, default=DEFAULT_RESULTS)
+    parser.add_argument("--sampled", type=Path, default=None)
+    parser.add_argument("--reforms", default=None, help="Comma list; default all")
+    parser.add_argument("--columns", default=",".join(DEFAULT_COLUMNS))
+    parser.add_argument("--abs-tolerance", type=float, default=DEFAULT_ABS_TOLERANCE)
+    parser.add_argument("--rel-tolerance", type=float, default=DEFAULT_REL_TOLERANCE)
+    parser.add_argument("--max-cells", type=int, default=None)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    reforms = (
+        tuple(reform.strip() for reform in args.reforms.split(",") if reform.strip())
+        if args.reforms
+        else None
+    )
+    columns = tuple(column.strip() for column in args.columns.split(","))
+    results = load_results(args.results, reforms=reforms)
+    sampled = load_results(args.sampled, reforms=reforms) if args.sampled else None
+    method = "curvature" if sampled is None else "sampled"
+
+    plans = [
+        plan
+        for series in build_series(results, columns=columns, sampled=sampled)
+        for plan in plan_reform(
+            series,
+            method=method,
+            abs_tolerance=args.abs_tolerance,
+            rel_tolerance=args.rel_tolerance,
+        )
+    ]
+    metadata = write_anchor_plan(
+        args.output,
+        plans,
+        max_cells=args.max_cells,
+        metadata={
+            "method": method,
+            "results": str(args.results),
+            "sampled": str(args.sampled) if args.sampled else None,
+            "columns": list(columns),
+            "abs_tolerance": args.abs_tolerance,
+            "rel_tolerance": args.rel_tolerance,
+        },
+    )
+    print(
+        f"{metadata['cell_count']} anchor cells for "
+        f"{metadata['segments_over_tolerance']} segments over tolerance "
+        f"({method}) -> {args.output}"
+    )
+    if metadata["submit_cells"]:
+        print(f"--cells {metadata['submit_cells']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,148 @@
+"""Plan resource tiers and launch order for a full-H5 panel submission.
+
+Learns per-cell duration and peak RSS from earlier cells' ``metadata.json``,
+which it reads from a local output root or from the R2 ``reform_full_h5``
+prefix. It then assigns each requested cell a container tier and orders the
+cells longest-first. The written plan is passed to
+``modal_batch/reform_full_h5.py::submit_reform_full_h5`` as ``--launch-plan``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+import sys
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+
+from scripts.estimate_full_h5_modal_cost import (  # noqa: E402
+    DEFAULT_BUCKET,
+    DEFAULT_PREFIX,
+    MODAL_CPU_CORE_SECOND_PRICE,
+    MODAL_MEMORY_GIB_SECOND_PRICE,
+    collect_completed_metadata,
+)
+from scripts.rank_full_h5_profiles import load_local_metadata  # noqa: E402
+from src.cell_scheduler import (  # noqa: E402
+    ResourceModel,
+    build_launch_plan,
+    observations_from_metadata,
+)
+from src.object_store import object_cache_dir_from_env, r2_client_from_env  # noqa: E402
+from src.reform_full_h5_contract import ReformCell, normalize_cells  # noqa: E402
+
+DEFAULT_OUTPUT = REPO / "tmp" / "full_h5_launch_plan.json"
+
+
+def parse_years(years: str) -> list[int]:
+    parsed: list[int] = []
+    for part in years.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", maxsplit=1)
+            parsed.extend(range(int(start), int(end) + 1))
+        else:
+            parsed.append(int(part))
+    return parsed
+
+
+def requested_cells(args: argparse.Namespace) -> tuple[ReformCell, ...]:
+    if args.cells:
+        cells = []
+        for raw_key in args.cells.split(","):
+            if not raw_key.strip():
+                continue
+            parts = dict(item.split("=", maxsplit=1) for item in raw_key.split("/"))
+            cells.append(
+                ReformCell(
+                    year=int(parts["year"]),
+                    reform=parts["reform"],
+                    scoring_type=parts.get("scoring", "static"),
+                )
+            )
+        return normalize_cells(cells)
+    return normalize_cells(
+        [
+            ReformCell(year=year, reform=reform.strip(), scoring_type=args.scoring_type)
+            for reform in args.reforms.split(",")
+            if reform.strip()
+            for year in parse_years(args.years)
+        ]
+    )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reforms", default="option10")
+    parser.add_argument("--years", default="2075")
+    parser.add_argument("--scoring-type", default="static")
+    parser.add_argument(
+        "--cells",
+        default="",
+        help="Comma-separated year=Y/reform=R/scoring=S keys; overrides "
+        "--reforms/--years/--scoring-type.",
+    )
+    parser.add_argument(
+        "--local-root",
+        type=Path,
+        help="Read history from metadata.json files under this directory "
+        "instead of R2.",
+    )
+    parser.add_argument(
+        "--bucket", default=os.environ.get("CRFB_R2_BUCKET", DEFAULT_BUCKET)
+    )
+    parser.add_argument("--prefix", default=DEFAULT_PREFIX)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Containers running at once, for the predicted makespan.",
+    )
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.local_root is not None:
+        records = load_local_metadata(args.local_root)
+    else:
+        records = collect_completed_metadata(
+            r2_client_from_env(),
+            bucket=args.bucket,
+            prefix=args.prefix,
+            cache_dir=object_cache_dir_from_env(),
+        )
+    plan = build_launch_plan(
+        requested_cells(args),
+        ResourceModel(observations_from_metadata(records)),
+        cpu_core_second_price=MODAL_CPU_CORE_SECOND_PRICE,
+        memory_gib_second_price=MODAL_MEMORY_GIB_SECOND_PRICE,
+        concurrency=args.concurrency,
+    )
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(plan, indent=2) + "\n", encoding="utf-8")
+    print(f"Planned {len(plan['cells'])} cells into {args.output}.")
+    print(
+        f"Predicted compute ${plan['predicted_cost_usd']:.2f} vs "
+        f"${plan['uniform_cost_usd']:.2f} at the default tier "
+        f"({plan['cells_without_history']} cells without history)."
+    )
+    print(
+        "Tiers: "
+        + ", ".join(f"{name}={count}" for name, count in plan["tier_counts"].items())
+    )
+    for cell in plan["cells_exceeding_largest_tier"]:
+        print(
+            f"  {cell} exceeds the largest tier; it may time out or run out of memory."
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,6 +9,7 @@ from pathlib import Path
 import sys
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 REPO = Path(__file__).resolve().parents[1]
@@ -21,6 +22,15 @@ from scripts.publish_full_h5_static_dashboard_results import (
     STANDARD_REFORMS,
     _scale_dollars_to_billions,
 )
+from src.behavioral_interpolation import (
+    GAIN_LOSS_COLUMNS,
+    NET_GAIN_LOSS_COMPONENTS,
+    TOB_TOTAL_COMPONENTS,
+    AnchorPanel,
+    derive_interior_identities,
+    interpolate_panel,
+    structural_reforms,
+)
 
 
 RESULTS = REPO / "results"
@@ -67,6 +77,17 @@ REFORM_LEVEL_COLUMNS = {
     "reform_tob_total": ("baseline_tob_total", "tob_total_impact"),
 }
 
+PROVENANCE_COLUMNS = (
+    "scenario_h5_uri",
+    "metadata_uri",
+    "complete_uri",
+    "output_h5_sha256",
+    "run_prefix",
+    "baseline_source",
+)
+EXACT_RESULT_TYPE = "exact_behavioral_endpoint_full_h5"
+INTERPOLATED_RESULT_TYPE = "linear_interpolation_between_behavioral_endpoint_ratios"
+
 
 def _display_path(path: Path) -> str:
     resolved = path.resolve()
@@ -121,43 +142,150 @@ def _published_behavioral_endpoints(
     return exact.sort_values(["reform_name", "year"]).reset_index(drop=True)
 
 
-def _endpoint_ratio(
+def _behavioral_annual_panel(
+    groups: list[tuple[str, pd.DataFrame, pd.DataFrame]],
     *,
-    behavioral_value: float,
-    static_value: float,
     fallback_records: list[dict[str, Any]],
-    reform_name: str,
-    year: int,
-    column: str,
-) -> float:
-    if abs(static_value) > 1e-9:
-        return behavioral_value / static_value
-    if abs(behavioral_value) <= 1e-9:
-        return 1.0
-    fallback_records.append(
-        {
-            "reform_name": reform_name,
-            "year": int(year),
-            "column": column,
-            "static_value": static_value,
-            "behavioral_value": behavioral_value,
-            "method": "endpoint_absolute_value_fallback",
-        }
+) -> pd.DataFrame:
+    """Annual behavioral rows for ``(reform, static group, endpoint group)``.
+
+    All exact behavioral cells of a reform are anchors: the required
+    2026/2100 endpoints plus any interior completion anchors (e.g.
+    option12@2062, where the phase-out kink makes a single 2026->2100 ratio
+    segment misrepresent every mid-century year). The interpolation itself
+    runs over the whole reform x year x column panel in
+    ``src.behavioral_interpolation``.
+    """
+    years = np.asarray(ANNUAL_YEARS)
+    reforms = tuple(reform for reform, _, _ in groups)
+    static = pd.concat(
+        [
+            group.sort_values("year").set_index("year").loc[list(ANNUAL_YEARS)]
+            for _, group, _ in groups
+        ],
+        ignore_index=True,
+    )
+    endpoints = [group.sort_values("year").set_index("year") for _, _, group in groups]
+    endpoint_columns = list(
+        dict.fromkeys(column for group in endpoints for column in group.columns)
+    )
+    for reform, group in zip(reforms, endpoints):
+        outside = sorted(set(group.index.astype(int)) - set(ANNUAL_YEARS))
+        if outside:
+            raise ValueError(
+                f"{reform} behavioral anchors outside {ANNUAL_YEARS}: {outside}"
+            )
+    # Endpoint rows laid out on the annual grid; NaN where a reform has no anchor.
+    anchors = pd.concat(
+        [group.reindex(index=years, columns=endpoint_columns) for group in endpoints],
+        ignore_index=True,
+    )
+    is_anchor = np.stack(
+        [np.isin(years, group.index.astype(int)) for group in endpoints]
+    )
+    flat_anchor = is_anchor.reshape(-1)
+    interior = ~is_anchor
+
+    def grid(frame: pd.DataFrame, columns: list[str]) -> np.ndarray:
+        values = (
+            frame[columns].to_numpy(dtype=float)
+            if columns
+            else np.empty((len(frame), 0))
+        )
+        return values.reshape(len(reforms), len(years), len(columns))
+
+    ratio_columns = [
+        column
+        for column in IMPACT_RATIO_COLUMNS
+        if column in static.columns and column in endpoint_columns
+    ]
+    interpolated = interpolate_panel(
+        AnchorPanel(
+            reforms=reforms,
+            years=years,
+            columns=tuple(ratio_columns),
+            static=grid(static, ratio_columns),
+            behavioral=grid(anchors, ratio_columns),
+            is_anchor=is_anchor,
+        )
+    )
+    fallback_records.extend(interpolated.fallbacks)
+
+    # Float views of every column the identities and reform levels read,
+    # with the interpolated series swapped in.
+    numeric = {
+        column: grid(static, [column])[..., 0]
+        for column in dict.fromkeys(
+            [
+                *BASELINE_COLUMNS,
+                *(part for pair in REFORM_LEVEL_COLUMNS.values() for part in pair),
+                *(
+                    column
+                    for rules in (TOB_TOTAL_COMPONENTS, NET_GAIN_LOSS_COMPONENTS)
+                    for target, parts in rules.items()
+                    for column in (target, *parts)
+                ),
+            ]
+        )
+        if column in static.columns
+    }
+    for index, column in enumerate(ratio_columns):
+        numeric[column] = interpolated.values[..., index]
+    gain_loss = [column for column in GAIN_LOSS_COLUMNS if column in endpoint_columns]
+    derived = derive_interior_identities(
+        numeric,
+        interior=interior,
+        structural=structural_reforms(grid(anchors, gain_loss), is_anchor),
     )
-    return float("nan")
-
-
-def _interpolate_ratio(
-    start: float, end: float, year: int, left: int, right: int
-) -> float:
-    weight = (year - left) / (right - left)
-    return start + (end - start) * weight
-
 
-def _bracketing_anchors(anchor_years: list[int], year: int) -> tuple[int, int]:
-    left = max(y for y in anchor_years if y < year)
-    right = min(y for y in anchor_years if y > year)
-    return left, right
+    out: dict[str, Any] = {
+        column: static[column].tolist() for column in static.columns if column != "year"
+    }
+    out["reform_name"] = np.repeat(reforms, len(years)).tolist()
+    out["year"] = np.tile(years, len(reforms)).tolist()
+    out["scoring_type"] = "behavioral"
+    for column in (*BASELINE_COLUMNS, *ratio_columns, *derived):
+        if column in static.columns:
+            out[column] = numeric[column].reshape(-1)
+    reform_levels = {
+        reform_column: (numeric[baseline_column] + numeric[impact_column]).reshape(-1)
+        for reform_column, (
+            baseline_column,
+            impact_column,
+        ) in REFORM_LEVEL_COLUMNS.items()
+        if baseline_column in numeric and impact_column in numeric
+    }
+    # Columns only derived on interior years come after the provenance
+    # columns, where the first interior row introduced them.
+    anchored = set(static.columns)
+    for reform_column, levels in reform_levels.items():
+        if anchored.issuperset(REFORM_LEVEL_COLUMNS[reform_column]):
+            out[reform_column] = levels
+
+    interpolated_provenance = {
+        "run_prefix": INTERPOLATED_RUN_PREFIX,
+        "baseline_source": INTERPOLATED_BASELINE_SOURCE,
+    }
+    for column in PROVENANCE_COLUMNS:
+        recorded = np.repeat(
+            [column in group.columns for group in endpoints], len(years)
+        )
+        exact = np.full(len(anchors), "", dtype=object)
+        if column in anchors.columns:
+            exact[recorded] = anchors[column].to_numpy(dtype=object)[recorded]
+        out[column] = np.where(
+            flat_anchor, exact, interpolated_provenance.get(column, "")
+        ).tolist()
+    result_type = np.where(
+        flat_anchor, EXACT_RESULT_TYPE, INTERPOLATED_RESULT_TYPE
+    ).tolist()
+    out["source"] = result_type
+    out["full_h5_result_type"] = result_type
+    for column in derived:
+        out.setdefault(column, numeric[column].reshape(-1))
+    for reform_column, levels in reform_levels.items():
+        out.setdefault(reform_column, levels)
+    return pd.DataFrame(out)
 
 
 def _behavioral_annual_for_reform(
@@ -167,156 +295,10 @@ def _behavioral_annual_for_reform(
     endpoint_group: pd.DataFrame,
     fallback_records: list[dict[str, Any]],
 ) -> pd.DataFrame:
-    static_group = static_group.sort_values("year").set_index("year")
-    endpoint_group = endpoint_group.sort_values("year").set_index("year")
-    # All exact behavioral cells for this reform are anchors: the required
-    # 2026/2100 endpoints plus any interior completion anchors (e.g.
-    # option12@2062, where the phase-out kink makes a single 2026->2100
-    # ratio segment misrepresent every mid-century year).
-    anchor_years = sorted(int(y) for y in endpoint_group.index)
-    rows: list[dict[str, Any]] = []
-
-    for year in ANNUAL_YEARS:
-        static_row = static_group.loc[year].to_dict()
-        row = dict(static_row)
-        row["reform_name"] = reform_name
-        row["year"] = int(year)
-        row["scoring_type"] = "behavioral"
-
-        for column in BASELINE_COLUMNS:
-            if column in static_row:
-                row[column] = float(static_row[column])
-
-        if year in anchor_years:
-            segment = (year, year)
-        else:
-            segment = _bracketing_anchors(anchor_years, year)
-
-        for column in IMPACT_RATIO_COLUMNS:
-            if (
-                column not in static_group.columns
-                or column not in endpoint_group.columns
-            ):
-                continue
-            if year in anchor_years:
-                row[column] = float(endpoint_group.loc[year, column])
-                continue
-            anchor_ratios: dict[int, float] = {}
-            anchor_values: dict[int, float] = {}
-            anchor_statics: dict[int, float] = {}
-            for anchor_year in segment:
-                static_value = float(static_group.loc[anchor_year, column])
-                behavioral_value = float(endpoint_group.loc[anchor_year, column])
-                anchor_statics[anchor_year] = static_value
-                anchor_values[anchor_year] = behavioral_value
-                anchor_ratios[anchor_year] = _endpoint_ratio(
-                    behavioral_value=behavioral_value,
-                    static_value=static_value,
-                    fallback_records=fallback_records,
-                    reform_name=reform_name,
-                    year=anchor_year,
-                    column=column,
-                )
-
-            left, right = segment
-            # Ratio interpolation is meaningless across a static sign flip:
-            # the swap reforms' static revenue crosses zero mid-century, and
-            # a behavioral/static ratio interpolated through that crossing
-            # understated the exact option12@2062 behavioral anchor by 2x.
-            # Interpolate the behavioral values directly on such segments.
-            sign_flip = anchor_statics[left] * anchor_statics[right] < 0
-            if sign_flip or any(
-                pd.isna(value) for value in anchor_ratios.values()
-            ):
-                if sign_flip and year == left + 1:
-                    # One record per (reform, column, segment).
-                    fallback_records.append(
-                        {
-                            "reform_name": reform_name,
-                            "segment": [int(left), int(right)],
-                            "column": column,
-                            "method": "sign_flip_segment_value_interpolation",
-                        }
-                    )
-                row[column] = _interpolate_ratio(
-                    anchor_values[left], anchor_values[right], year, left, right
-                )
-            else:
-                ratio = _interpolate_ratio(
-                    anchor_ratios[left], anchor_ratios[right], year, left, right
-                )
-                row[column] = float(static_row[column]) * ratio
-
-        # Interior rows: interpolate only the primitive series, then derive
-        # the algebraically dependent columns so every published row satisfies
-        # the same identities the exact endpoints do (independently
-        # interpolating dependents broke TOB additivity by up to $47B and the
-        # structural gain/loss decomposition in every interior swap row).
-        # The gain/loss decomposition only exists for the structural swaps;
-        # other reforms carry their TOB impacts in the net columns and keep
-        # gains/losses at zero, so deriving net from them would zero real
-        # values.
-        if year not in anchor_years:
-            if all(
-                column in row
-                for column in ("tob_oasdi_impact", "tob_medicare_hi_impact")
-            ):
-                row["tob_total_impact"] = float(row["tob_oasdi_impact"]) + float(
-                    row["tob_medicare_hi_impact"]
-                )
-            structural = any(
-                abs(float(endpoint_group.loc[anchor_year, column])) > 1e-6
-                for anchor_year in anchor_years
-                for column in ("oasdi_gain", "oasdi_loss", "hi_gain", "hi_loss")
-                if column in endpoint_group.columns
-            )
-            if structural:
-                if all(column in row for column in ("oasdi_gain", "oasdi_loss")):
-                    row["oasdi_net_impact"] = float(row["oasdi_gain"]) - float(
-                        row["oasdi_loss"]
-                    )
-                if all(column in row for column in ("hi_gain", "hi_loss")):
-                    row["hi_net_impact"] = float(row["hi_gain"]) - float(row["hi_loss"])
-
-        for reform_column, (
-            baseline_column,
-            impact_column,
-        ) in REFORM_LEVEL_COLUMNS.items():
-            if baseline_column in row and impact_column in row:
-                row[reform_column] = float(row[baseline_column]) + float(
-                    row[impact_column]
-                )
-
-        if year in anchor_years:
-            endpoint_row = endpoint_group.loc[year].to_dict()
-            for column in (
-                "scenario_h5_uri",
-                "metadata_uri",
-                "complete_uri",
-                "output_h5_sha256",
-                "run_prefix",
-                "baseline_source",
-            ):
-                row[column] = endpoint_row.get(column, "")
-            row["source"] = "exact_behavioral_endpoint_full_h5"
-            row["full_h5_result_type"] = "exact_behavioral_endpoint_full_h5"
-        else:
-            for column in (
-                "scenario_h5_uri",
-                "metadata_uri",
-                "complete_uri",
-                "output_h5_sha256",
-            ):
-                row[column] = ""
-            row["run_prefix"] = INTERPOLATED_RUN_PREFIX
-            row["baseline_source"] = INTERPOLATED_BASELINE_SOURCE
-            row["source"] = "linear_interpolation_between_behavioral_endpoint_ratios"
-            row["full_h5_result_type"] = (
-                "linear_interpolation_between_behavioral_endpoint_ratios"
-            )
-        rows.append(row)
-
-    return pd.DataFrame(rows)
+    return _behavioral_annual_panel(
+        [(reform_name, static_group, endpoint_group)],
+        fallback_records=fallback_records,
+    )
 
 
 def build_behavioral_display(
@@ -351,18 +333,17 @@ def build_behavioral_display(
         raise ValueError(f"Missing static display rows; first missing: {preview}")
 
     fallback_records: list[dict[str, Any]] = []
-    annual_rows: list[pd.DataFrame] = []
-    for reform in STANDARD_REFORMS:
-        annual_rows.append(
-            _behavioral_annual_for_reform(
-                reform_name=reform,
-                static_group=static[static["reform_name"] == reform],
-                endpoint_group=exact[exact["reform_name"] == reform],
-                fallback_records=fallback_records,
+    display = _behavioral_annual_panel(
+        [
+            (
+                reform,
+                static[static["reform_name"] == reform],
+                exact[exact["reform_name"] == reform],
             )
-        )
-
-    display = pd.concat(annual_rows, ignore_index=True)
+            for reform in STANDARD_REFORMS
+        ],
+        fallback_records=fallback_records,
+    )
     columns = list(
         dict.fromkeys([*DASHBOARD_COLUMNS, *static.columns, *display.columns])
     )
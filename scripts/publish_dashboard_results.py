@@ -9,6 +9,7 @@ import tempfile
 
 import pandas as pd
 
+from scripts import build_dashboard_shards
 from scripts.publish_behavioral_endpoint_dashboard_results import (
     DEFAULT_BEHAVIORAL_ENDPOINT_AGGREGATE,
     build_behavioral_display,
@@ -18,6 +19,12 @@ from scripts.publish_full_h5_static_dashboard_results import (
     DEFAULT_TOB_BASELINE,
     publish_full_h5_static_results,
 )
+from src.results_store import (
+    content_vintage,
+    export_results_csv,
+    normalize_results,
+    write_results_store,
+)
 
 
 REPO = Path(__file__).resolve().parents[1]
@@ -28,6 +35,7 @@ TOB_BASELINE = DEFAULT_TOB_BASELINE
 OUT_METADATA = REPO / "results.csv.metadata.json"
 DASHBOARD_OUT = REPO / "dashboard" / "public" / "data" / "results.csv"
 ROOT_OUT = REPO / "results.csv"
+RESULTS_STORE = RESULTS / "store"
 
 
 def parse_args() -> argparse.Namespace:
@@ -40,6 +48,19 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--out-metadata", type=Path, default=OUT_METADATA)
     parser.add_argument("--dashboard-out", type=Path, default=DASHBOARD_OUT)
     parser.add_argument("--root-out", type=Path, default=ROOT_OUT)
+    parser.add_argument(
+        "--results-store",
+        type=Path,
+        default=RESULTS_STORE,
+        help="Partitioned results store this vintage is added to.",
+    )
+    parser.add_argument(
+        "--no-results-store",
+        dest="results_store",
+        action="store_const",
+        const=None,
+        help="Publish results.csv without adding a store vintage.",
+    )
     return parser.parse_args()
 
 
@@ -121,17 +142,20 @@ def build_metadata(
         "year_start": int(results["year"].min()),
         "year_end": int(results["year"].max()),
         "public_dashboard_contract": (
-            "Dashboard reads this single results.csv and filters by scoring_type."
+            "results.csv is the single public results file; the dashboard reads "
+            "the per-scoring-type, per-reform shards built from it."
         ),
     }
 
 
 def main() -> int:
     args = parse_args()
-    results = build_results(
-        args.static_source,
-        args.behavioral_source,
-        args.tob_baseline,
+    results = normalize_results(
+        build_results(
+            args.static_source,
+            args.behavioral_source,
+            args.tob_baseline,
+        )
     )
     metadata = build_metadata(
         results,
@@ -145,14 +169,32 @@ def main() -> int:
     args.dashboard_out.parent.mkdir(parents=True, exist_ok=True)
     args.root_out.parent.mkdir(parents=True, exist_ok=True)
 
-    results.to_csv(args.root_out, index=False, float_format="%.10f")
+    vintage = content_vintage(results)
+    metadata["results_vintage"] = vintage
+    metadata["results_store"] = (
+        str(args.results_store) if args.results_store is not None else None
+    )
+    export_results_csv(results, args.root_out)
+    if args.results_store is not None:
+        write_results_store(
+            results, args.results_store, vintage=vintage, metadata=metadata
+        )
     args.out_metadata.write_text(
         json.dumps(metadata, indent=2) + "\n", encoding="utf-8"
     )
     shutil.copy2(args.root_out, args.dashboard_out)
+    shard_dir = args.dashboard_out.parent / build_dashboard_shards.OUTPUT_DIR.name
+    shard_index, shard_payloads = build_dashboard_shards.build(
+        args.dashboard_out,
+        args.dashboard_out.parent / build_dashboard_shards.BALANCED_FIX_CSV.name,
+    )
+    build_dashboard_shards.write(shard_index, shard_payloads, shard_dir)
 
+    if args.results_store is not None:
+        print(f"Wrote {args.results_store / vintage} (results vintage {vintage})")
     print(f"Wrote {args.root_out} ({len(results)} rows)")
     print(f"Wrote {args.dashboard_out} (deployment copy)")
+    print(f"Wrote {len(shard_payloads)} dashboard shards to {shard_dir}")
     print(f"Wrote {args.out_metadata}")
     return 0
 
@@ -0,0 +1,163 @@
+"""Rank the slowest stages and output variables across full-H5 cell profiles.
+
+Reads the ``profile`` section that ``run_reform_full_h5_cell`` writes into
+each cell's ``metadata.json`` -- from a local output root or from the R2
+``reform_full_h5`` prefix -- and reports, per stage and per output variable,
+total / mean / max wall time, total CPU time, and the largest peak RSS and RSS
+growth seen. Use it to size Modal memory and timeouts and to find the output
+variables that dominate a panel's cost.
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import sys
+from typing import Any, Iterable
+
+import pandas as pd
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+
+from scripts.estimate_full_h5_modal_cost import (  # noqa: E402
+    DEFAULT_BUCKET,
+    DEFAULT_PREFIX,
+    collect_completed_metadata,
+)
+from src.object_store import object_cache_dir_from_env, r2_client_from_env  # noqa: E402
+from src.stage_profiler import PROFILE_SCHEMA  # noqa: E402
+
+DEFAULT_OUTPUT = REPO / "tmp" / "full_h5_profile_ranking.json"
+DEFAULT_TOP = 25
+
+
+def load_local_metadata(root: Path) -> list[dict[str, Any]]:
+    return [
+        json.loads(path.read_text(encoding="utf-8"))
+        for path in sorted(root.rglob("metadata.json"))
+    ]
+
+
+def _profile_rows(
+    records: Iterable[dict[str, Any]], section: str
+) -> tuple[pd.DataFrame, int]:
+    rows: list[dict[str, Any]] = []
+    profiled = 0
+    for record in records:
+        profile = record.get("profile")
+        if not isinstance(profile, dict) or profile.get("schema") != PROFILE_SCHEMA:
+            continue
+        profiled += 1
+        cell = f"{record.get('year')}/{record.get('reform_id')}"
+        for item in profile.get(section) or []:
+            rows.append({"cell": cell, **item})
+    return pd.DataFrame(rows), profiled
+
+
+def _rank(frame: pd.DataFrame, keys: list[str], top: int) -> list[dict[str, Any]]:
+    if frame.empty:
+        return []
+    ranked = (
+        frame.groupby(keys, sort=False, dropna=False)
+        .agg(
+            cells=("cell", "nunique"),
+            total_wall_seconds=("wall_seconds", "sum"),
+            mean_wall_seconds=("wall_seconds", "mean"),
+            max_wall_seconds=("wall_seconds", "max"),
+            total_cpu_seconds=("cpu_seconds", "sum"),
+            max_peak_rss_bytes=("peak_rss_bytes", "max"),
+            max_rss_growth_bytes=("rss_growth_bytes", "max"),
+            failures=("failed", "sum"),
+        )
+        .reset_index()
+        .sort_values("total_wall_seconds", ascending=False, kind="stable")
+        .head(top)
+    )
+    return json.loads(ranked.to_json(orient="records"))
+
+
+def rank_profiles(
+    records: list[dict[str, Any]], *, top: int = DEFAULT_TOP
+) -> dict[str, Any]:
+    stages, profiled = _profile_rows(records, "stages")
+    variables, _ = _profile_rows(records, "variables")
+    totals = [
+        record["profile"]
+        for record in records
+        if isinstance(record.get("profile"), dict)
+        and record["profile"].get("schema") == PROFILE_SCHEMA
+    ]
+    peaks = [
+        profile["peak_rss_bytes"]
+        for profile in totals
+        if profile.get("peak_rss_bytes") is not None
+    ]
+    walls = [float(profile["total_wall_seconds"]) for profile in totals]
+    top_level_stages = (
+        stages.loc[stages["parent"].isna()] if not stages.empty else stages
+    )
+    return {
+        "schema": "crfb_full_h5_profile_ranking/v1",
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "metadata_records": len(records),
+        "profiled_records": profiled,
+        "max_cell_peak_rss_bytes": max(peaks) if peaks else None,
+        "max_cell_wall_seconds": max(walls) if walls else None,
+        "mean_cell_wall_seconds": sum(walls) / len(walls) if walls else None,
+        "top_level_stages": _rank(top_level_stages, ["stage"], top),
+        "stages": _rank(stages, ["stage", "parent"], top),
+        "variables": _rank(variables, ["entity", "variable"], top),
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--local-root",
+        type=Path,
+        help="Read metadata.json files under this directory instead of R2.",
+    )
+    parser.add_argument(
+        "--bucket", default=os.environ.get("CRFB_R2_BUCKET", DEFAULT_BUCKET)
+    )
+    parser.add_argument("--prefix", default=DEFAULT_PREFIX)
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.local_root is not None:
+        records = load_local_metadata(args.local_root)
+    else:
+        records = collect_completed_metadata(
+            r2_client_from_env(),
+            bucket=args.bucket,
+            prefix=args.prefix,
+            cache_dir=object_cache_dir_from_env(),
+        )
+    ranking = rank_profiles(records, top=args.top)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(ranking, indent=2) + "\n", encoding="utf-8")
+    print(
+        f"Ranked {ranking['profiled_records']}/{ranking['metadata_records']} "
+        f"profiled cells into {args.output}."
+    )
+    for label in ("top_level_stages", "variables"):
+        print(f"\nSlowest {label.replace('_', ' ')} (total wall seconds):")
+        for item in ranking[label][:10]:
+            name = item.get("variable") or item.get("stage")
+            print(
+                f"  {name:<48} {item['total_wall_seconds']:>12.1f}s "
+                f"max {item['max_wall_seconds']:>9.1f}s"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
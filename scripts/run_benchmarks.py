@@ -0,0 +1,330 @@
+"""Time the scoring and build hot paths on synthetic datasets, offline.
+
+Generates deterministic enhanced-CPS-shaped datasets (``src/synthetic_datasets``)
+at each requested size, times each benchmarked entry point, appends the run to
+a JSON-lines history, and compares medians against a stored baseline:
+
+- ``calibrate_entropy_constraints`` -- the projection calibration solver;
+- ``aggregate_full_output_h5`` -- the post-H5 aggregator's weighted sums;
+- ``materialize_year_frame`` -- the projection pipeline's input frame build;
+- ``materialize_tob_revenue_pair`` -- the three-tax-state TOB pass;
+- ``compute_reform_result`` -- one static option1 reform score.
+
+Entry points whose dependencies (``policyengine_us``, ``microdf``) are not
+installed are recorded as skipped rather than failing the run. A benchmark
+regresses when its median exceeds the baseline median by more than
+``--threshold`` (and by more than the noise floor); the script exits 1 if any
+do. ``--update-baseline`` rewrites the baseline from this run.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import importlib.util
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+
+from src.synthetic_datasets import (  # noqa: E402
+    BENCHMARK_SIZES,
+    DEFAULT_SEED,
+    DEFAULT_YEAR,
+    entropy_calibration_problem,
+    write_full_output_h5,
+    write_policyengine_input_h5,
+)
+
+BENCHMARK_DIR = REPO / "tmp" / "benchmarks"
+DEFAULT_HISTORY = BENCHMARK_DIR / "history.jsonl"
+DEFAULT_BASELINE = BENCHMARK_DIR / "baseline.json"
+DATASET_DIR = BENCHMARK_DIR / "datasets"
+HISTORY_SCHEMA = "crfb_benchmark_run/v1"
+DEFAULT_THRESHOLD = 0.25
+NOISE_FLOOR_SECONDS = 0.05
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    requires: tuple[str, ...]
+    # Builds the timed callable for one size; setup cost is not timed.
+    prepare: Callable[[int, Path], Callable[[], Any]]
+
+
+def _input_dataset(n_households: int, dataset_dir: Path) -> Path:
+    path = dataset_dir / f"input-{n_households}-seed{DEFAULT_SEED}.h5"
+    if not path.exists():
+        write_policyengine_input_h5(path, n_households)
+    return path
+
+
+def _output_dataset(n_households: int, dataset_dir: Path) -> Path:
+    path = dataset_dir / f"full-output-{n_households}-seed{DEFAULT_SEED}.h5"
+    if not path.exists():
+        write_full_output_h5(path, n_households)
+    return path
+
+
+def _prepare_calibration(n_households: int, dataset_dir: Path) -> Callable[[], Any]:
+    del dataset_dir
+    from src.projection import calibrate_entropy_constraints
+
+    A, targets, weights = entropy_calibration_problem(n_households)
+    return lambda: calibrate_entropy_constraints(A, targets, weights)
+
+
+def _prepare_aggregate(n_households: int, dataset_dir: Path) -> Callable[[], Any]:
+    from scripts.aggregate_reform_full_h5_results import _aggregate_full_output_h5
+
+    path = _output_dataset(n_households, dataset_dir)
+    return lambda: _aggregate_full_output_h5(path)
+
+
+def _microsimulation(path: Path) -> Any:
+    from policyengine_us import Microsimulation
+
+    return Microsimulation(dataset=str(path))
+
+
+def _prepare_year_frame(n_households: int, dataset_dir: Path) -> Callable[[], Any]:
+    from src.pipeline import materialize_year_frame
+
+    path = _input_dataset(n_households, dataset_dir)
+    return lambda: materialize_year_frame(_microsimulation(path), DEFAULT_YEAR + 1)
+
+
+def _prepare_tob_pair(n_households: int, dataset_dir: Path) -> Callable[[], Any]:
+    from src.reform_full_h5_worker import materialize_tob_revenue_pair
+
+    path = _input_dataset(n_households, dataset_dir)
+    return lambda: materialize_tob_revenue_pair(
+        _microsimulation(path), year=DEFAULT_YEAR
+    )
+
+
+def _prepare_reform_result(n_households: int, dataset_dir: Path) -> Callable[[], Any]:
+    from src.year_runner import (
+        MODAL_EMPLOYER_NET_REFORMS,
+        compute_reform_result,
+        get_reform_lookups,
+        load_baseline,
+    )
+
+    path = _input_dataset(n_households, dataset_dir)
+    baseline = load_baseline(DEFAULT_YEAR, str(path))
+    reform_functions, behavioral_functions = get_reform_lookups()
+    return lambda: compute_reform_result(
+        reform_id="option1",
+        year=DEFAULT_YEAR,
+        scoring_type="static",
+        dataset_name=str(path),
+        baseline=baseline,
+        reform_functions=reform_functions,
+        behavioral_functions=behavioral_functions,
+        employer_net_reforms=MODAL_EMPLOYER_NET_REFORMS,
+    )
+
+
+BENCHMARKS = (
+    Benchmark("calibrate_entropy_constraints", (), _prepare_calibration),
+    Benchmark("aggregate_full_output_h5", ("microdf",), _prepare_aggregate),
+    Benchmark("materialize_year_frame", ("policyengine_us",), _prepare_year_frame),
+    Benchmark("materialize_tob_revenue_pair", ("policyengine_us",), _prepare_tob_pair),
+    Benchmark("compute_reform_result", ("policyengine_us",), _prepare_reform_result),
+)
+
+
+def _missing_modules(modules: tuple[str, ...]) -> list[str]:
+    return [module for module in modules if importlib.util.find_spec(module) is None]
+
+
+def time_benchmark(
+    benchmark: Benchmark,
+    *,
+    size: str,
+    n_households: int,
+    repeats: int,
+    dataset_dir: Path = DATASET_DIR,
+) -> dict[str, Any]:
+    record: dict[str, Any] = {
+        "benchmark": benchmark.name,
+        "size": size,
+        "households": n_households,
+    }
+    missing = _missing_modules(benchmark.requires)
+    if missing:
+        return {**record, "status": "skipped", "reason": f"missing {missing}"}
+    run = benchmark.prepare(n_households, dataset_dir)
+    seconds = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        run()
+        seconds.append(time.perf_counter() - started)
+    return {
+        **record,
+        "status": "ok",
+        "repeats": repeats,
+        "min_seconds": min(seconds),
+        "median_seconds": statistics.median(seconds),
+    }
+
+
+def _git_sha() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(
+    *,
+    names: list[str] | None = None,
+    sizes: list[str] | None = None,
+    repeats: int = 3,
+    dataset_dir: Path = DATASET_DIR,
+) -> dict[str, Any]:
+    selected = [
+        benchmark
+        for benchmark in BENCHMARKS
+        if names is None or benchmark.name in names
+    ]
+    results = [
+        time_benchmark(
+            benchmark,
+            size=size,
+            n_households=BENCHMARK_SIZES[size],
+            repeats=repeats,
+            dataset_dir=dataset_dir,
+        )
+        for size in sizes or list(BENCHMARK_SIZES)
+        for benchmark in selected
+    ]
+    return {
+        "schema": HISTORY_SCHEMA,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_sha": _git_sha(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": DEFAULT_SEED,
+        "results": results,
+    }
+
+
+def _result_key(result: dict[str, Any]) -> str:
+    return f"{result['benchmark']}@{result['size']}"
+
+
+def find_regressions(
+    run: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    noise_floor_seconds: float = NOISE_FLOOR_SECONDS,
+) -> list[dict[str, Any]]:
+    reference = {
+        _result_key(result): result
+        for result in baseline.get("results", [])
+        if result.get("status") == "ok"
+    }
+    regressions = []
+    for result in run["results"]:
+        previous = reference.get(_result_key(result))
+        if result.get("status") != "ok" or previous is None:
+            continue
+        current, before = result["median_seconds"], previous["median_seconds"]
+        if (
+            current > before * (1 + threshold)
+            and current - before > noise_floor_seconds
+        ):
+            regressions.append(
+                {
+                    "benchmark": result["benchmark"],
+                    "size": result["size"],
+                    "baseline_median_seconds": before,
+                    "median_seconds": current,
+                    "ratio": current / before if before else float("inf"),
+                }
+            )
+    return regressions
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--benchmark",
+        action="append",
+        choices=[benchmark.name for benchmark in BENCHMARKS],
+        help="Run only this benchmark (repeatable). Defaults to all.",
+    )
+    parser.add_argument(
+        "--size",
+        action="append",
+        choices=list(BENCHMARK_SIZES),
+        help="Run only this dataset size (repeatable). Defaults to all.",
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--dataset-dir", type=Path, default=DATASET_DIR)
+    parser.add_argument("--update-baseline", action="store_true")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    run = run_benchmarks(
+        names=args.benchmark,
+        sizes=args.size,
+        repeats=args.repeats,
+        dataset_dir=args.dataset_dir,
+    )
+    args.history.parent.mkdir(parents=True, exist_ok=True)
+    with args.history.open("a", encoding="utf-8") as history:
+        history.write(json.dumps(run, sort_keys=True) + "\n")
+
+    for result in run["results"]:
+        if result["status"] == "ok":
+            print(
+                f"{_result_key(result):<48} median {result['median_seconds']:9.4f}s "
+                f"min {result['min_seconds']:9.4f}s"
+            )
+        else:
+            print(f"{_result_key(result):<48} skipped ({result['reason']})")
+
+    regressions: list[dict[str, Any]] = []
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = find_regressions(run, baseline, threshold=args.threshold)
+        for item in regressions:
+            print(
+                f"REGRESSION {item['benchmark']}@{item['size']}: "
+                f"{item['baseline_median_seconds']:.4f}s -> "
+                f"{item['median_seconds']:.4f}s ({item['ratio']:.2f}x)"
+            )
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(run, indent=2) + "\n", encoding="utf-8")
+        print(f"wrote baseline {args.baseline}")
+        return 0
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,93 @@
+"""Score behavioral reforms over drawn labor-supply elasticities on one machine.
+
+Runs ``src/elasticity_monte_carlo`` over ``--reforms`` x ``--years`` x
+``--draws`` on household-sampled datasets and writes, under ``--output-dir``:
+
+- ``run.json`` -- the plan fingerprint; a rerun must match it;
+- ``baselines/<year>.json`` -- each year's sampled dataset and baseline;
+- ``draws.jsonl`` -- one reform result per finished ``(year, reform, draw)``;
+- ``bands.csv`` -- point estimate, mean and percentile bands per reform/year.
+
+Interrupted runs resume where they stopped; pass a larger ``--draws`` to add
+draws to a finished run. Each worker holds one microsimulation, so size
+``--workers`` to memory as well as cores. The bands are diagnostics on
+sampled data, not publishable results.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+
+from src.elasticity_monte_carlo import (  # noqa: E402
+    DEFAULT_PRIORS,
+    MonteCarloPlan,
+    load_priors,
+    run_monte_carlo,
+)
+from src.modal_batch_helpers import parse_years  # noqa: E402
+
+DEFAULT_OUTPUT_DIR = REPO / "tmp" / "elasticity_monte_carlo"
+DEFAULT_REFORMS = "option1,option2,option5,option8,option12"
+DEFAULT_YEARS = "2030,2050,2075,2100"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reforms", default=DEFAULT_REFORMS, help="Comma list")
+    parser.add_argument(
+        "--years", default=DEFAULT_YEARS, help="Comma list; A-B ranges allowed"
+    )
+    parser.add_argument("--draws", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sample-fraction", type=float, default=0.05)
+    parser.add_argument("--min-households", type=int, default=0)
+    parser.add_argument(
+        "--priors",
+        type=Path,
+        default=None,
+        help="JSON list of priors; default scales income 0-2x, substitution 0.5-1.5x",
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument(
+        "--share-datasets",
+        action="store_true",
+        help="Load each year's sampled dataset once into shared memory for all workers",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    plan = MonteCarloPlan(
+        reforms=tuple(
+            reform.strip() for reform in args.reforms.split(",") if reform.strip()
+        ),
+        years=tuple(sorted(set(parse_years(args.years)))),
+        draws=args.draws,
+        seed=args.seed,
+        sample_fraction=args.sample_fraction,
+        min_households=args.min_households,
+        priors=load_priors(args.priors) if args.priors else DEFAULT_PRIORS,
+    )
+    bands = run_monte_carlo(
+        plan,
+        args.output_dir,
+        workers=args.workers,
+        share_datasets=args.share_datasets,
+    )
+    print(
+        f"Scored {len(plan.cells())} cells (run {plan.fingerprint()}); "
+        f"{len(bands)} reform-year bands in {args.output_dir}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
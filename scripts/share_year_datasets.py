@@ -0,0 +1,59 @@
+"""Hold year datasets in shared memory for other local scoring processes.
+
+Publishes each ``--dataset`` H5 to a ``DatasetBroker`` and keeps it there
+until interrupted. Meanwhile any process started with the printed
+``CRFB_DATASET_BROKER_DIR`` builds its simulations on the shared copy
+rather than loading its own. That covers ``run_local_proof.py`` variants
+and diagnostics scripts alike. The segments are removed once this process
+and every attached process have exited.
+
+Usage:
+    uv run python scripts/share_year_datasets.py \
+        --dataset projected_datasets_v2/2026.h5
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import signal
+import sys
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+
+from src.dataset_broker import BROKER_DIR_ENV, DatasetBroker  # noqa: E402
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dataset", action="append", type=Path, required=True)
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=None,
+        help="Broker directory; defaults to /dev/shm/crfb_dataset_broker.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    with DatasetBroker(args.root) as broker:
+        for dataset in args.dataset:
+            handle = broker.publish(dataset)
+            print(
+                f"Shared {dataset} ({handle.nbytes / 1024**2:,.1f} MiB) "
+                f"as {handle.key}."
+            )
+        print(f"export {BROKER_DIR_ENV}={broker.root}")
+        print("Holding the shared copies; press Ctrl-C to release them.")
+        try:
+            signal.pause()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,286 @@
+"""Plan the fewest extra behavioral anchor cells that keep interpolation error bounded.
+
+Behavioral rows are exact only at a reform's anchor years; every other year
+is the static row times a behavioral/static ratio interpolated between the
+bracketing anchors (``behavioral_interpolation``). This module estimates,
+for every candidate pair of anchors, how far that interpolation could be
+from the truth, and picks per existing anchor segment the smallest set of
+extra anchor years that keeps every interior year within tolerance.
+
+The truth comes from a *reference* annual behavioral series:
+
+- ``sampled``: cheap sampled-dataset static and behavioral scores give a
+  ratio per year, applied to the published static row. The error is the
+  gap between that series and its ratio interpolation between the anchors.
+- ``curvature``: no new scores. The reference is the published behavioral
+  row, and the error compares two equally plausible smooth responses
+  between a pair of anchors. One is the published proportional path
+  (static x interpolated ratio). The other is an additive path (static
+  plus an interpolated behavioral offset). They coincide while the static
+  path is straight and the ratio steady, and separate as the static path
+  bends between the anchors, which is where the ad-hoc anchors
+  (option12@2062, option6@2033) ended up.
+
+Candidate years are years with an exact static full-H5 row, so a new anchor's
+ratio denominator is itself exact. A year's tolerance is ``max(abs_tolerance,
+rel_tolerance * |reference|)`` in the published units (billions). The output
+is a ``reform_id,year,scoring_type`` cells CSV, every row behavioral. Its
+``.metadata.json`` carries the same cells as a ``submit_cells`` key list
+(``year=Y/reform=R/scoring=behavioral,...``) ready for the full-H5
+submitter's ``--cells``, which otherwise defaults to static scoring.
+"""
+
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass
+import json
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+
+from .behavioral_interpolation import AnchorPanel, interpolate_panel
+from .reform_full_h5_contract import ReformCell
+
+
+PLAN_SCHEMA = "crfb_behavioral_anchor_plan/v1"
+METHODS = ("sampled", "curvature")
+DEFAULT_COLUMNS = ("revenue_impact", "tob_oasdi_impact", "tob_medicare_hi_impact")
+DEFAULT_ABS_TOLERANCE = 1.0
+DEFAULT_REL_TOLERANCE = 0.02
+
+
+@dataclass(frozen=True)
+class ReformSeries:
+    """One reform's annual series, ``years x columns``, in published units.
+
+    ``static`` is the published static row; ``reference`` the behavioral
+    estimate the interpolation is judged against (exact at ``anchors``).
+    ``candidates`` are the years a new anchor may be placed at.
+    """
+
+    reform: str
+    years: np.ndarray
+    columns: tuple[str, ...]
+    static: np.ndarray
+    reference: np.ndarray
+    anchors: tuple[int, ...]
+    candidates: tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class SegmentPlan:
+    reform: str
+    segment: tuple[int, int]
+    worst_year: int | None
+    error_ratio: float
+    added_years: tuple[int, ...]
+    residual_error_ratio: float
+
+    @property
+    def reachable(self) -> bool:
+        return self.residual_error_ratio <= 1.0
+
+
+def _interpolated(series: ReformSeries, left: int, right: int) -> np.ndarray:
+    """The publisher's ratio interpolation over ``years[left..right]``."""
+    window = slice(left, right + 1)
+    is_anchor = np.zeros((1, right - left + 1), dtype=bool)
+    is_anchor[0, [0, -1]] = True
+    panel = AnchorPanel(
+        reforms=(series.reform,),
+        years=series.years[window],
+        columns=series.columns,
+        static=series.static[None, window],
+        behavioral=series.reference[None, window],
+        is_anchor=is_anchor,
+    )
+    return interpolate_panel(panel).values[0]
+
+
+def _truth(series: ReformSeries, left: int, right: int, method: str) -> np.ndarray:
+    reference = series.reference[left : right + 1]
+    if method == "sampled":
+        return reference
+    static = series.static[left : right + 1]
+    offset = reference - static
+    weight = np.linspace(0.0, 1.0, right - left + 1)[:, None]
+    return static + offset[0] + (offset[-1] - offset[0]) * weight
+
+
+def segment_error_ratio(
+    series: ReformSeries,
+    left: int,
+    right: int,
+    *,
+    method: str,
+    abs_tolerance: float,
+    rel_tolerance: float,
+) -> tuple[float, int | None]:
+    """Worst ``error / tolerance`` over the years strictly inside a segment.
+
+    ``left`` and ``right`` index ``series.years``. Returns the ratio and the
+    year it occurs in; ``(0.0, None)`` for adjacent anchors.
+    """
+    if right - left < 2:
+        return 0.0, None
+    truth = _truth(series, left, right, method)
+    error = np.abs(_interpolated(series, left, right) - truth)[1:-1]
+    allowed = np.maximum(abs_tolerance, rel_tolerance * np.abs(truth[1:-1]))
+    ratio = np.where(np.isnan(error), np.inf, error / allowed).max(axis=1)
+    worst = int(np.argmax(ratio))
+    return float(ratio[worst]), int(series.years[left + 1 + worst])
+
+
+def plan_reform(
+    series: ReformSeries,
+    *,
+    method: str,
+    abs_tolerance: float = DEFAULT_ABS_TOLERANCE,
+    rel_tolerance: float = DEFAULT_REL_TOLERANCE,
+) -> list[SegmentPlan]:
+    """The fewest extra anchors per existing segment of one reform.
+
+    Within a segment this is a shortest path over candidate years: an edge
+    joins two candidates whose interpolation stays within tolerance, and
+    ties go to the plan with the smaller worst error. Consecutive
+    candidates are always joined, so a segment that cannot reach tolerance
+    gets every candidate and reports its residual error. A plan within
+    tolerance always beats one that is not, whatever their anchor counts.
+    """
+    if method not in METHODS:
+        raise ValueError(f"unknown method {method!r}; expected one of {METHODS}")
+    index = {int(year): position for position, year in enumerate(series.years)}
+    missing = sorted(set(series.anchors) - set(index))
+    if missing:
+        raise ValueError(f"{series.reform} anchors outside the series: {missing}")
+
+    cache: dict[tuple[int, int], tuple[float, int | None]] = {}
+
+    def ratio(left: int, right: int) -> tuple[float, int | None]:
+        if (left, right) not in cache:
+            cache[left, right] = segment_error_ratio(
+                series,
+                index[left],
+                index[right],
+                method=method,
+                abs_tolerance=abs_tolerance,
+                rel_tolerance=rel_tolerance,
+            )
+        return cache[left, right]
+
+    anchors = sorted(series.anchors)
+    plans = []
+    for left, right in zip(anchors, anchors[1:]):
+        nodes = [
+            left,
+            *sorted(year for year in series.candidates if left < year < right),
+            right,
+        ]
+        before, worst_year = ratio(left, right)
+        # best[j] = (over tolerance, extra anchors, worst ratio, previous node)
+        # reaching nodes[j]; a forced consecutive edge must not outrank a
+        # longer path that stays within tolerance.
+        best: list[tuple[bool, int, float, int] | None] = [None] * len(nodes)
+        best[0] = (False, 0, 0.0, -1)
+        for j in range(1, len(nodes)):
+            for i in range(j):
+                if best[i] is None:
+                    continue
+                edge, _ = ratio(nodes[i], nodes[j])
+                if edge > 1.0 and i != j - 1:
+                    continue
+                _, count, worst, _ = best[i]
+                worst = max(worst, edge)
+                option = (worst > 1.0, count + (1 if i > 0 else 0), worst, i)
+                if best[j] is None or option[:3] < best[j][:3]:
+                    best[j] = option
+        path, cursor = [], len(nodes) - 1
+        while cursor > 0:
+            cursor = best[cursor][3]
+            if cursor > 0:
+                path.append(nodes[cursor])
+        plans.append(
+            SegmentPlan(
+                reform=series.reform,
+                segment=(left, right),
+                worst_year=worst_year,
+                error_ratio=before,
+                added_years=tuple(sorted(path)),
+                residual_error_ratio=best[-1][2],
+            )
+        )
+    return plans
+
+
+def apply_budget(
+    plans: Sequence[SegmentPlan], max_cells: int | None
+) -> tuple[list[SegmentPlan], list[SegmentPlan]]:
+    """Keep whole segment proposals, worst first, while they fit ``max_cells``."""
+    proposed = [plan for plan in plans if plan.added_years]
+    if max_cells is None:
+        return proposed, []
+    kept, dropped, used = [], [], 0
+    for plan in sorted(proposed, key=lambda plan: -plan.error_ratio):
+        if used + len(plan.added_years) <= max_cells:
+            kept.append(plan)
+            used += len(plan.added_years)
+        else:
+            dropped.append(plan)
+    return kept, dropped
+
+
+def _plan_record(plan: SegmentPlan) -> dict[str, Any]:
+    return {
+        "reform_name": plan.reform,
+        "segment": list(plan.segment),
+        "worst_year": plan.worst_year,
+        "error_ratio": plan.error_ratio,
+        "added_years": list(plan.added_years),
+        "residual_error_ratio": plan.residual_error_ratio,
+        "tolerance_reachable": plan.reachable,
+    }
+
+
+def write_anchor_plan(
+    output_path: Path,
+    plans: Sequence[SegmentPlan],
+    *,
+    max_cells: int | None = None,
+    metadata: Mapping[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Write the cells CSV and its ``.metadata.json``; returns the metadata."""
+    kept, dropped = apply_budget(plans, max_cells)
+    cells = sorted(
+        {
+            ReformCell(year=year, reform=plan.reform, scoring_type="behavioral")
+            for plan in kept
+            for year in plan.added_years
+        }
+    )
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with output_path.open("w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=["reform_id", "year", "scoring_type"])
+        writer.writeheader()
+        writer.writerows(
+            {"reform_id": cell.reform, "year": cell.year, "scoring_type": "behavioral"}
+            for cell in cells
+        )
+    payload = {
+        "schema": PLAN_SCHEMA,
+        **dict(metadata or {}),
+        "max_cells": max_cells,
+        "cell_count": len(cells),
+        "submit_cells": ",".join(cell.key() for cell in cells),
+        "segments_over_tolerance": sum(plan.error_ratio > 1.0 for plan in plans),
+        "unreachable_segments": [
+            _plan_record(plan) for plan in plans if not plan.reachable
+        ],
+        "planned": [_plan_record(plan) for plan in kept],
+        "dropped_for_budget": [_plan_record(plan) for plan in dropped],
+    }
+    output_path.with_suffix(output_path.suffix + ".metadata.json").write_text(
+        json.dumps(payload, indent=2) + "\n", encoding="utf-8"
+    )
+    return payload
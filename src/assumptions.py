@@ -0,0 +1,221 @@
+"""One in-memory copy of each economic-assumptions table.
+
+The Trustees, SSA and CMS tables under ``data/`` are small but were reread
+and reparsed by every loader call, often once per year inside a loop. This
+module parses each file once per process into a year-indexed table of float
+arrays, keyed by path and file stat so an edited file is picked up, and
+records the SHA-256 of the exact bytes it parsed for provenance.
+
+- ``year_table(path)`` -- tables with one row per ``year``. ``YearTable.at``
+  looks up a column for many years at once; ``YearTable.span`` returns an
+  inclusive year range. Missing years raise ``KeyError``.
+- ``age_table(path)`` -- the long ``Year,Age,Total`` population file as a
+  ``years x ages`` matrix with ages above ``max_age`` folded into the top
+  slot.
+- ``loaded_sources()`` -- path and hash of every table parsed so far.
+
+Tables are shared between callers: treat the arrays as read-only and take
+``YearTable.frame()`` for a mutable copy.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+import hashlib
+import io
+from pathlib import Path
+from typing import Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DATA_DIR = REPO_ROOT / "data"
+
+TRUSTEES_AUX_FILE = DATA_DIR / "social_security_aux_tr2026.csv"
+POPULATION_FILE = DATA_DIR / "SSPopJul_TR2026_interim.csv"
+HI_EXPENDITURES_FILE = DATA_DIR / "hi_expenditures_tr2026.csv"
+SSA_ECONOMIC_PROJECTIONS_FILE = DATA_DIR / "ssa_economic_projections.csv"
+CURRENT_LAW_TOB_FILE = DATA_DIR / "tob_current_law_tr2025.csv"
+
+
+def _relative_to_repo(path: Path) -> str:
+    try:
+        return str(path.relative_to(REPO_ROOT))
+    except ValueError:
+        return str(path)
+
+
+@dataclass(frozen=True)
+class YearTable:
+    """A table with one row per year; every non-year column as ``float64``."""
+
+    source: str
+    sha256: str
+    years: np.ndarray
+    columns: Mapping[str, np.ndarray]
+
+    def _positions(self, years: Iterable[int] | np.ndarray) -> np.ndarray:
+        requested = np.atleast_1d(np.asarray(years, dtype=np.int64))
+        positions = np.clip(
+            np.searchsorted(self.years, requested), 0, len(self.years) - 1
+        )
+        missing = self.years[positions] != requested
+        if missing.any():
+            raise KeyError(
+                f"{self.source} has no year(s) "
+                f"{sorted(set(requested[missing].tolist()))}"
+            )
+        return positions
+
+    def column(self, name: str) -> np.ndarray:
+        if name not in self.columns:
+            raise KeyError(f"{self.source} has no column {name!r}")
+        return self.columns[name]
+
+    def at(self, column: str, years: Iterable[int] | np.ndarray) -> np.ndarray:
+        """``column`` for each of ``years``, in the order given."""
+        return self.column(column)[self._positions(years)]
+
+    def value(self, column: str, year: int) -> float:
+        return float(self.at(column, [year])[0])
+
+    def span(self, column: str, start: int, end: int) -> np.ndarray:
+        """``column`` for every year in ``[start, end]``; gaps raise."""
+        return self.at(column, np.arange(start, end + 1))
+
+    def __contains__(self, year: object) -> bool:
+        try:
+            self._positions([int(year)])
+        except (KeyError, TypeError, ValueError):
+            return False
+        return True
+
+    def frame(self) -> pd.DataFrame:
+        """A fresh ``year``-first DataFrame copy of the table."""
+        return pd.DataFrame(
+            {"year": self.years.copy()}
+            | {name: values.copy() for name, values in self.columns.items()}
+        )
+
+
+@dataclass(frozen=True)
+class AgeTable:
+    """Population by single year of age: ``totals[year_index, age]``."""
+
+    source: str
+    sha256: str
+    years: np.ndarray
+    ages: np.ndarray
+    totals: np.ndarray
+
+    def for_year(self, year: int) -> np.ndarray:
+        position = int(np.searchsorted(self.years, year))
+        if position >= len(self.years) or self.years[position] != year:
+            raise KeyError(f"{self.source} has no year {year}")
+        return self.totals[position]
+
+
+_SOURCES: dict[str, str] = {}
+
+
+@lru_cache(maxsize=None)
+def _read(resolved: str, mtime_ns: int, size: int) -> tuple[str, pd.DataFrame]:
+    del mtime_ns, size  # cache key only: a rewritten file is reparsed
+    payload = Path(resolved).read_bytes()
+    digest = hashlib.sha256(payload).hexdigest()
+    _SOURCES[resolved] = digest
+    return digest, pd.read_csv(io.BytesIO(payload))
+
+
+def _parsed(path: str | Path) -> tuple[str, str, pd.DataFrame]:
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    digest, frame = _read(str(resolved), stat.st_mtime_ns, stat.st_size)
+    return _relative_to_repo(resolved), digest, frame
+
+
+@lru_cache(maxsize=None)
+def _year_table(resolved: str, mtime_ns: int, size: int, year_column: str) -> YearTable:
+    source = _relative_to_repo(Path(resolved))
+    digest, frame = _read(resolved, mtime_ns, size)
+    if year_column not in frame.columns:
+        raise ValueError(f"{source} has no {year_column!r} column")
+    frame = frame.sort_values(year_column, kind="stable")
+    years = frame[year_column].to_numpy(dtype=np.int64)
+    duplicated = np.unique(years[1:][years[1:] == years[:-1]])
+    if duplicated.size:
+        raise ValueError(f"{source} has duplicate years: {duplicated.tolist()}")
+    columns = {}
+    for name in frame.columns:
+        if name == year_column:
+            continue
+        values = pd.to_numeric(frame[name], errors="coerce").to_numpy(float)
+        values.flags.writeable = False
+        columns[name] = values
+    years.flags.writeable = False
+    return YearTable(source=source, sha256=digest, years=years, columns=columns)
+
+
+def year_table(path: str | Path, *, year_column: str = "year") -> YearTable:
+    """The cached year-indexed table for ``path``.
+
+    Non-numeric cells become ``NaN``; duplicate years raise ``ValueError``.
+    """
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    return _year_table(str(resolved), stat.st_mtime_ns, stat.st_size, year_column)
+
+
+@lru_cache(maxsize=None)
+def _age_table(resolved: str, mtime_ns: int, size: int, max_age: int) -> AgeTable:
+    digest, frame = _read(resolved, mtime_ns, size)
+    capped = frame.assign(Age=frame["Age"].clip(upper=max_age))
+    matrix = capped.pivot_table(
+        index="Year", columns="Age", values="Total", aggfunc="sum", fill_value=0
+    ).reindex(columns=np.arange(max_age + 1), fill_value=0)
+    years = matrix.index.to_numpy(dtype=np.int64)
+    ages = np.arange(max_age + 1)
+    totals = matrix.to_numpy(dtype=float)
+    for array in (years, ages, totals):
+        array.flags.writeable = False
+    return AgeTable(
+        source=_relative_to_repo(Path(resolved)),
+        sha256=digest,
+        years=years,
+        ages=ages,
+        totals=totals,
+    )
+
+
+def age_table(path: str | Path = POPULATION_FILE, *, max_age: int = 85) -> AgeTable:
+    """The cached ``years x ages`` population matrix for a ``Year,Age,Total`` file."""
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    return _age_table(str(resolved), stat.st_mtime_ns, stat.st_size, max_age)
+
+
+def table_frame(path: str | Path) -> pd.DataFrame:
+    """A fresh copy of the cached raw parse of ``path``, columns as read."""
+    return _parsed(path)[2].copy()
+
+
+def table_sha256(path: str | Path) -> str:
+    return _parsed(path)[1]
+
+
+def loaded_sources() -> list[dict[str, str]]:
+    """``file``/``sha256`` for every table parsed in this process so far."""
+    return [
+        {"file": _relative_to_repo(Path(resolved)), "sha256": digest}
+        for resolved, digest in sorted(_SOURCES.items())
+    ]
+
+
+def clear_cache() -> None:
+    _read.cache_clear()
+    _year_table.cache_clear()
+    _age_table.cache_clear()
+    _SOURCES.clear()
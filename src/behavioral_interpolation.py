@@ -0,0 +1,248 @@
+"""Vectorized behavioral/static ratio interpolation between exact anchors.
+
+The behavioral display publishes exact behavioral full-H5 cells at a few
+anchor years per reform and fills the other years by interpolating the
+behavioral/static ratio linearly between consecutive anchors. This module
+does that for a whole ``reform x year x column`` panel at once:
+
+- an anchor ratio is ``behavioral / static``; a (near) zero static value
+  gives ``1.0`` when the behavioral value is (near) zero too and ``NaN``
+  otherwise, which is recorded as an ``endpoint_absolute_value_fallback``;
+- a segment whose static anchors have opposite signs, or with a ``NaN``
+  anchor ratio, interpolates the behavioral values directly instead, and a
+  sign flip is recorded once per segment as
+  ``sign_flip_segment_value_interpolation``;
+- comparisons against ``NaN`` are false, so a missing static value behaves
+  like a zero denominator and a missing behavioral value propagates.
+
+Fallback records come back in the order the per-year publisher loop emitted
+them (reform, year, column, then left anchor, right anchor, sign flip),
+including the per-interior-year repeats of an anchor's fallback, so the
+published metadata does not change.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, MutableMapping
+
+import numpy as np
+
+ZERO_STATIC_TOLERANCE = 1e-9
+STRUCTURAL_TOLERANCE = 1e-6
+ENDPOINT_FALLBACK = "endpoint_absolute_value_fallback"
+SIGN_FLIP_FALLBACK = "sign_flip_segment_value_interpolation"
+
+TOB_TOTAL_COMPONENTS = {
+    "tob_total_impact": ("tob_oasdi_impact", "tob_medicare_hi_impact"),
+}
+NET_GAIN_LOSS_COMPONENTS = {
+    "oasdi_net_impact": ("oasdi_gain", "oasdi_loss"),
+    "hi_net_impact": ("hi_gain", "hi_loss"),
+}
+GAIN_LOSS_COLUMNS = ("oasdi_gain", "oasdi_loss", "hi_gain", "hi_loss")
+
+
+@dataclass(frozen=True)
+class AnchorPanel:
+    """Static and exact behavioral values on a ``reform x year x column`` grid.
+
+    ``behavioral`` is only read where ``is_anchor`` is set; ``years`` must be
+    ascending.
+    """
+
+    reforms: tuple[str, ...]
+    years: np.ndarray
+    columns: tuple[str, ...]
+    static: np.ndarray
+    behavioral: np.ndarray
+    is_anchor: np.ndarray
+
+    def __post_init__(self) -> None:
+        shape = (len(self.reforms), len(self.years), len(self.columns))
+        if self.static.shape != shape or self.behavioral.shape != shape:
+            raise ValueError(
+                f"static {self.static.shape} and behavioral "
+                f"{self.behavioral.shape} must both be {shape}"
+            )
+        if self.is_anchor.shape != shape[:2]:
+            raise ValueError(f"is_anchor {self.is_anchor.shape} must be {shape[:2]}")
+        if len(self.years) > 1 and not bool(np.all(np.diff(self.years) > 0)):
+            raise ValueError("years must be strictly ascending")
+
+
+@dataclass(frozen=True)
+class PanelInterpolation:
+    """Interpolated values and the bracketing anchor index of every cell."""
+
+    values: np.ndarray
+    left: np.ndarray
+    right: np.ndarray
+    fallbacks: list[dict[str, Any]]
+
+
+def endpoint_ratios(
+    static: np.ndarray, behavioral: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Behavioral/static ratios and the mask of cells that fell back to NaN."""
+    usable = np.abs(static) > ZERO_STATIC_TOLERANCE
+    both_zero = ~usable & (np.abs(behavioral) <= ZERO_STATIC_TOLERANCE)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = np.where(usable, behavioral / np.where(usable, static, 1.0), np.nan)
+    ratios = np.where(both_zero, 1.0, ratios)
+    return ratios, ~usable & ~both_zero
+
+
+def bracketing_anchors(is_anchor: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Indices of the nearest anchor at or before / at or after each year.
+
+    Anchor years bracket themselves. Raises ``ValueError`` when a year has no
+    anchor on one side.
+    """
+    n_years = is_anchor.shape[-1]
+    positions = np.arange(n_years)
+    left = np.maximum.accumulate(np.where(is_anchor, positions, -1), axis=-1)
+    right = np.flip(
+        np.minimum.accumulate(
+            np.flip(np.where(is_anchor, positions, n_years), axis=-1), axis=-1
+        ),
+        axis=-1,
+    )
+    unbracketed = (left < 0) | (right >= n_years)
+    if bool(unbracketed.any()):
+        reform, year = np.argwhere(unbracketed)[0]
+        raise ValueError(
+            f"year index {int(year)} of reform index {int(reform)} "
+            "has no behavioral anchor on one side"
+        )
+    return left, right
+
+
+def interpolate_panel(panel: AnchorPanel) -> PanelInterpolation:
+    """Fill every non-anchor cell of ``panel`` from its bracketing anchors."""
+    left, right = bracketing_anchors(panel.is_anchor)
+    ratios, fallback = endpoint_ratios(panel.static, panel.behavioral)
+    interior = ~panel.is_anchor
+
+    def at(values: np.ndarray, index: np.ndarray) -> np.ndarray:
+        return np.take_along_axis(values, index[..., None], axis=1)
+
+    years = np.asarray(panel.years)
+    left_years = years[left]
+    span = years[right] - left_years
+    weight = ((years - left_years) / np.where(span == 0, 1, span))[..., None]
+
+    left_static, right_static = at(panel.static, left), at(panel.static, right)
+    left_value, right_value = at(panel.behavioral, left), at(panel.behavioral, right)
+    left_ratio, right_ratio = at(ratios, left), at(ratios, right)
+
+    sign_flip = left_static * right_static < 0
+    by_value = sign_flip | np.isnan(left_ratio) | np.isnan(right_ratio)
+    with np.errstate(invalid="ignore"):
+        value_path = left_value + (right_value - left_value) * weight
+        ratio_path = panel.static * (left_ratio + (right_ratio - left_ratio) * weight)
+    values = np.where(
+        panel.is_anchor[..., None],
+        panel.behavioral,
+        np.where(by_value, value_path, ratio_path),
+    )
+
+    events = (
+        interior[..., None] & at(fallback, left),
+        interior[..., None] & at(fallback, right),
+        interior[..., None] & sign_flip & (years == left_years + 1)[..., None],
+    )
+    return PanelInterpolation(
+        values=values,
+        left=left,
+        right=right,
+        fallbacks=_fallback_records(panel, left, right, events),
+    )
+
+
+def _fallback_records(
+    panel: AnchorPanel,
+    left: np.ndarray,
+    right: np.ndarray,
+    events: tuple[np.ndarray, np.ndarray, np.ndarray],
+) -> list[dict[str, Any]]:
+    hits = [
+        np.column_stack([*np.nonzero(mask), np.full(int(mask.sum()), kind)])
+        for kind, mask in enumerate(events)
+    ]
+    found = np.concatenate(hits)
+    found = found[np.lexsort(found.T[::-1])]
+
+    records: list[dict[str, Any]] = []
+    for reform, year, column, kind in found.tolist():
+        left_year = int(panel.years[left[reform, year]])
+        right_year = int(panel.years[right[reform, year]])
+        if kind == 2:
+            records.append(
+                {
+                    "reform_name": panel.reforms[reform],
+                    "segment": [left_year, right_year],
+                    "column": panel.columns[column],
+                    "method": SIGN_FLIP_FALLBACK,
+                }
+            )
+            continue
+        anchor = left[reform, year] if kind == 0 else right[reform, year]
+        records.append(
+            {
+                "reform_name": panel.reforms[reform],
+                "year": int(panel.years[anchor]),
+                "column": panel.columns[column],
+                "static_value": float(panel.static[reform, anchor, column]),
+                "behavioral_value": float(panel.behavioral[reform, anchor, column]),
+                "method": ENDPOINT_FALLBACK,
+            }
+        )
+    return records
+
+
+def structural_reforms(gain_loss: np.ndarray, is_anchor: np.ndarray) -> np.ndarray:
+    """Reforms whose exact anchors carry a gain/loss decomposition.
+
+    ``gain_loss`` is ``reform x year x column`` over the gain/loss columns the
+    anchors have; only anchor years are considered.
+    """
+    large = np.abs(gain_loss) > STRUCTURAL_TOLERANCE
+    return (large & is_anchor[..., None]).any(axis=(1, 2))
+
+
+def derive_interior_identities(
+    columns: MutableMapping[str, np.ndarray],
+    *,
+    interior: np.ndarray,
+    structural: np.ndarray,
+) -> list[str]:
+    """Rebuild the dependent columns on interior years, in place.
+
+    Only the primitive series are interpolated; the TOB total and, for the
+    structural reforms, the net = gain - loss identity are derived from them
+    so interpolated rows satisfy the identities the exact anchors do. Other
+    reforms carry their TOB impacts in the net columns and keep gains and
+    losses at zero, so their nets are left alone. A derived column missing
+    from ``columns`` is added as ``NaN`` outside the rows it covers. Returns
+    the derived column names.
+    """
+    shape = interior.shape
+    rules = [
+        (target, np.add, parts, interior)
+        for target, parts in TOB_TOTAL_COMPONENTS.items()
+    ]
+    rules += [
+        (target, np.subtract, parts, interior & structural[:, None])
+        for target, parts in NET_GAIN_LOSS_COMPONENTS.items()
+    ]
+    derived: list[str] = []
+    for target, combine, (first, second), rows in rules:
+        if first not in columns or second not in columns or not bool(rows.any()):
+            continue
+        current = columns.get(target, np.full(shape, np.nan))
+        columns[target] = np.where(
+            rows, combine(columns[first], columns[second]), current
+        )
+        derived.append(target)
+    return derived
@@ -0,0 +1,170 @@
+"""Warm starts carried from one projection year's calibration to the next.
+
+``build_year`` runs several solves per year:
+
+- the Stage B demographic entropy reweight;
+- the payroll bisection for alpha;
+- the taxation-of-benefits probe search for gamma, one Microsimulation per
+  probe;
+- the Stage D final entropy calibration.
+
+Each started from scratch in every year, although adjacent years have
+nearly identical targets and weights. A ``CalibrationChain`` threaded
+through consecutive ``build_year`` calls carries each solve's answer
+forward as the next year's starting point:
+
+- The entropy duals are kept per stage, with the constraint names they
+  belong to. A dual is offered only to a solve with the same constraints
+  (Stage D gains the income guards partway through a run).
+  ``calibrate_entropy_constraints`` uses it only when it starts closer to
+  feasibility than its own least-squares start, and it retries cold if
+  the warm solve does not converge.
+- alpha brackets the next payroll bisection.
+- gamma, and the elasticity implied by the last two probes, seed the next
+  probe search only with ``seed_gamma``.
+- beta is closed form (target over current benefits) and is only
+  recorded.
+
+The entropy and alpha solves reach the same answer from either start,
+within solver tolerance. The gamma search is best-effort by design and may
+stop at a different gamma inside ``GAMMA_TOLERANCE``. A seeded year's
+dataset would then depend on which years came before it in the run, so
+gamma seeding is opt-in and each year's metadata records the seeds it was
+given. Work saved is measured against the most recent cold solve of each
+stage. It is an estimate, since a cold solve of the same year is never run.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Sequence
+
+import numpy as np
+
+
+@dataclass
+class DualSeed:
+    names: tuple[str, ...]
+    dual: np.ndarray
+    year: int
+
+
+@dataclass
+class CalibrationChain:
+    """Mutable warm-start state for consecutive ``build_year`` calls."""
+
+    seed_gamma: bool = False
+    previous_year: int | None = None
+    duals: dict[str, DualSeed] = field(default_factory=dict)
+    alpha: float | None = None
+    beta: float | None = None
+    gamma: float | None = None
+    gamma_elasticity: float | None = None
+    cold_reference: dict[str, int] = field(default_factory=dict)
+    history: list[dict[str, Any]] = field(default_factory=list)
+
+    def dual_for(self, stage: str, names: Sequence[str]) -> np.ndarray | None:
+        seed = self.duals.get(stage)
+        if seed is None or seed.names != tuple(names):
+            return None
+        return seed.dual
+
+    def gamma_seed(self) -> dict[str, float]:
+        """Keyword seeds for the gamma probe search; empty unless opted in."""
+        if not self.seed_gamma or self.gamma is None:
+            return {}
+        seed = {"initial_gamma": self.gamma}
+        if self.gamma_elasticity is not None:
+            seed["initial_elasticity"] = self.gamma_elasticity
+        return seed
+
+    def record_solve(
+        self, year: int, stage: str, work: int, *, warm: bool
+    ) -> dict[str, Any]:
+        """Log one solve's work (iterations, evaluations or probes)."""
+        reference = self.cold_reference.get(stage)
+        if not warm:
+            self.cold_reference[stage] = work
+        record = {
+            "year": year,
+            "stage": stage,
+            "warm": warm,
+            "work": work,
+            "cold_reference": reference if warm else work,
+            "estimated_work_saved": (
+                reference - work if warm and reference is not None else 0
+            ),
+        }
+        self.history.append(record)
+        return record
+
+    def advance(
+        self,
+        year: int,
+        *,
+        duals: dict[str, tuple[Sequence[str], np.ndarray]],
+        alpha: float,
+        beta: float,
+        gamma: float,
+        gamma_probes: Sequence[dict[str, float]],
+    ) -> None:
+        """Store ``year``'s solutions as the next year's starting points."""
+        self.previous_year = year
+        for stage, (names, dual) in duals.items():
+            self.duals[stage] = DualSeed(
+                names=tuple(names), dual=np.asarray(dual, dtype=float), year=year
+            )
+        self.alpha = float(alpha)
+        self.beta = float(beta)
+        self.gamma = float(gamma)
+        elasticity = implied_elasticity(gamma_probes)
+        if elasticity is not None:
+            self.gamma_elasticity = elasticity
+
+    def seeds(self) -> dict[str, Any]:
+        """The starting points on offer, for the year's metadata."""
+        return {
+            "previous_year": self.previous_year,
+            "seed_gamma": self.seed_gamma,
+            "alpha": self.alpha,
+            "beta": self.beta,
+            "gamma": self.gamma,
+            "gamma_elasticity": self.gamma_elasticity,
+            "dual_stages": {
+                stage: {"year": seed.year, "constraint_count": len(seed.names)}
+                for stage, seed in sorted(self.duals.items())
+            },
+        }
+
+    def summary(self) -> dict[str, Any]:
+        by_stage: dict[str, dict[str, int]] = {}
+        for record in self.history:
+            stage = by_stage.setdefault(
+                record["stage"], {"solves": 0, "warm": 0, "estimated_work_saved": 0}
+            )
+            stage["solves"] += 1
+            stage["warm"] += int(record["warm"])
+            stage["estimated_work_saved"] += record["estimated_work_saved"]
+        return by_stage
+
+
+def implied_elasticity(probes: Sequence[dict[str, float]]) -> float | None:
+    """Log-log slope of total TOB in gamma over the last two probes.
+
+    Mirrors the refinement inside the gamma search, including its
+    plausibility band, so a noisy pair never seeds the next year.
+    """
+    if len(probes) < 2:
+        return None
+    first, last = probes[-2], probes[-1]
+    if not (
+        first["total_tob"] > 0
+        and last["total_tob"] > 0
+        and first["gamma"] != last["gamma"]
+    ):
+        return None
+    value = float(
+        np.log(last["total_tob"] / first["total_tob"])
+        / np.log(last["gamma"] / first["gamma"])
+    )
+    return value if 0.2 < value < 6 else None
@@ -0,0 +1,258 @@
+"""Stage checkpoints for full-H5 reform cells, so a preempted cell resumes.
+
+A cell's expensive stages are, in order:
+
+- the TOB revenue pair (three income-tax passes);
+- each output entity table;
+- the written ``scenario.h5``.
+
+When a container was preempted or timed out, all of them were lost and
+the paid cell reran from scratch. ``CellCheckpoint`` persists each stage as
+it completes to a directory keyed by ``checkpoint_key``. That key is a
+hash of everything that determines the cell's output: cell, dataset,
+code, runtime and output manifest. A rerun of the same computation finds
+the directory, and a changed input finds an empty one.
+
+Every stage file is written to a temporary name, hashed and renamed into
+place, and only then recorded in ``manifest.json``, itself replaced
+atomically. A stage is reused only if its file still hashes to the
+recorded SHA-256. A torn or corrupted stage is dropped and recomputed.
+``events`` records what was saved, resumed and discarded for the cell
+metadata.
+
+On Modal the checkpoint root lives on the results volume. Pass the
+volume's ``commit`` as ``commit`` so a stage survives a preempted
+container.
+
+Setting ``CRFB_FULL_H5_CHECKPOINT_CRASH_AFTER`` to a stage name (for
+example ``tob_pair`` or ``entity:person``) SIGKILLs the process right after
+that stage is saved. That makes preemption reproducible locally.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from datetime import datetime, timezone
+import hashlib
+import json
+import os
+from pathlib import Path
+import shutil
+import signal
+import tempfile
+from typing import Any, Callable, Mapping
+
+import numpy as np
+
+
+CHECKPOINT_SCHEMA = "crfb_full_h5_cell_checkpoint/v1"
+CHECKPOINT_DIRNAME = "reform_full_h5_checkpoints"
+CRASH_AFTER_ENV = "CRFB_FULL_H5_CHECKPOINT_CRASH_AFTER"
+
+
+def checkpoint_key(identity: Mapping[str, Any]) -> str:
+    """SHA-256 of the canonical JSON of a cell's computation identity."""
+    payload = json.dumps(identity, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stage_filename(stage: str) -> str:
+    return stage.replace(":", "__").replace("/", "_") + ".npz"
+
+
+def crash_point(stage: str) -> None:
+    """Kill the process here if ``CRASH_AFTER_ENV`` names ``stage``."""
+    if os.environ.get(CRASH_AFTER_ENV) == stage:
+        os.kill(os.getpid(), signal.SIGKILL)
+
+
+def _storable(name: str, value: Any) -> np.ndarray:
+    array = np.asarray(value)
+    if array.dtype != object:
+        return array
+    if not all(isinstance(item, str) for item in array.flat):
+        raise TypeError(f"Checkpoint array {name!r} holds non-string objects.")
+    return array.astype(str)
+
+
+class CellCheckpoint:
+    """Completed stages of one cell's computation."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        key: str,
+        *,
+        identity: Mapping[str, Any] | None = None,
+        commit: Callable[[], None] | None = None,
+    ) -> None:
+        self.directory = Path(root) / key
+        self.key = key
+        self.identity = dict(identity or {})
+        self._commit = commit
+        self.events: list[dict[str, Any]] = []
+        self._manifest = self._read_manifest()
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.directory / "manifest.json"
+
+    def _read_manifest(self) -> dict[str, Any]:
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            manifest = None
+        if (
+            not isinstance(manifest, dict)
+            or manifest.get("schema") != CHECKPOINT_SCHEMA
+            or manifest.get("key") != self.key
+            or not isinstance(manifest.get("stages"), dict)
+        ):
+            return {
+                "schema": CHECKPOINT_SCHEMA,
+                "key": self.key,
+                "identity": self.identity,
+                "stages": {},
+            }
+        return manifest
+
+    def _write_manifest(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=self.directory, delete=False
+        ) as temp:
+            json.dump(self._manifest, temp, indent=2, sort_keys=True)
+            temp.write("\n")
+        os.replace(temp.name, self.manifest_path)
+        if self._commit is not None:
+            self._commit()
+
+    def _event(self, stage: str, action: str, **details: Any) -> None:
+        self.events.append({"stage": stage, "action": action, **details})
+
+    @property
+    def stages(self) -> list[str]:
+        return list(self._manifest["stages"])
+
+    def _discard(self, stage: str, reason: str) -> None:
+        record = self._manifest["stages"].pop(stage, None)
+        if record and record.get("file") and record.get("owned", True):
+            with contextlib.suppress(OSError):
+                (self.directory / record["file"]).unlink()
+        self._write_manifest()
+        self._event(stage, "discarded", reason=reason)
+
+    def _verified(self, stage: str) -> tuple[Path, dict[str, Any]] | None:
+        record = self._manifest["stages"].get(stage)
+        if record is None:
+            return None
+        path = (
+            Path(record["path"])
+            if "path" in record
+            else self.directory / record["file"]
+        )
+        if not path.exists():
+            self._discard(stage, "file missing")
+            return None
+        actual = _file_sha256(path)
+        if actual != record["sha256"]:
+            self._discard(stage, f"sha256 {actual} != recorded {record['sha256']}")
+            return None
+        return path, record
+
+    def save_arrays(
+        self,
+        stage: str,
+        arrays: Mapping[str, np.ndarray],
+        meta: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Persist named arrays (no pickled objects) and ``meta`` for ``stage``.
+
+        Object arrays of strings, such as enum outputs, are stored as
+        fixed-width unicode so ``load_arrays`` can read them without pickle.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        filename = _stage_filename(stage)
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, prefix=f".{filename}.", suffix=".npz", delete=False
+        ) as temp:
+            np.savez(
+                temp, **{name: _storable(name, value) for name, value in arrays.items()}
+            )
+        temp_path = Path(temp.name)
+        sha256 = _file_sha256(temp_path)
+        os.replace(temp_path, self.directory / filename)
+        self._record(stage, {"file": filename, "sha256": sha256}, meta)
+        crash_point(stage)
+
+    def load_arrays(
+        self, stage: str
+    ) -> tuple[dict[str, np.ndarray], dict[str, Any]] | None:
+        verified = self._verified(stage)
+        if verified is None:
+            return None
+        path, record = verified
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+        except (OSError, ValueError) as error:
+            self._discard(stage, f"unreadable: {type(error).__name__}")
+            return None
+        self._event(stage, "resumed")
+        return arrays, dict(record.get("meta") or {})
+
+    def save_file(
+        self, stage: str, path: str | Path, meta: Mapping[str, Any] | None = None
+    ) -> None:
+        """Record an output file written elsewhere (it is not copied)."""
+        path = Path(path)
+        self._record(
+            stage,
+            {"path": str(path), "sha256": _file_sha256(path), "owned": False},
+            meta,
+        )
+        crash_point(stage)
+
+    def load_file(self, stage: str) -> tuple[Path, dict[str, Any]] | None:
+        verified = self._verified(stage)
+        if verified is None:
+            return None
+        path, record = verified
+        self._event(stage, "resumed")
+        return path, dict(record.get("meta") or {})
+
+    def _record(
+        self, stage: str, location: dict[str, Any], meta: Mapping[str, Any] | None
+    ) -> None:
+        self._manifest["stages"][stage] = {
+            **location,
+            "saved_at": datetime.now(timezone.utc).isoformat(),
+            "meta": dict(meta or {}),
+        }
+        self._write_manifest()
+        self._event(stage, "saved")
+
+    def clear(self) -> None:
+        """Remove the checkpoint once the cell's artifacts are durable."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        if self._commit is not None:
+            self._commit()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "schema": CHECKPOINT_SCHEMA,
+            "key": self.key,
+            "directory": str(self.directory),
+            "resumed_stages": [
+                event["stage"] for event in self.events if event["action"] == "resumed"
+            ],
+            "events": list(self.events),
+        }
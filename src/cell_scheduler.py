@@ -0,0 +1,387 @@
+"""Resource tiers and launch order for full-H5 panel submissions.
+
+``submit_reform_full_h5`` used to launch every cell with one container size:
+4 CPUs, 64 GiB and a six-hour timeout. Early static cells need a fraction
+of that, while late-horizon behavioral cells can outgrow it. This module
+learns per-cell resource needs from earlier cells' ``metadata.json``. It
+uses ``duration_seconds``, plus the profiler's ``peak_rss_bytes`` where it
+was recorded. From that it builds a launch plan:
+
+- A cell that has run before is predicted from its own worst observation.
+- Other cells use a per-scoring-type log-linear trend in year, shifted by
+  the median residual of the cell's reform when that reform has history.
+- Each cell gets the smallest tier whose memory and timeout cover the
+  prediction with headroom. Cells with no usable history, or no recorded
+  peak RSS, keep at least the default tier's memory.
+- Cells are ordered longest predicted duration first, with unknown
+  durations at the front. The slowest cells therefore start while the
+  queue still has work to overlap with them.
+
+The plan records a predicted cost per cell, the uniform-default cost it
+replaces and, given a concurrency, the predicted makespan. The uniform cost
+leaves out the reruns of cells that outgrow the default tier, so it can
+come out lower than the plan's. The CPU count
+is the same in every default tier, so durations learned at 4 CPUs stay
+valid.
+
+``TieredSpawner`` applies a tier to one spawn through the function's
+``with_options``. Tests drive it with a fake function object. The module
+imports only the standard library, because the Modal submitter imports it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import heapq
+import json
+import math
+from pathlib import Path
+import statistics
+from typing import Any, Callable, Iterable, Mapping, Sequence, TypeVar
+
+from .reform_full_h5_contract import ReformCell
+
+
+PLAN_SCHEMA = "crfb_full_h5_launch_plan/v1"
+MEMORY_HEADROOM = 1.25
+TIMEOUT_HEADROOM = 1.5
+DEFAULT_TIER_NAME = "standard"
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ResourceTier:
+    name: str
+    cpu: float
+    memory_mb: int
+    timeout_seconds: int
+
+    @property
+    def memory_bytes(self) -> int:
+        return self.memory_mb * 1024 * 1024
+
+    def cost_per_second(
+        self, *, cpu_core_second_price: float, memory_gib_second_price: float
+    ) -> float:
+        return (
+            self.cpu * cpu_core_second_price
+            + self.memory_mb / 1024 * memory_gib_second_price
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, value: Mapping[str, Any]) -> "ResourceTier":
+        return cls(
+            name=str(value["name"]),
+            cpu=float(value["cpu"]),
+            memory_mb=int(value["memory_mb"]),
+            timeout_seconds=int(value["timeout_seconds"]),
+        )
+
+
+DEFAULT_TIERS = (
+    ResourceTier("small", cpu=4, memory_mb=16384, timeout_seconds=2 * 3600),
+    ResourceTier("medium", cpu=4, memory_mb=32768, timeout_seconds=4 * 3600),
+    ResourceTier("standard", cpu=4, memory_mb=65536, timeout_seconds=6 * 3600),
+    ResourceTier("large", cpu=4, memory_mb=131072, timeout_seconds=12 * 3600),
+)
+
+
+@dataclass(frozen=True)
+class CellObservation:
+    cell: ReformCell
+    duration_seconds: float | None
+    peak_rss_bytes: int | None
+
+
+@dataclass(frozen=True)
+class CellPrediction:
+    duration_seconds: float | None
+    peak_rss_bytes: float | None
+    basis: str
+
+
+def observations_from_metadata(
+    records: Iterable[Mapping[str, Any]],
+) -> list[CellObservation]:
+    """Read cells' durations and peak RSS from metadata or cost records.
+
+    Accepts whole ``metadata.json`` payloads (peak RSS inside ``profile``)
+    and the flattened records of ``collect_completed_metadata``.
+    """
+    observations = []
+    for record in records:
+        if not (record.get("reform_id") or record.get("reform")):
+            continue
+        try:
+            cell = ReformCell.from_any(record)
+        except (KeyError, TypeError, ValueError):
+            continue
+        duration = record.get("duration_seconds")
+        peak_rss = record.get("peak_rss_bytes")
+        if peak_rss is None and isinstance(record.get("profile"), Mapping):
+            peak_rss = record["profile"].get("peak_rss_bytes")
+        observations.append(
+            CellObservation(
+                cell=cell,
+                duration_seconds=(
+                    float(duration) if isinstance(duration, (int, float)) else None
+                ),
+                peak_rss_bytes=int(peak_rss) if isinstance(peak_rss, int) else None,
+            )
+        )
+    return observations
+
+
+@dataclass(frozen=True)
+class _LogTrend:
+    intercept: float
+    slope: float
+    reform_offsets: dict[str, float]
+
+    @classmethod
+    def fit(cls, points: Sequence[tuple[int, str, float]]) -> "_LogTrend | None":
+        points = [point for point in points if point[2] > 0]
+        if not points:
+            return None
+        years = [float(year) for year, _, _ in points]
+        values = [math.log(value) for _, _, value in points]
+        mean_year = statistics.fmean(years)
+        mean_value = statistics.fmean(values)
+        spread = sum((year - mean_year) ** 2 for year in years)
+        slope = (
+            sum(
+                (year - mean_year) * (value - mean_value)
+                for year, value in zip(years, values)
+            )
+            / spread
+            if spread > 0
+            else 0.0
+        )
+        intercept = mean_value - slope * mean_year
+        residuals: dict[str, list[float]] = {}
+        for (_, reform, _), year, value in zip(points, years, values):
+            residuals.setdefault(str(reform), []).append(
+                value - (intercept + slope * year)
+            )
+        return cls(
+            intercept=intercept,
+            slope=slope,
+            reform_offsets={
+                reform: statistics.median(items) for reform, items in residuals.items()
+            },
+        )
+
+    def predict(self, year: int, reform: str) -> float:
+        return math.exp(
+            self.intercept + self.slope * year + self.reform_offsets.get(reform, 0.0)
+        )
+
+
+class ResourceModel:
+    """Per-cell duration and peak-RSS predictions learned from history."""
+
+    def __init__(self, observations: Sequence[CellObservation]) -> None:
+        self.observation_count = len(observations)
+        self._observed: dict[ReformCell, tuple[float | None, float | None]] = {}
+        for observation in observations:
+            duration, peak_rss = self._observed.get(observation.cell, (None, None))
+            self._observed[observation.cell] = (
+                _max_present(duration, observation.duration_seconds),
+                _max_present(peak_rss, observation.peak_rss_bytes),
+            )
+        self._duration_trends: dict[str, _LogTrend | None] = {}
+        self._rss_trends: dict[str, _LogTrend | None] = {}
+        for scoring_type in {cell.scoring_type for cell in self._observed}:
+            cells = [
+                (cell, values)
+                for cell, values in self._observed.items()
+                if cell.scoring_type == scoring_type
+            ]
+            self._duration_trends[scoring_type] = _LogTrend.fit(
+                [(c.year, c.reform, v[0]) for c, v in cells if v[0] is not None]
+            )
+            self._rss_trends[scoring_type] = _LogTrend.fit(
+                [(c.year, c.reform, v[1]) for c, v in cells if v[1] is not None]
+            )
+
+    def predict(self, cell: ReformCell) -> CellPrediction:
+        duration, peak_rss = self._observed.get(cell, (None, None))
+        if duration is not None:
+            return CellPrediction(duration, peak_rss, "observed")
+        duration_trend = self._duration_trends.get(cell.scoring_type)
+        if duration_trend is None:
+            return CellPrediction(None, None, "no_history")
+        rss_trend = self._rss_trends.get(cell.scoring_type)
+        return CellPrediction(
+            duration_trend.predict(cell.year, cell.reform),
+            rss_trend.predict(cell.year, cell.reform) if rss_trend else None,
+            "trend",
+        )
+
+
+def _max_present(first: float | None, second: float | None) -> float | None:
+    present = [value for value in (first, second) if value is not None]
+    return max(present) if present else None
+
+
+def select_tier(
+    prediction: CellPrediction,
+    tiers: Sequence[ResourceTier] = DEFAULT_TIERS,
+    *,
+    default_tier: str = DEFAULT_TIER_NAME,
+) -> tuple[ResourceTier, bool]:
+    """The smallest tier covering ``prediction``, and whether any tier did."""
+    default = next(tier for tier in tiers if tier.name == default_tier)
+    if prediction.duration_seconds is None:
+        return default, True
+    needed_memory = (
+        prediction.peak_rss_bytes * MEMORY_HEADROOM
+        if prediction.peak_rss_bytes is not None
+        else default.memory_bytes
+    )
+    needed_timeout = prediction.duration_seconds * TIMEOUT_HEADROOM
+    ordered = sorted(tiers, key=lambda tier: (tier.memory_mb, tier.timeout_seconds))
+    for tier in ordered:
+        if (
+            tier.memory_bytes >= needed_memory
+            and tier.timeout_seconds >= needed_timeout
+        ):
+            return tier, True
+    return ordered[-1], False
+
+
+def predicted_makespan_seconds(durations: Sequence[float], concurrency: int) -> float:
+    """Finish time of ``durations`` started in order on ``concurrency`` slots."""
+    slots = [0.0] * max(1, concurrency)
+    for duration in durations:
+        heapq.heappush(slots, heapq.heappop(slots) + duration)
+    return max(slots)
+
+
+def build_launch_plan(
+    cells: Sequence[ReformCell],
+    model: ResourceModel,
+    *,
+    cpu_core_second_price: float,
+    memory_gib_second_price: float,
+    tiers: Sequence[ResourceTier] = DEFAULT_TIERS,
+    default_tier: str = DEFAULT_TIER_NAME,
+    concurrency: int | None = None,
+) -> dict[str, Any]:
+    prices = {
+        "cpu_core_second_price": cpu_core_second_price,
+        "memory_gib_second_price": memory_gib_second_price,
+    }
+    default = next(tier for tier in tiers if tier.name == default_tier)
+    entries = []
+    for cell in cells:
+        prediction = model.predict(cell)
+        tier, fits = select_tier(prediction, tiers, default_tier=default_tier)
+        duration = prediction.duration_seconds
+        entries.append(
+            {
+                **cell.to_ledger(),
+                "cell": cell.key(),
+                "tier": tier.to_dict(),
+                "fits_tier": fits,
+                "basis": prediction.basis,
+                "predicted_duration_seconds": duration,
+                "predicted_peak_rss_bytes": prediction.peak_rss_bytes,
+                "predicted_cost_usd": (
+                    None
+                    if duration is None
+                    else duration * tier.cost_per_second(**prices)
+                ),
+                "uniform_cost_usd": (
+                    None
+                    if duration is None
+                    else duration * default.cost_per_second(**prices)
+                ),
+            }
+        )
+    # Longest first; cells without a prediction go to the front because they
+    # may be the longest of all.
+    entries.sort(
+        key=lambda entry: (
+            entry["predicted_duration_seconds"] is not None,
+            -(entry["predicted_duration_seconds"] or 0.0),
+        )
+    )
+    for position, entry in enumerate(entries):
+        entry["launch_order"] = position
+
+    predicted = [entry for entry in entries if entry["predicted_cost_usd"] is not None]
+    plan = {
+        "schema": PLAN_SCHEMA,
+        "history_observations": model.observation_count,
+        "tiers": [tier.to_dict() for tier in tiers],
+        "default_tier": default_tier,
+        "memory_headroom": MEMORY_HEADROOM,
+        "timeout_headroom": TIMEOUT_HEADROOM,
+        **prices,
+        "cells": entries,
+        "cells_without_history": sum(
+            entry["basis"] == "no_history" for entry in entries
+        ),
+        "cells_exceeding_largest_tier": [
+            entry["cell"] for entry in entries if not entry["fits_tier"]
+        ],
+        "tier_counts": {
+            tier.name: sum(entry["tier"]["name"] == tier.name for entry in entries)
+            for tier in tiers
+        },
+        "predicted_cost_usd": sum(entry["predicted_cost_usd"] for entry in predicted),
+        "uniform_cost_usd": sum(entry["uniform_cost_usd"] for entry in predicted),
+        "concurrency": concurrency,
+        "predicted_makespan_seconds": None,
+    }
+    if concurrency and not plan["cells_without_history"]:
+        plan["predicted_makespan_seconds"] = predicted_makespan_seconds(
+            [entry["predicted_duration_seconds"] for entry in entries], concurrency
+        )
+    return plan
+
+
+def load_launch_plan(path: str | Path) -> dict[str, Any]:
+    plan = json.loads(Path(path).read_text(encoding="utf-8"))
+    if plan.get("schema") != PLAN_SCHEMA:
+        raise ValueError(f"{path} is not a {PLAN_SCHEMA} launch plan.")
+    return plan
+
+
+def planned_tiers(plan: Mapping[str, Any]) -> dict[str, ResourceTier]:
+    return {
+        str(entry["cell"]): ResourceTier.from_dict(entry["tier"])
+        for entry in plan["cells"]
+    }
+
+
+def order_by_plan(
+    items: Sequence[T], plan: Mapping[str, Any], *, key: Callable[[T], str]
+) -> list[T]:
+    """``items`` in launch order; items the plan does not name go last."""
+    order = {str(entry["cell"]): entry["launch_order"] for entry in plan["cells"]}
+    return sorted(items, key=lambda item: order.get(key(item), len(order)))
+
+
+class TieredSpawner:
+    """Calls a Modal function with per-call tier resources."""
+
+    def __init__(self, function: Any) -> None:
+        self.function = function
+
+    def function_for(self, tier: ResourceTier | None) -> Any:
+        if tier is None:
+            return self.function
+        return self.function.with_options(
+            cpu=tier.cpu,
+            memory=tier.memory_mb,
+            timeout=tier.timeout_seconds,
+        )
+
+    def spawn(self, payload: Any, tier: ResourceTier | None = None) -> Any:
+        return self.function_for(tier).spawn(payload)
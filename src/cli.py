@@ -1,14 +1,45 @@
 from __future__ import annotations
 
 import argparse
+from dataclasses import dataclass
+import importlib
 import sys
+from typing import Any, Callable
 
-from . import (
-    dashboard_baseline_assumptions,
-    reform_full_h5_artifacts,
-    repro_bundle_cli,
-    selected_cells,
-)
+# Subcommand modules are imported only when their command is dispatched, so
+# ``crfb-tob <command>`` pays for the pandas / policyengine stack only when
+# that command needs it. ``tests/test_cli_import_budget.py`` enforces this.
+
+
+@dataclass(frozen=True)
+class Command:
+    module: str
+    help: str
+
+
+COMMANDS = {
+    "write-repro-bundle": Command(
+        "repro_bundle_cli",
+        "Write a reproducibility bundle without launching Modal.",
+    ),
+    "build-dashboard-baseline-assumptions": Command(
+        "dashboard_baseline_assumptions",
+        "Build public dashboard baseline assumption and audit artifacts.",
+    ),
+    "write-selected-cells": Command(
+        "selected_cells",
+        "Write the selected CRFB long-run reform/year cells CSV.",
+    ),
+    "reform-full-h5-artifacts": Command(
+        "reform_full_h5_artifacts",
+        "Inspect and validate CRFB full reform H5 artifacts.",
+    ),
+}
+
+
+def _command_main(name: str) -> Callable[[list[str]], Any]:
+    module = importlib.import_module(f"{__package__}.{COMMANDS[name].module}")
+    return module.main
 
 
 def _run_dashboard_baseline_assumptions(
@@ -21,34 +52,23 @@ def _run_dashboard_baseline_assumptions(
     if args.policyengine_us_path is not None:
         forwarded.extend(["--policyengine-us-path", str(args.policyengine_us_path)])
     forwarded.extend(remaining)
-    return dashboard_baseline_assumptions.main(forwarded)
+    return _command_main("build-dashboard-baseline-assumptions")(forwarded)
 
 
 def main(argv: list[str] | None = None) -> int:
     if argv is None:
         argv = sys.argv[1:]
-    command_handlers = {
-        "write-repro-bundle": repro_bundle_cli.main,
-        "build-dashboard-baseline-assumptions": dashboard_baseline_assumptions.main,
-        "write-selected-cells": selected_cells.main,
-        "reform-full-h5-artifacts": reform_full_h5_artifacts.main,
-    }
-    if argv and argv[0] in command_handlers:
-        return command_handlers[argv[0]](argv[1:])
+    if argv and argv[0] in COMMANDS:
+        return _command_main(argv[0])(argv[1:])
 
     parser = argparse.ArgumentParser(prog="crfb-tob")
     subparsers = parser.add_subparsers(dest="command", required=True)
+    subcommands = {
+        name: subparsers.add_parser(name, help=command.help)
+        for name, command in COMMANDS.items()
+    }
 
-    repro_parser = subparsers.add_parser(
-        "write-repro-bundle",
-        help="Write a reproducibility bundle without launching Modal.",
-    )
-    repro_parser.set_defaults(handler=repro_bundle_cli.main)
-
-    baseline_parser = subparsers.add_parser(
-        "build-dashboard-baseline-assumptions",
-        help="Build public dashboard baseline assumption and audit artifacts.",
-    )
+    baseline_parser = subcommands["build-dashboard-baseline-assumptions"]
     baseline_parser.add_argument(
         "--metadata-root",
         action="append",
@@ -71,19 +91,7 @@ def main(argv: list[str] | None = None) -> int:
         handler_accepts_namespace=True,
     )
 
-    selected_cells_parser = subparsers.add_parser(
-        "write-selected-cells",
-        help="Write the selected CRFB long-run reform/year cells CSV.",
-    )
-    selected_cells_parser.set_defaults(handler=selected_cells.main)
-
-    reform_full_h5_parser = subparsers.add_parser(
-        "reform-full-h5-artifacts",
-        help="Inspect and validate CRFB full reform H5 artifacts.",
-    )
-    reform_full_h5_parser.set_defaults(handler=reform_full_h5_artifacts.main)
-
     args, remaining = parser.parse_known_args(argv)
     if getattr(args, "handler_accepts_namespace", False):
         return args.handler(args, remaining)
-    return args.handler(remaining)
+    return _command_main(args.command)(remaining)
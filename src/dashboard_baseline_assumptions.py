@@ -11,6 +11,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable
 
+import numpy as np
 import pandas as pd
 
 
@@ -19,6 +20,11 @@ WORKSPACE = REPO.parent
 if str(REPO) not in sys.path:
     sys.path.insert(0, str(REPO))
 
+from src.parameter_timeline import (
+    float_timelines,
+    parameter_timeline,
+    verify_timeline,
+)
 from src.tob_baseline import (
     GENERATED_BASELINE_MANIFEST_PATH,
     validate_tob_baseline_manifest,
@@ -555,83 +561,90 @@ def _build_trustees_parameters(policyengine_us_path: Path | None = None):
 def build_indexed_parameter_tables(
     module,
     parameters=None,
+    *,
+    verify: bool = False,
 ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     parameters = parameters or _build_trustees_parameters()
+    years = list(YEAR_RANGE)
 
-    parameter_rows: list[dict[str, Any]] = []
+    indexed: list[tuple[str, str, Any]] = []
     seen: set[str] = set()
     for group_id, group_label, root in _group_roots(parameters):
         for parameter in _module_iter_updatable_parameters(module, root):
             if parameter.name in seen:
                 continue
             seen.add(parameter.name)
-            metadata = getattr(parameter, "metadata", {})
-            uprating = metadata.get("uprating")
-            for year in range(2026, 2101):
-                parameter_rows.append(
-                    {
-                        "parameter_group": group_id,
-                        "parameter_group_label": group_label,
-                        "parameter_name": parameter.name,
-                        "parameter_label": _short_parameter_label(parameter.name),
-                        "uprating_parameter": _as_uprating_name(uprating),
-                        "rounding": _rounding_label(uprating),
-                        "year": year,
-                        "value": float(parameter(f"{year}-01-01")),
-                    }
-                )
+            indexed.append((group_id, group_label, parameter))
 
-    long = pd.DataFrame(parameter_rows)
+    timelines = float_timelines([parameter for _, _, parameter in indexed], years)
+    if verify:
+        for (_, _, parameter), values in zip(indexed, timelines.values):
+            verify_timeline(parameter, years, values.tolist())
 
-    summary_rows: list[dict[str, Any]] = []
-    for parameter_name, group in long.groupby("parameter_name", sort=False):
-        first = group.iloc[0]
-        values = {
-            int(row.year): float(row.value)
-            for row in group.itertuples(index=False)
-            if int(row.year) in SPOTLIGHT_YEARS
-        }
-        value_2026 = values[2026]
-        value_2100 = values[2100]
-        summary_rows.append(
+    identity = pd.DataFrame(
+        [
             {
-                "parameter_group": first["parameter_group"],
-                "parameter_group_label": first["parameter_group_label"],
-                "parameter_name": parameter_name,
-                "parameter_label": first["parameter_label"],
-                "uprating_parameter": first["uprating_parameter"],
-                "rounding": first["rounding"],
-                **{f"value_{year}": values[year] for year in SPOTLIGHT_YEARS},
-                "growth_2026_to_2100_pct": (
-                    (value_2100 / value_2026 - 1) * 100 if value_2026 else 0
+                "parameter_group": group_id,
+                "parameter_group_label": group_label,
+                "parameter_name": parameter.name,
+                "parameter_label": _short_parameter_label(parameter.name),
+                "uprating_parameter": _as_uprating_name(
+                    getattr(parameter, "metadata", {}).get("uprating")
+                ),
+                "rounding": _rounding_label(
+                    getattr(parameter, "metadata", {}).get("uprating")
                 ),
             }
-        )
+            for group_id, group_label, parameter in indexed
+        ],
+        columns=[
+            "parameter_group",
+            "parameter_group_label",
+            "parameter_name",
+            "parameter_label",
+            "uprating_parameter",
+            "rounding",
+        ],
+    )
 
-    summary = pd.DataFrame(summary_rows)
+    long = identity.loc[identity.index.repeat(len(years))].reset_index(drop=True)
+    long["year"] = np.tile(np.asarray(years, dtype=np.int64), len(indexed))
+    long["value"] = timelines.values.reshape(-1)
+
+    spotlight = timelines.at(SPOTLIGHT_YEARS)
+    first, last = timelines.at([2026])[:, 0], timelines.at([2100])[:, 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth_pct = np.where(first != 0, (last / first - 1) * 100, 0.0)
+    summary = identity.copy()
+    for position, year in enumerate(SPOTLIGHT_YEARS):
+        summary[f"value_{year}"] = spotlight[:, position]
+    summary["growth_2026_to_2100_pct"] = growth_pct
 
-    growth_rows = []
     default_uprating = _get_parameter_by_name(parameters, "gov.irs.uprating")
     nawi = _get_parameter_by_name(parameters, "gov.ssa.nawi")
-    for year in range(2026, 2101):
-        if year < 2035:
-            growth_multiplier = float(default_uprating(f"{year}-01-01")) / float(
-                default_uprating(f"{year - 1}-01-01")
-            )
-            source = "PolicyEngine default IRS uprating"
-        else:
-            growth_multiplier = float(nawi(f"{year - 1}-01-01")) / float(
-                nawi(f"{year - 2}-01-01")
-            )
-            source = "SSA Trustees average-wage growth"
-        growth_rows.append(
-            {
-                "year": year,
-                "indexing_source": source,
-                "growth_rate_pct": (growth_multiplier - 1) * 100,
-            }
-        )
-    growth = pd.DataFrame(growth_rows)
+    index_years = np.asarray(years, dtype=np.int64)
+    uprating = np.array(
+        parameter_timeline(default_uprating, range(years[0] - 1, years[-1] + 1)),
+        dtype=float,
+    )
+    wages = np.array(
+        parameter_timeline(nawi, range(years[0] - 2, years[-1])), dtype=float
+    )
+    trustees = index_years >= 2035
+    growth_multiplier = np.where(
+        trustees, wages[1:] / wages[:-1], uprating[1:] / uprating[:-1]
+    )
+    growth = pd.DataFrame(
+        {
+            "year": index_years,
+            "indexing_source": np.where(
+                trustees,
+                "SSA Trustees average-wage growth",
+                "PolicyEngine default IRS uprating",
+            ),
+            "growth_rate_pct": (growth_multiplier - 1) * 100,
+        }
+    )
 
     return long, summary, growth
 
@@ -1032,6 +1045,18 @@ def _parameter_value(parameters, parameter_name: str, year: int) -> Any:
         return None
 
 
+def _parameter_values(
+    parameters, parameter_name: str, years: Iterable[int]
+) -> list[Any]:
+    """``_parameter_value`` for every year, from one read of the schedule."""
+    years = list(years)
+    try:
+        parameter = _get_parameter_by_name(parameters, parameter_name)
+        return parameter_timeline(parameter, years)
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return [_parameter_value(parameters, parameter_name, year) for year in years]
+
+
 def _static_reform_dict_functions():
     from src import reforms
 
@@ -1084,8 +1109,9 @@ def build_reform_parameter_tables(parameters) -> tuple[pd.DataFrame, pd.DataFram
 
     baseline_rows: list[dict[str, Any]] = []
     for parameter_name, metadata in sorted(touched.items()):
-        for year in YEAR_RANGE:
-            baseline_value = _parameter_value(parameters, parameter_name, year)
+        for year, baseline_value in zip(
+            YEAR_RANGE, _parameter_values(parameters, parameter_name, YEAR_RANGE)
+        ):
             baseline_rows.append(
                 {
                     "year": year,
@@ -1133,6 +1159,14 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
             "the installed policyengine-us package is used."
         ),
     )
+    parser.add_argument(
+        "--verify-parameter-timelines",
+        action="store_true",
+        help=(
+            "Check every indexed-parameter timeline value against a direct "
+            "per-year parameter call before writing outputs."
+        ),
+    )
     return parser.parse_args(argv)
 
 
@@ -1140,6 +1174,7 @@ def write_outputs(
     metadata_roots: Iterable[Path] | None = None,
     *,
     policyengine_us_path: Path | None = None,
+    verify_parameter_timelines: bool = False,
 ) -> None:
     _ensure_import_paths(policyengine_us_path)
     module_path, module = _load_tax_assumption_module()
@@ -1157,6 +1192,7 @@ def write_outputs(
     indexed_long, indexed_summary, growth = build_indexed_parameter_tables(
         module,
         parameters,
+        verify=verify_parameter_timelines,
     )
     calibration_targets = build_calibration_targets(
         baseline,
@@ -1272,7 +1308,11 @@ def write_outputs(
 
 def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv)
-    write_outputs(args.metadata_root, policyengine_us_path=args.policyengine_us_path)
+    write_outputs(
+        args.metadata_root,
+        policyengine_us_path=args.policyengine_us_path,
+        verify_parameter_timelines=args.verify_parameter_timelines,
+    )
     return 0
 
 
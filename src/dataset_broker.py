@@ -0,0 +1,351 @@
+"""Share one copy of a year's input dataset between local scoring processes.
+
+Every ``Microsimulation`` built from a year H5 reads the whole file into
+private arrays. Several local processes scoring the same year each hold
+their own copy: ``run_local_proof.py`` variants, diagnostics scripts,
+Monte Carlo pool workers. Memory then runs out long before cores do.
+
+A ``DatasetBroker`` reads a year H5 once into a single flat file in shared
+memory (``/dev/shm`` where it exists), with a JSON layout of where each
+``variable/period`` array starts. A process attaches by mapping that file
+read-only. Its arrays are views into the mapping, so every process shares
+the same physical pages.
+
+- Segments are keyed by the source file's real path, size and mtime. Any
+  process can look a path up with ``attach_published`` without being given
+  a handle. A rebuilt dataset gets a new segment.
+- Publishing is atomic and idempotent: two brokers publishing the same file
+  end up sharing one segment.
+- Each attachment, and the publishing broker itself, holds a reference file
+  named after its PID. References of dead processes are ignored. Whoever
+  drops the last live reference removes the segment. Already-mapped views
+  stay valid after that, because unlinking a mapped file does not unmap it.
+- A publisher can ``release`` a year once nothing more will read it. Each
+  process keeps at most one ``attach_published`` attachment, so moving on
+  to another year drops its reference to the last one.
+
+With ``CRFB_DATASET_BROKER_DIR`` set, ``engine.dataset_microsimulation``
+attaches to a published copy of its dataset when there is one.
+"""
+
+from __future__ import annotations
+
+import atexit
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import shutil
+import tempfile
+from typing import Any
+import uuid
+
+import numpy as np
+
+
+BROKER_SCHEMA = "crfb_shared_dataset/v1"
+BROKER_DIR_ENV = "CRFB_DATASET_BROKER_DIR"
+LAYOUT_NAME = "layout.json"
+DATA_NAME = "data.bin"
+REFS_DIRNAME = "refs"
+ALIGNMENT = 64
+
+_ATTACHED: dict[tuple[str, str], "SharedDataset"] = {}
+
+
+def default_broker_root() -> Path:
+    configured = os.environ.get(BROKER_DIR_ENV)
+    if configured:
+        return Path(configured)
+    shm = Path("/dev/shm")
+    base = shm if shm.is_dir() else Path(tempfile.gettempdir())
+    return base / "crfb_dataset_broker"
+
+
+def dataset_key(path: str | Path) -> str:
+    """Key of a dataset file's current contents (path, size and mtime)."""
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    identity = {
+        "path": str(resolved),
+        "size_bytes": int(stat.st_size),
+        "mtime_ns": int(stat.st_mtime_ns),
+    }
+    encoded = json.dumps(identity, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:24]
+
+
+@dataclass(frozen=True)
+class SharedDatasetHandle:
+    """Picklable pointer to a published dataset, for passing to workers."""
+
+    root: str
+    key: str
+    source_path: str
+    nbytes: int
+    time_period: str | None
+
+    @property
+    def segment_dir(self) -> Path:
+        return Path(self.root) / self.key
+
+    @classmethod
+    def from_layout(
+        cls, root: str | Path, layout: dict[str, Any]
+    ) -> "SharedDatasetHandle":
+        return cls(
+            root=str(root),
+            key=layout["key"],
+            source_path=layout["source_path"],
+            nbytes=int(layout["nbytes"]),
+            time_period=layout["time_period"],
+        )
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def live_refcount(segment_dir: str | Path) -> int:
+    refs = Path(segment_dir) / REFS_DIRNAME
+    if not refs.is_dir():
+        return 0
+    count = 0
+    for ref in refs.iterdir():
+        pid = ref.name.split("-", maxsplit=1)[0]
+        if pid.isdigit() and _pid_alive(int(pid)):
+            count += 1
+    return count
+
+
+def _add_ref(segment_dir: Path) -> Path:
+    ref = segment_dir / REFS_DIRNAME / f"{os.getpid()}-{uuid.uuid4().hex}"
+    ref.touch()
+    return ref
+
+
+def _release_ref(segment_dir: Path, ref: Path) -> None:
+    ref.unlink(missing_ok=True)
+    if live_refcount(segment_dir) == 0:
+        shutil.rmtree(segment_dir, ignore_errors=True)
+
+
+def _read_h5_arrays(path: Path) -> dict[str, dict[str, np.ndarray]]:
+    import h5py
+
+    arrays: dict[str, dict[str, np.ndarray]] = {}
+    with h5py.File(path, "r") as store:
+        for variable, group in store.items():
+            if not isinstance(group, h5py.Group):
+                continue
+            for period, dataset in group.items():
+                values = dataset[()]
+                if values.dtype == object:
+                    values = values.astype("S")
+                arrays.setdefault(variable, {})[period] = np.ascontiguousarray(values)
+    return arrays
+
+
+def _write_segment(
+    directory: Path, arrays: dict[str, dict[str, np.ndarray]]
+) -> tuple[list[dict[str, Any]], int]:
+    entries: list[dict[str, Any]] = []
+    offset = 0
+    for variable, periods in arrays.items():
+        for period, values in periods.items():
+            offset = -(-offset // ALIGNMENT) * ALIGNMENT
+            entries.append(
+                {
+                    "variable": variable,
+                    "period": period,
+                    "dtype": values.dtype.str,
+                    "shape": list(values.shape),
+                    "offset": offset,
+                    "nbytes": int(values.nbytes),
+                }
+            )
+            offset += values.nbytes
+    with (directory / DATA_NAME).open("wb") as data:
+        for entry, values in zip(
+            entries,
+            (values for periods in arrays.values() for values in periods.values()),
+        ):
+            data.seek(entry["offset"])
+            data.write(values.tobytes())
+        data.truncate(offset)
+    return entries, offset
+
+
+class DatasetBroker:
+    """Publishes year datasets into shared memory and owns them until closed."""
+
+    def __init__(self, root: str | Path | None = None) -> None:
+        self.root = Path(root) if root is not None else default_broker_root()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._owned: dict[str, tuple[SharedDatasetHandle, Path]] = {}
+
+    def publish(self, path: str | Path) -> SharedDatasetHandle:
+        source = Path(path).resolve()
+        key = dataset_key(source)
+        if key in self._owned:
+            return self._owned[key][0]
+        segment_dir = self.root / key
+        if not (segment_dir / LAYOUT_NAME).exists():
+            staging = self.root / f".{key}.{uuid.uuid4().hex}.tmp"
+            (staging / REFS_DIRNAME).mkdir(parents=True)
+            entries, nbytes = _write_segment(staging, _read_h5_arrays(source))
+            periods = sorted({entry["period"] for entry in entries})
+            layout = {
+                "schema": BROKER_SCHEMA,
+                "key": key,
+                "source_path": str(source),
+                "nbytes": nbytes,
+                "time_period": periods[0] if len(periods) == 1 else None,
+                "arrays": entries,
+            }
+            (staging / LAYOUT_NAME).write_text(
+                json.dumps(layout, indent=2) + "\n", encoding="utf-8"
+            )
+            try:
+                staging.rename(segment_dir)
+            except OSError:
+                # Another broker published the same file first; share its copy.
+                shutil.rmtree(staging, ignore_errors=True)
+        layout = json.loads((segment_dir / LAYOUT_NAME).read_text(encoding="utf-8"))
+        handle = SharedDatasetHandle.from_layout(self.root, layout)
+        self._owned[key] = (handle, _add_ref(segment_dir))
+        return handle
+
+    def release(self, handle: SharedDatasetHandle) -> None:
+        """Drop this broker's reference; the last live reference removes it."""
+        owned = self._owned.pop(handle.key, None)
+        if owned is not None:
+            _release_ref(owned[0].segment_dir, owned[1])
+
+    def refcount(self, handle: SharedDatasetHandle) -> int:
+        return live_refcount(handle.segment_dir)
+
+    def close(self) -> None:
+        for handle, ref in self._owned.values():
+            _release_ref(handle.segment_dir, ref)
+        self._owned.clear()
+
+    def __enter__(self) -> "DatasetBroker":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class SharedDataset:
+    """Read-only ``variable -> period -> array`` views of a published dataset."""
+
+    def __init__(self, handle: SharedDatasetHandle) -> None:
+        self.handle = handle
+        segment_dir = handle.segment_dir
+        if not (segment_dir / LAYOUT_NAME).exists():
+            raise FileNotFoundError(
+                f"Shared dataset {handle.key} is no longer published under "
+                f"{handle.root}."
+            )
+        self._ref: Path | None = _add_ref(segment_dir)
+        layout = json.loads((segment_dir / LAYOUT_NAME).read_text(encoding="utf-8"))
+        buffer = (
+            np.memmap(segment_dir / DATA_NAME, dtype=np.uint8, mode="r")
+            if layout["nbytes"]
+            else np.zeros(0, dtype=np.uint8)
+        )
+        self.arrays: dict[str, dict[str, np.ndarray]] = {}
+        for entry in layout["arrays"]:
+            start = entry["offset"]
+            values = (
+                buffer[start : start + entry["nbytes"]]
+                .view(np.dtype(entry["dtype"]))
+                .reshape(entry["shape"])
+            )
+            self.arrays.setdefault(entry["variable"], {})[entry["period"]] = values
+
+    def load_dataset(self) -> dict[str, dict[str, np.ndarray]]:
+        return self.arrays
+
+    def policyengine_dataset(self) -> Any:
+        """A ``policyengine_core`` dataset whose inputs are these shared views."""
+        from policyengine_core.data import Dataset
+
+        shared = self
+
+        class _SharedYearDataset(Dataset):
+            name = f"shared_{shared.handle.key}"
+            label = f"Shared copy of {Path(shared.handle.source_path).name}"
+            data_format = Dataset.TIME_PERIOD_ARRAYS
+            file_path = shared.handle.source_path
+            time_period = shared.handle.time_period
+
+            def load_dataset(self) -> dict[str, dict[str, np.ndarray]]:
+                return shared.load_dataset()
+
+        return _SharedYearDataset()
+
+    def close(self) -> None:
+        if self._ref is not None:
+            _release_ref(self.handle.segment_dir, self._ref)
+            self._ref = None
+
+    def __enter__(self) -> "SharedDataset":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def attach(handle: SharedDatasetHandle) -> SharedDataset:
+    return SharedDataset(handle)
+
+
+def attach_published(
+    path: str | Path, *, root: str | Path | None = None
+) -> SharedDataset | None:
+    """This process's attachment to ``path``'s published copy, if any.
+
+    Without ``root``, only looks when ``CRFB_DATASET_BROKER_DIR`` is set. The
+    attachment is cached until the process asks for another dataset, or
+    exits; views already handed out stay valid after it is dropped.
+    """
+    if root is None:
+        if not os.environ.get(BROKER_DIR_ENV):
+            return None
+        root = default_broker_root()
+    try:
+        key = dataset_key(path)
+    except (TypeError, FileNotFoundError, NotADirectoryError):
+        return None
+    cache_key = (str(Path(root).resolve()), key)
+    for other in [other for other in _ATTACHED if other != cache_key]:
+        _ATTACHED.pop(other).close()
+    shared = _ATTACHED.get(cache_key)
+    if shared is not None and shared._ref is not None:
+        return shared
+    layout_path = Path(root) / key / LAYOUT_NAME
+    if not layout_path.exists():
+        return None
+    layout = json.loads(layout_path.read_text(encoding="utf-8"))
+    try:
+        shared = attach(SharedDatasetHandle.from_layout(root, layout))
+    except FileNotFoundError:
+        return None
+    _ATTACHED[cache_key] = shared
+    return shared
+
+
+@atexit.register
+def _release_attached() -> None:
+    for shared in _ATTACHED.values():
+        shared.close()
+    _ATTACHED.clear()
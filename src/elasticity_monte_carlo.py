@@ -0,0 +1,583 @@
+"""Monte Carlo bands on behavioral scores over uncertain labor-supply elasticities.
+
+Behavioral scoring applies the single point estimates in
+``reforms.CBO_ELASTICITIES``. This engine instead draws elasticity vectors
+from configurable priors, scores every ``(year, reform, draw)`` cell on a
+household-sampled dataset, and reports percentile bands on the impacts:
+
+- each ``ElasticityPrior`` matches one parameter path or a path prefix and
+  draws a single multiplier per draw that scales every matched point
+  estimate, so e.g. the substitution elasticities move together and keep
+  their decile profile; unmatched parameters stay at their point estimates;
+- draw ``d`` of a plan uses ``default_rng([seed, d])``, so a draw's
+  elasticities do not depend on how many draws are requested or which ran
+  first; draw 0 is the point estimate itself;
+- every year's sampled dataset and baseline are built once and shared by all
+  of that year's draws and reforms;
+- cells run in a process pool and are appended to ``draws.jsonl`` as they
+  finish. Rerunning with the same plan skips finished cells. Raising
+  ``draws`` extends a run; changing anything else is refused.
+
+Results are sampled-dataset diagnostics, not publishable rows; production
+behavioral cells still go through ``modal_batch/reform_full_h5.py``.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass
+import hashlib
+import json
+import math
+import os
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+RUN_SCHEMA = "crfb_elasticity_monte_carlo/v1"
+RUN_NAME = "run.json"
+DRAWS_NAME = "draws.jsonl"
+BASELINES_DIR = "baselines"
+SAMPLES_DIR = "samples"
+BANDS_NAME = "bands.csv"
+POINT_DRAW = 0
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+BAND_METRICS = ("revenue_impact", "tob_total_impact")
+DISTRIBUTIONS = ("normal", "lognormal", "uniform", "triangular")
+# The reverse-Roth behavioral reform is a Reform class, not a parameter dict,
+# so its elasticities cannot be swapped per draw.
+UNSUPPORTED_REFORMS = frozenset({"reverse_roth"})
+
+ELASTICITY_ROOT = "gov.simulation.labor_supply_responses.elasticities"
+
+
+@dataclass(frozen=True)
+class ElasticityPrior:
+    """A multiplier distribution for the elasticities under ``match``.
+
+    ``normal`` draws ``N(1, sd)``; ``lognormal`` draws a mean-one lognormal
+    with log-scale ``sd``; ``uniform`` and ``triangular`` (mode 1) draw on
+    ``[low, high]``.
+    """
+
+    match: str
+    distribution: str
+    sd: float = 0.0
+    low: float = 1.0
+    high: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.distribution not in DISTRIBUTIONS:
+            raise ValueError(
+                f"unknown distribution {self.distribution!r}; "
+                f"expected one of {DISTRIBUTIONS}"
+            )
+        if self.sd < 0:
+            raise ValueError(f"{self.match}: sd must be non-negative")
+        if self.distribution in ("uniform", "triangular") and not (
+            self.low <= self.high
+        ):
+            raise ValueError(f"{self.match}: low must not exceed high")
+        if self.distribution == "triangular" and not self.low <= 1.0 <= self.high:
+            raise ValueError(f"{self.match}: triangular bounds must bracket 1")
+
+    def matches(self, path: str) -> bool:
+        return path == self.match or path.startswith(f"{self.match}.")
+
+    def multiplier(self, rng: np.random.Generator) -> float:
+        if self.distribution == "normal":
+            return float(rng.normal(1.0, self.sd))
+        if self.distribution == "lognormal":
+            return float(rng.lognormal(-0.5 * self.sd**2, self.sd))
+        if self.distribution == "uniform":
+            return float(rng.uniform(self.low, self.high))
+        if self.low == self.high:
+            return self.low
+        return float(rng.triangular(self.low, 1.0, self.high))
+
+
+# Illustrative default: income effects anywhere from none to twice the CBO
+# value, substitution effects within +/-50%, drawn independently.
+DEFAULT_PRIORS = (
+    ElasticityPrior(f"{ELASTICITY_ROOT}.income", "uniform", low=0.0, high=2.0),
+    ElasticityPrior(f"{ELASTICITY_ROOT}.substitution", "uniform", low=0.5, high=1.5),
+)
+
+
+def load_priors(path: str | Path) -> tuple[ElasticityPrior, ...]:
+    """Priors from a JSON list of ``ElasticityPrior`` field objects."""
+    entries = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(entries, list) or not entries:
+        raise ValueError(f"{path} must hold a non-empty JSON list of priors")
+    return tuple(ElasticityPrior(**entry) for entry in entries)
+
+
+def _point_elasticities() -> dict[str, dict[str, float]]:
+    try:
+        from .reforms import CBO_ELASTICITIES
+    except ImportError:  # pragma: no cover - script execution fallback
+        from reforms import CBO_ELASTICITIES
+    return CBO_ELASTICITIES
+
+
+def _assignments(
+    priors: Sequence[ElasticityPrior], paths: Iterable[str]
+) -> dict[str, int]:
+    """Which prior (by index) scales each parameter path."""
+    assigned: dict[str, int] = {}
+    for index, prior in enumerate(priors):
+        matched = [path for path in paths if prior.matches(path)]
+        if not matched:
+            raise ValueError(f"prior {prior.match!r} matches no elasticity")
+        for path in matched:
+            if path in assigned:
+                raise ValueError(
+                    f"{path} is matched by both {priors[assigned[path]].match!r} "
+                    f"and {prior.match!r}"
+                )
+            assigned[path] = index
+    return assigned
+
+
+def draw_multipliers(
+    draw: int, *, seed: int, priors: Sequence[ElasticityPrior]
+) -> tuple[float, ...]:
+    """One multiplier per prior for ``draw``; all ones for the point draw."""
+    if draw == POINT_DRAW:
+        return tuple(1.0 for _ in priors)
+    rng = np.random.default_rng([seed, draw])
+    return tuple(prior.multiplier(rng) for prior in priors)
+
+
+def elasticity_draw(
+    draw: int,
+    *,
+    seed: int,
+    priors: Sequence[ElasticityPrior] = DEFAULT_PRIORS,
+    point: Mapping[str, Mapping[str, float]] | None = None,
+) -> dict[str, dict[str, float]]:
+    """The elasticity parameter dict for ``draw``, shaped like the point dict."""
+    point = _point_elasticities() if point is None else point
+    assigned = _assignments(priors, point)
+    multipliers = draw_multipliers(draw, seed=seed, priors=priors)
+    return {
+        path: {
+            period: float(value)
+            * (multipliers[assigned[path]] if path in assigned else 1.0)
+            for period, value in periods.items()
+        }
+        for path, periods in point.items()
+    }
+
+
+@dataclass(frozen=True)
+class MonteCarloPlan:
+    """The cells of one Monte Carlo run.
+
+    Everything but ``draws`` and the reported ``percentiles`` is part of the
+    run's identity: a rerun may ask for more draws, but not different priors,
+    seed, sample or cells.
+    """
+
+    reforms: tuple[str, ...]
+    years: tuple[int, ...]
+    draws: int
+    seed: int = 0
+    sample_fraction: float = 0.05
+    min_households: int = 0
+    priors: tuple[ElasticityPrior, ...] = DEFAULT_PRIORS
+    percentiles: tuple[float, ...] = DEFAULT_PERCENTILES
+
+    def __post_init__(self) -> None:
+        if self.draws < 1:
+            raise ValueError("draws must be at least 1")
+        unsupported = sorted(UNSUPPORTED_REFORMS.intersection(self.reforms))
+        if unsupported:
+            raise ValueError(f"no per-draw behavioral dict for {unsupported}")
+        if not self.reforms or not self.years:
+            raise ValueError("a plan needs at least one reform and one year")
+
+    def identity(self) -> dict[str, Any]:
+        payload = asdict(self)
+        payload.pop("draws")
+        payload.pop("percentiles")
+        return payload
+
+    def fingerprint(self) -> str:
+        encoded = json.dumps(self.identity(), sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
+    def cells(self) -> list[tuple[int, str, int]]:
+        """``(year, reform, draw)`` for the point draw and draws 1..N."""
+        return [
+            (year, reform, draw)
+            for year in self.years
+            for draw in range(self.draws + 1)
+            for reform in self.reforms
+        ]
+
+
+@dataclass(frozen=True)
+class YearInputs:
+    """The sampled dataset and its baseline, shared by a year's cells."""
+
+    year: int
+    dataset: str
+    baseline: dict[str, Any]
+    sample: dict[str, Any]
+
+
+@dataclass(frozen=True)
+class DrawTask:
+    year: int
+    reform: str
+    draw: int
+    dataset: str
+    baseline: dict[str, Any]
+    elasticities: dict[str, dict[str, float]]
+
+
+def prepare_year(
+    plan: MonteCarloPlan, year: int, dataset: str, samples_dir: str
+) -> YearInputs:
+    """Sample ``dataset`` for ``year`` and score its baseline once."""
+    try:
+        from .year_runner import (
+            baseline_result_to_dict,
+            load_baseline,
+            maybe_create_household_sampled_dataset,
+        )
+    except ImportError:  # pragma: no cover - script execution fallback
+        from year_runner import (
+            baseline_result_to_dict,
+            load_baseline,
+            maybe_create_household_sampled_dataset,
+        )
+
+    sample = maybe_create_household_sampled_dataset(
+        dataset,
+        year=year,
+        sample_fraction=plan.sample_fraction,
+        seed=plan.seed,
+        min_households=plan.min_households,
+        output_dir=samples_dir,
+    )
+    baseline = load_baseline(year, sample.dataset_name)
+    return YearInputs(
+        year=year,
+        dataset=sample.dataset_name,
+        baseline=baseline_result_to_dict(baseline),
+        sample=dict(sample.metadata),
+    )
+
+
+def score_draw(task: DrawTask) -> dict[str, Any]:
+    """Score one reform with the task's elasticities on the sampled dataset."""
+    try:
+        from .year_runner import (
+            MODAL_EMPLOYER_NET_REFORMS,
+            BaselineResult,
+            compute_reform_result,
+            get_reform_lookups,
+        )
+    except ImportError:  # pragma: no cover - script execution fallback
+        from year_runner import (
+            MODAL_EMPLOYER_NET_REFORMS,
+            BaselineResult,
+            compute_reform_result,
+            get_reform_lookups,
+        )
+
+    reform_functions, behavioral_functions = get_reform_lookups()
+    point_definition = behavioral_functions[task.reform]
+
+    def definition() -> dict[str, Any]:
+        reform_dict = point_definition()
+        if not isinstance(reform_dict, dict):
+            raise TypeError(f"{task.reform} has no behavioral parameter dict")
+        reform_dict.update(task.elasticities)
+        return reform_dict
+
+    return compute_reform_result(
+        reform_id=task.reform,
+        year=task.year,
+        scoring_type="behavioral",
+        dataset_name=task.dataset,
+        baseline=BaselineResult(**task.baseline),
+        reform_functions=reform_functions,
+        behavioral_functions={task.reform: definition},
+        employer_net_reforms=MODAL_EMPLOYER_NET_REFORMS,
+    )
+
+
+def _cell_key(record: Mapping[str, Any]) -> tuple[int, str, int]:
+    return int(record["year"]), str(record["reform_name"]), int(record["draw"])
+
+
+def read_draws(output_dir: str | Path) -> list[dict[str, Any]]:
+    """Finished cell records; a torn final line from a crash is ignored."""
+    path = Path(output_dir) / DRAWS_NAME
+    if not path.exists():
+        return []
+    records = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return records
+
+
+def _drop_torn_tail(path: Path) -> None:
+    """Cut a partial last line so appended records start on their own line."""
+    if not path.exists():
+        return
+    payload = path.read_bytes()
+    if payload and not payload.endswith(b"\n"):
+        path.write_bytes(payload[: payload.rfind(b"\n") + 1])
+
+
+def _check_run(plan: MonteCarloPlan, output_dir: Path) -> None:
+    run_path = output_dir / RUN_NAME
+    expected = {
+        "schema": RUN_SCHEMA,
+        "fingerprint": plan.fingerprint(),
+        "plan": plan.identity(),
+    }
+    if run_path.exists():
+        recorded = json.loads(run_path.read_text(encoding="utf-8"))
+        if recorded.get("fingerprint") != expected["fingerprint"]:
+            raise ValueError(
+                f"{output_dir} holds run {recorded.get('fingerprint')}, not "
+                f"{expected['fingerprint']}; use a new output directory"
+            )
+        return
+    output_dir.mkdir(parents=True, exist_ok=True)
+    run_path.write_text(json.dumps(expected, indent=2) + "\n", encoding="utf-8")
+
+
+def _cached_year(output_dir: Path, year: int) -> YearInputs | None:
+    path = output_dir / BASELINES_DIR / f"{year}.json"
+    if not path.exists():
+        return None
+    inputs = YearInputs(**json.loads(path.read_text(encoding="utf-8")))
+    if not Path(inputs.dataset).exists():
+        return None
+    return inputs
+
+
+def _write_year(output_dir: Path, inputs: YearInputs) -> None:
+    path = output_dir / BASELINES_DIR / f"{inputs.year}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(asdict(inputs), indent=2) + "\n", encoding="utf-8")
+
+
+class _InlineExecutor:
+    """``submit`` that runs immediately, for ``workers=1`` and debugging."""
+
+    def submit(self, function: Callable[..., Any], *args: Any) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(function(*args))
+        except Exception as error:  # re-raised by result()
+            future.set_exception(error)
+        return future
+
+    def __enter__(self) -> _InlineExecutor:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+def _use_dataset_broker(root: str) -> None:
+    try:
+        from .dataset_broker import BROKER_DIR_ENV
+    except ImportError:  # pragma: no cover - script execution fallback
+        from dataset_broker import BROKER_DIR_ENV
+
+    os.environ[BROKER_DIR_ENV] = root
+
+
+def run_monte_carlo(
+    plan: MonteCarloPlan,
+    output_dir: str | Path,
+    *,
+    dataset_for_year: Callable[[int], str] | None = None,
+    workers: int = 1,
+    point: Mapping[str, Mapping[str, float]] | None = None,
+    prepare: Callable[[MonteCarloPlan, int, str, str], YearInputs] = prepare_year,
+    score: Callable[[DrawTask], dict[str, Any]] = score_draw,
+    share_datasets: bool = False,
+) -> pd.DataFrame:
+    """Score every unfinished cell of ``plan`` and return its bands.
+
+    ``dataset_for_year`` defaults to ``runtime_config.dataset_path``.
+    ``prepare`` and ``score`` must be picklable when ``workers > 1``. With
+    ``share_datasets``, each year's sampled dataset is published to a
+    ``DatasetBroker`` once, and the pool's simulations read that shared
+    copy instead of each loading their own. A year's copy is released as
+    soon as its last draw is recorded.
+    """
+    output_dir = Path(output_dir)
+    _check_run(plan, output_dir)
+    if dataset_for_year is None:
+        try:
+            from .runtime_config import dataset_path as dataset_for_year
+        except ImportError:  # pragma: no cover - script execution fallback
+            from runtime_config import dataset_path as dataset_for_year
+    point = _point_elasticities() if point is None else point
+    draws = {
+        draw: elasticity_draw(draw, seed=plan.seed, priors=plan.priors, point=point)
+        for draw in range(plan.draws + 1)
+    }
+
+    _drop_torn_tail(output_dir / DRAWS_NAME)
+    done = {_cell_key(record) for record in read_draws(output_dir)}
+    pending: dict[int, list[tuple[str, int]]] = {}
+    for year, reform, draw in plan.cells():
+        if (year, reform, draw) not in done:
+            pending.setdefault(year, []).append((reform, draw))
+
+    broker = None
+    if share_datasets and workers > 1:
+        try:
+            from .dataset_broker import DatasetBroker
+        except ImportError:  # pragma: no cover - script execution fallback
+            from dataset_broker import DatasetBroker
+
+        broker = DatasetBroker()
+    executor = (
+        ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_use_dataset_broker if broker is not None else None,
+            initargs=(str(broker.root),) if broker is not None else (),
+        )
+        if workers > 1
+        else _InlineExecutor()
+    )
+    running: dict[Future, tuple[str, Any]] = {}
+    # Unrecorded draws per published segment; years can share one dataset.
+    published: dict[int, Any] = {}
+    unrecorded: dict[str, int] = {}
+
+    def submit_year(inputs: YearInputs) -> None:
+        if broker is not None:
+            handle = published[inputs.year] = broker.publish(inputs.dataset)
+            unrecorded[handle.key] = unrecorded.get(handle.key, 0) + len(
+                pending[inputs.year]
+            )
+        for reform, draw in pending[inputs.year]:
+            task = DrawTask(
+                year=inputs.year,
+                reform=reform,
+                draw=draw,
+                dataset=inputs.dataset,
+                baseline=inputs.baseline,
+                elasticities=draws[draw],
+            )
+            running[executor.submit(score, task)] = ("draw", task)
+
+    with (
+        broker or nullcontext(),
+        executor,
+        (output_dir / DRAWS_NAME).open("a", encoding="utf-8") as sink,
+    ):
+        for year in pending:
+            cached = _cached_year(output_dir, year)
+            if cached is not None:
+                submit_year(cached)
+                continue
+            future = executor.submit(
+                prepare,
+                plan,
+                year,
+                dataset_for_year(year),
+                str(output_dir / SAMPLES_DIR),
+            )
+            running[future] = ("year", year)
+
+        while running:
+            finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in finished:
+                kind, payload = running.pop(future)
+                if kind == "year":
+                    inputs = future.result()
+                    _write_year(output_dir, inputs)
+                    submit_year(inputs)
+                    continue
+                record = {
+                    **future.result(),
+                    "draw": payload.draw,
+                    "elasticity_multipliers": list(
+                        draw_multipliers(
+                            payload.draw, seed=plan.seed, priors=plan.priors
+                        )
+                    ),
+                }
+                sink.write(json.dumps(record, sort_keys=True, default=str) + "\n")
+                sink.flush()
+                if broker is not None:
+                    handle = published[payload.year]
+                    unrecorded[handle.key] -= 1
+                    if not unrecorded[handle.key]:
+                        broker.release(handle)
+
+    bands = summarize_draws(read_draws(output_dir), plan)
+    bands.to_csv(output_dir / BANDS_NAME, index=False)
+    return bands
+
+
+def summarize_draws(
+    records: Iterable[Mapping[str, Any]],
+    plan: MonteCarloPlan,
+    *,
+    metrics: Sequence[str] = BAND_METRICS,
+) -> pd.DataFrame:
+    """Percentile bands over draws 1..N per reform and year.
+
+    The point-estimate draw is reported alongside, not pooled into the bands.
+    Cells from draws beyond ``plan.draws`` are left out.
+    """
+    frame = pd.DataFrame(list(records))
+    columns = ["reform_name", "year", "draws"]
+    for metric in metrics:
+        columns += [f"point_{metric}", f"{metric}_mean"]
+        columns += [f"{metric}_p{_label(q)}" for q in plan.percentiles]
+    if frame.empty:
+        return pd.DataFrame(columns=columns)
+    frame = frame[frame["draw"].between(POINT_DRAW, plan.draws)]
+
+    rows = []
+    for (reform, year), group in frame.groupby(["reform_name", "year"], sort=True):
+        sampled = group[group["draw"] != POINT_DRAW]
+        point_rows = group[group["draw"] == POINT_DRAW]
+        row: dict[str, Any] = {
+            "reform_name": reform,
+            "year": int(year),
+            "draws": len(sampled),
+        }
+        for metric in metrics:
+            # Sorted so the bands do not depend on completion order.
+            values = np.sort(sampled[metric].to_numpy(dtype=float))
+            row[f"point_{metric}"] = (
+                float(point_rows[metric].iloc[0]) if len(point_rows) else math.nan
+            )
+            row[f"{metric}_mean"] = float(values.mean()) if len(values) else math.nan
+            bands = (
+                np.percentile(values, plan.percentiles)
+                if len(values)
+                else [math.nan] * len(plan.percentiles)
+            )
+            for q, value in zip(plan.percentiles, bands):
+                row[f"{metric}_p{_label(q)}"] = float(value)
+        rows.append(row)
+    return pd.DataFrame(rows, columns=columns)
+
+
+def _label(percentile: float) -> str:
+    return f"{percentile:g}".replace(".", "_")
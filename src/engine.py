@@ -39,10 +39,24 @@ def dataset_microsimulation(dataset: Any, reform: Any = None, **kwargs: Any):
     version and is scored under it. ``_require_certified_runtime`` asserts that
     pairing still holds — the managed gate's protection, applied locally — so a
     build can never be silently scored under a mismatched model.
+
+    When a ``DatasetBroker`` has published the dataset under
+    ``CRFB_DATASET_BROKER_DIR``, the simulation reads the shared read-only
+    arrays instead of loading its own copy of the file.
     """
     _require_certified_runtime()
     from policyengine_us import Microsimulation
 
+    try:
+        from .dataset_broker import attach_published
+    except ImportError:  # pragma: no cover - script execution fallback
+        from dataset_broker import attach_published
+
+    shared = attach_published(dataset)
+    if shared is not None:
+        return Microsimulation(
+            dataset=shared.policyengine_dataset(), reform=reform, **kwargs
+        )
     return Microsimulation(dataset=str(dataset), reform=reform, **kwargs)
 
 
@@ -0,0 +1,240 @@
+"""Vectorized 10-year and 75-year present-value summaries over the results panel.
+
+The dashboard's summary cards and ``scripts/build_headline_summary.py`` both
+reduce per-year revenue rows to a 10-year nominal total and a 75-year present
+value discounted per trust fund. This module does that reduction as column
+operations over the whole panel, so every (reform, scoring type, allocation
+mode) summary comes out of one grouped sum instead of a per-row walk.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .assumptions import table_frame
+from .trust_fund_allocation import ALLOCATION_MODES, split_revenue_frame
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_EFFECTIVE_RATES_CSV = (
+    REPO_ROOT / "dashboard" / "public" / "data" / "effective_interest_rates.csv"
+)
+TEN_YEAR_START = 2026
+TEN_YEAR_END = 2035
+SPLIT_COLUMNS = (
+    "revenue_impact",
+    "oasdi_impact",
+    "hi_impact",
+    "general_fund_impact",
+)
+SUMMARY_COLUMNS = (
+    "ten_year_nominal_billions",
+    "pv75_total_billions",
+    "pv75_oasdi_billions",
+    "pv75_medicare_hi_billions",
+    "pv75_general_fund_billions",
+)
+DEFAULT_SUMMARY_KEYS = ("reform_name", "scoring_type", "allocation_mode")
+
+
+@dataclass(frozen=True)
+class DiscountFactors:
+    """Cumulative per-fund discount factors to the start of the first year."""
+
+    years: np.ndarray
+    oasdi: np.ndarray
+    hi: np.ndarray
+
+    def at(self, years: Sequence[int] | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        requested = np.asarray(years, dtype=np.int64)
+        positions = np.searchsorted(self.years, requested)
+        positions = np.clip(positions, 0, len(self.years) - 1)
+        missing = self.years[positions] != requested
+        if missing.any():
+            raise KeyError(
+                "No discount factor for years: "
+                f"{sorted(set(requested[missing].tolist()))}"
+            )
+        return self.oasdi[positions], self.hi[positions]
+
+
+def discount_factors_from_rates(
+    years: Iterable[int],
+    oasdi_rate_pct: Iterable[float],
+    hi_rate_pct: Iterable[float],
+) -> DiscountFactors:
+    year_array = np.asarray(list(years), dtype=np.int64)
+    oasdi_rates = np.asarray(list(oasdi_rate_pct), dtype=float)
+    hi_rates = np.asarray(list(hi_rate_pct), dtype=float)
+    if not (len(year_array) == len(oasdi_rates) == len(hi_rates)):
+        raise ValueError("Rate series must have one value per year.")
+    order = np.argsort(year_array, kind="stable")
+    year_array = year_array[order]
+    if len(np.unique(year_array)) != len(year_array):
+        raise ValueError("Rate series has duplicate years.")
+    return DiscountFactors(
+        years=year_array,
+        oasdi=np.cumprod(1.0 / (1.0 + oasdi_rates[order] / 100.0)),
+        hi=np.cumprod(1.0 / (1.0 + hi_rates[order] / 100.0)),
+    )
+
+
+def load_effective_rates(path: Path = DEFAULT_EFFECTIVE_RATES_CSV) -> pd.DataFrame:
+    rates = table_frame(path)
+    return rates.astype(
+        {
+            "year": "int64",
+            "oasdi_effective_rate_pct": "float64",
+            "hi_effective_rate_pct": "float64",
+        }
+    ).sort_values("year", kind="stable")
+
+
+def load_discount_factors(
+    path: Path = DEFAULT_EFFECTIVE_RATES_CSV,
+    *,
+    rate_shift_pct: float = 0.0,
+) -> DiscountFactors:
+    """Discount factors from the Trustees effective rates.
+
+    ``rate_shift_pct`` adds a parallel shift (in percentage points) to both
+    series, for discount-rate sensitivity runs.
+    """
+    rates = load_effective_rates(path)
+    return discount_factors_from_rates(
+        rates["year"],
+        rates["oasdi_effective_rate_pct"] + rate_shift_pct,
+        rates["hi_effective_rate_pct"] + rate_shift_pct,
+    )
+
+
+def split_panel(
+    results: pd.DataFrame,
+    allocation_modes: Iterable[str] = ALLOCATION_MODES,
+) -> pd.DataFrame:
+    """Stack the trust-fund split of every row under each allocation mode."""
+    identity = pd.DataFrame(
+        {
+            "year": pd.to_numeric(results["year"]).astype("int64"),
+            "reform_name": results["reform_name"].astype(str),
+            "scoring_type": results["scoring_type"].astype(str),
+        },
+        index=results.index,
+    )
+    frames = [
+        pd.concat(
+            [
+                identity.assign(allocation_mode=mode),
+                split_revenue_frame(results, allocation_mode=mode),
+            ],
+            axis=1,
+        )
+        for mode in allocation_modes
+    ]
+    if not frames:
+        raise ValueError("At least one allocation mode is required.")
+    return pd.concat(frames, ignore_index=True)
+
+
+def rate_shift_grid(
+    factors_for_shift: Callable[[float], DiscountFactors],
+    rate_shifts_pct: Iterable[float],
+) -> tuple[DiscountFactors, ...]:
+    return tuple(factors_for_shift(float(shift)) for shift in rate_shifts_pct)
+
+
+def summary_cube(
+    split: pd.DataFrame,
+    factor_grid: Sequence[DiscountFactors],
+    *,
+    keys: Sequence[str] = DEFAULT_SUMMARY_KEYS,
+    ten_year_start: int = TEN_YEAR_START,
+    ten_year_end: int = TEN_YEAR_END,
+) -> tuple[pd.DataFrame, np.ndarray]:
+    """Summary figures for every ``keys`` group under every discount scenario.
+
+    Flows are accumulated once into dense (group x year) arrays; each scenario
+    is then a matrix product against its factor vector. Returns the group
+    labels (in first-appearance order) and an array shaped
+    ``(group, scenario, SUMMARY_COLUMNS)``. General-fund flows discount at the
+    OASDI series, matching the dashboard; the PV total is the sum of the
+    discounted components.
+    """
+    if not factor_grid:
+        raise ValueError("At least one discount scenario is required.")
+    group_codes, groups = pd.MultiIndex.from_frame(split[list(keys)]).factorize()
+    years = np.unique(split["year"].to_numpy(dtype=np.int64))
+    year_codes = np.searchsorted(years, split["year"].to_numpy(dtype=np.int64))
+
+    def flows(column: str) -> np.ndarray:
+        dense = np.zeros((len(groups), len(years)))
+        np.add.at(dense, (group_codes, year_codes), split[column].to_numpy(float))
+        return dense
+
+    revenue, oasdi, hi, general_fund = (flows(column) for column in SPLIT_COLUMNS)
+    oasdi_factors, hi_factors = (
+        np.vstack(matrix) for matrix in zip(*(f.at(years) for f in factor_grid))
+    )
+    in_window = (years >= ten_year_start) & (years <= ten_year_end)
+
+    pv_oasdi = oasdi @ oasdi_factors.T
+    pv_hi = hi @ hi_factors.T
+    pv_general_fund = general_fund @ oasdi_factors.T
+    ten_year = np.repeat(
+        revenue[:, in_window].sum(axis=1, keepdims=True), len(factor_grid), axis=1
+    )
+    cube = np.stack(
+        [
+            ten_year,
+            pv_oasdi + pv_hi + pv_general_fund,
+            pv_oasdi,
+            pv_hi,
+            pv_general_fund,
+        ],
+        axis=-1,
+    )
+    return groups.to_frame(index=False, name=list(keys)), cube
+
+
+def summarize_split(
+    split: pd.DataFrame,
+    factors: DiscountFactors,
+    *,
+    keys: Sequence[str] = DEFAULT_SUMMARY_KEYS,
+    ten_year_start: int = TEN_YEAR_START,
+    ten_year_end: int = TEN_YEAR_END,
+) -> pd.DataFrame:
+    """Reduce split rows to summary figures, one row per ``keys`` group."""
+    groups, cube = summary_cube(
+        split,
+        [factors],
+        keys=keys,
+        ten_year_start=ten_year_start,
+        ten_year_end=ten_year_end,
+    )
+    return pd.concat(
+        [groups, pd.DataFrame(cube[:, 0, :], columns=list(SUMMARY_COLUMNS))],
+        axis=1,
+    )
+
+
+def summarize_panel(
+    results: pd.DataFrame,
+    factors: DiscountFactors,
+    *,
+    allocation_modes: Iterable[str] = ALLOCATION_MODES,
+    ten_year_start: int = TEN_YEAR_START,
+    ten_year_end: int = TEN_YEAR_END,
+) -> pd.DataFrame:
+    """Every (reform, scoring type, allocation mode) summary in one pass."""
+    return summarize_split(
+        split_panel(results, allocation_modes),
+        factors,
+        ten_year_start=ten_year_start,
+        ten_year_end=ten_year_end,
+    )
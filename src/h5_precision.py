@@ -0,0 +1,139 @@
+"""Precision policies for full-output scenario H5 entity tables.
+
+Every output variable is computed as float64, and by default is stored that
+way. Under the ``float32`` policy, the dollar-valued outputs listed in
+``FLOAT32_OUTPUT_VARIABLES`` are stored in single precision instead. That
+roughly halves the bytes each cell uploads, stores and hands to the
+aggregators.
+
+A column is only downcast when it passes a check against its float64
+values. The check compares the weighted total, using the entity's own
+weight column, from the stored values with the float64 one. The difference
+must be within ``max(absolute_tolerance, relative_tolerance * |total|)``.
+A column is also kept at float64 if rounding would make a finite value
+overflow. IDs, weights and non-float columns are never touched. Every
+decision is returned as a report for ``metadata.json``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .reform_full_h5_output_manifest import (
+    FLOAT32_OUTPUT_VARIABLES,
+    FULL_H5_PRECISION_POLICY_NAMES,
+)
+
+
+PRECISION_REPORT_SCHEMA = "crfb_full_h5_precision_report/v1"
+
+
+@dataclass(frozen=True)
+class PrecisionPolicy:
+    name: str
+    float32_variables: frozenset[str] = frozenset()
+    relative_tolerance: float = 1e-6
+    absolute_tolerance: float = 1.0
+
+    @classmethod
+    def named(cls, name: str) -> "PrecisionPolicy":
+        if name not in FULL_H5_PRECISION_POLICY_NAMES:
+            raise ValueError(
+                f"Unknown full-H5 precision policy {name!r}; expected one of "
+                + ", ".join(FULL_H5_PRECISION_POLICY_NAMES)
+            )
+        if name == "float32":
+            return cls(name, FLOAT32_OUTPUT_VARIABLES)
+        return cls(name)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "float32_variables": sorted(self.float32_variables),
+            "relative_tolerance": self.relative_tolerance,
+            "absolute_tolerance": self.absolute_tolerance,
+        }
+
+
+def _is_exact_column(variable: str) -> bool:
+    return variable.endswith("_id") or variable.endswith("_weight")
+
+
+def _check_float32(
+    values: np.ndarray,
+    stored: np.ndarray,
+    weights: np.ndarray,
+    policy: PrecisionPolicy,
+) -> dict[str, Any]:
+    finite = np.isfinite(values)
+    if not np.array_equal(finite, np.isfinite(stored)):
+        return {"passed": False, "reason": "float32 overflows a finite value"}
+    total = float(np.dot(weights[finite], values[finite]))
+    stored_total = float(np.dot(weights[finite], stored[finite].astype(np.float64)))
+    error = abs(stored_total - total)
+    tolerance = max(policy.absolute_tolerance, policy.relative_tolerance * abs(total))
+    return {
+        "passed": error <= tolerance,
+        "weighted_total_float64": total,
+        "weighted_total_stored": stored_total,
+        "absolute_error": error,
+        "tolerance": tolerance,
+        "max_abs_value_error": float(
+            np.max(np.abs(stored[finite] - values[finite]), initial=0.0)
+        ),
+    }
+
+
+def apply_precision_policy(
+    entity_frames: dict[str, pd.DataFrame],
+    policy: PrecisionPolicy,
+) -> dict[str, Any]:
+    """Downcast ``policy``'s variables in place where they pass the check."""
+
+    columns: list[dict[str, Any]] = []
+    for entity, dataframe in entity_frames.items():
+        weight_column = f"{entity}_weight"
+        weights = (
+            dataframe[weight_column].to_numpy(dtype=np.float64)
+            if weight_column in dataframe.columns
+            else np.ones(len(dataframe))
+        )
+        for variable in dataframe.columns:
+            if variable not in policy.float32_variables:
+                continue
+            record = {
+                "entity": entity,
+                "variable": str(variable),
+                "weight": weight_column if weight_column in dataframe else None,
+            }
+            values = dataframe[variable].to_numpy()
+            if _is_exact_column(str(variable)):
+                record.update(passed=False, reason="ID and weight columns stay exact")
+            elif values.dtype != np.float64:
+                record.update(passed=False, reason=f"column is {values.dtype}")
+            else:
+                with np.errstate(over="ignore"):
+                    stored = values.astype(np.float32)
+                record.update(_check_float32(values, stored, weights, policy))
+                if record["passed"]:
+                    dataframe[variable] = stored
+            record["stored_dtype"] = str(dataframe[variable].dtype)
+            columns.append(record)
+
+    downcast = [record for record in columns if record["stored_dtype"] == "float32"]
+    return {
+        "schema": PRECISION_REPORT_SCHEMA,
+        "policy": policy.to_dict(),
+        "float32_column_count": len(downcast),
+        "kept_float64": [
+            record for record in columns if record["stored_dtype"] != "float32"
+        ],
+        "bytes_saved": int(
+            sum(4 * len(entity_frames[record["entity"]]) for record in downcast)
+        ),
+        "columns": columns,
+    }
@@ -4,9 +4,12 @@ from pathlib import Path
 
 import pandas as pd
 
+from .assumptions import HI_EXPENDITURES_FILE, table_frame, year_table
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
-DEFAULT_HI_EXPENDITURES = REPO_ROOT / "data" / "hi_expenditures_tr2026.csv"
+DEFAULT_HI_EXPENDITURES = HI_EXPENDITURES_FILE
+HI_COLUMNS = ("cost_rate", "hi_taxable_payroll", "hi_expenditures")
 
 
 def get_hi_data(path: str | Path = DEFAULT_HI_EXPENDITURES) -> pd.DataFrame:
@@ -17,7 +20,7 @@ def get_hi_data(path: str | Path = DEFAULT_HI_EXPENDITURES) -> pd.DataFrame:
     fail loudly instead of falling through to an old vintage.
     """
 
-    frame = pd.read_csv(path)
+    frame = table_frame(path)
     required = {"year", "cost_rate", "hi_taxable_payroll", "hi_expenditures"}
     missing = required.difference(frame.columns)
     if missing:
@@ -38,12 +41,10 @@ def hi_expenditures_for_year(
     *,
     path: str | Path = DEFAULT_HI_EXPENDITURES,
 ) -> dict[str, float]:
-    frame = get_hi_data(path).set_index("year")
-    if int(year) not in frame.index:
+    table = year_table(path)
+    missing = set(HI_COLUMNS).difference(table.columns)
+    if missing:
+        raise ValueError(f"HI expenditures file missing columns: {sorted(missing)}")
+    if int(year) not in table:
         raise KeyError(f"HI expenditures file has no year {year}.")
-    row = frame.loc[int(year)]
-    return {
-        "cost_rate": float(row["cost_rate"]),
-        "hi_taxable_payroll": float(row["hi_taxable_payroll"]),
-        "hi_expenditures": float(row["hi_expenditures"]),
-    }
+    return {column: table.value(column, int(year)) for column in HI_COLUMNS}
@@ -0,0 +1,310 @@
+"""Concurrent launch and live progress for full-H5 panel submissions.
+
+``submit_reform_full_h5`` spawned every cell, then blocked on each call in
+submission order. A failure in the last-submitted cell was only seen after
+every earlier call had returned, and progress in between meant rescanning
+R2 for ``complete.json`` markers. ``run_cells`` instead drives the panel
+from one asyncio loop:
+
+- At most ``max_in_flight`` cells are running at once.
+- Every state change is streamed as a JSON line to a local log, and as one
+  line to the terminal, the moment it happens:
+
+  - ``queued``, when the panel starts;
+  - ``running``, once a call is spawned;
+  - ``uploaded``, when the worker reports its artifact pair uploaded and
+    read back;
+  - ``validated``, once ``validate_cell_result`` finds nothing wrong;
+  - ``failed``, ``retrying`` and ``cancelled``.
+
+- A ``RetryPolicy`` respawns a cell after an infrastructure error, such as
+  a timeout or preemption. The worker's reservation consumption is
+  idempotent for the same token, and its stage checkpoints resume
+  finished work. A retry is still a second paid call, so only listed
+  error types are retried, up to ``max_attempts``.
+- Setting ``cancel`` cancels the live calls and leaves queued cells
+  unstarted. With ``fail_fast``, the first failure sets it.
+
+The executor is the only part that talks to Modal, so tests run whole
+panels against a local fake. Modal's call handles block, and a
+``ThreadedCellExecutor`` keeps them off the event loop. Its threads are
+its own, never asyncio's shared default pool: one per in-flight wait,
+plus separate threads for spawning and cancelling. A cancel therefore
+never queues behind ``get`` calls that can block for hours.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+from typing import Any, Callable, Protocol, Sequence
+
+
+EVENT_SCHEMA = "crfb_full_h5_progress_event/v1"
+TERMINAL_STATES = ("validated", "failed", "cancelled")
+
+
+class CellExecutor(Protocol):
+    async def start(self, cell: str, attempt: int) -> Any:
+        """Launch ``cell`` and return a handle for ``wait``/``cancel``."""
+
+    async def wait(self, handle: Any) -> dict[str, Any]:
+        """Return the worker's result, or raise the call's error."""
+
+    async def cancel(self, handle: Any) -> None:
+        """Stop a running call."""
+
+
+class ThreadedCellExecutor:
+    """``CellExecutor`` for clients whose spawn, get and cancel calls block.
+
+    ``spawn(cell, attempt)`` launches one call and returns its handle.
+    Handles are expected to have blocking ``get()`` and ``cancel()``
+    methods, as Modal function calls do.
+    """
+
+    def __init__(
+        self,
+        spawn: Callable[[str, int], Any],
+        max_in_flight: int,
+        *,
+        control_threads: int = 2,
+    ) -> None:
+        self._spawn = spawn
+        self._waiters = ThreadPoolExecutor(
+            max_workers=max(1, max_in_flight), thread_name_prefix="cell-wait"
+        )
+        self._control = ThreadPoolExecutor(
+            max_workers=max(1, control_threads), thread_name_prefix="cell-control"
+        )
+
+    async def start(self, cell: str, attempt: int) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._control, self._spawn, cell, attempt)
+
+    async def wait(self, handle: Any) -> dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._waiters, handle.get)
+
+    async def cancel(self, handle: Any) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._control, handle.cancel)
+
+    def close(self) -> None:
+        """Release the threads; waits still blocked on a call are abandoned."""
+        self._waiters.shutdown(wait=False, cancel_futures=True)
+        self._control.shutdown(wait=False, cancel_futures=True)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 1
+    backoff_seconds: float = 30.0
+    retry_on: tuple[str, ...] = (
+        "TimeoutError",
+        "FunctionTimeoutError",
+        "InternalFailure",
+        "ConnectionError",
+    )
+
+    def should_retry(self, error: BaseException, attempt: int) -> bool:
+        return attempt < self.max_attempts and type(error).__name__ in self.retry_on
+
+
+def validate_cell_result(result: Any) -> list[str]:
+    """Problems with a worker's returned metadata; empty when it is sound."""
+    if not isinstance(result, dict):
+        return ["worker returned no metadata"]
+    problems = []
+    if result.get("full_reform_output_h5_saved") is not True:
+        problems.append("worker did not report a saved full-output H5")
+    if not result.get("output_h5_sha256"):
+        problems.append("worker did not report the output H5 SHA-256")
+    schema_validation = result.get("expected_schema_validation")
+    if schema_validation is not None and schema_validation.get("validated") is not True:
+        problems.append("expected-schema validation did not pass")
+    object_store = result.get("object_store")
+    if object_store is not None:
+        if not isinstance(result.get("object_store_post_upload_validation"), dict):
+            problems.append("object-store upload was not read back")
+        expected_sha = (object_store.get("validation") or {}).get(
+            "scenario_h5_expected_sha256"
+        )
+        if expected_sha != result.get("output_h5_sha256"):
+            problems.append("uploaded H5 SHA-256 does not match the worker's")
+    return problems
+
+
+class ProgressStream:
+    """Appends progress events to a JSONL log and echoes a terminal line."""
+
+    def __init__(
+        self,
+        path: str | Path | None,
+        *,
+        total: int,
+        echo: Callable[[str], None] | None = print,
+    ) -> None:
+        self.path = Path(path) if path is not None else None
+        self.total = total
+        self.echo = echo
+        self.states: dict[str, str] = {}
+        self.events: list[dict[str, Any]] = []
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def emit(self, cell: str, state: str, **details: Any) -> dict[str, Any]:
+        self.states[cell] = state
+        event = {
+            "schema": EVENT_SCHEMA,
+            "at": datetime.now(timezone.utc).isoformat(),
+            "cell": cell,
+            "state": state,
+            **details,
+        }
+        self.events.append(event)
+        if self.path is not None:
+            with self.path.open("a", encoding="utf-8") as log:
+                log.write(json.dumps(event, sort_keys=True, default=str) + "\n")
+        if self.echo is not None:
+            self.echo(self.format(event))
+        return event
+
+    def counts(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for state in self.states.values():
+            counts[state] = counts.get(state, 0) + 1
+        return counts
+
+    def format(self, event: dict[str, Any]) -> str:
+        counts = self.counts()
+        done = sum(counts.get(state, 0) for state in TERMINAL_STATES)
+        summary = ", ".join(
+            f"{counts[state]} {state}"
+            for state in ("running", "validated", "failed", "cancelled")
+            if counts.get(state)
+        )
+        detail = event.get("error") or event.get("call_id") or ""
+        return (
+            f"[{done}/{self.total} done; {summary}] {event['cell']} "
+            f"{event['state']}{f': {detail}' if detail else ''}"
+        )
+
+
+@dataclass
+class CellOutcome:
+    cell: str
+    state: str
+    attempts: int = 0
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    problems: list[str] = field(default_factory=list)
+
+
+async def run_cells(
+    cells: Sequence[str],
+    executor: CellExecutor,
+    *,
+    stream: ProgressStream,
+    max_in_flight: int,
+    retry_policy: RetryPolicy = RetryPolicy(),
+    validate: Callable[[Any], list[str]] = validate_cell_result,
+    cancel: asyncio.Event | None = None,
+    fail_fast: bool = False,
+) -> dict[str, CellOutcome]:
+    """Launch ``cells`` in order under a concurrency cap and follow each call."""
+    cancel = cancel or asyncio.Event()
+    slots = asyncio.Semaphore(max(1, max_in_flight))
+    for cell in cells:
+        stream.emit(cell, "queued")
+
+    async def follow(cell: str) -> CellOutcome:
+        outcome = CellOutcome(cell=cell, state="queued")
+        async with slots:
+            while True:
+                if cancel.is_set():
+                    outcome.state = "cancelled"
+                    stream.emit(cell, "cancelled", attempt=outcome.attempts)
+                    return outcome
+                outcome.attempts += 1
+                try:
+                    handle = await executor.start(cell, outcome.attempts)
+                except Exception as error:
+                    return _failed(outcome, error)
+                stream.emit(
+                    cell,
+                    "running",
+                    attempt=outcome.attempts,
+                    call_id=getattr(handle, "object_id", None),
+                )
+                waiting = asyncio.ensure_future(executor.wait(handle))
+                cancelled = asyncio.ensure_future(cancel.wait())
+                await asyncio.wait(
+                    {waiting, cancelled}, return_when=asyncio.FIRST_COMPLETED
+                )
+                cancelled.cancel()
+                if not waiting.done():
+                    waiting.cancel()
+                    await executor.cancel(handle)
+                    outcome.state = "cancelled"
+                    stream.emit(cell, "cancelled", attempt=outcome.attempts)
+                    return outcome
+                try:
+                    result = waiting.result()
+                except Exception as error:
+                    if retry_policy.should_retry(error, outcome.attempts):
+                        stream.emit(
+                            cell,
+                            "retrying",
+                            attempt=outcome.attempts,
+                            error=f"{type(error).__name__}: {error}",
+                        )
+                        await asyncio.sleep(retry_policy.backoff_seconds)
+                        continue
+                    return _failed(outcome, error)
+                break
+
+        outcome.result = result
+        if isinstance(result, dict) and isinstance(
+            result.get("object_store_post_upload_validation"), dict
+        ):
+            stream.emit(
+                cell,
+                "uploaded",
+                attempt=outcome.attempts,
+                output_h5_sha256=result.get("output_h5_sha256"),
+                output_h5_size_bytes=result.get("output_h5_size_bytes"),
+            )
+        outcome.problems = validate(result)
+        if outcome.problems:
+            outcome.state = "failed"
+            outcome.error = "; ".join(outcome.problems)
+            stream.emit(cell, "failed", attempt=outcome.attempts, error=outcome.error)
+            if fail_fast:
+                cancel.set()
+            return outcome
+        outcome.state = "validated"
+        stream.emit(
+            cell,
+            "validated",
+            attempt=outcome.attempts,
+            duration_seconds=result.get("duration_seconds"),
+        )
+        return outcome
+
+    def _failed(outcome: CellOutcome, error: BaseException) -> CellOutcome:
+        outcome.state = "failed"
+        outcome.error = f"{type(error).__name__}: {error}"
+        stream.emit(
+            outcome.cell, "failed", attempt=outcome.attempts, error=outcome.error
+        )
+        if fail_fast:
+            cancel.set()
+        return outcome
+
+    outcomes = await asyncio.gather(*(follow(cell) for cell in cells))
+    return {outcome.cell: outcome for outcome in outcomes}
@@ -0,0 +1,462 @@
+"""Shared R2 / S3 access for status scans and artifact fetches.
+
+Status builders, the cost estimator, and the full-H5 aggregator all read the
+same ``reform_full_h5`` tree. This module gives them one pooled client, one
+paginated lister, and concurrent GETs of small JSON objects backed by a local
+ETag-keyed cache, so refreshing status over hundreds of cells does not pay a
+serial round-trip per ``complete.json`` / ``metadata.json``.
+
+Large artifacts (scenario H5 files) go through ``ArtifactCache`` instead: a
+size-budgeted local cache whose JSON index records each file's ETag, size,
+SHA256, and mtime, so a warm cache is validated by ``stat`` rather than by
+re-hashing every file on every run.
+
+The reader only needs the boto3 S3 client surface (``list_objects_v2`` and
+``get_object``), so tests run it against an in-process fake and a local
+MinIO works by pointing ``CRFB_R2_ENDPOINT_URL`` at it.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+import threading
+import time
+from typing import Any, Iterable
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_OBJECT_CACHE_DIR = REPO_ROOT / "tmp" / "r2_object_cache"
+DEFAULT_MAX_WORKERS = 16
+ETAG_SUFFIX = ".etag"
+ARTIFACT_INDEX_NAME = "index.json"
+ARTIFACT_INDEX_SCHEMA = "crfb_r2_artifact_cache_index/v1"
+DEFAULT_ARTIFACT_CACHE_MAX_BYTES = 200 * 1024**3
+DEFAULT_ARTIFACT_WORKERS = 4
+STREAM_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ObjectListing:
+    bucket: str
+    key: str
+    etag: str
+    size: int
+
+
+def r2_credentials_from_env() -> dict[str, str | None]:
+    endpoint_url = os.environ.get("CRFB_R2_ENDPOINT_URL")
+    account_id = os.environ.get("CRFB_R2_ACCOUNT_ID")
+    if not endpoint_url and account_id:
+        endpoint_url = f"https://{account_id}.r2.cloudflarestorage.com"
+    return {
+        "endpoint_url": endpoint_url,
+        "access_key_id": os.environ.get("CRFB_R2_ACCESS_KEY_ID")
+        or os.environ.get("AWS_ACCESS_KEY_ID"),
+        "secret_access_key": os.environ.get("CRFB_R2_SECRET_ACCESS_KEY")
+        or os.environ.get("AWS_SECRET_ACCESS_KEY"),
+    }
+
+
+def r2_client_from_env(
+    *,
+    required: bool = True,
+    max_pool_connections: int = DEFAULT_MAX_WORKERS,
+) -> Any | None:
+    """Build one pooled S3 client for R2 from the CRFB environment.
+
+    boto3 clients are thread-safe, so a single client sized to the worker
+    pool serves every concurrent request. With ``required=False`` missing
+    credentials return ``None`` instead of raising, for best-effort status
+    scans.
+    """
+    credentials = r2_credentials_from_env()
+    missing = [
+        name
+        for name, value in {
+            "CRFB_R2_ENDPOINT_URL or CRFB_R2_ACCOUNT_ID": credentials["endpoint_url"],
+            "CRFB_R2_ACCESS_KEY_ID": credentials["access_key_id"],
+            "CRFB_R2_SECRET_ACCESS_KEY": credentials["secret_access_key"],
+        }.items()
+        if not value
+    ]
+    if missing:
+        if not required:
+            return None
+        raise RuntimeError("Missing R2 credentials: " + ", ".join(missing))
+
+    import boto3
+    from botocore.config import Config
+
+    return boto3.client(
+        "s3",
+        endpoint_url=credentials["endpoint_url"],
+        region_name=os.environ.get("AWS_DEFAULT_REGION") or "auto",
+        aws_access_key_id=credentials["access_key_id"],
+        aws_secret_access_key=credentials["secret_access_key"],
+        config=Config(
+            max_pool_connections=max_pool_connections,
+            retries={"max_attempts": 10, "mode": "adaptive"},
+            connect_timeout=30,
+            read_timeout=300,
+        ),
+    )
+
+
+def object_cache_dir_from_env() -> Path:
+    configured = os.environ.get("CRFB_R2_OBJECT_CACHE_DIR")
+    return Path(configured).expanduser() if configured else DEFAULT_OBJECT_CACHE_DIR
+
+
+def _read_body(body: Any) -> bytes:
+    if hasattr(body, "read"):
+        return body.read()
+    if isinstance(body, bytes):
+        return body
+    raise TypeError(f"Unsupported object body type: {type(body).__name__}")
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as file:
+        for chunk in iter(lambda: file.read(STREAM_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _atomic_write_bytes(path: Path, payload: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", delete=False
+    ) as handle:
+        handle.write(payload)
+        temporary = Path(handle.name)
+    temporary.replace(path)
+
+
+class ObjectStoreReader:
+    """Paginated listing plus concurrent, ETag-cached GETs over one client.
+
+    Cached bodies live at ``cache_dir/<bucket>/<key>`` with the ETag they were
+    fetched under in a ``.etag`` sidecar. A listing whose ETag matches the
+    sidecar is served from disk with no request; anything else is fetched and
+    the cache entry replaced.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        cache_dir: Path | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self.client = client
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
+        self.stats = {"get_requests": 0, "cache_hits": 0, "list_requests": 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def list(
+        self,
+        bucket: str,
+        prefix: str,
+        *,
+        suffixes: tuple[str, ...] | None = None,
+    ) -> list[ObjectListing]:
+        listings: list[ObjectListing] = []
+        token = None
+        while True:
+            kwargs: dict[str, Any] = {"Bucket": bucket, "Prefix": prefix}
+            if token:
+                kwargs["ContinuationToken"] = token
+            response = self.client.list_objects_v2(**kwargs)
+            self._count("list_requests")
+            for item in response.get("Contents", []):
+                key = str(item.get("Key") or "")
+                if suffixes is not None and not key.endswith(suffixes):
+                    continue
+                listings.append(
+                    ObjectListing(
+                        bucket=bucket,
+                        key=key,
+                        etag=str(item.get("ETag") or ""),
+                        size=int(item.get("Size") or 0),
+                    )
+                )
+            if not response.get("IsTruncated"):
+                return listings
+            token = response.get("NextContinuationToken")
+
+    def list_many(
+        self,
+        bucket: str,
+        prefixes: Iterable[str],
+        *,
+        suffixes: tuple[str, ...] | None = None,
+    ) -> dict[str, list[ObjectListing]]:
+        """List several prefixes concurrently; results keep prefix order."""
+        ordered = list(dict.fromkeys(prefixes))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            batches = pool.map(
+                lambda prefix: self.list(bucket, prefix, suffixes=suffixes),
+                ordered,
+            )
+            return dict(zip(ordered, batches))
+
+    def _cache_path(self, bucket: str, key: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / bucket / key
+
+    def _cached_body(self, listing: ObjectListing) -> bytes | None:
+        path = self._cache_path(listing.bucket, listing.key)
+        if path is None or not listing.etag:
+            return None
+        etag_path = path.with_name(path.name + ETAG_SUFFIX)
+        try:
+            if etag_path.read_text(encoding="utf-8") != listing.etag:
+                return None
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _store(self, bucket: str, key: str, etag: str, body: bytes) -> None:
+        path = self._cache_path(bucket, key)
+        if path is None or not etag:
+            return
+        _atomic_write_bytes(path, body)
+        _atomic_write_bytes(path.with_name(path.name + ETAG_SUFFIX), etag.encode())
+
+    def get_bytes(self, bucket: str, key: str, *, etag: str | None = None) -> bytes:
+        """GET one object, skipping the request when ``etag`` is cached."""
+        if etag:
+            cached = self._cached_body(
+                ObjectListing(bucket=bucket, key=key, etag=etag, size=0)
+            )
+            if cached is not None:
+                self._count("cache_hits")
+                return cached
+        response = self.client.get_object(Bucket=bucket, Key=key)
+        self._count("get_requests")
+        body = _read_body(response["Body"])
+        self._store(bucket, key, str(response.get("ETag") or etag or ""), body)
+        return body
+
+    def get_json(self, bucket: str, key: str, *, etag: str | None = None) -> Any:
+        return json.loads(self.get_bytes(bucket, key, etag=etag).decode("utf-8"))
+
+    def get_json_many(
+        self,
+        requests: Iterable[ObjectListing | tuple[str, str]],
+    ) -> dict[str, Any]:
+        """Fetch many JSON objects concurrently.
+
+        Accepts listings (ETag-aware) or ``(bucket, key)`` pairs. Returns a
+        key -> payload mapping in request order; a failed fetch maps to the
+        exception rather than aborting the batch, so status scans can record
+        per-object read errors.
+        """
+        normalized = [
+            request
+            if isinstance(request, ObjectListing)
+            else ObjectListing(bucket=request[0], key=request[1], etag="", size=0)
+            for request in requests
+        ]
+
+        def fetch(listing: ObjectListing) -> Any:
+            try:
+                return self.get_json(
+                    listing.bucket, listing.key, etag=listing.etag or None
+                )
+            except Exception as error:  # noqa: BLE001 - surfaced per key
+                return error
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            payloads = list(pool.map(fetch, normalized))
+        return {listing.key: payload for listing, payload in zip(normalized, payloads)}
+
+
+@dataclass(frozen=True)
+class ArtifactRequest:
+    bucket: str
+    key: str
+    expected_sha256: str | None = None
+
+
+class ArtifactCache:
+    """Persistent, size-budgeted cache for large R2 artifacts.
+
+    Files live at ``cache_dir/<bucket>/<key>``; ``index.json`` beside them
+    records ``etag``, ``size``, ``sha256``, ``mtime_ns``, and ``last_used``
+    per object. A cached file is trusted when its ``stat`` still matches the
+    index and its recorded SHA256 matches the caller's expectation, so a warm
+    run hashes nothing. Downloads stream to a temporary file while hashing,
+    then replace the cached copy atomically. When the cache grows past
+    ``max_bytes``, least recently used entries are evicted; entries needed by
+    the batch in flight are never evicted.
+
+    Files already on disk from before the index existed are hashed once and
+    adopted, rather than downloaded again, when they match the expected SHA256
+    or no SHA256 is pinned.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        cache_dir: Path,
+        *,
+        max_bytes: int | None = DEFAULT_ARTIFACT_CACHE_MAX_BYTES,
+        max_workers: int = DEFAULT_ARTIFACT_WORKERS,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self.client = client
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.max_workers = max_workers
+        self.index_path = self.cache_dir / ARTIFACT_INDEX_NAME
+        self.stats = {"hits": 0, "adopted": 0, "downloads": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        self._entries = self._load_index()
+
+    def _load_index(self) -> dict[str, dict[str, Any]]:
+        try:
+            payload = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        if payload.get("schema") != ARTIFACT_INDEX_SCHEMA:
+            return {}
+        return dict(payload.get("entries") or {})
+
+    def flush(self) -> None:
+        with self._lock:
+            payload = {"schema": ARTIFACT_INDEX_SCHEMA, "entries": self._entries}
+            body = json.dumps(payload, indent=1, sort_keys=True).encode("utf-8")
+        _atomic_write_bytes(self.index_path, body)
+
+    def path_for(self, bucket: str, key: str) -> Path:
+        return self.cache_dir / bucket / key
+
+    @staticmethod
+    def _entry_id(bucket: str, key: str) -> str:
+        return f"{bucket}/{key}"
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def _record(self, request: ArtifactRequest, path: Path, **fields: Any) -> None:
+        stat = path.stat()
+        with self._lock:
+            self._entries[self._entry_id(request.bucket, request.key)] = {
+                "bucket": request.bucket,
+                "key": request.key,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "last_used": time.time(),
+                **fields,
+            }
+
+    def _valid_entry(self, request: ArtifactRequest, path: Path) -> bool:
+        with self._lock:
+            entry = self._entries.get(self._entry_id(request.bucket, request.key))
+        if entry is None:
+            return False
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return False
+        if stat.st_size != entry["size"] or stat.st_mtime_ns != entry["mtime_ns"]:
+            return False
+        return request.expected_sha256 in (None, entry["sha256"])
+
+    def _touch(self, request: ArtifactRequest) -> None:
+        with self._lock:
+            entry = self._entries[self._entry_id(request.bucket, request.key)]
+            entry["last_used"] = time.time()
+
+    def _download(self, request: ArtifactRequest, path: Path) -> dict[str, Any]:
+        response = self.client.get_object(Bucket=request.bucket, Key=request.key)
+        body = response["Body"]
+        digest = hashlib.sha256()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=f".{path.name}.", delete=False
+        ) as handle:
+            temporary = Path(handle.name)
+            try:
+                for chunk in iter(lambda: body.read(STREAM_CHUNK_BYTES), b""):
+                    digest.update(chunk)
+                    handle.write(chunk)
+            except BaseException:
+                temporary.unlink(missing_ok=True)
+                raise
+        sha256 = digest.hexdigest()
+        if request.expected_sha256 is not None and sha256 != request.expected_sha256:
+            temporary.unlink(missing_ok=True)
+            raise RuntimeError(f"Downloaded SHA mismatch for {request.key}")
+        temporary.replace(path)
+        return {"etag": str(response.get("ETag") or ""), "sha256": sha256}
+
+    def fetch(self, request: ArtifactRequest) -> Path:
+        path = self.path_for(request.bucket, request.key)
+        if self._valid_entry(request, path):
+            self._touch(request)
+            self._count("hits")
+            return path
+        if path.exists():
+            sha256 = _file_sha256(path)
+            if request.expected_sha256 in (None, sha256):
+                self._record(request, path, etag="", sha256=sha256)
+                self._count("adopted")
+                return path
+        fields = self._download(request, path)
+        self._record(request, path, **fields)
+        self._count("downloads")
+        return path
+
+    def fetch_many(self, requests: Iterable[ArtifactRequest]) -> list[Path]:
+        """Fetch a batch concurrently, then evict down to the size budget."""
+        batch = list(requests)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            paths = list(pool.map(self.fetch, batch))
+        self.evict(
+            keep={self._entry_id(request.bucket, request.key) for request in batch}
+        )
+        self.flush()
+        return paths
+
+    def evict(self, *, keep: Iterable[str] = ()) -> None:
+        if self.max_bytes is None:
+            return
+        keep = set(keep)
+        with self._lock:
+            total = sum(int(entry["size"]) for entry in self._entries.values())
+            victims = sorted(
+                (
+                    (entry["last_used"], entry_id)
+                    for entry_id, entry in self._entries.items()
+                    if entry_id not in keep
+                )
+            )
+            evicted: list[dict[str, Any]] = []
+            for _, entry_id in victims:
+                if total <= self.max_bytes:
+                    break
+                entry = self._entries.pop(entry_id)
+                total -= int(entry["size"])
+                evicted.append(entry)
+        for entry in evicted:
+            self.path_for(entry["bucket"], entry["key"]).unlink(missing_ok=True)
+            self._count("evictions")
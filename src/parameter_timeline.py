@@ -0,0 +1,104 @@
+"""Dense year-by-year values of PolicyEngine parameters, one pass each.
+
+``parameter(f"{year}-01-01")`` parses the instant and walks the parameter's
+breakpoints on every call, so a ``parameters x years`` table built from
+calls costs one lookup per cell. A leaf ``Parameter`` already carries its
+whole schedule, uprated years included, as ``values_list`` (one
+``ParameterAtInstant`` per breakpoint). ``parameter_timeline`` reads that
+list once and places every January 1st on it with a single
+``searchsorted``. This reproduces ``Parameter._get_at_instant``: the newest
+breakpoint at or before the instant wins, and the first-listed breakpoint
+wins ties. Before the first breakpoint the value is ``None``.
+
+Objects without a ``values_list`` (parameter nodes, scales, stand-ins) fall
+back to one call per year, so callers never need to special-case them.
+``verify_timeline`` re-derives a timeline from calls for audits.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+
+def january_instants(years: Iterable[int]) -> list[str]:
+    return [f"{int(year)}-01-01" for year in years]
+
+
+def parameter_timeline(parameter, years: Sequence[int]) -> list[Any]:
+    """``parameter`` on January 1st of each of ``years``, in order."""
+    instants = january_instants(years)
+    values_list = getattr(parameter, "values_list", None)
+    if values_list is None:
+        return [parameter(instant) for instant in instants]
+    if not values_list:
+        return [None] * len(instants)
+    # Newest first, ties in listed order, as _get_at_instant scans them.
+    newest_first = sorted(
+        values_list, key=lambda at_instant: at_instant.instant_str, reverse=True
+    )
+    oldest_first = newest_first[::-1]
+    breakpoints = np.array([at_instant.instant_str for at_instant in oldest_first])
+    positions = np.searchsorted(breakpoints, np.array(instants), side="right") - 1
+    return [
+        oldest_first[position].value if position >= 0 else None
+        for position in positions.tolist()
+    ]
+
+
+@dataclass(frozen=True)
+class ParameterTimelines:
+    """Float timelines for several parameters: ``values[parameter, year]``."""
+
+    names: tuple[str, ...]
+    years: np.ndarray
+    values: np.ndarray
+
+    def year_positions(self, years: Iterable[int]) -> np.ndarray:
+        requested = np.asarray(list(years), dtype=np.int64)
+        positions = np.searchsorted(self.years, requested)
+        if (positions >= len(self.years)).any() or (
+            self.years[np.minimum(positions, len(self.years) - 1)] != requested
+        ).any():
+            raise KeyError(f"Timeline does not cover years {requested.tolist()}")
+        return positions
+
+    def at(self, years: Iterable[int]) -> np.ndarray:
+        """``values`` restricted to ``years`` (``parameters x len(years)``)."""
+        return self.values[:, self.year_positions(years)]
+
+
+def float_timelines(
+    parameters: Sequence[Any], years: Sequence[int]
+) -> ParameterTimelines:
+    """Stack numeric timelines; a missing or non-numeric value raises like ``float()``."""
+    values = np.array(
+        [
+            [float(value) for value in parameter_timeline(parameter, years)]
+            for parameter in parameters
+        ],
+        dtype=float,
+    ).reshape(len(parameters), len(years))
+    return ParameterTimelines(
+        names=tuple(parameter.name for parameter in parameters),
+        years=np.asarray(years, dtype=np.int64),
+        values=values,
+    )
+
+
+def verify_timeline(parameter, years: Sequence[int], values: Sequence[Any]) -> None:
+    """Raise ``ValueError`` where ``values`` differ from per-year calls."""
+    for year, instant, value in zip(years, january_instants(years), values):
+        expected = parameter(instant)
+        if expected != value and not (
+            isinstance(expected, float)
+            and isinstance(value, float)
+            and np.isnan(expected)
+            and np.isnan(value)
+        ):
+            raise ValueError(
+                f"{getattr(parameter, 'name', parameter)} timeline gives {value!r} "
+                f"for {year}; a direct call gives {expected!r}"
+            )
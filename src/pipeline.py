@@ -28,6 +28,8 @@ import h5py
 import numpy as np
 import pandas as pd
 
+from src.assumptions import TRUSTEES_AUX_FILE, year_table
+from src.calibration_chain import CalibrationChain
 from src.projection import (
     aggregate_age_targets,
     build_age_bins,
@@ -39,7 +41,7 @@ from src.projection import (
     load_economic_targets,
     load_population_age_targets,
     load_tob_targets,
-    solve_earnings_scale,
+    solve_earnings_scale_with_info,
     target_source_provenance,
     write_json,
 )
@@ -300,15 +302,10 @@ def _project_variable_to_person_rows(sim, df, *, var_name, year, base_period):
 
 
 def _tr2026_gdp_growth(from_year: int, to_year: int) -> float:
-    table = pd.read_csv(
-        Path(__file__).resolve().parent.parent
-        / "data"
-        / "social_security_aux_tr2026.csv"
-    ).set_index("year")
-    return float(
-        table.loc[to_year, "gdp_in_billion_nominal_usd"]
-        / table.loc[from_year, "gdp_in_billion_nominal_usd"]
+    gdp = year_table(TRUSTEES_AUX_FILE).at(
+        "gdp_in_billion_nominal_usd", [to_year, from_year]
     )
+    return float(gdp[0] / gdp[1])
 
 
 def cap_longrun_income_growth(df: pd.DataFrame, sim, year: int) -> dict:
@@ -613,6 +610,9 @@ def _solve_other_income_gamma(
     demographic_weights: np.ndarray,
     person_household_index: np.ndarray,
     tob_targets: dict[str, float],
+    *,
+    initial_gamma: float = 1.0,
+    initial_elasticity: float = 1.5,
 ) -> tuple[float, list[dict]]:
     """Scale beneficiary households' other income toward the Trustees
     taxation-of-benefits target.
@@ -622,6 +622,9 @@ def _solve_other_income_gamma(
     to other income. When probes show that, the solver stops at the best
     bounded gamma and the final entropy calibration closes the rest.
 
+    The search starts at ``initial_gamma`` with ``initial_elasticity`` as
+    its prior (an adjacent year's answer when chained).
+
     Returns (gamma, probe history). The frame is NOT modified.
     """
     target_total = tob_targets["oasdi_tob"] + tob_targets["hi_tob"]
@@ -644,12 +647,12 @@ def _solve_other_income_gamma(
         )
         return total
 
-    gamma = 1.0
+    gamma = min(max(initial_gamma, 1 / GAMMA_MAX), GAMMA_MAX)
     total = total_tob_at(gamma)
     if abs(total / target_total - 1) <= GAMMA_TOLERANCE:
         return gamma, probes
 
-    elasticity = 1.5  # prior; refined after the second probe
+    elasticity = initial_elasticity  # prior; refined after the second probe
     for _ in range(GAMMA_MAX_PROBES):
         ratio = target_total / total
         gamma_next = gamma * ratio ** (1 / elasticity)
@@ -705,12 +708,7 @@ def _income_guard_vectors(sim, year: int) -> dict[str, np.ndarray]:
 
 
 def _gdp_for_year(year: int) -> float:
-    table = pd.read_csv(
-        Path(__file__).resolve().parent.parent
-        / "data"
-        / "social_security_aux_tr2026.csv"
-    ).set_index("year")
-    return float(table.loc[year, "gdp_in_billion_nominal_usd"]) * 1e9
+    return year_table(TRUSTEES_AUX_FILE).value("gdp_in_billion_nominal_usd", year) * 1e9
 
 
 def _tax_assumption_reform(year: int):
@@ -740,8 +738,13 @@ def build_year(
     *,
     base_dataset_label: str | None = None,
     policyengine_us_version: str | None = None,
+    chain: CalibrationChain | None = None,
 ) -> dict:
-    """Build one calibrated year dataset; returns the sentinel record."""
+    """Build one calibrated year dataset; returns the sentinel record.
+
+    With a ``chain`` the solves start from the previous chained year's
+    solutions, and this year's solutions are stored back into it.
+    """
     from src.engine import base_microsimulation, dataset_microsimulation
 
     start_time = time.monotonic()
@@ -813,9 +816,27 @@ def build_year(
         f"target {target_share_65:.1%}"
     )
 
+    chain_seeds = chain.seeds() if chain is not None else None
+    chain_records: list[dict] = []
+
+    def chain_record(stage: str, work: int, *, warm: bool) -> None:
+        if chain is not None:
+            chain_records.append(chain.record_solve(year, stage, work, warm=warm))
+
     # ----- Stage B: demographic reweight -----
-    demographic_weights, _ = calibrate_entropy_constraints(
-        age_matrix, age_targets, base_weights
+    age_constraint_names = [f"age_bin_{i}" for i in range(age_matrix.shape[1])]
+    demographic_weights, stage_b_info = calibrate_entropy_constraints(
+        age_matrix,
+        age_targets,
+        base_weights,
+        initial_dual=(
+            chain.dual_for("stage_b", age_constraint_names) if chain else None
+        ),
+    )
+    chain_record(
+        "stage_b",
+        stage_b_info["iterations_total"],
+        warm=stage_b_info["start"] == "warm",
     )
     audit_b = entropy_weight_audit(demographic_weights, base_weights)
     _log(
@@ -826,13 +847,15 @@ def build_year(
 
     # ----- Stage C: value scaling -----
     person_demo_weights = demographic_weights[person_household_index]
-    alpha = solve_earnings_scale(
+    alpha, alpha_info = solve_earnings_scale_with_info(
         gross_wages=gross_wages,
         taxable_self_employment=taxable_se,
         weights=person_demo_weights,
         cap=cap,
         payroll_target=economic_targets["payroll_total"],
+        initial=chain.alpha if chain else None,
     )
+    chain_record("alpha", alpha_info["evaluations"], warm=alpha_info["start"] == "warm")
     ss_columns = [
         f"{var}__{year}"
         for var in SOCIAL_SECURITY_SCALE_CANDIDATES
@@ -873,6 +896,7 @@ def build_year(
         > 0
     )
     beneficiary_person_mask = household_has_ss[person_household_index]
+    gamma_seed = chain.gamma_seed() if chain is not None else {}
     gamma, gamma_probes = _solve_other_income_gamma(
         df,
         year,
@@ -882,7 +906,9 @@ def build_year(
         demographic_weights,
         person_household_index,
         tob_targets,
+        **gamma_seed,
     )
+    chain_record("gamma", len(gamma_probes), warm=bool(gamma_seed))
     df.loc[beneficiary_person_mask, other_income_columns] = (
         df.loc[beneficiary_person_mask, other_income_columns] * gamma
     )
@@ -963,8 +989,26 @@ def build_year(
             list(guard_targets.values()),
         ]
     )
+    final_constraint_names = [
+        *age_constraint_names,
+        "ss_total",
+        "payroll_total",
+        "oasdi_tob",
+        "hi_tob",
+        *guard_vectors,
+    ]
     final_weights, solve_info = calibrate_entropy_constraints(
-        constraint_matrix, constraint_targets, start_weights
+        constraint_matrix,
+        constraint_targets,
+        start_weights,
+        initial_dual=(
+            chain.dual_for("stage_d", final_constraint_names) if chain else None
+        ),
+    )
+    chain_record(
+        "stage_d",
+        solve_info["iterations_total"],
+        warm=solve_info["start"] == "warm",
     )
     audit_d = entropy_weight_audit(final_weights, start_weights)
     contributor_audits = {
@@ -1010,6 +1054,18 @@ def build_year(
         raise RuntimeError(f"{year}: publication gates failed.")
 
     update_h5_household_weights(output_path, year, final_weights)
+    if chain is not None:
+        chain.advance(
+            year,
+            duals={
+                "stage_b": (age_constraint_names, stage_b_info["dual"]),
+                "stage_d": (final_constraint_names, solve_info["dual"]),
+            },
+            alpha=alpha,
+            beta=beta,
+            gamma=gamma,
+            gamma_probes=gamma_probes,
+        )
 
     income_tax_total = float(vectors["income_tax"] @ final_weights)
     elapsed = time.monotonic() - start_time
@@ -1025,6 +1081,12 @@ def build_year(
         "share_65_plus_target": target_share_65,
         "income_tax_total": income_tax_total,
         "max_constraint_pct_error": solve_info["max_constraint_pct_error"],
+        "stage_b_newton_iterations": stage_b_info["iterations_total"],
+        "stage_d_newton_iterations": solve_info["iterations_total"],
+        "alpha_payroll_evaluations": alpha_info["evaluations"],
+        "gamma_probe_count": len(gamma_probes),
+        "calibration_chain_warm": chain_seeds is not None
+        and chain_seeds["previous_year"] is not None,
         "duration_seconds": elapsed,
         "duration_clock": "time.monotonic",
         **{f"{k}_achieved": v for k, v in achieved_final.items()},
@@ -1111,6 +1173,14 @@ def build_year(
                 "dollars; IRS uprating follows the NAWI wage path from 2035."
             ),
         },
+        "calibration_chain": {
+            "seeds": chain_seeds,
+            "stage_b_start": stage_b_info["start"],
+            "stage_d_start": solve_info["start"],
+            "alpha_start": alpha_info["start"],
+            "gamma_start": "warm" if gamma_seed else "cold",
+            "solves": chain_records,
+        },
         "sentinel": sentinel,
     }
     write_json(Path(f"{output_path}.metadata.json"), metadata)
@@ -26,12 +26,12 @@ self-contained for launch-approval hashing.
 
 from __future__ import annotations
 
-import hashlib
 import json
 from pathlib import Path
 
 import numpy as np
-import pandas as pd
+
+from .assumptions import age_table, table_sha256, year_table
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = REPO_ROOT / "data"
@@ -93,7 +93,7 @@ CONTRIBUTOR_GATES = {
 
 
 def _sha256(path: Path) -> str:
-    return hashlib.sha256(path.read_bytes()).hexdigest()
+    return table_sha256(path)
 
 
 def load_population_age_targets(year: int) -> tuple[np.ndarray, np.ndarray]:
@@ -103,37 +103,32 @@ def load_population_age_targets(year: int) -> tuple[np.ndarray, np.ndarray]:
     single-year-age shape (``SSPopJul_TR2026_interim.csv``). Ages above 85
     collapse into the 85+ slot.
     """
-    table = pd.read_csv(POPULATION_FILE)
-    rows = table[table.Year == year]
-    if rows.empty:
+    table = age_table(POPULATION_FILE, max_age=85)
+    if year not in table.years:
         raise ValueError(f"No population projection for {year}.")
-    capped_age = rows.Age.clip(upper=85)
-    totals = rows.groupby(capped_age).Total.sum()
-    ages = np.arange(86)
-    return ages, totals.reindex(ages, fill_value=0).to_numpy(dtype=float)
+    return table.ages.copy(), table.for_year(year).copy()
 
 
 def load_economic_targets(year: int) -> dict[str, float]:
     """TR2026 OASDI cost and taxable payroll targets in dollars."""
-    table = pd.read_csv(ECONOMIC_FILE).set_index("year")
-    if year not in table.index:
+    table = year_table(ECONOMIC_FILE)
+    if year not in table:
         raise ValueError(f"No Trustees economic projection for {year}.")
-    row = table.loc[year]
     return {
-        "ss_total": float(row.oasdi_cost_in_billion_nominal_usd) * 1e9,
-        "payroll_total": float(row.taxable_payroll_in_billion_nominal_usd) * 1e9,
+        "ss_total": table.value("oasdi_cost_in_billion_nominal_usd", year) * 1e9,
+        "payroll_total": table.value("taxable_payroll_in_billion_nominal_usd", year)
+        * 1e9,
     }
 
 
 def load_tob_targets(year: int) -> dict[str, float]:
     """TR2026 current-law taxation-of-benefits targets in dollars."""
-    table = pd.read_csv(TOB_FILE).set_index("year")
-    if year not in table.index:
+    table = year_table(TOB_FILE)
+    if year not in table:
         raise ValueError(f"No TR2026 TOB target for {year}.")
-    row = table.loc[year]
     return {
-        "oasdi_tob": float(row.oasdi_tob_billions_nominal_usd) * 1e9,
-        "hi_tob": float(row.hi_tob_billions_nominal_usd) * 1e9,
+        "oasdi_tob": table.value("oasdi_tob_billions_nominal_usd", year) * 1e9,
+        "hi_tob": table.value("hi_tob_billions_nominal_usd", year) * 1e9,
     }
 
 
@@ -213,52 +208,26 @@ def aggregate_age_targets(
 # ---------------------------------------------------------------------------
 
 
-def calibrate_entropy_constraints(
-    A: np.ndarray,
-    targets: np.ndarray,
+def _entropy_newton(
+    A_scaled: np.ndarray,
+    targets_scaled: np.ndarray,
     baseline_weights: np.ndarray,
-    max_iters: int = 200,
-    tol: float = 1e-10,
-) -> tuple[np.ndarray, dict]:
-    """Strictly positive weights minimizing KL divergence from baseline
-    subject to ``A.T @ w == targets``.
+    beta: np.ndarray,
+    max_iters: int,
+    tol: float,
+) -> tuple[np.ndarray, float, int]:
+    """Damped Newton on the entropy dual from ``beta``.
 
-    Solves the dual with damped Newton iterations; weights are
-    ``baseline * exp(A_scaled @ beta)`` and therefore positive.
+    Returns the final dual, its gradient norm and the Newton steps taken.
     """
-    A = np.asarray(A, dtype=float)
-    targets = np.asarray(targets, dtype=float)
-    baseline_weights = np.asarray(baseline_weights, dtype=float)
-    if (targets <= 0).any():
-        # All constraint columns in this pipeline are nonnegative
-        # (member counts, benefits, payroll, TOB revenue), so a
-        # nonpositive target can never be met with positive weights.
-        raise RuntimeError(
-            "Entropy calibration requires strictly positive targets; got "
-            f"{targets[targets <= 0]}."
-        )
-
-    scales = np.maximum(
-        np.maximum(np.abs(targets), np.abs(A.T @ baseline_weights)), 1.0
-    )
-    A_scaled = A / scales
-    targets_scaled = targets / scales
-
     ridge = 1e-12
 
     def weights_for(beta_vec: np.ndarray) -> np.ndarray:
         eta = np.clip(A_scaled @ beta_vec, -700, 700)
         return baseline_weights * np.exp(eta)
 
-    # Least-squares warm start (as in the v1 production solver).
-    gram = A_scaled.T @ (baseline_weights[:, None] * A_scaled)
-    gram += np.eye(gram.shape[0]) * ridge
-    try:
-        beta = np.linalg.solve(gram, targets_scaled - A_scaled.T @ baseline_weights)
-    except np.linalg.LinAlgError:
-        beta = np.zeros(A.shape[1])
-
     gradient_norm = np.inf
+    iterations = 0
     for _ in range(max_iters):
         w = weights_for(beta)
         gradient = A_scaled.T @ w - targets_scaled
@@ -289,13 +258,92 @@ def calibrate_entropy_constraints(
             # constraints are already met to acceptance precision;
             # otherwise the problem is infeasible for positive weights.
             break
+        iterations += 1
+    return beta, gradient_norm, iterations
 
-    w = weights_for(beta)
-    achieved = A.T @ w
-    with np.errstate(divide="ignore", invalid="ignore"):
-        pct_errors = np.abs(achieved - targets) / np.maximum(np.abs(targets), 1e-9)
-    max_pct = float(np.max(pct_errors))
-    if gradient_norm > 1e-6 or max_pct > 1e-4:
+
+def calibrate_entropy_constraints(
+    A: np.ndarray,
+    targets: np.ndarray,
+    baseline_weights: np.ndarray,
+    max_iters: int = 200,
+    tol: float = 1e-10,
+    *,
+    initial_dual: np.ndarray | None = None,
+) -> tuple[np.ndarray, dict]:
+    """Strictly positive weights minimizing KL divergence from baseline
+    subject to ``A.T @ w == targets``.
+
+    Solves the dual with damped Newton iterations; weights are
+    ``baseline * exp(A @ dual)`` and therefore positive.
+
+    ``initial_dual`` warm-starts the solve, typically from an adjacent
+    year's ``info["dual"]`` for the same constraints. It is used only when
+    it starts closer to feasibility than the least-squares start. If the
+    warm solve fails to converge, the cold start is retried. ``info``
+    records the start used and the Newton iterations.
+    """
+    A = np.asarray(A, dtype=float)
+    targets = np.asarray(targets, dtype=float)
+    baseline_weights = np.asarray(baseline_weights, dtype=float)
+    if (targets <= 0).any():
+        # All constraint columns in this pipeline are nonnegative
+        # (member counts, benefits, payroll, TOB revenue), so a
+        # nonpositive target can never be met with positive weights.
+        raise RuntimeError(
+            "Entropy calibration requires strictly positive targets; got "
+            f"{targets[targets <= 0]}."
+        )
+
+    scales = np.maximum(
+        np.maximum(np.abs(targets), np.abs(A.T @ baseline_weights)), 1.0
+    )
+    A_scaled = A / scales
+    targets_scaled = targets / scales
+
+    def weights_for(beta_vec: np.ndarray) -> np.ndarray:
+        eta = np.clip(A_scaled @ beta_vec, -700, 700)
+        return baseline_weights * np.exp(eta)
+
+    def start_gradient_norm(beta_vec: np.ndarray) -> float:
+        return float(
+            np.max(np.abs(A_scaled.T @ weights_for(beta_vec) - targets_scaled))
+        )
+
+    # Least-squares warm start (as in the v1 production solver).
+    gram = A_scaled.T @ (baseline_weights[:, None] * A_scaled)
+    gram += np.eye(gram.shape[0]) * 1e-12
+    try:
+        cold_beta = np.linalg.solve(
+            gram, targets_scaled - A_scaled.T @ baseline_weights
+        )
+    except np.linalg.LinAlgError:
+        cold_beta = np.zeros(A.shape[1])
+
+    # The dual is carried unscaled (eta = A @ dual) so it survives the
+    # per-problem column scaling.
+    starts = [("least_squares", cold_beta)]
+    if initial_dual is not None and np.shape(initial_dual) == (A.shape[1],):
+        warm_beta = np.asarray(initial_dual, dtype=float) * scales
+        if np.isfinite(warm_beta).all() and start_gradient_norm(
+            warm_beta
+        ) < start_gradient_norm(cold_beta):
+            starts.insert(0, ("warm", warm_beta))
+
+    iterations_used = 0
+    for start, beta in starts:
+        beta, gradient_norm, iterations = _entropy_newton(
+            A_scaled, targets_scaled, baseline_weights, beta, max_iters, tol
+        )
+        iterations_used += iterations
+        w = weights_for(beta)
+        achieved = A.T @ w
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pct_errors = np.abs(achieved - targets) / np.maximum(np.abs(targets), 1e-9)
+        max_pct = float(np.max(pct_errors))
+        if gradient_norm <= 1e-6 and max_pct <= 1e-4:
+            break
+    else:
         raise RuntimeError(
             "Entropy calibration did not converge: max constraint error "
             f"{max_pct:.3%}, dual gradient norm {gradient_norm:.2e}."
@@ -304,6 +352,12 @@ def calibrate_entropy_constraints(
         "max_constraint_pct_error": max_pct,
         "dual_gradient_norm": gradient_norm,
         "achieved": achieved,
+        "dual": beta / scales,
+        "start": start,
+        "warm_start_offered": initial_dual is not None,
+        "warm_start_fell_back": len(starts) > 1 and start != starts[0][0],
+        "iterations": iterations,
+        "iterations_total": iterations_used,
     }
     return w, info
 
@@ -418,35 +472,86 @@ def taxable_payroll_at_scale(
     return float(((taxable_wages + taxable_se) * weights).sum())
 
 
-def solve_earnings_scale(
+def solve_earnings_scale_with_info(
     gross_wages: np.ndarray,
     taxable_self_employment: np.ndarray,
     weights: np.ndarray,
     cap: float,
     payroll_target: float,
     tol: float = 1e-13,
-) -> float:
-    """Scalar alpha such that scaled taxable payroll equals the target."""
+    *,
+    initial: float | None = None,
+    initial_width: float = 0.02,
+) -> tuple[float, dict]:
+    """``solve_earnings_scale`` plus the bracket used and payroll evaluations.
+
+    ``initial`` (an adjacent year's alpha) brackets the bisection at
+    ``initial * (1 -/+ initial_width)``. The bracket widens until it holds
+    the target, so a poor guess costs a few evaluations and never changes
+    the answer.
+    """
     args = (gross_wages, taxable_self_employment, weights, cap)
-    low, high = 1e-6, 1.0
-    while taxable_payroll_at_scale(high, *args) < payroll_target:
-        high *= 2
-        if high > 1e4:
-            ceiling = taxable_payroll_at_scale(np.inf, *args)
-            raise RuntimeError(
-                "Taxable payroll target "
-                f"${payroll_target / 1e9:,.1f}B exceeds the cap-bound ceiling "
-                f"${ceiling / 1e9:,.1f}B."
-            )
+    evaluations = 0
+
+    def payroll_at(alpha: float) -> float:
+        nonlocal evaluations
+        evaluations += 1
+        return taxable_payroll_at_scale(alpha, *args)
+
+    def raise_unreachable() -> None:
+        ceiling = taxable_payroll_at_scale(np.inf, *args)
+        raise RuntimeError(
+            "Taxable payroll target "
+            f"${payroll_target / 1e9:,.1f}B exceeds the cap-bound ceiling "
+            f"${ceiling / 1e9:,.1f}B."
+        )
+
+    warm = initial is not None and np.isfinite(initial) and initial > 0
+    if warm:
+        low = max(initial * (1 - initial_width), 1e-6)
+        high = initial * (1 + initial_width)
+        while payroll_at(high) < payroll_target:
+            low, high = high, high * 2
+            if high > 1e4:
+                raise_unreachable()
+        while low > 1e-6 and payroll_at(low) >= payroll_target:
+            low, high = max(low / 2, 1e-6), low
+    else:
+        low, high = 1e-6, 1.0
+        while payroll_at(high) < payroll_target:
+            high *= 2
+            if high > 1e4:
+                raise_unreachable()
+    bracket = [low, high]
     for _ in range(200):
         mid = 0.5 * (low + high)
-        if taxable_payroll_at_scale(mid, *args) < payroll_target:
+        if payroll_at(mid) < payroll_target:
             low = mid
         else:
             high = mid
         if high - low < tol * max(high, 1.0):
             break
-    return 0.5 * (low + high)
+    alpha = 0.5 * (low + high)
+    return alpha, {
+        "start": "warm" if warm else "cold",
+        "initial_bracket": bracket,
+        "evaluations": evaluations,
+    }
+
+
+def solve_earnings_scale(
+    gross_wages: np.ndarray,
+    taxable_self_employment: np.ndarray,
+    weights: np.ndarray,
+    cap: float,
+    payroll_target: float,
+    tol: float = 1e-13,
+) -> float:
+    """Scalar alpha such that scaled taxable payroll equals the target."""
+    alpha, _ = solve_earnings_scale_with_info(
+        gross_wages, taxable_self_employment, weights, cap, payroll_target, tol
+    )
+    return alpha
 
 
 # ---------------------------------------------------------------------------
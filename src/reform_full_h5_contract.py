@@ -6,13 +6,22 @@ from datetime import datetime
 from datetime import timezone
 import fcntl
 import hashlib
+import hmac
 import json
+import os
 from pathlib import Path
 import secrets
 import tempfile
 from typing import Any, Protocol
 
 
+# Defined here rather than in the worker so submitters can name the entrypoint
+# without importing the simulation stack.
+WORKER_ENTRYPOINT = "src.reform_full_h5_worker.run_reform_full_h5_cell"
+RESERVATION_BATCH_SCHEMA = "crfb_full_h5_reservation_batch/v1"
+BATCH_SIGNING_KEY_ENV = "CRFB_APPROVAL_BATCH_SIGNING_KEY"
+
+
 class ApprovalGuardError(RuntimeError):
     """Raised when a paid reform-H5 launch is not explicitly approved."""
 
@@ -88,6 +97,14 @@ class ApprovalStore(Protocol):
     def consume_reservation(self, token_hash: str, payload: dict[str, Any]) -> None:
         """Consume a per-cell reservation exactly once or raise ApprovalGuardError."""
 
+    def read_approval(self, nonce: str) -> dict[str, Any]:
+        """Return the consumed approval record or raise ApprovalGuardError."""
+
+    def consume_batched_reservation(
+        self, token_hash: str, payload: dict[str, Any]
+    ) -> None:
+        """Consume a token from a reservation batch exactly once (retry-safe)."""
+
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -114,6 +131,23 @@ def _expected_reservation_payload_subset(
     }
 
 
+def batch_manifest_sha256(manifest: dict[str, Any]) -> str:
+    return hashlib.sha256(_canonical_json(manifest)).hexdigest()
+
+
+def sign_batch_manifest(manifest: dict[str, Any], key: bytes) -> str:
+    return hmac.new(key, _canonical_json(manifest), hashlib.sha256).hexdigest()
+
+
+def batch_signing_key_from_env() -> bytes | None:
+    value = os.environ.get(BATCH_SIGNING_KEY_ENV)
+    return value.encode("utf-8") if value else None
+
+
+def _canonical_json(payload: dict[str, Any]) -> bytes:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
 def _validate_payload_subset(
     *,
     actual: dict[str, Any],
@@ -322,8 +356,18 @@ def submitter_consume_and_reserve(
     approval_nonce: str,
     consumed_by: str,
     store: ApprovalStore,
+    batch: bool = False,
+    signing_key: bytes | None = None,
 ) -> list[Reservation]:
-    """Validate, consume, and reserve a paid launch before creating calls."""
+    """Validate, consume, and reserve a paid launch before creating calls.
+
+    With ``batch``, every reservation is written into the approval record
+    itself, so consuming the approval and reserving all cells is one
+    conditional write, whatever the panel size. The ledger keeps the batch
+    manifest's SHA-256 and, when a signing key is given or set in
+    ``CRFB_APPROVAL_BATCH_SIGNING_KEY``, its HMAC-SHA256 signature. Workers
+    verify their token against that manifest.
+    """
 
     ledger = load_ledger(ledger_path)
     cells = normalize_cells(requested_cells)
@@ -361,6 +405,15 @@ def submitter_consume_and_reserve(
         "consumed_by": consumed_by,
         "consumed_at": utc_now_iso(),
     }
+    if batch:
+        return _consume_and_reserve_batch(
+            ledger_path,
+            ledger,
+            cells=cells,
+            approval_payload=approval_payload,
+            store=store,
+            signing_key=signing_key or batch_signing_key_from_env(),
+        )
     store.consume_approval_once(approval_nonce, approval_payload)
 
     reservations: list[Reservation] = []
@@ -396,6 +449,114 @@ def submitter_consume_and_reserve(
     return reservations
 
 
+def _consume_and_reserve_batch(
+    ledger_path: str | Path,
+    ledger: dict[str, Any],
+    *,
+    cells: tuple[ReformCell, ...],
+    approval_payload: dict[str, Any],
+    store: ApprovalStore,
+    signing_key: bytes | None,
+) -> list[Reservation]:
+    reservations = []
+    for cell in cells:
+        token = secrets.token_urlsafe(32)
+        reservations.append(
+            Reservation(cell=cell, token=token, token_hash=token_hash(token))
+        )
+    manifest = {
+        "schema": RESERVATION_BATCH_SCHEMA,
+        "nonce": approval_payload["nonce"],
+        "launch_mode": approval_payload["launch_mode"],
+        "worker_entrypoint": approval_payload["worker_entrypoint"],
+        "code_bundle_sha": approval_payload["code_bundle_sha"],
+        "durable_storage_target": approval_payload["durable_storage_target"],
+        "created_at": approval_payload["consumed_at"],
+        "reservations": [
+            {"cell": reservation.cell.to_ledger(), "token_hash": reservation.token_hash}
+            for reservation in reservations
+        ],
+    }
+    manifest_sha = batch_manifest_sha256(manifest)
+    # The single atomic transition: a racing submitter loses this write and
+    # raises before touching the ledger.
+    store.consume_approval_once(
+        approval_payload["nonce"],
+        {
+            **approval_payload,
+            "reservation_batch": manifest,
+            "reservation_batch_sha256": manifest_sha,
+        },
+    )
+    ledger.update(
+        {
+            "approval_consumed": True,
+            "approval_consumed_at": approval_payload["consumed_at"],
+            "approval_consumed_by": approval_payload["consumed_by"],
+            "paid_call_count_consumed": len(cells),
+            "reserved_cells": [cell.to_ledger() for cell in cells],
+            "reservation_token_hashes": [
+                reservation.token_hash for reservation in reservations
+            ],
+            "reservation_batch_sha256": manifest_sha,
+            "reservation_batch_signature": (
+                sign_batch_manifest(manifest, signing_key)
+                if signing_key is not None
+                else None
+            ),
+        }
+    )
+    write_ledger(ledger_path, ledger)
+    return reservations
+
+
+def _verify_batched_reservation(
+    ledger: dict[str, Any],
+    *,
+    digest: str,
+    expected_reservation: dict[str, Any],
+    store: ApprovalStore,
+    signing_key: bytes | None,
+) -> None:
+    record = store.read_approval(expected_reservation["nonce"])
+    manifest = record.get("reservation_batch")
+    _require(isinstance(manifest, dict), "Approval record has no reservation batch.")
+    _require(
+        manifest.get("schema") == RESERVATION_BATCH_SCHEMA,
+        "Reservation batch schema is not supported.",
+    )
+    _require(
+        batch_manifest_sha256(manifest) == ledger.get("reservation_batch_sha256"),
+        "Reservation batch manifest does not match the ledger.",
+    )
+    signature = ledger.get("reservation_batch_signature")
+    key = signing_key or batch_signing_key_from_env()
+    if key is not None:
+        # With a key available an unsigned batch is as suspect as a bad one.
+        _require(signature is not None, "Reservation batch is not signed.")
+    if signature is not None:
+        _require(
+            key is not None,
+            f"{BATCH_SIGNING_KEY_ENV} is required to verify the reservation batch.",
+        )
+        _require(
+            hmac.compare_digest(sign_batch_manifest(manifest, key), str(signature)),
+            "Reservation batch signature is invalid.",
+        )
+    _validate_payload_subset(
+        actual=manifest,
+        expected={
+            key: value for key, value in expected_reservation.items() if key != "cell"
+        },
+        context="Reservation batch",
+    )
+    _require(
+        {"cell": expected_reservation["cell"], "token_hash": digest}
+        in manifest.get("reservations", []),
+        "Reservation token is not in the batch manifest for this cell.",
+    )
+
+
 def worker_verify_reserved_call(
     *,
     ledger_path: str | Path,
@@ -408,6 +569,7 @@ def worker_verify_reserved_call(
     approval_nonce: str,
     reservation_token: str,
     store: ApprovalStore,
+    signing_key: bytes | None = None,
 ) -> dict[str, Any]:
     """Fail closed unless this worker invocation has a reserved cell token."""
 
@@ -449,14 +611,22 @@ def worker_verify_reserved_call(
         worker_entrypoint=worker_entrypoint,
         code_bundle_sha=code_bundle_sha,
     )
-    store.consume_reservation(
-        digest,
-        {
-            **expected_reservation,
-            "expected_reservation": expected_reservation,
-            "consumed_at": utc_now_iso(),
-        },
-    )
+    consumption = {
+        **expected_reservation,
+        "expected_reservation": expected_reservation,
+        "consumed_at": utc_now_iso(),
+    }
+    if ledger.get("reservation_batch_sha256"):
+        _verify_batched_reservation(
+            ledger,
+            digest=digest,
+            expected_reservation=expected_reservation,
+            store=store,
+            signing_key=signing_key,
+        )
+        store.consume_batched_reservation(digest, consumption)
+    else:
+        store.consume_reservation(digest, consumption)
     return ledger
 
 
@@ -535,6 +705,43 @@ class LocalFileLockApprovalStore:
 
         self._with_lock(operation)
 
+    def read_approval(self, nonce: str) -> dict[str, Any]:
+        path = self.root / f"approvals/{nonce}.json"
+
+        def operation() -> dict[str, Any]:
+            if not path.exists():
+                raise ApprovalGuardError("Approval record does not exist.")
+            return json.loads(path.read_text(encoding="utf-8"))
+
+        return self._with_lock(operation)
+
+    def consume_batched_reservation(
+        self, token_hash: str, payload: dict[str, Any]
+    ) -> None:
+        expected = payload.get("expected_reservation")
+        if not isinstance(expected, dict):
+            raise ApprovalGuardError(
+                "Reservation consumption payload is missing expected_reservation."
+            )
+        consumed_path = self.root / f"consumed_reservations/{token_hash}.json"
+
+        def operation() -> None:
+            if consumed_path.exists():
+                consumed_payload = json.loads(consumed_path.read_text(encoding="utf-8"))
+                _validate_payload_subset(
+                    actual=consumed_payload.get("expected_reservation") or {},
+                    expected=expected,
+                    context="Local consumed reservation retry",
+                )
+                return
+            consumed_path.parent.mkdir(parents=True, exist_ok=True)
+            consumed_path.write_text(
+                json.dumps(payload, indent=2) + "\n",
+                encoding="utf-8",
+            )
+
+        self._with_lock(operation)
+
 
 class R2ConditionalApprovalStore:
     """Approval store backed by conditional object creation in R2/S3."""
@@ -613,6 +820,32 @@ class R2ConditionalApprovalStore:
                 context="R2 consumed reservation retry",
             )
 
+    def read_approval(self, nonce: str) -> dict[str, Any]:
+        return self._read_json(f"approvals/{nonce}.json")
+
+    def consume_batched_reservation(
+        self, token_hash: str, payload: dict[str, Any]
+    ) -> None:
+        expected = payload.get("expected_reservation")
+        if not isinstance(expected, dict):
+            raise ApprovalGuardError(
+                "Reservation consumption payload is missing expected_reservation."
+            )
+        try:
+            self._put_once(f"consumed_reservations/{token_hash}.json", payload)
+        except ApprovalGuardError as error:
+            consumed_payload = self._read_json(
+                f"consumed_reservations/{token_hash}.json"
+            )
+            consumed_expected = consumed_payload.get("expected_reservation")
+            if not isinstance(consumed_expected, dict):
+                raise error
+            _validate_payload_subset(
+                actual=consumed_expected,
+                expected=expected,
+                context="R2 consumed reservation retry",
+            )
+
 
 def record_launched_call_ids(
     *,
@@ -93,5 +93,51 @@ TOB_REVENUE_VARIABLES = frozenset(
 )
 
 
+# Dollar-valued outputs that the "float32" precision policy may store in
+# single precision. IDs, weights, counts, flags, enums and geographies are
+# never listed: they must round-trip exactly.
+FLOAT32_OUTPUT_VARIABLES = frozenset(
+    {
+        "employment_income",
+        "ssi",
+        "social_security",
+        "medicare_cost",
+        "medicaid",
+        "unemployment_compensation",
+        "self_employment_income",
+        "partnership_s_corp_income",
+        "sstb_self_employment_income_before_lsr",
+        "taxable_earnings_for_social_security",
+        "social_security_taxable_self_employment_income",
+        "employee_social_security_tax",
+        "employee_medicare_tax",
+        "employer_social_security_tax",
+        "employer_medicare_tax",
+        "self_employment_tax",
+        "snap",
+        "tanf",
+        "spm_unit_net_income",
+        "income_tax",
+        "employee_payroll_tax",
+        "state_income_tax",
+        "household_state_income_tax",
+        "eitc",
+        "ctc",
+        "tax_unit_social_security",
+        "tax_unit_taxable_social_security",
+        "taxable_social_security",
+        "tob_revenue_oasdi",
+        "tob_revenue_medicare_hi",
+        "household_net_income",
+        "household_benefits",
+        "household_tax",
+        "household_market_income",
+        "employer_ss_tax_income_tax_revenue",
+        "employer_medicare_tax_income_tax_revenue",
+    }
+)
+FULL_H5_PRECISION_POLICY_NAMES = ("float64", "float32")
+
+
 def full_h5_output_variable_manifest() -> dict[str, list[str]]:
     return deepcopy(DEFAULT_FULL_H5_OUTPUT_VARIABLES_BY_ENTITY)
@@ -5,10 +5,8 @@ from datetime import datetime
 import importlib.metadata
 from pathlib import Path
 import platform
-import subprocess
 import sys
 from typing import Any, Callable
-import hashlib
 import json
 import os
 import tempfile
@@ -16,8 +14,12 @@ import time
 
 import numpy as np
 import pandas as pd
-from policyengine_core.reforms import Reform
 
+from .cell_checkpoint import CHECKPOINT_DIRNAME
+from .cell_checkpoint import CellCheckpoint
+from .cell_checkpoint import checkpoint_key
+from .h5_precision import PrecisionPolicy
+from .h5_precision import apply_precision_policy
 from .reform_full_h5_artifacts import (
     US_ENTITY_KEYS,
     file_sha256,
@@ -25,6 +27,7 @@ from .reform_full_h5_artifacts import (
     upload_artifact_pair_to_object_store,
     validate_full_h5_against_expected_schema,
 )
+from .reform_full_h5_contract import WORKER_ENTRYPOINT
 from .reform_full_h5_contract import ApprovalStore
 from .reform_full_h5_contract import ReformCell
 from .reform_full_h5_contract import file_sha256 as contract_file_sha256
@@ -35,6 +38,8 @@ from .reform_full_h5_output_manifest import (
     TOB_REVENUE_VARIABLES,
     full_h5_output_variable_manifest,
 )
+from .runtime_fingerprint import pip_freeze
+from .stage_profiler import StageProfiler
 from .tax_assumption_loader import (
     load_tax_assumption_reform_for_metadata,
     load_tax_assumption_reform_for_dataset,
@@ -43,8 +48,9 @@ from .tax_assumption_loader import (
 )
 
 
-WORKER_ENTRYPOINT = "src.reform_full_h5_worker.run_reform_full_h5_cell"
 FULL_H5_DIRNAME = "reform_full_h5"
+TOB_CHECKPOINT_STAGE = "tob_pair"
+SCENARIO_CHECKPOINT_STAGE = "scenario_h5"
 
 
 @dataclass(frozen=True)
@@ -92,6 +98,8 @@ def _option_static_reform(reform_id: str) -> Any:
 
 def _coerce_policy_reform(reform_definition: Any) -> Any:
     if isinstance(reform_definition, dict):
+        from policyengine_core.reforms import Reform
+
         return Reform.from_dict(reform_definition, country_id="us")
     return reform_definition
 
@@ -220,17 +228,12 @@ def _calculate_unweighted(
     return _as_1d_array(values)
 
 
-def materialize_tob_revenue_pair(
+def _compute_tob_revenue_pair(
     sim: Any,
     *,
     year: int,
     progress: Callable[[str], None] | None = None,
-) -> dict[str, Any]:
-    """Materialize TOB revenue variables without duplicate branch formulas.
-
-    This computes raw tax-unit arrays only. It performs no weighted aggregation.
-    """
-
+) -> tuple[np.ndarray, np.ndarray, dict[str, Any]]:
     from policyengine_core.periods import period as get_period
 
     def emit(message: str) -> None:
@@ -282,9 +285,31 @@ def materialize_tob_revenue_pair(
     finally:
         sim.branches.pop(capped_branch_name, None)
 
-    emit("materialize TOB: cache OASDI/HI arrays")
     oasdi = np.maximum(tax_capped_ss - tax_no_ss, 0)
     medicare_hi = np.maximum(tax_full_ss - tax_capped_ss, 0)
+    return (
+        oasdi,
+        medicare_hi,
+        {
+            "materialized": sorted(TOB_REVENUE_VARIABLES),
+            "method": "single_shared_three_tax_state_pass",
+            "weighted_aggregation_used": False,
+            "no_ss_branch_deleted_cached_arrays": int(no_ss_deleted),
+            "capped_branch_deleted_cached_arrays": int(capped_deleted),
+        },
+    )
+
+
+def _cache_tob_revenue_pair(
+    sim: Any,
+    *,
+    year: int,
+    oasdi: np.ndarray,
+    medicare_hi: np.ndarray,
+) -> None:
+    from policyengine_core.periods import period as get_period
+
+    period = get_period(year)
     sim.populations["tax_unit"].get_holder("tob_revenue_oasdi").put_in_cache(
         oasdi,
         period,
@@ -295,13 +320,116 @@ def materialize_tob_revenue_pair(
         period,
         sim.branch_name,
     )
-    return {
-        "materialized": sorted(TOB_REVENUE_VARIABLES),
-        "method": "single_shared_three_tax_state_pass",
-        "weighted_aggregation_used": False,
-        "no_ss_branch_deleted_cached_arrays": int(no_ss_deleted),
-        "capped_branch_deleted_cached_arrays": int(capped_deleted),
-    }
+
+
+def materialize_tob_revenue_pair(
+    sim: Any,
+    *,
+    year: int,
+    progress: Callable[[str], None] | None = None,
+) -> dict[str, Any]:
+    """Materialize TOB revenue variables without duplicate branch formulas.
+
+    This computes raw tax-unit arrays only. It performs no weighted aggregation.
+    """
+
+    oasdi, medicare_hi, info = _compute_tob_revenue_pair(
+        sim,
+        year=year,
+        progress=progress,
+    )
+    if progress is not None:
+        progress("materialize TOB: cache OASDI/HI arrays")
+    _cache_tob_revenue_pair(sim, year=year, oasdi=oasdi, medicare_hi=medicare_hi)
+    return info
+
+
+def _checkpointed_tob_revenue_pair(
+    sim: Any,
+    *,
+    year: int,
+    checkpoint: CellCheckpoint,
+) -> dict[str, Any]:
+    resumed = checkpoint.load_arrays(TOB_CHECKPOINT_STAGE)
+    if resumed is None:
+        oasdi, medicare_hi, info = _compute_tob_revenue_pair(sim, year=year)
+        checkpoint.save_arrays(
+            TOB_CHECKPOINT_STAGE,
+            {"tob_revenue_oasdi": oasdi, "tob_revenue_medicare_hi": medicare_hi},
+            meta=info,
+        )
+    else:
+        arrays, info = resumed
+        oasdi = arrays["tob_revenue_oasdi"]
+        medicare_hi = arrays["tob_revenue_medicare_hi"]
+    _cache_tob_revenue_pair(sim, year=year, oasdi=oasdi, medicare_hi=medicare_hi)
+    return info
+
+
+def _materialize_entity_frame(
+    sim: Any,
+    dataframe: pd.DataFrame,
+    *,
+    entity: str,
+    output_variables: list[str],
+    variables: dict[str, Any],
+    year: int,
+    tob_materialized: bool,
+    profiler: StageProfiler,
+) -> list[dict[str, Any]]:
+    """Add ``entity``'s output variables to ``dataframe``; return the skips."""
+
+    skipped: list[dict[str, Any]] = []
+    for variable_name in output_variables:
+        variable = variables.get(variable_name)
+        if variable is None:
+            skipped.append(
+                {
+                    "variable": variable_name,
+                    "entity": entity,
+                    "reason": "variable is missing from tax-benefit system",
+                }
+            )
+            continue
+        if variable_name in TOB_REVENUE_VARIABLES and not tob_materialized:
+            skipped.append(
+                {
+                    "variable": variable_name,
+                    "entity": entity,
+                    "reason": "TOB pair materializer did not run",
+                }
+            )
+            continue
+        try:
+            with profiler.variable(variable_name, entity):
+                values = _calculate_native_entity(
+                    sim,
+                    variable_name,
+                    year=year,
+                    entity=entity,
+                )
+        except Exception as error:
+            skipped.append(
+                {
+                    "variable": variable_name,
+                    "entity": entity,
+                    "reason": f"{type(error).__name__}: {str(error)[:240]}",
+                }
+            )
+            continue
+        if values.ndim != 1 or len(values) != len(dataframe):
+            skipped.append(
+                {
+                    "variable": variable_name,
+                    "entity": entity,
+                    "reason": (
+                        f"shape {list(values.shape)} does not match {len(dataframe)}"
+                    ),
+                }
+            )
+            continue
+        dataframe[variable_name] = values
+    return skipped
 
 
 def save_complete_microsimulation_h5(
@@ -312,14 +440,25 @@ def save_complete_microsimulation_h5(
     fail_on_empty_entity: bool = True,
     allowed_skipped_variables: set[str] | None = None,
     variables_by_entity: dict[str, list[str]] | None = None,
+    profiler: StageProfiler | None = None,
+    checkpoint: CellCheckpoint | None = None,
+    precision_policy: PrecisionPolicy | None = None,
 ) -> dict[str, Any]:
     """Materialize the approved output-variable manifest and write the H5.
 
     This function is deliberately independent of the legacy aggregate scorer.
     It computes output entity arrays and persists entity tables; aggregate
-    fiscal totals are a downstream post-H5 concern.
+    fiscal totals are a downstream post-H5 concern. When a ``profiler`` is
+    given, TOB materialization, every output variable, the H5 write, and the
+    output hash are timed into it. With a ``checkpoint``, the TOB pair and
+    each finished entity table are saved as they complete, and stages it
+    already holds are loaded instead of recomputed. A ``precision_policy``
+    is applied to the finished tables just before the write, so checkpoints
+    always hold float64 values.
     """
 
+    profiler = profiler or StageProfiler()
+
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     counts = _entity_counts(sim)
@@ -338,62 +477,53 @@ def save_complete_microsimulation_h5(
     }
     tob_materialization = None
     if requested_tob_variables == TOB_REVENUE_VARIABLES:
-        tob_materialization = materialize_tob_revenue_pair(sim, year=year)
+        with profiler.stage("materialize_tob_revenue_pair"):
+            if checkpoint is None:
+                tob_materialization = materialize_tob_revenue_pair(sim, year=year)
+            else:
+                tob_materialization = _checkpointed_tob_revenue_pair(
+                    sim,
+                    year=year,
+                    checkpoint=checkpoint,
+                )
 
     skipped: list[dict[str, Any]] = []
     variables = getattr(getattr(sim, "tax_benefit_system", None), "variables", {})
     for entity, output_variables in variables_by_entity.items():
         if entity not in entity_frames:
             continue
-        for variable_name in output_variables:
-            variable = variables.get(variable_name)
-            if variable is None:
-                skipped.append(
-                    {
-                        "variable": variable_name,
-                        "entity": entity,
-                        "reason": "variable is missing from tax-benefit system",
-                    }
-                )
-                continue
-            if variable_name in TOB_REVENUE_VARIABLES and tob_materialization is None:
-                skipped.append(
-                    {
-                        "variable": variable_name,
-                        "entity": entity,
-                        "reason": "TOB pair materializer did not run",
-                    }
-                )
-                continue
-            try:
-                values = _calculate_native_entity(
-                    sim,
-                    variable_name,
-                    year=year,
-                    entity=entity,
-                )
-            except Exception as error:
-                skipped.append(
-                    {
-                        "variable": variable_name,
-                        "entity": entity,
-                        "reason": f"{type(error).__name__}: {str(error)[:240]}",
-                    }
-                )
-                continue
-            if values.ndim != 1 or len(values) != len(entity_frames[entity]):
-                skipped.append(
-                    {
-                        "variable": variable_name,
-                        "entity": entity,
-                        "reason": (
-                            f"shape {list(values.shape)} does not match "
-                            f"{len(entity_frames[entity])}"
-                        ),
-                    }
-                )
-                continue
-            entity_frames[entity][variable_name] = values
+        stage = f"entity:{entity}"
+        resumed = checkpoint.load_arrays(stage) if checkpoint is not None else None
+        if resumed is not None:
+            arrays, meta = resumed
+            for position, column in enumerate(meta["columns"]):
+                entity_frames[entity][column] = arrays[f"column_{position}"]
+            skipped.extend(meta["skipped"])
+            continue
+        entity_skipped = _materialize_entity_frame(
+            sim,
+            entity_frames[entity],
+            entity=entity,
+            output_variables=output_variables,
+            variables=variables,
+            year=year,
+            tob_materialized=tob_materialization is not None,
+            profiler=profiler,
+        )
+        skipped.extend(entity_skipped)
+        if checkpoint is not None:
+            dataframe = entity_frames[entity]
+            checkpoint.save_arrays(
+                stage,
+                {
+                    f"column_{position}": dataframe[column].to_numpy()
+                    for position, column in enumerate(dataframe.columns)
+                },
+                meta={
+                    "columns": [str(column) for column in dataframe.columns],
+                    "skipped": entity_skipped,
+                },
+            )
 
     empty_entities = [
         entity for entity, dataframe in entity_frames.items() if dataframe.empty
@@ -417,16 +547,24 @@ def save_complete_microsimulation_h5(
             "Full reform H5 generation skipped unapproved variables: " + examples
         )
 
+    precision = None
+    if precision_policy is not None:
+        with profiler.stage("apply_precision_policy"):
+            precision = apply_precision_policy(entity_frames, precision_policy)
+
     tmp_path = output_path.with_name(f"{output_path.name}.tmp")
     tmp_path.unlink(missing_ok=True)
-    with pd.HDFStore(tmp_path, mode="w") as store:
-        for entity in US_ENTITY_KEYS:
-            dataframe = entity_frames.get(entity)
-            if dataframe is None:
-                continue
-            store.put(entity, dataframe, format="table")
-        store.put("_time_period", pd.Series([int(year)]), format="table")
-    tmp_path.replace(output_path)
+    with profiler.stage("write_output_h5"):
+        with pd.HDFStore(tmp_path, mode="w") as store:
+            for entity in US_ENTITY_KEYS:
+                dataframe = entity_frames.get(entity)
+                if dataframe is None:
+                    continue
+                store.put(entity, dataframe, format="table")
+            store.put("_time_period", pd.Series([int(year)]), format="table")
+        tmp_path.replace(output_path)
+    with profiler.stage("output_h5_sha256"):
+        output_sha256 = file_sha256(output_path)
 
     entities = {
         entity: {
@@ -442,7 +580,7 @@ def save_complete_microsimulation_h5(
         "path": str(output_path),
         "year": int(year),
         "size_bytes": int(output_path.stat().st_size),
-        "sha256": file_sha256(output_path),
+        "sha256": output_sha256,
         "entities": entities,
         "entity_count": int(len(entities)),
         "variable_count": int(sum(item["column_count"] for item in entities.values())),
@@ -451,6 +589,7 @@ def save_complete_microsimulation_h5(
         "capture_policy": "checked full-output variable manifest materialized from the reform microsimulation",
         "output_variable_manifest": variables_by_entity,
         "tob_materialization": tob_materialization,
+        "precision": precision,
     }
 
 
@@ -599,29 +738,6 @@ def _package_version(distribution: str) -> str | None:
         return None
 
 
-def _pip_freeze() -> dict[str, Any]:
-    try:
-        result = subprocess.run(
-            [sys.executable, "-m", "pip", "freeze", "--all"],
-            check=True,
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-    except Exception as error:
-        return {
-            "available": False,
-            "error": f"{type(error).__name__}: {str(error)[:240]}",
-        }
-    lines = sorted(line.strip() for line in result.stdout.splitlines() if line.strip())
-    payload = "\n".join(lines) + "\n"
-    return {
-        "available": True,
-        "sha256": hashlib.sha256(payload.encode("utf-8")).hexdigest(),
-        "packages": lines,
-    }
-
-
 def baseline_metadata_for_dataset(dataset_path: str | Path) -> dict[str, Any]:
     dataset = Path(dataset_path)
     candidates: list[Path] = []
@@ -773,7 +889,7 @@ def runtime_provenance_from_environment(
             "h5py": _package_version("h5py"),
             "tables": _package_version("tables"),
         },
-        "pip_freeze": _pip_freeze(),
+        "pip_freeze": pip_freeze(),
         "submitter_runtime_fingerprint": submitter_runtime_fingerprint,
         "policyengine_py_identifier": os.environ.get("CRFB_POLICYENGINE_PY_IDENTIFIER")
         or os.environ.get("CRFB_POLICYENGINE_VERSION"),
@@ -798,6 +914,54 @@ def runtime_provenance_from_environment(
     }
 
 
+def open_cell_checkpoint(
+    root: str | Path,
+    *,
+    cell: ReformCell,
+    run_prefix: str,
+    dataset_path: Path,
+    scenario_path: Path,
+    code_bundle_sha: str | None,
+    pip_freeze_sha256: str | None,
+    variables_by_entity: dict[str, list[str]] | None = None,
+    precision_policy: PrecisionPolicy | None = None,
+    commit: Callable[[], None] | None = None,
+) -> CellCheckpoint:
+    """Open the checkpoint for everything that determines this cell's H5.
+
+    The dataset is identified by size and mtime rather than its SHA-256 so
+    that opening a checkpoint costs no full read of the input.
+    """
+
+    dataset_stat = dataset_path.stat()
+    identity = {
+        "schema": "crfb_full_h5_cell_checkpoint_identity/v1",
+        "year": int(cell.year),
+        "reform_id": cell.reform,
+        "scoring_type": cell.scoring_type,
+        "run_prefix": run_prefix,
+        "dataset_path": str(dataset_path),
+        "dataset_size_bytes": int(dataset_stat.st_size),
+        "dataset_mtime_ns": int(dataset_stat.st_mtime_ns),
+        "scenario_path": str(scenario_path),
+        "worker_sha256": contract_file_sha256(__file__),
+        "code_bundle_sha": code_bundle_sha,
+        "pip_freeze_sha256": pip_freeze_sha256,
+        "output_variable_manifest_key": checkpoint_key(
+            variables_by_entity or full_h5_output_variable_manifest()
+        ),
+        "precision_policy": (
+            precision_policy.to_dict() if precision_policy is not None else None
+        ),
+    }
+    return CellCheckpoint(
+        root,
+        checkpoint_key(identity),
+        identity=identity,
+        commit=commit,
+    )
+
+
 def run_reform_full_h5_cell(
     *,
     year: int,
@@ -819,8 +983,12 @@ def run_reform_full_h5_cell(
     reservation_token: str | None = None,
     submitter_runtime_fingerprint: dict[str, Any] | None = None,
     expected_pip_freeze_sha256: str | None = None,
+    checkpoint_root: str | Path | None = None,
+    checkpoint_commit: Callable[[], None] | None = None,
+    precision_policy: PrecisionPolicy | None = None,
 ) -> dict[str, Any]:
     started_monotonic = time.monotonic()
+    profiler = StageProfiler()
     scoring_type = normalize_scoring_type(scoring_type)
     cell = ReformCell(year=year, reform=reform_id, scoring_type=scoring_type)
     guard_ledger: dict[str, Any] | None = None
@@ -842,18 +1010,19 @@ def run_reform_full_h5_cell(
                 "approval_store was provided but guard fields are missing: "
                 + ", ".join(missing)
             )
-        guard_ledger = worker_verify_reserved_call(
-            ledger_path=ledger_path,
-            cell=cell,
-            launch_mode=launch_mode,
-            worker_entrypoint=WORKER_ENTRYPOINT,
-            worker_sha=contract_file_sha256(__file__),
-            code_bundle_sha=code_bundle_sha,
-            durable_storage_target=durable_storage_target,
-            approval_nonce=approval_nonce,
-            reservation_token=reservation_token,
-            store=approval_store,
-        )
+        with profiler.stage("guard_verification"):
+            guard_ledger = worker_verify_reserved_call(
+                ledger_path=ledger_path,
+                cell=cell,
+                launch_mode=launch_mode,
+                worker_entrypoint=WORKER_ENTRYPOINT,
+                worker_sha=contract_file_sha256(__file__),
+                code_bundle_sha=code_bundle_sha,
+                durable_storage_target=durable_storage_target,
+                approval_nonce=approval_nonce,
+                reservation_token=reservation_token,
+                store=approval_store,
+            )
 
     dataset_path = Path(dataset_path).expanduser().resolve()
     approved_schema_manifest_sha = (
@@ -884,16 +1053,18 @@ def run_reform_full_h5_cell(
         )
     baseline_dataset_validation = None
     if baseline_dataset_manifest_path is not None:
-        baseline_dataset_validation = validate_baseline_dataset_against_manifest(
+        with profiler.stage("baseline_validation"):
+            baseline_dataset_validation = validate_baseline_dataset_against_manifest(
+                dataset_path=dataset_path,
+                year=year,
+                manifest_path=baseline_dataset_manifest_path,
+                approved_manifest_sha256=approved_baseline_manifest_sha,
+            )
+    with profiler.stage("runtime_provenance"):
+        runtime_provenance = runtime_provenance_from_environment(
             dataset_path=dataset_path,
-            year=year,
-            manifest_path=baseline_dataset_manifest_path,
-            approved_manifest_sha256=approved_baseline_manifest_sha,
+            submitter_runtime_fingerprint=submitter_runtime_fingerprint,
         )
-    runtime_provenance = runtime_provenance_from_environment(
-        dataset_path=dataset_path,
-        submitter_runtime_fingerprint=submitter_runtime_fingerprint,
-    )
     actual_pip_freeze_sha = runtime_provenance.get("pip_freeze", {}).get("sha256")
     ledger_pip_freeze_sha = (
         guard_ledger.get("approved_pip_freeze_sha256") if guard_ledger else None
@@ -968,21 +1139,55 @@ def run_reform_full_h5_cell(
         tax_contract = tax_assumption_contract_for_dataset(dataset_path, year)
     combined_reform = _compose_reforms(current_law_reform, policy_reform)
 
-    from .engine import dataset_microsimulation
-
-    sim = dataset_microsimulation(dataset_path, reform=combined_reform)
-    behavioral_baseline_installation = None
-    if scoring_type == "behavioral":
-        behavioral_baseline_installation = install_behavioral_baseline_tax_system(
-            sim,
-            baseline_reform=current_law_reform,
-        )
-    h5_metadata = save_complete_microsimulation_h5(
-        sim,
-        scenario_path,
-        year=year,
+    checkpoint = open_cell_checkpoint(
+        checkpoint_root or Path(output_root) / run_prefix / CHECKPOINT_DIRNAME,
+        cell=cell,
+        run_prefix=run_prefix,
+        dataset_path=dataset_path,
+        scenario_path=scenario_path,
+        code_bundle_sha=code_bundle_sha,
+        pip_freeze_sha256=actual_pip_freeze_sha,
+        precision_policy=precision_policy,
+        commit=checkpoint_commit,
     )
-    del sim
+    resumed_scenario = checkpoint.load_file(SCENARIO_CHECKPOINT_STAGE)
+    if resumed_scenario is not None:
+        _, scenario_meta = resumed_scenario
+        h5_metadata = scenario_meta["h5_metadata"]
+        behavioral_baseline_installation = scenario_meta[
+            "behavioral_baseline_installation"
+        ]
+    else:
+        from .engine import dataset_microsimulation
+
+        with profiler.stage("build_microsimulation"):
+            sim = dataset_microsimulation(dataset_path, reform=combined_reform)
+            behavioral_baseline_installation = None
+            if scoring_type == "behavioral":
+                behavioral_baseline_installation = (
+                    install_behavioral_baseline_tax_system(
+                        sim,
+                        baseline_reform=current_law_reform,
+                    )
+                )
+        with profiler.stage("save_complete_microsimulation_h5"):
+            h5_metadata = save_complete_microsimulation_h5(
+                sim,
+                scenario_path,
+                year=year,
+                profiler=profiler,
+                checkpoint=checkpoint,
+                precision_policy=precision_policy,
+            )
+        del sim
+        checkpoint.save_file(
+            SCENARIO_CHECKPOINT_STAGE,
+            scenario_path,
+            meta={
+                "h5_metadata": h5_metadata,
+                "behavioral_baseline_installation": behavioral_baseline_installation,
+            },
+        )
 
     schema_validation = None
     if expected_schema_manifest_path is not None:
@@ -991,17 +1196,20 @@ def run_reform_full_h5_cell(
             expected_entity_rows = baseline_dataset_validation.get("record", {}).get(
                 "expected_entity_rows"
             )
-        schema_validation = validate_full_h5_against_expected_schema(
-            candidate_h5_path=scenario_path,
-            expected_schema_manifest_path=expected_schema_manifest_path,
-            expected_entity_rows=expected_entity_rows,
-        )
+        with profiler.stage("expected_schema_validation"):
+            schema_validation = validate_full_h5_against_expected_schema(
+                candidate_h5_path=scenario_path,
+                expected_schema_manifest_path=expected_schema_manifest_path,
+                expected_entity_rows=expected_entity_rows,
+            )
 
     if object_store is not None:
         object_store["validation"]["scenario_h5_expected_sha256"] = h5_metadata[
             "sha256"
         ]
 
+    with profiler.stage("dataset_h5_sha256"):
+        dataset_h5_sha256 = file_sha256(dataset_path)
     metadata = {
         "schema": "crfb_full_reform_h5_metadata/v1",
         "created_at": datetime.now().isoformat(),
@@ -1009,7 +1217,7 @@ def run_reform_full_h5_cell(
         "reform_id": reform_id,
         "scoring_type": scoring_type,
         "dataset_path": str(dataset_path),
-        "dataset_h5_sha256": file_sha256(dataset_path),
+        "dataset_h5_sha256": dataset_h5_sha256,
         "dataset_h5_size_bytes": int(dataset_path.stat().st_size),
         "baseline_dataset_validation": baseline_dataset_validation,
         "run_prefix": run_prefix,
@@ -1031,24 +1239,31 @@ def run_reform_full_h5_cell(
         "scenario_h5": h5_metadata,
         "expected_schema_validation": schema_validation,
         "object_store": object_store,
+        "checkpoint": checkpoint.to_dict(),
         "duration_seconds": round(time.monotonic() - started_monotonic, 3),
         "duration_clock": "time.monotonic",
+        # Covers everything up to this write; the returned copy adds upload.
+        "profile": profiler.to_dict(),
     }
     _write_json(metadata_path, metadata)
 
     if object_store_config is not None and object_store is not None:
-        object_validation = upload_artifact_pair_to_object_store(
-            client=_boto3_client(object_store_config),
-            bucket=object_store_config.bucket,
-            scenario_path=scenario_path,
-            metadata_path=metadata_path,
-            scenario_key=object_store["scenario_key"],
-            metadata_key=object_store["metadata_key"],
-            completion_key=object_store["completion_key"],
-        )
+        with profiler.stage("object_store_upload"):
+            object_validation = upload_artifact_pair_to_object_store(
+                client=_boto3_client(object_store_config),
+                bucket=object_store_config.bucket,
+                scenario_path=scenario_path,
+                metadata_path=metadata_path,
+                scenario_key=object_store["scenario_key"],
+                metadata_key=object_store["metadata_key"],
+                completion_key=object_store["completion_key"],
+            )
+        checkpoint.clear()
         return {
             **metadata,
+            "profile": profiler.to_dict(),
             "object_store_post_upload_validation": object_validation,
         }
 
+    checkpoint.clear()
     return metadata
@@ -0,0 +1,445 @@
+"""Typed, partitioned store for the published results panel.
+
+``results.csv`` (and its dashboard copy) used to be the only persisted form of
+the panel, so every downstream analysis reparsed the whole file and did its
+own dtype coercion and filtering. This module gives the panel one explicit
+schema and two interchangeable on-disk forms:
+
+- a partitioned store, one NumPy ``.npz`` file per ``(scoring_type,
+  reform_name)`` partition under ``<root>/<vintage>/``, with a
+  ``manifest.json`` recording the schema, the partitions and their checksums.
+  Each column is its own array in the archive (text and boolean columns carry
+  a missing-value mask beside them), so ``ResultsStore.query`` reads only the
+  partitions and columns a caller asks for;
+- the dashboard CSV, exported from the same typed frame with the publisher's
+  ``%.10f`` float format, so the deployed file is unchanged.
+
+A vintage identifies one published panel. By default it is derived from the
+exported CSV bytes, so republishing identical results is a no-op and two
+vintages with different ids are guaranteed to differ.
+
+``load_results`` accepts either a store root or a results CSV and returns the
+same typed frame; analysis scripts use it instead of ``pd.read_csv``. Both
+forms need only NumPy and pandas, and partitions load without pickle.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+import shutil
+import tempfile
+from typing import Any, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+
+STORE_SCHEMA = "crfb_results_store/v2"
+MANIFEST_NAME = "manifest.json"
+LATEST_NAME = "latest.json"
+CSV_FLOAT_FORMAT = "%.10f"
+PARTITION_COLUMNS = ("scoring_type", "reform_name")
+MISSING_SUFFIX = ".missing"
+
+# Column -> pandas dtype for every column the published panel may carry, in
+# the published column order. Dollar columns are float64; provenance columns
+# are nullable strings because interpolated rows carry none.
+RESULTS_SCHEMA: dict[str, str] = {
+    "year": "int64",
+    "reform_name": "string",
+    "baseline_tax_assumption_name": "string",
+    "baseline_tax_assumption_active": "boolean",
+    "baseline_revenue": "float64",
+    "reform_revenue": "float64",
+    "revenue_impact": "float64",
+    "baseline_tob_medicare_hi": "float64",
+    "reform_tob_medicare_hi": "float64",
+    "tob_medicare_hi_impact": "float64",
+    "baseline_tob_oasdi": "float64",
+    "reform_tob_oasdi": "float64",
+    "tob_oasdi_impact": "float64",
+    "baseline_tob_total": "float64",
+    "reform_tob_total": "float64",
+    "tob_total_impact": "float64",
+    "scoring_type": "string",
+    "employer_ss_tax_revenue": "float64",
+    "employer_medicare_tax_revenue": "float64",
+    "oasdi_gain": "float64",
+    "hi_gain": "float64",
+    "oasdi_loss": "float64",
+    "hi_loss": "float64",
+    "oasdi_net_impact": "float64",
+    "hi_net_impact": "float64",
+    "source": "string",
+    "scenario_h5_uri": "string",
+    "metadata_uri": "string",
+    "complete_uri": "string",
+    "output_h5_sha256": "string",
+    "run_prefix": "string",
+    "baseline_source": "string",
+    "full_h5_result_type": "string",
+}
+REQUIRED_COLUMNS = ("year", "reform_name")
+
+
+def _coerce_boolean(values: pd.Series) -> pd.Series:
+    mapping = {"true": True, "false": False, "1": True, "0": False}
+    normalized = values.map(
+        lambda value: (
+            pd.NA
+            if pd.isna(value) or value == ""
+            else mapping.get(str(value).strip().lower(), value)
+        )
+    )
+    unknown = normalized.map(
+        lambda value: not (value is pd.NA or isinstance(value, bool))
+    )
+    if unknown.any():
+        raise ValueError(
+            f"{values.name} has non-boolean values: "
+            f"{sorted(set(values[unknown].astype(str)))[:5]}"
+        )
+    return normalized.astype("boolean")
+
+
+def normalize_results(frame: pd.DataFrame) -> pd.DataFrame:
+    """Coerce a results frame's schema columns to ``RESULTS_SCHEMA`` dtypes.
+
+    Column order is preserved. Columns outside the schema keep the dtype
+    pandas inferred, and schema columns the frame does not carry are left
+    out rather than invented, so older vintages load as they are.
+    """
+    missing = [column for column in REQUIRED_COLUMNS if column not in frame.columns]
+    if missing:
+        raise ValueError(f"results frame is missing required columns: {missing}")
+    if frame["year"].isna().any():
+        raise ValueError("results frame has rows without a year.")
+    typed: dict[str, pd.Series] = {}
+    for column in frame.columns:
+        values = frame[column]
+        dtype = RESULTS_SCHEMA.get(column)
+        if dtype == "boolean":
+            typed[column] = _coerce_boolean(values)
+        elif dtype in ("float64", "int64"):
+            typed[column] = pd.to_numeric(values, errors="raise").astype(dtype)
+        elif dtype == "string":
+            typed[column] = values.astype("string")
+        else:
+            typed[column] = values
+    return pd.DataFrame(typed, index=frame.index)
+
+
+def read_results_csv(path: str | Path) -> pd.DataFrame:
+    """Parse a results CSV once, with schema dtypes."""
+    text_columns = {
+        column: "string"
+        for column, dtype in RESULTS_SCHEMA.items()
+        if dtype in ("string", "boolean")
+    }
+    return normalize_results(pd.read_csv(path, dtype=text_columns))
+
+
+def filter_results(
+    frame: pd.DataFrame,
+    *,
+    reforms: Iterable[str] | None = None,
+    scoring_types: Iterable[str] | None = None,
+    years: Iterable[int] | None = None,
+    columns: Iterable[str] | None = None,
+) -> pd.DataFrame:
+    mask = pd.Series(True, index=frame.index)
+    if reforms is not None:
+        mask &= frame["reform_name"].isin(list(reforms)).fillna(False)
+    if scoring_types is not None:
+        mask &= frame["scoring_type"].isin(list(scoring_types)).fillna(False)
+    if years is not None:
+        mask &= frame["year"].isin([int(year) for year in years])
+    filtered = frame.loc[mask.astype(bool)]
+    if columns is not None:
+        filtered = filtered[_select_columns(filtered.columns, columns)]
+    return filtered.reset_index(drop=True)
+
+
+def _select_columns(available: Iterable[str], columns: Iterable[str]) -> list[str]:
+    available = list(available)
+    selected = list(dict.fromkeys(columns))
+    missing = [column for column in selected if column not in available]
+    if missing:
+        raise KeyError(f"results have no columns {missing}")
+    return selected
+
+
+def results_csv_bytes(frame: pd.DataFrame) -> bytes:
+    buffer = io.StringIO()
+    frame.to_csv(buffer, index=False, float_format=CSV_FLOAT_FORMAT)
+    return buffer.getvalue().encode("utf-8")
+
+
+def export_results_csv(frame: pd.DataFrame, path: str | Path) -> Path:
+    """Write the dashboard CSV form of a typed results frame, atomically."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp-{os.getpid()}")
+    tmp_path.write_bytes(results_csv_bytes(frame))
+    tmp_path.replace(path)
+    return path
+
+
+def content_vintage(frame: pd.DataFrame) -> str:
+    """A vintage id derived from the exported CSV bytes."""
+    return f"results-{hashlib.sha256(results_csv_bytes(frame)).hexdigest()[:16]}"
+
+
+def _partition_name(scoring_type: str, reform_name: str) -> str:
+    return f"scoring_type={scoring_type}/reform_name={reform_name}.npz"
+
+
+def _file_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _encode_column(name: str, values: pd.Series) -> dict[str, np.ndarray]:
+    """Arrays for one column: numeric columns as they are, text and boolean
+    columns as plain values plus a mask of missing rows."""
+    if isinstance(values.dtype, np.dtype) and values.dtype != object:
+        return {name: values.to_numpy()}
+    missing = values.isna().to_numpy(dtype=bool)
+    if pd.api.types.is_bool_dtype(values.dtype):
+        data = values.fillna(False).to_numpy(dtype=bool)
+    else:
+        data = np.array(
+            ["" if gone else str(item) for item, gone in zip(values, missing)],
+            dtype=str,
+        )
+    return {name: data, f"{name}{MISSING_SUFFIX}": missing}
+
+
+def _decode_column(archive: Any, name: str, dtype: str) -> pd.Series:
+    values = archive[name]
+    missing_key = f"{name}{MISSING_SUFFIX}"
+    if missing_key in archive.files:
+        values = values.astype(object)
+        values[archive[missing_key]] = None
+    return pd.Series(values, name=name).astype(dtype)
+
+
+def _write_partition(frame: pd.DataFrame, path: Path) -> None:
+    arrays: dict[str, np.ndarray] = {}
+    for column in frame.columns:
+        arrays.update(_encode_column(column, frame[column]))
+    with path.open("wb") as handle:
+        np.savez(handle, **arrays)
+
+
+def _read_partition(
+    path: Path, dtypes: Mapping[str, str], columns: Iterable[str]
+) -> pd.DataFrame:
+    with np.load(path, allow_pickle=False) as archive:
+        return pd.DataFrame(
+            {
+                column: _decode_column(archive, column, dtypes[column])
+                for column in columns
+            }
+        )
+
+
+def write_results_store(
+    frame: pd.DataFrame,
+    root: str | Path,
+    *,
+    vintage: str | None = None,
+    metadata: Mapping[str, Any] | None = None,
+) -> str:
+    """Persist ``frame`` as one vintage of the partitioned store.
+
+    Partitions are listed in the manifest in first-appearance order and keep
+    their row order, so a panel written grouped by partition (as the
+    publisher writes it) reads back in its original row order. The vintage is built in a temporary
+    directory and renamed into place, so readers never see a partial vintage;
+    ``latest.json`` is updated last. An existing vintage with the same id is
+    left untouched.
+    """
+    root = Path(root)
+    missing = [column for column in PARTITION_COLUMNS if column not in frame.columns]
+    if missing:
+        raise ValueError(f"results frame is missing partition columns: {missing}")
+    typed = normalize_results(frame).reset_index(drop=True)
+    vintage = vintage or content_vintage(typed)
+    target = root / vintage
+    if (target / MANIFEST_NAME).exists():
+        _write_latest(root, vintage)
+        return vintage
+
+    root.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{vintage}-", dir=root))
+    try:
+        partitions = []
+        for (scoring_type, reform_name), group in typed.groupby(
+            list(PARTITION_COLUMNS), sort=False
+        ):
+            name = _partition_name(str(scoring_type), str(reform_name))
+            path = staging / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _write_partition(group.reset_index(drop=True), path)
+            partitions.append(
+                {
+                    "scoring_type": str(scoring_type),
+                    "reform_name": str(reform_name),
+                    "path": name,
+                    "rows": int(len(group)),
+                    "year_start": int(group["year"].min()),
+                    "year_end": int(group["year"].max()),
+                    "sha256": _file_sha256(path),
+                }
+            )
+        manifest = {
+            "schema": STORE_SCHEMA,
+            "vintage": vintage,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "rows": int(len(typed)),
+            "columns": {column: str(dtype) for column, dtype in typed.dtypes.items()},
+            "csv_sha256": hashlib.sha256(results_csv_bytes(typed)).hexdigest(),
+            "partitions": partitions,
+            "metadata": dict(metadata or {}),
+        }
+        (staging / MANIFEST_NAME).write_text(
+            json.dumps(manifest, indent=2) + "\n", encoding="utf-8"
+        )
+        staging.replace(target)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    _write_latest(root, vintage)
+    return vintage
+
+
+def _write_latest(root: Path, vintage: str) -> None:
+    tmp_path = root / f".{LATEST_NAME}.tmp-{os.getpid()}"
+    tmp_path.write_text(
+        json.dumps({"vintage": vintage}, indent=2) + "\n", encoding="utf-8"
+    )
+    tmp_path.replace(root / LATEST_NAME)
+
+
+class ResultsStore:
+    """Read access to the vintages under one store root."""
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def vintages(self) -> list[str]:
+        if not self.root.is_dir():
+            return []
+        return sorted(path.parent.name for path in self.root.glob(f"*/{MANIFEST_NAME}"))
+
+    def latest_vintage(self) -> str:
+        latest = self.root / LATEST_NAME
+        if not latest.exists():
+            raise FileNotFoundError(f"No results store at {self.root}.")
+        return json.loads(latest.read_text(encoding="utf-8"))["vintage"]
+
+    def manifest(self, vintage: str | None = None) -> dict[str, Any]:
+        vintage = vintage or self.latest_vintage()
+        path = self.root / vintage / MANIFEST_NAME
+        if not path.exists():
+            raise FileNotFoundError(
+                f"Unknown results vintage {vintage!r} in {self.root}."
+            )
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+        if manifest.get("schema") != STORE_SCHEMA:
+            raise ValueError(f"{path} is not a {STORE_SCHEMA} manifest.")
+        return manifest
+
+    def query(
+        self,
+        *,
+        vintage: str | None = None,
+        reforms: Iterable[str] | None = None,
+        scoring_types: Iterable[str] | None = None,
+        years: Iterable[int] | None = None,
+        columns: Iterable[str] | None = None,
+    ) -> pd.DataFrame:
+        """Typed rows for the requested slice, reading only matching partitions."""
+        manifest = self.manifest(vintage)
+        reforms = None if reforms is None else set(reforms)
+        scoring_types = None if scoring_types is None else set(scoring_types)
+        years = None if years is None else [int(year) for year in years]
+        schema_columns = list(manifest["columns"])
+        read_columns = schema_columns
+        if columns is not None:
+            columns = _select_columns(schema_columns, columns)
+            read_columns = list(
+                dict.fromkeys([*columns, *REQUIRED_COLUMNS, *PARTITION_COLUMNS])
+            )
+
+        frames = []
+        for partition in manifest["partitions"]:
+            if reforms is not None and partition["reform_name"] not in reforms:
+                continue
+            if (
+                scoring_types is not None
+                and partition["scoring_type"] not in scoring_types
+            ):
+                continue
+            if years is not None and not any(
+                partition["year_start"] <= year <= partition["year_end"]
+                for year in years
+            ):
+                continue
+            frames.append(
+                _read_partition(
+                    self.root / manifest["vintage"] / partition["path"],
+                    manifest["columns"],
+                    read_columns,
+                )
+            )
+        if frames:
+            frame = pd.concat(frames, ignore_index=True)
+        else:
+            frame = pd.DataFrame(
+                {
+                    column: pd.Series(dtype=dtype)
+                    for column, dtype in manifest["columns"].items()
+                    if column in read_columns
+                }
+            )
+        frame = normalize_results(frame)
+        return filter_results(frame, years=years, columns=columns)
+
+    def export_csv(self, path: str | Path, *, vintage: str | None = None) -> Path:
+        return export_results_csv(self.query(vintage=vintage), path)
+
+
+def load_results(
+    source: str | Path,
+    *,
+    vintage: str | None = None,
+    reforms: Iterable[str] | None = None,
+    scoring_types: Iterable[str] | None = None,
+    years: Iterable[int] | None = None,
+    columns: Iterable[str] | None = None,
+) -> pd.DataFrame:
+    """Typed results from a store root or a results CSV, filtered alike."""
+    source = Path(source)
+    if source.is_dir():
+        return ResultsStore(source).query(
+            vintage=vintage,
+            reforms=reforms,
+            scoring_types=scoring_types,
+            years=years,
+            columns=columns,
+        )
+    if vintage is not None:
+        raise ValueError(f"{source} is a CSV; vintages only apply to a results store.")
+    return filter_results(
+        read_results_csv(source),
+        reforms=reforms,
+        scoring_types=scoring_types,
+        years=years,
+        columns=columns,
+    )
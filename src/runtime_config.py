@@ -11,6 +11,11 @@ import shutil
 import subprocess
 from typing import Iterable
 
+try:
+    from .runtime_fingerprint import cached_tree_sha256
+except ImportError:  # pragma: no cover - script execution fallback
+    from runtime_fingerprint import cached_tree_sha256
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 WORKSPACE_ROOT = REPO_ROOT.parent
@@ -151,17 +156,20 @@ def _policyengine_us_package_file_sha256(path: Path | None = None) -> str | None
     return hashlib.sha256(package_file.read_bytes()).hexdigest()
 
 
-def _policyengine_us_package_tree_sha256(path: Path | None = None) -> str | None:
-    package_dir = _policyengine_us_package_dir(path)
-    if package_dir is None:
-        return None
-    digest = hashlib.sha256()
+def _policyengine_us_package_tree_files(package_dir: Path) -> list[tuple[Path, str]]:
+    files = []
     for file_path in sorted(package_dir.rglob("*")):
         if not file_path.is_file():
             continue
         if "__pycache__" in file_path.parts or file_path.suffix in {".pyc", ".pyo"}:
             continue
-        relative_path = file_path.relative_to(package_dir).as_posix()
+        files.append((file_path, file_path.relative_to(package_dir).as_posix()))
+    return files
+
+
+def _package_tree_sha256(files: list[tuple[Path, str]]) -> str:
+    digest = hashlib.sha256()
+    for file_path, relative_path in files:
         contents = file_path.read_bytes()
         digest.update(relative_path.encode("utf-8"))
         digest.update(b"\0")
@@ -172,6 +180,14 @@ def _policyengine_us_package_tree_sha256(path: Path | None = None) -> str | None
     return digest.hexdigest()
 
 
+def _policyengine_us_package_tree_sha256(path: Path | None = None) -> str | None:
+    package_dir = _policyengine_us_package_dir(path)
+    if package_dir is None:
+        return None
+    files = _policyengine_us_package_tree_files(package_dir)
+    return cached_tree_sha256(package_dir, files, lambda: _package_tree_sha256(files))
+
+
 def _sha256_file(path: Path) -> str:
     digest = hashlib.sha256()
     with path.open("rb") as file:
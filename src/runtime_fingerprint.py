@@ -0,0 +1,179 @@
+"""Cached fingerprints of the installed runtime.
+
+Workers and certified-runtime checks fingerprint the environment they run
+in: a SHA-256 over every file of the installed ``policyengine_us`` tree and
+a hash of the ``pip freeze --all`` listing. Both are expensive to produce
+(thousands of parameter YAMLs to read, a pip subprocess) and almost never
+change between calls, so this module caches them:
+
+- ``cached_tree_sha256`` keys a tree digest on the tree's stat manifest
+  (each file's relative path, size, mtime and inode) and persists it in a
+  small JSON cache shared across processes. An unchanged tree costs one
+  ``stat`` per file; any change rehashes the tree. The digest is a single
+  stream over all file contents, so a changed file cannot be patched in
+  alone without changing the published hash format.
+- ``pip_freeze`` builds the ``pip freeze --all`` listing from
+  ``importlib.metadata`` once per interpreter. Environments with editable
+  or direct-URL installs, whose freeze lines pip formats specially, fall
+  back to running pip.
+
+``CRFB_RUNTIME_FINGERPRINT_CACHE`` overrides the cache file; set it to an
+empty string to disable persistence.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from functools import lru_cache
+import hashlib
+import importlib.metadata as package_metadata
+import json
+import os
+from pathlib import Path
+import re
+import subprocess
+import sys
+import tempfile
+from typing import Any, Callable, Sequence
+
+
+CACHE_SCHEMA = "crfb_runtime_fingerprint_cache/v1"
+CACHE_ENV = "CRFB_RUNTIME_FINGERPRINT_CACHE"
+
+
+def default_cache_path() -> Path | None:
+    configured = os.environ.get(CACHE_ENV)
+    if configured is not None:
+        return Path(configured).expanduser() if configured.strip() else None
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "crfb" / "runtime_fingerprints.json"
+
+
+def stat_manifest_sha256(files: Sequence[tuple[Path, str]]) -> str:
+    """Hash of ``(relative path, size, mtime_ns, inode)`` for every file."""
+    digest = hashlib.sha256()
+    for file_path, relative_path in files:
+        stat = file_path.stat()
+        record = f"{relative_path}\0{stat.st_size}\0{stat.st_mtime_ns}\0{stat.st_ino}\n"
+        digest.update(record.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _read_cache(path: Path) -> dict[str, Any]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("schema") != CACHE_SCHEMA:
+        return {}
+    trees = payload.get("trees")
+    return trees if isinstance(trees, dict) else {}
+
+
+def _write_cache(path: Path, trees: dict[str, Any]) -> None:
+    temporary: str | None = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, prefix=f".{path.name}.", delete=False
+        ) as handle:
+            temporary = handle.name
+            json.dump({"schema": CACHE_SCHEMA, "trees": trees}, handle, indent=2)
+        os.replace(temporary, path)
+    except OSError:
+        # A read-only cache dir only costs a rehash next time.
+        if temporary is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(temporary)
+
+
+def cached_tree_sha256(
+    root: Path,
+    files: Sequence[tuple[Path, str]],
+    compute: Callable[[], str],
+    *,
+    cache_path: Path | None = None,
+) -> str:
+    """``compute()``, reused while the stat manifest of ``files`` is unchanged."""
+    cache_path = default_cache_path() if cache_path is None else cache_path
+    manifest = stat_manifest_sha256(files)
+    key = str(Path(root).resolve())
+    trees = _read_cache(cache_path) if cache_path else {}
+    entry = trees.get(key)
+    if isinstance(entry, dict) and entry.get("stat_sha256") == manifest:
+        return str(entry["tree_sha256"])
+    tree_sha256 = compute()
+    if cache_path:
+        # Reread so concurrent workers caching other trees are not clobbered.
+        trees = _read_cache(cache_path)
+        trees[key] = {
+            "stat_sha256": manifest,
+            "tree_sha256": tree_sha256,
+            "file_count": len(files),
+        }
+        _write_cache(cache_path, trees)
+    return tree_sha256
+
+
+def _normalized_name(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _metadata_freeze_lines() -> list[str] | None:
+    """``pip freeze --all`` lines from installed metadata, or ``None``.
+
+    Mirrors pip: the first distribution per normalized name on ``sys.path``
+    wins and prints as ``Name==version``. Returns ``None`` when any install
+    carries a ``direct_url.json`` (editable, VCS or URL), which pip prints
+    differently.
+    """
+    lines: dict[str, str] = {}
+    for distribution in package_metadata.distributions():
+        name = distribution.metadata["Name"]
+        if not name:
+            continue
+        key = _normalized_name(name)
+        if key in lines:
+            continue
+        if distribution.read_text("direct_url.json"):
+            return None
+        lines[key] = f"{name}=={distribution.version}"
+    return sorted(lines.values())
+
+
+def _subprocess_freeze_lines() -> list[str]:
+    result = subprocess.run(
+        [sys.executable, "-m", "pip", "freeze", "--all"],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    return sorted(line.strip() for line in result.stdout.splitlines() if line.strip())
+
+
+@lru_cache(maxsize=1)
+def _freeze_lines() -> tuple[tuple[str, ...], str]:
+    # Failures raise and so are retried on the next call; successes are kept.
+    lines = _metadata_freeze_lines()
+    if lines is not None:
+        return tuple(lines), "importlib.metadata"
+    return tuple(_subprocess_freeze_lines()), "pip"
+
+
+def pip_freeze() -> dict[str, Any]:
+    """The interpreter's sorted ``pip freeze --all`` listing and its SHA-256."""
+    try:
+        lines, source = _freeze_lines()
+    except Exception as error:
+        return {
+            "available": False,
+            "error": f"{type(error).__name__}: {str(error)[:240]}",
+        }
+    payload = "\n".join(lines) + "\n"
+    return {
+        "available": True,
+        "sha256": hashlib.sha256(payload.encode("utf-8")).hexdigest(),
+        "packages": list(lines),
+        "source": source,
+    }
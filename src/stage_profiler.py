@@ -0,0 +1,113 @@
+"""Per-stage and per-variable wall, CPU, and peak-RSS telemetry for H5 cells.
+
+``run_reform_full_h5_cell`` used to record a single ``duration_seconds``. The
+profiler here breaks that down into named stages (dataset hashing, baseline
+validation, TOB materialization, the output-variable loop, upload, ...) and
+individual output variables, and serializes the result as the ``profile``
+section of cell metadata. ``scripts/rank_full_h5_profiles.py`` ranks those
+sections across a panel to size Modal memory and timeouts.
+
+Each measurement costs two ``perf_counter``/``process_time`` reads and one
+``getrusage`` call, so timing every output variable is cheap next to the
+microsimulation work it measures. Peak RSS is the process high-water mark
+(``ru_maxrss``) when the stage ends; it never decreases, so the stage whose
+``rss_growth_bytes`` is largest is the one that raised the ceiling.
+"""
+
+from __future__ import annotations
+
+from contextlib import AbstractContextManager, contextmanager
+import sys
+import time
+from typing import Any, Iterator
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows has no resource module
+    resource = None
+
+
+PROFILE_SCHEMA = "crfb_full_h5_stage_profile/v1"
+
+
+def peak_rss_bytes() -> int | None:
+    """The process's peak resident set size so far, in bytes."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes; macOS reports bytes.
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+class StageProfiler:
+    """Collects timed stages and per-variable measurements for one cell."""
+
+    def __init__(self) -> None:
+        self.stages: list[dict[str, Any]] = []
+        self.variables: list[dict[str, Any]] = []
+        self._started_wall = time.perf_counter()
+        self._started_cpu = time.process_time()
+        self._started_rss = peak_rss_bytes()
+        self._open_stages: list[str] = []
+
+    @contextmanager
+    def _measure(
+        self, record: dict[str, Any], into: list[dict[str, Any]]
+    ) -> Iterator[None]:
+        record["parent"] = self._open_stages[-1] if self._open_stages else None
+        record["failed"] = False
+        rss_before = peak_rss_bytes()
+        wall_before = time.perf_counter()
+        cpu_before = time.process_time()
+        try:
+            yield
+        except BaseException:
+            record["failed"] = True
+            raise
+        finally:
+            rss_after = peak_rss_bytes()
+            record.update(
+                {
+                    "wall_seconds": round(time.perf_counter() - wall_before, 6),
+                    "cpu_seconds": round(time.process_time() - cpu_before, 6),
+                    "peak_rss_bytes": rss_after,
+                    "rss_growth_bytes": (
+                        None
+                        if rss_before is None or rss_after is None
+                        else rss_after - rss_before
+                    ),
+                }
+            )
+            into.append(record)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time one named stage of the cell.
+
+        Stages may nest; each record names its enclosing stage in ``parent``
+        so totals can be taken over top-level stages without double counting.
+        """
+        with self._measure({"stage": name}, self.stages):
+            self._open_stages.append(name)
+            try:
+                yield
+            finally:
+                self._open_stages.pop()
+
+    def variable(self, name: str, entity: str) -> AbstractContextManager[None]:
+        """Time the computation of one output variable."""
+        return self._measure({"variable": name, "entity": entity}, self.variables)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "schema": PROFILE_SCHEMA,
+            "wall_clock": "time.perf_counter",
+            "cpu_clock": "time.process_time",
+            "rss_source": "resource.getrusage(RUSAGE_SELF).ru_maxrss",
+            "total_wall_seconds": round(time.perf_counter() - self._started_wall, 6),
+            "total_cpu_seconds": round(time.process_time() - self._started_cpu, 6),
+            "starting_peak_rss_bytes": self._started_rss,
+            "peak_rss_bytes": peak_rss_bytes(),
+            "stages": list(self.stages),
+            "variables": list(self.variables),
+        }
@@ -0,0 +1,323 @@
+"""Deterministic synthetic datasets for offline benchmarks.
+
+Generates households shaped like the enhanced CPS -- persons grouped into
+households, tax units, SPM units, families and marital units, with ages,
+earnings, Social Security benefits and weights -- from a seeded generator, so
+the same ``(n_households, seed)`` always yields byte-identical arrays. Three
+artifacts are built from one population:
+
+- a PolicyEngine input H5 (``variable/period`` datasets, as in the enhanced
+  CPS files) that ``Microsimulation(dataset=...)`` can load;
+- a full-output scenario H5 with the entity tables the post-H5 aggregator
+  reads;
+- an entropy-calibration problem (constraint matrix, targets, baseline
+  weights) with the structure ``projection.calibrate_entropy_constraints``
+  solves.
+
+None of this is statistically representative; it exists so hot paths can be
+timed locally at realistic array shapes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_SEED = 20260101
+DEFAULT_YEAR = 2026
+BENCHMARK_SIZES = {"small": 500, "medium": 5_000, "large": 50_000}
+GROUP_ENTITIES = ("household", "tax_unit", "spm_unit", "family", "marital_unit")
+
+
+@dataclass(frozen=True)
+class SyntheticPopulation:
+    """Person-level arrays plus the group each person belongs to."""
+
+    person: pd.DataFrame
+    household_weight: np.ndarray
+
+    @property
+    def n_households(self) -> int:
+        return len(self.household_weight)
+
+
+def synthetic_population(
+    n_households: int, *, seed: int = DEFAULT_SEED
+) -> SyntheticPopulation:
+    if n_households < 1:
+        raise ValueError("n_households must be at least 1.")
+    rng = np.random.default_rng([seed, n_households])
+    sizes = np.clip(rng.poisson(1.5, n_households) + 1, 1, 8)
+    household_index = np.repeat(np.arange(n_households), sizes)
+    position = np.arange(len(household_index)) - np.repeat(
+        np.cumsum(sizes) - sizes, sizes
+    )
+    n_people = len(household_index)
+
+    head_age = rng.integers(18, 91, n_households)
+    age = np.where(
+        position == 0,
+        head_age[household_index],
+        np.where(
+            position == 1,
+            np.clip(head_age[household_index] + rng.integers(-8, 9, n_people), 18, 95),
+            rng.integers(0, 18, n_people),
+        ),
+    )
+    adult = position <= 1
+    working = adult & (age < 67)
+    earnings = np.where(
+        working & (rng.random(n_people) < 0.8),
+        np.round(rng.lognormal(10.6, 0.9, n_people), 0),
+        0.0,
+    )
+    self_employment = np.where(
+        working & (rng.random(n_people) < 0.1),
+        np.round(rng.lognormal(9.8, 1.1, n_people), 0),
+        0.0,
+    )
+    social_security = np.where(
+        adult & (age >= 62),
+        np.round(rng.normal(22_000, 6_000, n_people).clip(3_000, 60_000), 0),
+        0.0,
+    )
+    # Heads and spouses share a marital unit; each dependent has their own.
+    marital_offset = np.where(position <= 1, 0, position - 1)
+    marital_unit = pd.factorize(
+        pd.MultiIndex.from_arrays([household_index, marital_offset])
+    )[0]
+    person = pd.DataFrame(
+        {
+            "person_id": np.arange(1, n_people + 1),
+            "household": household_index,
+            "marital_unit": marital_unit,
+            "age": age.astype(np.int64),
+            "is_male": rng.random(n_people) < 0.5,
+            "is_tax_unit_head": position == 0,
+            "is_tax_unit_spouse": position == 1,
+            "is_tax_unit_dependent": position >= 2,
+            "employment_income": earnings,
+            "self_employment_income": self_employment,
+            "social_security_retirement": social_security,
+            "taxable_interest_income": np.round(
+                rng.exponential(400, n_people) * adult, 0
+            ),
+        }
+    )
+    household_weight = np.round(rng.uniform(500, 1_500, n_households), 3)
+    return SyntheticPopulation(person=person, household_weight=household_weight)
+
+
+def _group_ids(population: SyntheticPopulation) -> dict[str, np.ndarray]:
+    """Person -> group id (1-based) for every group entity.
+
+    Each household is one tax unit, one SPM unit and one family, which keeps
+    the membership arrays consistent without modelling filing rules.
+    """
+    household = population.person["household"].to_numpy() + 1
+    return {
+        "household": household,
+        "tax_unit": household,
+        "spm_unit": household,
+        "family": household,
+        "marital_unit": population.person["marital_unit"].to_numpy() + 1,
+    }
+
+
+def write_policyengine_input_h5(
+    path: str | Path,
+    n_households: int,
+    *,
+    year: int = DEFAULT_YEAR,
+    seed: int = DEFAULT_SEED,
+) -> Path:
+    """Write an enhanced-CPS-layout input dataset (``variable/year`` arrays).
+
+    A ``.metadata.json`` sidecar with no tax assumption is written beside it,
+    so the tax-assumption loader treats the file as current law.
+    """
+    import h5py
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    population = synthetic_population(n_households, seed=seed)
+    person = population.person
+    membership = _group_ids(population)
+    arrays: dict[str, np.ndarray] = {
+        "person_id": person["person_id"].to_numpy(),
+        "age": person["age"].to_numpy(),
+        "is_male": person["is_male"].to_numpy(),
+        "is_tax_unit_head": person["is_tax_unit_head"].to_numpy(),
+        "is_tax_unit_spouse": person["is_tax_unit_spouse"].to_numpy(),
+        "is_tax_unit_dependent": person["is_tax_unit_dependent"].to_numpy(),
+        "employment_income": person["employment_income"].to_numpy(),
+        "self_employment_income": person["self_employment_income"].to_numpy(),
+        "social_security_retirement": person["social_security_retirement"].to_numpy(),
+        "taxable_interest_income": person["taxable_interest_income"].to_numpy(),
+        "household_weight": population.household_weight,
+        "state_fips": np.full(n_households, 6, dtype=np.int64),
+    }
+    for entity in GROUP_ENTITIES:
+        ids = membership[entity]
+        arrays[f"{entity}_id"] = np.unique(ids)
+        arrays[f"person_{entity}_id"] = ids
+
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with h5py.File(tmp_path, "w") as store:
+        for variable, values in arrays.items():
+            store.create_dataset(f"{variable}/{year}", data=values)
+    tmp_path.replace(path)
+    Path(f"{path}.metadata.json").write_text(
+        json.dumps(
+            {
+                "synthetic": True,
+                "n_households": n_households,
+                "seed": seed,
+                "year": year,
+            },
+            indent=2,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def write_full_output_h5(
+    path: str | Path,
+    n_households: int,
+    *,
+    year: int = DEFAULT_YEAR,
+    seed: int = DEFAULT_SEED,
+    extra_columns_per_entity: int = 40,
+) -> Path:
+    """Write a scenario H5 with the entity tables a full-H5 worker produces.
+
+    ``extra_columns_per_entity`` pads each table with float columns so reads
+    cost roughly what the real ~hundreds-of-variables output does.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    population = synthetic_population(n_households, seed=seed)
+    person = population.person
+    membership = _group_ids(population)
+    rng = np.random.default_rng([seed, n_households, 1])
+    person_weight = population.household_weight[membership["household"] - 1]
+
+    def group_sum(entity: str, values: np.ndarray) -> np.ndarray:
+        return np.bincount(membership[entity] - 1, weights=values)
+
+    def group_weight(entity: str) -> np.ndarray:
+        first = np.unique(membership[entity], return_index=True)[1]
+        return person_weight[first]
+
+    earnings = person["employment_income"].to_numpy()
+    self_employment = person["self_employment_income"].to_numpy()
+    social_security = person["social_security_retirement"].to_numpy()
+    tax_unit_social_security = group_sum("tax_unit", social_security)
+    income_tax = np.maximum(
+        group_sum("tax_unit", earnings + self_employment) * 0.12 - 2_000, 0.0
+    )
+    tob_total = np.minimum(tax_unit_social_security * 0.85, income_tax) * 0.2
+    tables = {
+        "person": pd.DataFrame(
+            {
+                "person_id": person["person_id"].to_numpy(),
+                "person_weight": person_weight,
+                "age": person["age"].to_numpy(),
+                "taxable_earnings_for_social_security": np.minimum(earnings, 176_100.0),
+                "social_security_taxable_self_employment_income": np.minimum(
+                    self_employment, 176_100.0
+                ),
+            }
+        ),
+        "tax_unit": pd.DataFrame(
+            {
+                "tax_unit_id": np.unique(membership["tax_unit"]),
+                "tax_unit_weight": group_weight("tax_unit"),
+                "income_tax": income_tax,
+                "tax_unit_social_security": tax_unit_social_security,
+                "tob_revenue_oasdi": tob_total * 0.6,
+                "tob_revenue_medicare_hi": tob_total * 0.4,
+            }
+        ),
+        "household": pd.DataFrame(
+            {
+                "household_id": np.unique(membership["household"]),
+                "household_weight": population.household_weight,
+                "household_net_income": group_sum("household", earnings) - income_tax,
+                "employer_ss_tax_income_tax_revenue": group_sum(
+                    "household", earnings * 0.062 * 0.1
+                ),
+                "employer_medicare_tax_income_tax_revenue": group_sum(
+                    "household", earnings * 0.0145 * 0.1
+                ),
+            }
+        ),
+    }
+    for entity in ("spm_unit", "family", "marital_unit"):
+        tables[entity] = pd.DataFrame(
+            {
+                f"{entity}_id": np.unique(membership[entity]),
+                f"{entity}_weight": group_weight(entity),
+            }
+        )
+    for entity, frame in tables.items():
+        padding = rng.normal(size=(len(frame), extra_columns_per_entity))
+        for column in range(extra_columns_per_entity):
+            frame[f"synthetic_{entity}_output_{column:03d}"] = padding[:, column]
+
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.unlink(missing_ok=True)
+    with pd.HDFStore(tmp_path, mode="w") as store:
+        for entity, frame in tables.items():
+            store.put(entity, frame, format="table")
+        store.put("_time_period", pd.Series([int(year)]), format="table")
+    tmp_path.replace(path)
+    return path
+
+
+def entropy_calibration_problem(
+    n_households: int,
+    *,
+    seed: int = DEFAULT_SEED,
+    target_drift: float = 0.05,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """``(A, targets, baseline_weights)`` for a feasible entropy calibration.
+
+    Columns mirror the projection pipeline: household member counts by age
+    band, then Social Security benefits and taxable payroll. Targets drift
+    from the baseline totals by up to ``target_drift`` so the solver has
+    real work to do.
+    """
+    population = synthetic_population(n_households, seed=seed)
+    person = population.person
+    household = person["household"].to_numpy()
+    age_bands = np.digitize(
+        person["age"].to_numpy(), [5, 18, 25, 35, 45, 55, 62, 67, 75, 85]
+    )
+    n_bands = 11
+    counts = np.zeros((n_households, n_bands))
+    np.add.at(counts, (household, age_bands), 1.0)
+    benefits = np.bincount(
+        household,
+        weights=person["social_security_retirement"].to_numpy(),
+        minlength=n_households,
+    )
+    payroll = np.bincount(
+        household,
+        weights=np.minimum(person["employment_income"].to_numpy(), 176_100.0),
+        minlength=n_households,
+    )
+    A = np.column_stack([counts, benefits, payroll])
+    A = A[:, A.sum(axis=0) > 0]
+    baseline_weights = population.household_weight
+    rng = np.random.default_rng([seed, n_households, 2])
+    drift = 1.0 + rng.uniform(-target_drift, target_drift, A.shape[1])
+    targets = (A.T @ baseline_weights) * drift
+    return A, targets, baseline_weights
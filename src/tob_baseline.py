@@ -9,6 +9,8 @@ import subprocess
 import numpy as np
 import pandas as pd
 
+from .assumptions import table_frame
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 CURRENT_LAW_PATH = REPO_ROOT / "data" / "tob_current_law_tr2025.csv"
@@ -89,16 +91,14 @@ def _unique_values(df: pd.DataFrame, column: str) -> list[str]:
 
 
 def load_current_law_series() -> pd.DataFrame:
-    current_law = pd.read_csv(CURRENT_LAW_PATH)
+    current_law = table_frame(CURRENT_LAW_PATH)
     missing_columns = REQUIRED_CURRENT_LAW_COLUMNS - set(current_law.columns)
     if missing_columns:
         raise ValueError(
             f"Missing current-law TOB columns in {CURRENT_LAW_PATH.name}: {sorted(missing_columns)}"
         )
 
-    payroll = pd.read_csv(
-        SSA_ECONOMIC_PROJECTIONS_PATH, usecols=["year", "taxable_payroll"]
-    )
+    payroll = table_frame(SSA_ECONOMIC_PROJECTIONS_PATH)[["year", "taxable_payroll"]]
     payroll_2025 = pd.DataFrame([{"year": 2025, "taxable_payroll": 10621.0}])
     payroll = pd.concat([payroll_2025, payroll], ignore_index=True)
 
@@ -177,7 +177,7 @@ def build_tob_baseline_tr2026() -> pd.DataFrame:
     TR2026 incorporates OBBBA in current law, so the published baseline IS
     the raw Trustees series — no OACT delta bridge, no HI scaling method.
     """
-    aux = pd.read_csv(TR2026_AUX_PATH)
+    aux = table_frame(TR2026_AUX_PATH)
     df = pd.DataFrame(
         {
             "year": aux["year"].astype(int),
@@ -310,7 +310,7 @@ def validate_generated_baseline(df: pd.DataFrame) -> None:
 
     # Cross-check against the TR2026 target extract: the published baseline
     # must equal the raw Trustees/CMS series in every overlapping year.
-    aux = pd.read_csv(TR2026_AUX_PATH).set_index("year")
+    aux = table_frame(TR2026_AUX_PATH).set_index("year")
     merged = df.set_index("year")
     overlap = merged.index.intersection(aux.index)
     if len(overlap) < 70:
@@ -3,6 +3,12 @@ from __future__ import annotations
 from functools import lru_cache
 from typing import Any, Mapping
 
+import numpy as np
+import pandas as pd
+
+
+ALLOCATION_MODES = ("currentLaw", "baselineShares", "allOasdi", "allHi")
+
 
 @lru_cache(maxsize=1)
 def load_allocation_rules() -> dict[str, set[str]]:
@@ -24,6 +30,9 @@ def load_allocation_rules() -> dict[str, set[str]]:
         "baselineShareOptions": {"option3", "option4", "option11"},
         "netImpactOptions": {"option5", "option6"},
         "directBranchingOptions": {"option12"},
+        # Reverse Roth's income-tax cost is folded into OASDI rather than shown
+        # as a general-fund line.
+        "generalFundToOasdiOptions": {"reverse_roth"},
     }
 
 
@@ -66,3 +75,97 @@ def split_revenue_impacts(
     oasdi_impact = float(row["tob_oasdi_impact"])
     hi_impact = float(row["tob_medicare_hi_impact"])
     return revenue_impact, oasdi_impact, hi_impact
+
+
+def split_revenue_frame(
+    frame: pd.DataFrame,
+    allocation_mode: str = "baselineShares",
+) -> pd.DataFrame:
+    """Vectorized splitRevenueImpacts from dashboard/src/lib/dashboard-data.ts.
+
+    Returns one row per input row with revenue, OASDI, HI and general-fund
+    impact columns. Unlike the scalar helper above, this covers every
+    dashboard mode, including the all-OASDI / all-HI overrides and the
+    reverse-Roth general-fund fold.
+    """
+    if allocation_mode not in ALLOCATION_MODES:
+        raise ValueError(
+            f"Unknown allocation mode {allocation_mode!r}; "
+            f"expected one of {ALLOCATION_MODES}"
+        )
+    rules = load_allocation_rules()
+    reform = frame["reform_name"].astype(str)
+
+    def column(name: str) -> np.ndarray:
+        return (
+            pd.to_numeric(frame[name], errors="coerce")
+            .fillna(0.0)
+            .to_numpy(dtype=float)
+        )
+
+    revenue = column("revenue_impact")
+    tob_oasdi = column("tob_oasdi_impact")
+    tob_hi = column("tob_medicare_hi_impact")
+    net_oasdi = column("oasdi_net_impact")
+    net_hi = column("hi_net_impact")
+    baseline_oasdi = column("baseline_tob_oasdi")
+    baseline_hi = column("baseline_tob_medicare_hi")
+
+    direct = reform.isin(rules["directBranchingOptions"]).to_numpy()
+    net = reform.isin(rules["netImpactOptions"]).to_numpy()
+    native_revenue = np.where(direct | net, net_oasdi + net_hi, revenue)
+
+    if allocation_mode in ("allOasdi", "allHi"):
+        zeros = np.zeros_like(native_revenue)
+        oasdi = native_revenue if allocation_mode == "allOasdi" else zeros
+        hi = zeros if allocation_mode == "allOasdi" else native_revenue
+        return pd.DataFrame(
+            {
+                "revenue_impact": native_revenue,
+                "oasdi_impact": oasdi,
+                "hi_impact": hi,
+                "general_fund_impact": zeros,
+            },
+            index=frame.index,
+        )
+
+    fold_to_oasdi = reform.isin(rules["generalFundToOasdiOptions"]).to_numpy()
+    baseline_shares = reform.isin(rules["baselineShareOptions"]).to_numpy()
+    if allocation_mode == "baselineShares":
+        baseline_shares = (
+            baseline_shares | reform.isin(rules["allocationEligibleOptions"]).to_numpy()
+        )
+    baseline_total = baseline_oasdi + baseline_hi
+    with np.errstate(divide="ignore", invalid="ignore"):
+        share_oasdi = np.where(
+            baseline_total > 0, revenue * baseline_oasdi / baseline_total, 0.0
+        )
+    share_hi = np.where(baseline_total > 0, revenue - share_oasdi, 0.0)
+
+    # Branch precedence mirrors the TypeScript: direct branching, reverse-Roth
+    # fold, baseline shares, net impact, then the statutory columns.
+    conditions = [direct, fold_to_oasdi, baseline_shares, net]
+    revenue_out = np.select(
+        conditions, [net_oasdi + net_hi, revenue, revenue, net_oasdi + net_hi], revenue
+    )
+    oasdi_out = np.select(
+        conditions,
+        [net_oasdi, revenue - tob_hi, share_oasdi, net_oasdi],
+        tob_oasdi,
+    )
+    hi_out = np.select(conditions, [net_hi, tob_hi, share_hi, net_hi], tob_hi)
+    zeros = np.zeros_like(revenue)
+    general_fund_out = np.select(
+        conditions,
+        [zeros, zeros, np.where(baseline_total > 0, 0.0, revenue), zeros],
+        revenue - tob_oasdi - tob_hi,
+    )
+    return pd.DataFrame(
+        {
+            "revenue_impact": revenue_out,
+            "oasdi_impact": oasdi_out,
+            "hi_impact": hi_out,
+            "general_fund_impact": general_fund_out,
+        },
+        index=frame.index,
+    )
@@ -0,0 +1,453 @@
+"""Attribute a cell's aggregate change between two full-output H5 vintages.
+
+``compare_result_vintages.py`` and ``attribute_result_changes.py`` diff
+aggregate ``results.csv`` rows. This module goes down to the microdata.
+It takes two full-output H5s for the same cell, for example before and
+after a dataset or ``policyengine-us`` update. Each entity's units are
+aligned on their ids (``tax_unit_id``, ``household_id``, ...). The change
+in a variable's weighted total then splits exactly into four parts:
+
+- ``value_change``: ``sum w_from * (x_to - x_from)`` over units in both
+  vintages.
+- ``weight_change``: ``sum (w_to - w_from) * x_to`` over the same units.
+- ``entered``: ``sum w_to * x_to`` over units only in the new vintage.
+- ``exited``: ``-sum w_from * x_from`` over units only in the old one.
+
+Each part is also summed by segment: the age band of the unit's oldest
+member, the household income decile, and filing status. A continuing unit
+keeps its old-vintage segment, so segment rows add up to the variable
+total. Vintages without a ``filing_status`` column (the default output
+manifest has none) segment tax units by their number of adults instead
+(``adults=0/1/2+``), and the summary names ``tax_unit_adults`` as the
+filing-status source.
+
+The worker writes each entity as one PyTables ``table`` whose float
+columns share a single values block. Selecting a few columns still decodes
+that whole block, so columns are read in row chunks of ``chunk_rows``, and
+only the requested columns of each chunk are kept. Each vintage is read
+once per entity, for the ids, the weights and every requested variable
+together. Peak memory is one chunk of the full table plus those columns,
+whatever the width of the output. Fixed-format tables cannot be read in
+part and are loaded whole.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .reform_full_h5_artifacts import (
+    US_ENTITY_KEYS,
+    US_ENTITY_WEIGHT_COLUMNS,
+    file_sha256,
+)
+
+
+ATTRIBUTION_SCHEMA = "crfb_vintage_attribution/v1"
+DEFAULT_VARIABLES = (
+    "income_tax",
+    "tob_revenue_oasdi",
+    "tob_revenue_medicare_hi",
+    "employee_payroll_tax",
+    "employer_ss_tax_income_tax_revenue",
+    "employer_medicare_tax_income_tax_revenue",
+)
+DIMENSIONS = ("age_band", "income_decile", "filing_status")
+AGE_BAND_EDGES = (25, 35, 45, 55, 65, 75)
+DEFAULT_CHUNK_ROWS = 100_000
+COMPONENTS = ("value_change", "weight_change", "entered", "exited")
+
+
+def _entity_id_column(entity: str) -> str:
+    return f"{entity}_id"
+
+
+def age_band_labels(ages: np.ndarray) -> np.ndarray:
+    """``"0-24"``, ``"25-34"``, ..., ``"75+"``; ``"unknown"`` for missing ages."""
+    names = [f"0-{AGE_BAND_EDGES[0] - 1}"]
+    names += [
+        f"{low}-{high - 1}" for low, high in zip(AGE_BAND_EDGES, AGE_BAND_EDGES[1:])
+    ]
+    names.append(f"{AGE_BAND_EDGES[-1]}+")
+    ages = np.asarray(ages, dtype=float)
+    labels = np.asarray(names, dtype=object)[np.digitize(ages, AGE_BAND_EDGES)]
+    labels[np.isnan(ages)] = "unknown"
+    return labels
+
+
+def match_positions(ids: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Position in ``targets`` of each of ``ids``, or -1 when absent.
+
+    ``targets`` must be unique; ``ids`` may repeat (person-to-unit links).
+    """
+    ids = np.asarray(ids)
+    targets = np.asarray(targets)
+    if len(targets) == 0:
+        return np.full(len(ids), -1, dtype=np.int64)
+    order = np.argsort(targets, kind="stable")
+    sorted_targets = targets[order]
+    if (sorted_targets[1:] == sorted_targets[:-1]).any():
+        raise ValueError("Cannot align on duplicate ids.")
+    found = np.minimum(np.searchsorted(sorted_targets, ids), len(targets) - 1)
+    matched = sorted_targets[found] == ids
+    return np.where(matched, order[found], -1)
+
+
+@dataclass
+class Vintage:
+    """One full-output H5, read in row chunks."""
+
+    path: Path
+    columns: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    chunk_rows: int = DEFAULT_CHUNK_ROWS
+    _loaded: dict[str, dict[str, np.ndarray]] = field(default_factory=dict, repr=False)
+    _segments: dict[str, dict[str, np.ndarray]] = field(
+        default_factory=dict, repr=False
+    )
+
+    @classmethod
+    def open(cls, path: Path, *, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Vintage:
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows must be at least 1.")
+        columns: dict[str, tuple[str, ...]] = {}
+        with pd.HDFStore(path, mode="r") as store:
+            for entity in US_ENTITY_KEYS:
+                if f"/{entity}" not in store.keys():
+                    continue
+                if store.get_storer(entity).format_type == "table":
+                    head = store.select(entity, start=0, stop=0)
+                else:
+                    head = store[entity].iloc[:0]
+                columns[entity] = tuple(str(column) for column in head.columns)
+        return cls(path=Path(path), columns=columns, chunk_rows=chunk_rows)
+
+    def load(self, entity: str, names: Sequence[str]) -> None:
+        """Read ``names`` in one pass and keep them for later ``read`` calls."""
+        self._loaded.setdefault(entity, {}).update(self._read_table(entity, names))
+
+    def read(self, entity: str, names: Sequence[str]) -> dict[str, np.ndarray]:
+        loaded = self._loaded.get(entity, {})
+        if all(name in loaded for name in names):
+            return {name: loaded[name] for name in names}
+        return self._read_table(entity, names)
+
+    def _read_table(self, entity: str, names: Sequence[str]) -> dict[str, np.ndarray]:
+        names = list(dict.fromkeys(names))
+        missing = [name for name in names if name not in self.columns.get(entity, ())]
+        if missing:
+            raise KeyError(f"{self.path} {entity} table has no columns {missing}")
+        with pd.HDFStore(self.path, mode="r") as store:
+            storer = store.get_storer(entity)
+            if storer.format_type != "table":
+                frame = store[entity]
+                return {name: frame[name].to_numpy() for name in names}
+            pieces: dict[str, list[np.ndarray]] = {name: [] for name in names}
+            for start in range(0, storer.nrows, self.chunk_rows) or (0,):
+                chunk = store.select(
+                    entity, columns=names, start=start, stop=start + self.chunk_rows
+                )
+                for name in names:
+                    pieces[name].append(chunk[name].to_numpy())
+        return {name: np.concatenate(parts) for name, parts in pieces.items()}
+
+    def entity_of(self, variable: str) -> str | None:
+        for entity in US_ENTITY_KEYS:
+            if variable in self.columns.get(entity, ()):
+                return entity
+        return None
+
+    def segments(self, entity: str) -> dict[str, np.ndarray]:
+        """Segment labels for every row of ``entity``, by dimension."""
+        if entity not in self._segments:
+            self._segments[entity] = self._build_segments(entity)
+        return self._segments[entity]
+
+    def _build_segments(self, entity: str) -> dict[str, np.ndarray]:
+        unit_ids = self.read(entity, [_entity_id_column(entity)])[
+            _entity_id_column(entity)
+        ]
+        person_columns = self.columns.get("person", ())
+        links = [
+            name
+            for name in (
+                _entity_id_column(entity),
+                "household_id",
+                "tax_unit_id",
+                "age",
+                "is_adult",
+            )
+            if name in person_columns
+        ]
+        person = self.read("person", list(dict.fromkeys(links)))
+        if _entity_id_column(entity) not in person:
+            raise KeyError(f"{self.path} person table has no {entity} link")
+        person_unit = match_positions(person[_entity_id_column(entity)], unit_ids)
+        linked = person_unit >= 0
+        segments: dict[str, np.ndarray] = {}
+
+        oldest = np.full(len(unit_ids), np.nan)
+        if "age" in person:
+            ages = np.asarray(person["age"], dtype=float)[linked]
+            np.fmax.at(oldest, person_unit[linked], ages)
+        segments["age_band"] = age_band_labels(oldest)
+
+        # Every member of a unit below the household shares its household.
+        unit_household = np.full(len(unit_ids), -1, dtype=np.int64)
+        if "household_id" in person and "household_income_decile" in self.columns.get(
+            "household", ()
+        ):
+            household = self.read(
+                "household", ["household_id", "household_income_decile"]
+            )
+            person_household = match_positions(
+                person["household_id"], household["household_id"]
+            )
+            unit_household[person_unit[linked]] = person_household[linked]
+            deciles = np.asarray(household["household_income_decile"], dtype=float)
+            names = np.asarray(
+                [
+                    str(int(value)) if np.isfinite(value) else "unknown"
+                    for value in deciles
+                ]
+                + ["unknown"],
+                dtype=object,
+            )
+            # Units with no linked household fall on the trailing "unknown".
+            segments["income_decile"] = names[
+                np.where(unit_household >= 0, unit_household, len(deciles))
+            ]
+        else:
+            segments["income_decile"] = np.full(len(unit_ids), "unknown", dtype=object)
+
+        segments["filing_status"] = self._filing_status(
+            entity, unit_ids, person, person_unit
+        )
+        return segments
+
+    def _filing_status(
+        self,
+        entity: str,
+        unit_ids: np.ndarray,
+        person: dict[str, np.ndarray],
+        person_unit: np.ndarray,
+    ) -> np.ndarray:
+        if entity != "tax_unit":
+            return np.full(len(unit_ids), "n/a", dtype=object)
+        if "filing_status" in self.columns.get("tax_unit", ()):
+            return np.asarray(
+                self.read("tax_unit", ["filing_status"])["filing_status"]
+            ).astype(str)
+        if "is_adult" not in person:
+            return np.full(len(unit_ids), "unknown", dtype=object)
+        linked = person_unit >= 0
+        adults = np.bincount(
+            person_unit[linked],
+            weights=np.asarray(person["is_adult"], dtype=float)[linked],
+            minlength=len(unit_ids),
+        ).astype(int)
+        return np.asarray(["adults=0", "adults=1", "adults=2+"], dtype=object)[
+            np.minimum(adults, 2)
+        ]
+
+    @property
+    def has_filing_status(self) -> bool:
+        return "filing_status" in self.columns.get("tax_unit", ())
+
+
+@dataclass(frozen=True)
+class VariableAttribution:
+    variable: str
+    entity: str
+    total_from: float
+    total_to: float
+    components: dict[str, float]
+    segments: pd.DataFrame
+    top_units: pd.DataFrame
+
+    @property
+    def delta(self) -> float:
+        return self.total_to - self.total_from
+
+
+def attribute_variable(
+    source: Vintage,
+    target: Vintage,
+    variable: str,
+    *,
+    dimensions: Sequence[str] = DIMENSIONS,
+    top_units: int = 0,
+) -> VariableAttribution:
+    """Decompose the change in ``variable``'s weighted total between vintages."""
+    entity = source.entity_of(variable)
+    if entity is None or target.entity_of(variable) != entity:
+        raise KeyError(f"{variable} is not in the same entity table of both vintages")
+    id_column = _entity_id_column(entity)
+    weight_column = US_ENTITY_WEIGHT_COLUMNS[entity]
+    old = source.read(entity, [id_column, weight_column, variable])
+    new = target.read(entity, [id_column, weight_column, variable])
+    old_weight = np.asarray(old[weight_column], dtype=float)
+    new_weight = np.asarray(new[weight_column], dtype=float)
+    old_value = np.asarray(old[variable], dtype=float)
+    new_value = np.asarray(new[variable], dtype=float)
+
+    position = match_positions(old[id_column], new[id_column])
+    continuing = position >= 0
+    entering = np.ones(len(new_value), dtype=bool)
+    entering[position[continuing]] = False
+    mapped = np.maximum(position, 0)
+
+    parts = {
+        "value_change": np.where(
+            continuing, old_weight * (new_value[mapped] - old_value), 0.0
+        ),
+        "weight_change": np.where(
+            continuing, (new_weight[mapped] - old_weight) * new_value[mapped], 0.0
+        ),
+        "entered": np.zeros(len(old_value)),
+        "exited": np.where(continuing, 0.0, -old_weight * old_value),
+    }
+    rows = {
+        name: np.concatenate([values, np.zeros(int(entering.sum()))])
+        for name, values in parts.items()
+    }
+    rows["entered"][len(old_value) :] = (new_weight * new_value)[entering]
+    frame = pd.DataFrame(rows)
+    frame["total"] = frame[list(COMPONENTS)].sum(axis=1)
+
+    old_segments = source.segments(entity)
+    new_segments = target.segments(entity)
+    segment_tables = []
+    for dimension in dimensions:
+        labels = np.concatenate(
+            [
+                np.asarray(old_segments[dimension], dtype=object),
+                np.asarray(new_segments[dimension], dtype=object)[entering],
+            ]
+        )
+        table = frame.groupby(labels, sort=True).sum()
+        table.index.name = "segment"
+        segment_tables.append(table.reset_index().assign(dimension=dimension))
+    segments = (
+        pd.concat(segment_tables, ignore_index=True)
+        if segment_tables
+        else pd.DataFrame(columns=["segment", *COMPONENTS, "total", "dimension"])
+    )
+
+    units = frame.assign(
+        unit_id=np.concatenate([old[id_column], new[id_column][entering]])
+    )
+    ranked = units.reindex(units["total"].abs().sort_values(ascending=False).index)
+    return VariableAttribution(
+        variable=variable,
+        entity=entity,
+        total_from=float(old_weight @ old_value),
+        total_to=float(new_weight @ new_value),
+        components={name: float(frame[name].sum()) for name in COMPONENTS},
+        segments=segments,
+        top_units=ranked.head(top_units).reset_index(drop=True),
+    )
+
+
+def attribute_vintages(
+    source_path: Path,
+    target_path: Path,
+    *,
+    variables: Iterable[str] = DEFAULT_VARIABLES,
+    dimensions: Sequence[str] = DIMENSIONS,
+    top_units: int = 0,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> tuple[list[VariableAttribution], dict[str, Any]]:
+    """Attribute every requested variable present in both vintages.
+
+    Returns the attributions and a summary payload; variables missing from
+    either vintage are listed under ``skipped_variables``.
+    """
+    unknown = sorted(set(dimensions) - set(DIMENSIONS))
+    if unknown:
+        raise ValueError(f"unknown dimensions {unknown}; expected {DIMENSIONS}")
+    source = Vintage.open(source_path, chunk_rows=chunk_rows)
+    target = Vintage.open(target_path, chunk_rows=chunk_rows)
+    attributions: list[VariableAttribution] = []
+    skipped: list[dict[str, str]] = []
+    present: list[str] = []
+    for variable in variables:
+        if source.entity_of(variable) is None or target.entity_of(variable) is None:
+            skipped.append({"variable": variable, "reason": "missing from a vintage"})
+        else:
+            present.append(variable)
+    for entity in dict.fromkeys(source.entity_of(variable) for variable in present):
+        names = [_entity_id_column(entity), US_ENTITY_WEIGHT_COLUMNS[entity]]
+        names += [name for name in present if source.entity_of(name) == entity]
+        for vintage in (source, target):
+            available = vintage.columns.get(entity, ())
+            vintage.load(entity, [name for name in names if name in available])
+    for variable in present:
+        attributions.append(
+            attribute_variable(
+                source,
+                target,
+                variable,
+                dimensions=dimensions,
+                top_units=top_units,
+            )
+        )
+    summary = {
+        "schema": ATTRIBUTION_SCHEMA,
+        "from": {"path": str(source_path), "sha256": file_sha256(source_path)},
+        "to": {"path": str(target_path), "sha256": file_sha256(target_path)},
+        "units": "dollars, weighted",
+        "filing_status_source": {
+            "from": "filing_status" if source.has_filing_status else "tax_unit_adults",
+            "to": "filing_status" if target.has_filing_status else "tax_unit_adults",
+        },
+        "variables": [
+            {
+                "variable": item.variable,
+                "entity": item.entity,
+                "total_from": item.total_from,
+                "total_to": item.total_to,
+                "delta": item.delta,
+                **item.components,
+            }
+            for item in attributions
+        ],
+        "skipped_variables": skipped,
+    }
+    return attributions, summary
+
+
+def segment_table(attributions: Sequence[VariableAttribution]) -> pd.DataFrame:
+    """Long ``variable, dimension, segment, components..., share_of_delta`` table."""
+    columns = [
+        "variable",
+        "entity",
+        "dimension",
+        "segment",
+        *COMPONENTS,
+        "total",
+        "share_of_delta",
+    ]
+    frames = []
+    for item in attributions:
+        frame = item.segments.assign(variable=item.variable, entity=item.entity)
+        frame["share_of_delta"] = frame["total"] / item.delta if item.delta else np.nan
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(frames, ignore_index=True)[columns]
+
+
+def top_unit_table(attributions: Sequence[VariableAttribution]) -> pd.DataFrame:
+    columns = ["variable", "entity", "unit_id", *COMPONENTS, "total"]
+    frames = [
+        item.top_units.assign(variable=item.variable, entity=item.entity)
+        for item in attributions
+        if not item.top_units.empty
+    ]
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(frames, ignore_index=True)[columns]
@@ -9,78 +9,14 @@ from typing import AbstractSet, Any, Callable, Mapping
 
 import numpy as np
 import pandas as pd
-from policyengine_core.data import Dataset
-from policyengine_core.reforms import Reform
 
 try:
-    from .engine import dataset_microsimulation
-    from .reforms import (
-        get_option10_behavioral_dict,
-        get_option10_reform,
-        get_option11_behavioral_dict,
-        get_option11_reform,
-        get_option12_behavioral_dict,
-        get_option12_reform,
-        get_option1_behavioral_dict,
-        get_option1_reform,
-        get_option2_behavioral_dict,
-        get_option2_reform,
-        get_option3_behavioral_dict,
-        get_option3_reform,
-        get_option4_behavioral_dict,
-        get_option4_reform,
-        get_option5_behavioral_dict,
-        get_option5_reform,
-        get_option6_behavioral_dict,
-        get_option6_reform,
-        get_option7_behavioral_dict,
-        get_option7_reform,
-        get_option8_behavioral_dict,
-        get_option8_reform,
-        get_option9_behavioral_dict,
-        get_option9_reform,
-        get_reverse_roth_behavioral_reform,
-        get_reverse_roth_reform,
-        get_tax93_behavioral_dict,
-        get_tax93_reform,
-    )
     from .tax_assumption_loader import (
         TaxAssumptionContract,
         load_tax_assumption_reform_for_dataset,
         tax_assumption_contract_for_dataset,
     )
 except ImportError:  # pragma: no cover - script execution fallback
-    from engine import dataset_microsimulation
-    from reforms import (
-        get_option10_behavioral_dict,
-        get_option10_reform,
-        get_option11_behavioral_dict,
-        get_option11_reform,
-        get_option12_behavioral_dict,
-        get_option12_reform,
-        get_option1_behavioral_dict,
-        get_option1_reform,
-        get_option2_behavioral_dict,
-        get_option2_reform,
-        get_option3_behavioral_dict,
-        get_option3_reform,
-        get_option4_behavioral_dict,
-        get_option4_reform,
-        get_option5_behavioral_dict,
-        get_option5_reform,
-        get_option6_behavioral_dict,
-        get_option6_reform,
-        get_option7_behavioral_dict,
-        get_option7_reform,
-        get_option8_behavioral_dict,
-        get_option8_reform,
-        get_option9_behavioral_dict,
-        get_option9_reform,
-        get_reverse_roth_behavioral_reform,
-        get_reverse_roth_reform,
-        get_tax93_behavioral_dict,
-        get_tax93_reform,
-    )
     from tax_assumption_loader import (
         TaxAssumptionContract,
         load_tax_assumption_reform_for_dataset,
@@ -88,38 +24,61 @@ except ImportError:  # pragma: no cover - script execution fallback
     )
 
 
+# The engine and reform modules load the policyengine-us tax-benefit system.
+# They are imported on first use so that aggregation, status, and manifest
+# code that only needs result types from this module starts quickly.
+def dataset_microsimulation(dataset: Any, reform: Any = None, **kwargs: Any) -> Any:
+    try:
+        from .engine import dataset_microsimulation as build
+    except ImportError:  # pragma: no cover - script execution fallback
+        from engine import dataset_microsimulation as build
+    return build(dataset, reform=reform, **kwargs)
+
+
+def _deferred_reform(name: str) -> Callable[[], Any]:
+    def build() -> Any:
+        try:
+            from . import reforms
+        except ImportError:  # pragma: no cover - script execution fallback
+            import reforms
+        return getattr(reforms, name)()
+
+    build.__name__ = build.__qualname__ = name
+    return build
+
+
 STATIC_REFORM_FUNCTIONS = {
-    "option1": get_option1_reform,
-    "option2": get_option2_reform,
-    "option3": get_option3_reform,
-    "option4": get_option4_reform,
-    "option5": get_option5_reform,
-    "option6": get_option6_reform,
-    "option7": get_option7_reform,
-    "option8": get_option8_reform,
-    "option9": get_option9_reform,
-    "option10": get_option10_reform,
-    "option11": get_option11_reform,
-    "option12": get_option12_reform,
-    "reverse_roth": get_reverse_roth_reform,
-    "tax93": get_tax93_reform,
+    "option1": _deferred_reform("get_option1_reform"),
+    "option2": _deferred_reform("get_option2_reform"),
+    "option3": _deferred_reform("get_option3_reform"),
+    "option4": _deferred_reform("get_option4_reform"),
+    "option5": _deferred_reform("get_option5_reform"),
+    "option6": _deferred_reform("get_option6_reform"),
+    "option7": _deferred_reform("get_option7_reform"),
+    "option8": _deferred_reform("get_option8_reform"),
+    "option9": _deferred_reform("get_option9_reform"),
+    "option10": _deferred_reform("get_option10_reform"),
+    "option11": _deferred_reform("get_option11_reform"),
+    "option12": _deferred_reform("get_option12_reform"),
+    "reverse_roth": _deferred_reform("get_reverse_roth_reform"),
+    "tax93": _deferred_reform("get_tax93_reform"),
 }
 
 BEHAVIORAL_REFORM_FUNCTIONS = {
-    "option1": get_option1_behavioral_dict,
-    "option2": get_option2_behavioral_dict,
-    "option3": get_option3_behavioral_dict,
-    "option4": get_option4_behavioral_dict,
-    "option5": get_option5_behavioral_dict,
-    "option6": get_option6_behavioral_dict,
-    "option7": get_option7_behavioral_dict,
-    "option8": get_option8_behavioral_dict,
-    "option9": get_option9_behavioral_dict,
-    "option10": get_option10_behavioral_dict,
-    "option11": get_option11_behavioral_dict,
-    "option12": get_option12_behavioral_dict,
-    "reverse_roth": get_reverse_roth_behavioral_reform,
-    "tax93": get_tax93_behavioral_dict,
+    "option1": _deferred_reform("get_option1_behavioral_dict"),
+    "option2": _deferred_reform("get_option2_behavioral_dict"),
+    "option3": _deferred_reform("get_option3_behavioral_dict"),
+    "option4": _deferred_reform("get_option4_behavioral_dict"),
+    "option5": _deferred_reform("get_option5_behavioral_dict"),
+    "option6": _deferred_reform("get_option6_behavioral_dict"),
+    "option7": _deferred_reform("get_option7_behavioral_dict"),
+    "option8": _deferred_reform("get_option8_behavioral_dict"),
+    "option9": _deferred_reform("get_option9_behavioral_dict"),
+    "option10": _deferred_reform("get_option10_behavioral_dict"),
+    "option11": _deferred_reform("get_option11_behavioral_dict"),
+    "option12": _deferred_reform("get_option12_behavioral_dict"),
+    "reverse_roth": _deferred_reform("get_reverse_roth_behavioral_reform"),
+    "tax93": _deferred_reform("get_tax93_behavioral_dict"),
 }
 
 OPTION6_PHASE_IN_RATES = {
@@ -192,6 +151,8 @@ class ScenarioAggregate:
 
 
 def _normalize_dataset(dataset: Any) -> Any:
+    from policyengine_core.data import Dataset
+
     if isinstance(dataset, Dataset):
         return dataset
     if isinstance(dataset, (str, Path)):
@@ -1342,6 +1303,8 @@ def build_reform(
             raise KeyError(f"No behavioral reform for: {reform_id}")
         reform_definition = behavioral_func()
         if isinstance(reform_definition, dict):
+            from policyengine_core.reforms import Reform
+
             return Reform.from_dict(reform_definition, country_id="us")
         return reform_definition
 
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src import anchor_planner
+from src.anchor_planner import (
+    ReformSeries,
+    SegmentPlan,
+    apply_budget,
+    plan_reform,
+    write_anchor_plan,
+)
+from modal_batch.reform_full_h5 import _parse_cell_keys
+from src.modal_batch_helpers import parse_cells_file
+from src.reform_full_h5_contract import ReformCell
+
+YEARS = np.arange(2026, 2041)
+
+
+def _series(static, ratio, *, anchors=(2026, 2040)) -> ReformSeries:
+    static = np.asarray(static, dtype=float)[:, None]
+    ratio = np.asarray(ratio, dtype=float)[:, None]
+    return ReformSeries(
+        reform="option1",
+        years=YEARS,
+        columns=("revenue_impact",),
+        static=static,
+        reference=static * ratio,
+        anchors=anchors,
+        candidates=tuple(int(year) for year in YEARS),
+    )
+
+
+def test_sampled_ratio_kink_needs_one_anchor_at_the_kink():
+    kinked = np.where(YEARS <= 2033, 0.9, 0.9 - 0.05 * (YEARS - 2033))
+    (plan,) = plan_reform(_series(np.full(len(YEARS), 100.0), kinked), method="sampled")
+
+    assert plan.error_ratio > 1.0
+    assert plan.added_years == (2033,)
+    assert plan.residual_error_ratio == pytest.approx(0.0, abs=1e-9)
+
+    linear = np.linspace(0.9, 0.5, len(YEARS))
+    (plan,) = plan_reform(_series(np.full(len(YEARS), 100.0), linear), method="sampled")
+    assert plan.added_years == ()
+    assert plan.reachable
+
+
+def test_curvature_adds_anchors_only_where_the_static_path_bends():
+    straight = 100.0 + 40.0 * (YEARS - 2026)
+    bent = np.where(YEARS <= 2033, straight, 380.0)
+    steady = np.full(len(YEARS), 0.8)
+
+    (unbent,) = plan_reform(_series(straight, steady), method="curvature")
+    (plan,) = plan_reform(_series(bent, steady), method="curvature")
+
+    assert unbent.error_ratio == pytest.approx(0.0, abs=1e-9)
+    assert unbent.added_years == ()
+    assert plan.error_ratio > 1.0
+    assert 2033 in plan.added_years
+    assert plan.reachable
+    with pytest.raises(ValueError, match="unknown method"):
+        plan_reform(_series(bent, steady), method="spline")
+
+
+def test_plan_within_tolerance_beats_fewer_anchors_over_tolerance(monkeypatch):
+    feasible = {(0, 1), (1, 2), (2, 3), (0, 3), (2, 4)}
+
+    def ratio(series, left, right, **_):
+        return (0.5 if (left, right) in feasible else 3.0), None
+
+    monkeypatch.setattr(anchor_planner, "segment_error_ratio", ratio)
+    years = np.arange(2030, 2035)
+    series = ReformSeries(
+        reform="option1",
+        years=years,
+        columns=("revenue_impact",),
+        static=np.ones((len(years), 1)),
+        reference=np.ones((len(years), 1)),
+        anchors=(2030, 2034),
+        candidates=tuple(int(year) for year in years),
+    )
+
+    (plan,) = plan_reform(series, method="sampled")
+
+    # 2033 alone leaves the forced 2033-2034 edge at 3x tolerance.
+    assert plan.added_years == (2031, 2032)
+    assert plan.residual_error_ratio == 0.5
+    assert plan.reachable
+
+
+def test_budget_keeps_the_worst_segments_whole():
+    plans = [
+        SegmentPlan("option1", (2026, 2040), 2030, 3.0, (2030, 2035), 0.5),
+        SegmentPlan("option2", (2026, 2040), 2031, 9.0, (2031,), 0.5),
+        SegmentPlan("option3", (2026, 2040), 2032, 5.0, (2032, 2033), 0.5),
+        SegmentPlan("option4", (2026, 2040), None, 0.0, (), 0.0),
+    ]
+
+    kept, dropped = apply_budget(plans, 3)
+
+    assert [plan.reform for plan in kept] == ["option2", "option3"]
+    assert [plan.reform for plan in dropped] == ["option1"]
+
+
+def test_plan_is_a_behavioral_cells_list_the_submitter_reads(tmp_path: Path):
+    kinked = np.where(YEARS <= 2033, 0.9, 0.9 - 0.05 * (YEARS - 2033))
+    plans = plan_reform(
+        _series(np.full(len(YEARS), 100.0), kinked, anchors=(2026, 2036, 2040)),
+        method="sampled",
+    )
+    output = tmp_path / "plan.csv"
+
+    metadata = write_anchor_plan(output, plans, metadata={"method": "sampled"})
+
+    assert parse_cells_file(output) == [("option1", 2033)]
+    assert "scoring_type" in output.read_text().splitlines()[0]
+    assert _parse_cell_keys(metadata["submit_cells"]) == (
+        ReformCell(year=2033, reform="option1", scoring_type="behavioral"),
+    )
+    sidecar = json.loads(Path(f"{output}.metadata.json").read_text())
+    assert sidecar == metadata
+    assert sidecar["method"] == "sampled"
+    assert sidecar["segments_over_tolerance"] == 1
+    assert sidecar["planned"][0]["segment"] == [2026, 2036]
+    assert sidecar["unreachable_segments"] == []
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.assumptions import (
+    POPULATION_FILE,
+    TRUSTEES_AUX_FILE,
+    age_table,
+    loaded_sources,
+    table_frame,
+    year_table,
+)
+
+
+def test_year_table_is_parsed_once_and_looks_up_ranges():
+    table = year_table(TRUSTEES_AUX_FILE)
+
+    assert year_table(TRUSTEES_AUX_FILE) is table
+    assert table.sha256 == hashlib.sha256(TRUSTEES_AUX_FILE.read_bytes()).hexdigest()
+    assert {"file": table.source, "sha256": table.sha256} in loaded_sources()
+    gdp = table.span("gdp_in_billion_nominal_usd", 2026, 2035)
+    assert gdp.shape == (10,)
+    assert gdp[0] == table.value("gdp_in_billion_nominal_usd", 2026) == 32289.0
+    assert table.at("gdp_in_billion_nominal_usd", [2035, 2026]).tolist() == [
+        gdp[-1],
+        gdp[0],
+    ]
+    assert 2026 in table and 1990 not in table
+    with pytest.raises(KeyError, match="1990"):
+        table.at("gdp_in_billion_nominal_usd", [2026, 1990])
+    with pytest.raises(ValueError):
+        table.columns["gdp_in_billion_nominal_usd"][0] = 0.0
+
+
+def test_copies_are_independent_of_the_cache():
+    frame = table_frame(TRUSTEES_AUX_FILE)
+    frame.loc[:, "gdp_in_billion_nominal_usd"] = 0.0
+    copied = year_table(TRUSTEES_AUX_FILE).frame()
+    copied.loc[:, "gdp_in_billion_nominal_usd"] = 0.0
+
+    assert year_table(TRUSTEES_AUX_FILE).value("gdp_in_billion_nominal_usd", 2026) > 0
+    assert (table_frame(TRUSTEES_AUX_FILE)["gdp_in_billion_nominal_usd"] > 0).all()
+
+
+def test_age_table_folds_the_oldest_ages():
+    table = age_table(POPULATION_FILE, max_age=85)
+    raw = table_frame(POPULATION_FILE)
+    rows = raw[raw.Year == 2060]
+
+    assert table.totals.shape == (len(table.years), 86)
+    np.testing.assert_allclose(table.for_year(2060).sum(), rows.Total.sum())
+    np.testing.assert_allclose(
+        table.for_year(2060)[85], rows[rows.Age >= 85].Total.sum()
+    )
+
+
+def test_rewritten_file_is_reparsed_and_duplicates_fail(tmp_path: Path):
+    path = tmp_path / "series.csv"
+    path.write_text("year,value\n2030,1\n2031,2\n")
+    assert year_table(path).value("value", 2031) == 2.0
+
+    path.write_text("year,value\n2030,1\n2031,5\n")
+    os.utime(path, ns=(1, 1))
+    assert year_table(path).value("value", 2031) == 5.0
+
+    path.write_text("year,value\n2030,1\n2030,2\n")
+    os.utime(path, ns=(2, 2))
+    with pytest.raises(ValueError, match="duplicate years: \\[2030\\]"):
+        year_table(path)
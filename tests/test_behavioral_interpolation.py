@@ -0,0 +1,126 @@
+"""Vectorized anchor-ratio interpolation on small hand-checked panels."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.behavioral_interpolation import (
+    ENDPOINT_FALLBACK,
+    SIGN_FLIP_FALLBACK,
+    AnchorPanel,
+    bracketing_anchors,
+    derive_interior_identities,
+    endpoint_ratios,
+    interpolate_panel,
+    structural_reforms,
+)
+
+YEARS = np.arange(2026, 2031)
+
+
+def _panel(static: list[float], behavioral: list[float], anchors: list[int]):
+    is_anchor = np.isin(YEARS, anchors)[None, :]
+    return AnchorPanel(
+        reforms=("r",),
+        years=YEARS,
+        columns=("revenue_impact",),
+        static=np.asarray(static, dtype=float)[None, :, None],
+        behavioral=np.where(
+            is_anchor[..., None],
+            np.asarray(behavioral, dtype=float)[None, :, None],
+            np.nan,
+        ),
+        is_anchor=is_anchor,
+    )
+
+
+def test_endpoint_ratio_nan_semantics():
+    static = np.array([2.0, 0.0, 0.0, np.nan, np.nan, 1e-12])
+    behavioral = np.array([1.0, 0.0, 5.0, 0.0, 5.0, np.nan])
+
+    ratios, fallback = endpoint_ratios(static, behavioral)
+
+    np.testing.assert_array_equal(ratios, [0.5, 1.0, np.nan, 1.0, np.nan, np.nan])
+    assert fallback.tolist() == [False, False, True, False, True, True]
+
+
+def test_ratio_path_between_anchors():
+    panel = _panel(
+        static=[10.0, 20.0, 30.0, 40.0, 50.0],
+        behavioral=[9.0, 0, 0, 0, 25.0],
+        anchors=[2026, 2030],
+    )
+
+    result = interpolate_panel(panel)
+
+    ratio = 0.9 + (0.5 - 0.9) * np.arange(5) / 4
+    np.testing.assert_allclose(result.values[0, :, 0], [10, 20, 30, 40, 50] * ratio)
+    assert result.values[0, 0, 0] == 9.0 and result.values[0, -1, 0] == 25.0
+    assert result.left[0].tolist() == [0, 0, 0, 0, 4]
+    assert result.right[0].tolist() == [0, 4, 4, 4, 4]
+    assert result.fallbacks == []
+
+
+def test_zero_static_anchor_falls_back_to_values_once_per_interior_year():
+    panel = _panel(
+        static=[0.0, 20.0, 30.0, 40.0, 50.0],
+        behavioral=[4.0, 0, 0, 0, 8.0],
+        anchors=[2026, 2030],
+    )
+
+    result = interpolate_panel(panel)
+
+    np.testing.assert_allclose(result.values[0, :, 0], [4.0, 5.0, 6.0, 7.0, 8.0])
+    assert [record["method"] for record in result.fallbacks] == [ENDPOINT_FALLBACK] * 3
+    assert {record["year"] for record in result.fallbacks} == {2026}
+    assert result.fallbacks[0]["behavioral_value"] == 4.0
+
+
+def test_sign_flip_segment_is_recorded_once():
+    panel = _panel(
+        static=[-10.0, -5.0, 0.0, 5.0, 10.0],
+        behavioral=[-8.0, 0, 0, 0, 12.0],
+        anchors=[2026, 2030],
+    )
+
+    result = interpolate_panel(panel)
+
+    np.testing.assert_allclose(result.values[0, :, 0], [-8.0, -3.0, 2.0, 7.0, 12.0])
+    assert result.fallbacks == [
+        {
+            "reform_name": "r",
+            "segment": [2026, 2030],
+            "column": "revenue_impact",
+            "method": SIGN_FLIP_FALLBACK,
+        }
+    ]
+
+
+def test_unbracketed_year_is_rejected():
+    with pytest.raises(ValueError, match="no behavioral anchor"):
+        bracketing_anchors(np.array([[True, False, False]]))
+
+
+def test_identities_only_touch_interior_rows_of_structural_reforms():
+    interior = np.array([[False, True, False], [False, True, False]])
+    gain_loss = np.zeros((2, 3, 1))
+    gain_loss[0, 0, 0] = 1.0
+    columns = {
+        "tob_oasdi_impact": np.full((2, 3), 2.0),
+        "tob_medicare_hi_impact": np.full((2, 3), 3.0),
+        "tob_total_impact": np.full((2, 3), 99.0),
+        "oasdi_gain": np.full((2, 3), 7.0),
+        "oasdi_loss": np.full((2, 3), 4.0),
+        "oasdi_net_impact": np.full((2, 3), 1.0),
+    }
+
+    derived = derive_interior_identities(
+        columns,
+        interior=interior,
+        structural=structural_reforms(gain_loss, ~interior),
+    )
+
+    assert derived == ["tob_total_impact", "oasdi_net_impact"]
+    assert columns["tob_total_impact"].tolist() == [[99.0, 5.0, 99.0]] * 2
+    assert columns["oasdi_net_impact"].tolist() == [[1.0, 3.0, 1.0], [1.0, 1.0, 1.0]]
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from src.calibration_chain import CalibrationChain, implied_elasticity
+
+
+def _advance(chain: CalibrationChain, year: int, names=("a", "b")) -> None:
+    chain.advance(
+        year,
+        duals={"stage_d": (names, np.array([0.1, -0.2]))},
+        alpha=1.05,
+        beta=0.98,
+        gamma=1.1,
+        gamma_probes=[
+            {"gamma": 1.0, "total_tob": 100.0},
+            {"gamma": 1.1, "total_tob": 100.0 * 1.1**1.8},
+        ],
+    )
+
+
+def test_duals_are_offered_only_for_the_same_constraints():
+    chain = CalibrationChain()
+    assert chain.dual_for("stage_d", ("a", "b")) is None
+
+    _advance(chain, 2030)
+
+    np.testing.assert_array_equal(chain.dual_for("stage_d", ("a", "b")), [0.1, -0.2])
+    assert chain.dual_for("stage_d", ("a", "b", "guard")) is None
+    assert chain.dual_for("stage_b", ("a", "b")) is None
+    assert chain.seeds()["previous_year"] == 2030
+    assert chain.gamma_elasticity == pytest.approx(1.8)
+
+
+def test_gamma_seeds_the_next_search_only_when_opted_in():
+    chain = CalibrationChain()
+    _advance(chain, 2030)
+    assert chain.gamma_seed() == {}
+    assert chain.seeds()["seed_gamma"] is False
+
+    seeded = CalibrationChain(seed_gamma=True)
+    assert seeded.gamma_seed() == {}
+    _advance(seeded, 2030)
+    assert seeded.gamma_seed() == {
+        "initial_gamma": 1.1,
+        "initial_elasticity": pytest.approx(1.8),
+    }
+
+
+def test_work_saved_is_measured_against_the_latest_cold_solve():
+    chain = CalibrationChain()
+    chain.record_solve(2026, "stage_d", 12, warm=False)
+    warm = chain.record_solve(2027, "stage_d", 4, warm=True)
+    chain.record_solve(2028, "stage_d", 10, warm=False)
+    later = chain.record_solve(2029, "stage_d", 3, warm=True)
+
+    assert warm["estimated_work_saved"] == 8
+    assert later["cold_reference"] == 10
+    assert chain.summary() == {
+        "stage_d": {"solves": 4, "warm": 2, "estimated_work_saved": 15}
+    }
+
+
+def test_implied_elasticity_rejects_saturated_probes():
+    assert implied_elasticity([{"gamma": 1.0, "total_tob": 1.0}]) is None
+    assert (
+        implied_elasticity(
+            [{"gamma": 1.0, "total_tob": 100.0}, {"gamma": 1.2, "total_tob": 100.5}]
+        )
+        is None
+    )
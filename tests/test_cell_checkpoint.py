@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import signal
+import subprocess
+import sys
+import textwrap
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import reform_full_h5_worker
+from src.cell_checkpoint import CRASH_AFTER_ENV, CellCheckpoint
+from src.reform_full_h5_worker import save_complete_microsimulation_h5
+from tests.test_reform_full_h5_worker import (
+    _TEST_VARIABLES_BY_ENTITY,
+    _Simulation,
+    _Variable,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+_CELL = textwrap.dedent(
+    """
+    from pathlib import Path
+    import sys
+
+    from src.cell_checkpoint import CellCheckpoint
+    from src.reform_full_h5_worker import save_complete_microsimulation_h5
+    from tests.test_cell_checkpoint import _VARIABLES_BY_ENTITY, _EnumSimulation
+
+    save_complete_microsimulation_h5(
+        _EnumSimulation(),
+        Path(sys.argv[2]),
+        year=2075,
+        fail_on_empty_entity=False,
+        variables_by_entity=_VARIABLES_BY_ENTITY,
+        checkpoint=CellCheckpoint(Path(sys.argv[1]), "cell"),
+    )
+    """
+)
+
+
+# Enum outputs such as race come back as strings, an object column in the frame.
+_VARIABLES_BY_ENTITY = {
+    **_TEST_VARIABLES_BY_ENTITY,
+    "person": [*_TEST_VARIABLES_BY_ENTITY["person"], "race"],
+}
+
+
+class _EnumSimulation(_Simulation):
+    def __init__(self):
+        super().__init__()
+        self.tax_benefit_system.variables["race"] = _Variable("person")
+        self.values[("race", "person")] = np.array(["WHITE", "BLACK"], dtype=object)
+
+
+class _CountingSimulation(_EnumSimulation):
+    def __init__(self):
+        super().__init__()
+        self.calculated: list[str] = []
+
+    def calculate(self, variable_name: str, period: int, map_to: str):
+        self.calculated.append(variable_name)
+        return super().calculate(variable_name, period, map_to)
+
+
+def _read_tables(path: Path) -> dict[str, pd.DataFrame]:
+    with pd.HDFStore(path, mode="r") as store:
+        return {key.strip("/"): store[key] for key in store.keys()}
+
+
+def test_killed_cell_resumes_from_saved_entity_tables(tmp_path, monkeypatch):
+    root = tmp_path / "checkpoints"
+    output = tmp_path / "scenario.h5"
+    killed = subprocess.run(
+        [sys.executable, "-c", _CELL, str(root), str(output)],
+        cwd=REPO_ROOT,
+        env={**os.environ, CRASH_AFTER_ENV: "entity:household"},
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert killed.returncode == -signal.SIGKILL, killed.stderr
+    assert not output.exists()
+
+    monkeypatch.delenv(CRASH_AFTER_ENV, raising=False)
+    checkpoint = CellCheckpoint(root, "cell")
+    sim = _CountingSimulation()
+    metadata = save_complete_microsimulation_h5(
+        sim,
+        output,
+        year=2075,
+        fail_on_empty_entity=False,
+        variables_by_entity=_VARIABLES_BY_ENTITY,
+        checkpoint=checkpoint,
+    )
+
+    assert sim.calculated == _VARIABLES_BY_ENTITY["tax_unit"]
+    assert checkpoint.to_dict()["resumed_stages"] == [
+        "entity:person",
+        "entity:household",
+    ]
+    assert metadata["variable_count"] == 10
+    fresh = tmp_path / "fresh.h5"
+    save_complete_microsimulation_h5(
+        _EnumSimulation(),
+        fresh,
+        year=2075,
+        fail_on_empty_entity=False,
+        variables_by_entity=_VARIABLES_BY_ENTITY,
+    )
+    resumed_tables, fresh_tables = _read_tables(output), _read_tables(fresh)
+    assert resumed_tables.keys() == fresh_tables.keys()
+    for key, table in fresh_tables.items():
+        assert resumed_tables[key].equals(table), key
+
+
+def test_string_arrays_round_trip_without_pickle(tmp_path):
+    checkpoint = CellCheckpoint(tmp_path, "cell")
+    checkpoint.save_arrays(
+        "entity:person", {"race": np.array(["WHITE", "BLACK"], dtype=object)}
+    )
+
+    arrays, _ = CellCheckpoint(tmp_path, "cell").load_arrays("entity:person")
+
+    assert arrays["race"].tolist() == ["WHITE", "BLACK"]
+    with pytest.raises(TypeError, match="non-string objects"):
+        checkpoint.save_arrays("other", {"mixed": np.array([1, "a"], dtype=object)})
+
+
+def test_corrupted_stage_is_discarded_and_recomputed(tmp_path):
+    checkpoint = CellCheckpoint(tmp_path, "cell")
+    checkpoint.save_arrays("tob_pair", {"oasdi": np.arange(4.0)}, meta={"rows": 4})
+    stage_file = tmp_path / "cell" / "tob_pair.npz"
+    stage_file.write_bytes(stage_file.read_bytes()[:-8] + b"corrupt!")
+
+    reopened = CellCheckpoint(tmp_path, "cell")
+
+    assert reopened.load_arrays("tob_pair") is None
+    assert reopened.stages == []
+    assert not stage_file.exists()
+    (event,) = reopened.events
+    assert event["action"] == "discarded"
+    assert event["reason"].startswith("sha256")
+    assert CellCheckpoint(tmp_path, "cell").stages == []
+
+
+def test_tob_pair_is_loaded_instead_of_recomputed(tmp_path, monkeypatch):
+    computed: list[int] = []
+    cached: list[tuple[np.ndarray, np.ndarray]] = []
+
+    def compute(sim, *, year):
+        computed.append(year)
+        return np.array([1.0, 2.0]), np.array([0.5, 0.0]), {"method": "test"}
+
+    def cache(sim, *, year, oasdi, medicare_hi):
+        cached.append((oasdi, medicare_hi))
+
+    monkeypatch.setattr(reform_full_h5_worker, "_compute_tob_revenue_pair", compute)
+    monkeypatch.setattr(reform_full_h5_worker, "_cache_tob_revenue_pair", cache)
+
+    for _ in range(2):
+        info = reform_full_h5_worker._checkpointed_tob_revenue_pair(
+            None,
+            year=2075,
+            checkpoint=CellCheckpoint(tmp_path, "cell"),
+        )
+        assert info == {"method": "test"}
+
+    assert computed == [2075]
+    assert len(cached) == 2
+    for oasdi, medicare_hi in cached:
+        np.testing.assert_array_equal(oasdi, [1.0, 2.0])
+        np.testing.assert_array_equal(medicare_hi, [0.5, 0.0])
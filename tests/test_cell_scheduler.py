@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import pytest
+
+from src.cell_scheduler import (
+    DEFAULT_TIERS,
+    CellPrediction,
+    ResourceModel,
+    TieredSpawner,
+    build_launch_plan,
+    observations_from_metadata,
+    order_by_plan,
+    planned_tiers,
+    predicted_makespan_seconds,
+    select_tier,
+)
+from src.reform_full_h5_contract import ReformCell
+
+GIB = 1024**3
+PRICES = {"cpu_core_second_price": 1e-5, "memory_gib_second_price": 2e-6}
+
+
+def _metadata(year, reform, scoring_type, duration, peak_rss=None):
+    record = {
+        "year": year,
+        "reform_id": reform,
+        "scoring_type": scoring_type,
+        "duration_seconds": duration,
+    }
+    if peak_rss is not None:
+        record["profile"] = {"peak_rss_bytes": peak_rss}
+    return record
+
+
+class _FakeCall:
+    def __init__(self, object_id: str):
+        self.object_id = object_id
+
+
+class _FakeFunction:
+    """Stands in for a Modal function: records each spawn and its options."""
+
+    def __init__(self, launches: list, options: dict | None = None):
+        self.launches = launches
+        self.options = options
+
+    def with_options(self, **options):
+        return _FakeFunction(self.launches, options)
+
+    def spawn(self, payload):
+        self.launches.append((payload["cell"], self.options))
+        return _FakeCall(f"call-{len(self.launches)}")
+
+
+def test_model_uses_observations_then_trends_then_defaults() -> None:
+    model = ResourceModel(
+        observations_from_metadata(
+            [
+                _metadata(2030, "option1", "static", 600.0, 8 * GIB),
+                _metadata(2030, "option1", "static", 900.0),
+                _metadata(2050, "option1", "static", 1_200.0, 12 * GIB),
+                _metadata(2070, "option2", "static", 2_400.0, 20 * GIB),
+                {"year": 2040, "duration_seconds": 5.0},
+            ]
+        )
+    )
+
+    observed = model.predict(ReformCell(2030, "option1"))
+    assert (observed.duration_seconds, observed.basis) == (900.0, "observed")
+    assert observed.peak_rss_bytes == 8 * GIB
+    trend = model.predict(ReformCell(2060, "option1"))
+    assert trend.basis == "trend"
+    assert 1_200.0 < trend.duration_seconds < 2_400.0
+    unknown = model.predict(ReformCell(2060, "option1", "behavioral"))
+    assert unknown == CellPrediction(None, None, "no_history")
+    assert select_tier(unknown)[0].name == "standard"
+    assert select_tier(CellPrediction(600.0, None, "trend"))[0].name == "standard"
+    assert select_tier(CellPrediction(600.0, 8 * GIB, "trend"))[0].name == "small"
+    assert select_tier(CellPrediction(60_000.0, 8 * GIB, "trend")) == (
+        DEFAULT_TIERS[-1],
+        False,
+    )
+
+
+def test_plan_orders_longest_first_and_prices_each_tier() -> None:
+    model = ResourceModel(
+        observations_from_metadata(
+            [
+                _metadata(2030, "option1", "static", 1_000.0, 8 * GIB),
+                _metadata(2090, "option1", "static", 10_000.0, 40 * GIB),
+            ]
+        )
+    )
+    cells = [
+        ReformCell(2030, "option1"),
+        ReformCell(2090, "option1"),
+        ReformCell(2090, "option1", "behavioral"),
+    ]
+
+    plan = build_launch_plan(cells, model, concurrency=2, **PRICES)
+
+    assert [entry["cell"] for entry in plan["cells"]] == [
+        "year=2090/reform=option1/scoring=behavioral",
+        "year=2090/reform=option1/scoring=static",
+        "year=2030/reform=option1/scoring=static",
+    ]
+    assert [entry["tier"]["name"] for entry in plan["cells"]] == [
+        "standard",
+        "standard",
+        "small",
+    ]
+    small, standard = DEFAULT_TIERS[0], DEFAULT_TIERS[2]
+    assert plan["predicted_cost_usd"] == pytest.approx(
+        10_000 * standard.cost_per_second(**PRICES)
+        + 1_000 * small.cost_per_second(**PRICES)
+    )
+    assert plan["uniform_cost_usd"] == pytest.approx(
+        11_000 * standard.cost_per_second(**PRICES)
+    )
+    assert plan["cells_without_history"] == 1
+    assert plan["predicted_makespan_seconds"] is None
+    assert predicted_makespan_seconds([5.0, 4.0, 3.0, 2.0], 2) == 7.0
+
+
+def test_fake_executor_launches_in_plan_order_with_tier_resources() -> None:
+    model = ResourceModel(
+        observations_from_metadata(
+            [
+                _metadata(2030, "option1", "static", 1_000.0, 8 * GIB),
+                _metadata(2090, "option1", "static", 10_000.0, 40 * GIB),
+            ]
+        )
+    )
+    requested = [ReformCell(2030, "option1"), ReformCell(2090, "option1")]
+    plan = build_launch_plan(requested, model, **PRICES)
+    tiers = planned_tiers(plan)
+    launches: list = []
+    spawner = TieredSpawner(_FakeFunction(launches))
+
+    for cell in order_by_plan(requested, plan, key=ReformCell.key):
+        spawner.spawn({"cell": cell.key()}, tiers[cell.key()])
+    spawner.spawn({"cell": "unplanned"})
+
+    assert launches == [
+        (
+            "year=2090/reform=option1/scoring=static",
+            {"cpu": 4.0, "memory": 65536, "timeout": 6 * 3600},
+        ),
+        (
+            "year=2030/reform=option1/scoring=static",
+            {"cpu": 4.0, "memory": 16384, "timeout": 2 * 3600},
+        ),
+        ("unplanned", None),
+    ]
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+SIMULATION_STACK = ("policyengine", "policyengine_core", "policyengine_us", "microdf")
+DATA_STACK = ("pandas", "numpy", "h5py", "tables")
+
+# Runs in a fresh interpreter: the simulation stack is made unimportable, so a
+# module that reaches for it at import time fails loudly even where it is
+# installed, and the loaded heavy modules are reported back as JSON.
+_PROBE = textwrap.dedent(
+    """
+    import importlib.abc
+    import json
+    import sys
+
+    BLOCKED = {blocked!r}
+
+    class _Block(importlib.abc.MetaPathFinder):
+        def find_spec(self, name, path, target=None):
+            if name.split(".")[0] in BLOCKED:
+                raise ModuleNotFoundError(f"blocked import of {{name}}")
+            return None
+
+    sys.meta_path.insert(0, _Block())
+    try:
+        exec({body!r})
+    except SystemExit as error:
+        if error.code not in (0, None):
+            raise
+    print(json.dumps(sorted({{name.split(".")[0] for name in sys.modules}})))
+    """
+)
+
+
+def _loaded_modules(body: str) -> set[str]:
+    script = _PROBE.format(blocked=SIMULATION_STACK, body=textwrap.dedent(body))
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert completed.returncode == 0, completed.stderr
+    return set(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+
+@pytest.mark.parametrize(
+    "command",
+    ["write-selected-cells", "reform-full-h5-artifacts", "write-repro-bundle"],
+)
+def test_lightweight_cli_commands_skip_heavy_stack(command):
+    loaded = _loaded_modules(
+        f"""
+        from src import cli
+        cli.main([{command!r}, "--help"])
+        """
+    )
+
+    assert loaded.isdisjoint(SIMULATION_STACK + DATA_STACK)
+
+
+def test_cli_help_does_not_import_subcommand_modules():
+    loaded = _loaded_modules(
+        """
+        import sys
+        from src import cli
+        try:
+            cli.main(["--help"])
+        finally:
+            assert "src.dashboard_baseline_assumptions" not in sys.modules
+        """
+    )
+
+    assert loaded.isdisjoint(SIMULATION_STACK + DATA_STACK)
+
+
+def test_submitter_surface_imports_without_heavy_stack():
+    loaded = _loaded_modules(
+        """
+        import modal_batch.reform_full_h5
+        import scripts.estimate_full_h5_modal_cost
+        from src.reform_full_h5_contract import WORKER_ENTRYPOINT
+        """
+    )
+
+    assert loaded.isdisjoint(SIMULATION_STACK + DATA_STACK)
+
+
+def test_simulating_modules_defer_the_tax_benefit_system():
+    loaded = _loaded_modules(
+        """
+        import src.year_runner
+        import src.reform_full_h5_worker
+        """
+    )
+
+    assert loaded.isdisjoint(SIMULATION_STACK)
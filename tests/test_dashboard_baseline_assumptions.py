@@ -9,7 +9,7 @@ import re
 from packaging.version import Version
 import pandas as pd
 
-from src import cli
+from src import cli, dashboard_baseline_assumptions
 from src.dashboard_baseline_assumptions import build_calibration_targets
 
 
@@ -94,7 +94,7 @@ def test_cli_exposes_dashboard_baseline_assumption_builder(monkeypatch):
         calls.append(list(argv or []))
         return 0
 
-    monkeypatch.setattr(cli.dashboard_baseline_assumptions, "main", fake_main)
+    monkeypatch.setattr(dashboard_baseline_assumptions, "main", fake_main)
 
     assert (
         cli.main(
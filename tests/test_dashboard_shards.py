@@ -0,0 +1,78 @@
+"""Guard the per-reform dashboard result shards against the published CSVs."""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from scripts.build_dashboard_shards import (
+    OUTPUT_DIR,
+    RESULT_COLUMNS,
+    SOLVENT_COLUMNS,
+    build,
+    load,
+    write,
+)
+from src.results_store import read_results_csv
+
+
+def test_committed_shards_match_regeneration():
+    committed, _ = load()
+    regenerated, payloads = build()
+
+    assert committed == regenerated, "stale; rerun scripts/build_dashboard_shards.py"
+    for relative, payload in payloads.items():
+        assert (OUTPUT_DIR / relative).read_bytes() == payload, relative
+
+
+def test_results_shards_reassemble_the_dashboard_csv():
+    index, frames = load()
+    results = read_results_csv(OUTPUT_DIR.parent / "results.csv")
+
+    shards = index["datasets"]["results"]["shards"]
+    assert sum(shard["rows"] for shard in shards) == len(results)
+    for shard in shards:
+        expected = (
+            results[
+                results["scoring_type"].eq(shard["scoring_type"])
+                & results["reform_name"].eq(shard["reform"])
+            ]
+            .sort_values("year")
+            .reset_index(drop=True)
+        )
+        frame = frames[shard["file"]]
+        assert list(frame.columns) == list(RESULT_COLUMNS)
+        assert frame["year"].tolist() == expected["year"].tolist()
+        np.testing.assert_allclose(
+            frame[list(RESULT_COLUMNS[1:])].astype(float).to_numpy(),
+            expected[list(RESULT_COLUMNS[1:])].to_numpy(),
+            equal_nan=True,
+        )
+
+
+def test_solvent_dataset_holds_only_solvent_rows():
+    index, frames = load()
+    balanced = pd.read_csv(OUTPUT_DIR.parent / "balanced_fix_results.csv")
+    solvent = balanced[balanced["baseline_scenario"].eq("ss_solvent")]
+
+    shards = index["datasets"]["ss_solvent"]["shards"]
+    assert sum(shard["rows"] for shard in shards) == len(solvent)
+    assert {shard["reform"] for shard in shards} == set(solvent["reform_name"])
+    for shard in shards:
+        assert list(frames[shard["file"]].columns) == list(SOLVENT_COLUMNS)
+
+
+def test_write_replaces_stale_shards(tmp_path):
+    index, payloads = build()
+    output = tmp_path / "shards"
+    stale = output / "results" / "static" / "retired_reform.json"
+    stale.parent.mkdir(parents=True)
+    stale.write_text("{}", encoding="utf-8")
+
+    write(index, payloads, output)
+
+    assert not stale.exists()
+    written = json.loads((output / "index.json").read_text(encoding="utf-8"))
+    assert written == index
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import multiprocessing
+import os
+
+import h5py
+import numpy as np
+import pytest
+
+from src.dataset_broker import (
+    BROKER_DIR_ENV,
+    DatasetBroker,
+    attach,
+    attach_published,
+    live_refcount,
+)
+from src.synthetic_datasets import write_policyengine_input_h5
+
+
+def _h5_arrays(path) -> dict[str, np.ndarray]:
+    with h5py.File(path, "r") as store:
+        return {variable: store[variable]["2026"][()] for variable in store}
+
+
+def _worker_view(dataset: str) -> tuple[int, float, bool, int]:
+    shared = attach_published(dataset)
+    income = shared.arrays["employment_income"]["2026"]
+    return (
+        os.getpid(),
+        float(income.sum()),
+        bool(income.flags.writeable),
+        live_refcount(shared.handle.segment_dir),
+    )
+
+
+def test_attached_arrays_match_the_h5_and_are_read_only(tmp_path) -> None:
+    dataset = write_policyengine_input_h5(tmp_path / "2026.h5", 200, year=2026)
+    expected = _h5_arrays(dataset)
+
+    with DatasetBroker(tmp_path / "shm") as broker:
+        handle = broker.publish(dataset)
+        assert broker.publish(dataset) is handle
+        assert handle.time_period == "2026"
+        with attach(handle) as shared:
+            assert broker.refcount(handle) == 2
+            assert shared.arrays.keys() == expected.keys()
+            for variable, values in expected.items():
+                view = shared.load_dataset()[variable]["2026"]
+                np.testing.assert_array_equal(view, values)
+                assert view.dtype == values.dtype
+            with pytest.raises(ValueError, match="read-only"):
+                shared.arrays["age"]["2026"][0] = 1
+        assert broker.refcount(handle) == 1
+    assert not handle.segment_dir.exists()
+    with pytest.raises(FileNotFoundError, match="no longer published"):
+        attach(handle)
+
+
+def test_pool_workers_share_one_published_copy(tmp_path, monkeypatch) -> None:
+    dataset = write_policyengine_input_h5(tmp_path / "2026.h5", 200, year=2026)
+    root = tmp_path / "shm"
+    monkeypatch.setenv(BROKER_DIR_ENV, str(root))
+    assert attach_published(dataset) is None
+
+    broker = DatasetBroker()
+    handle = broker.publish(dataset)
+    # A second publisher of the same file shares the first one's segment.
+    other = DatasetBroker(root)
+    assert other.publish(dataset) == handle
+    assert [path.name for path in root.iterdir()] == [handle.key]
+    other.close()
+
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=2, mp_context=context) as pool:
+        views = list(pool.map(_worker_view, [str(dataset)] * 4))
+
+    expected_total = float(_h5_arrays(dataset)["employment_income"].sum())
+    assert {total for _, total, _, _ in views} == {expected_total}
+    assert not any(writeable for _, _, writeable, _ in views)
+    assert max(refs for _, _, _, refs in views) >= 2
+    # Pool workers exited without detaching; their references no longer count.
+    assert broker.refcount(handle) == 1
+    broker.close()
+    assert not handle.segment_dir.exists()
+
+
+def test_release_and_moving_to_another_year_drop_references(tmp_path) -> None:
+    first = write_policyengine_input_h5(tmp_path / "2026.h5", 50, year=2026)
+    second = write_policyengine_input_h5(tmp_path / "2027.h5", 50, year=2027)
+    root = tmp_path / "shm"
+
+    with DatasetBroker(root) as broker:
+        first_handle = broker.publish(first)
+        second_handle = broker.publish(second)
+        shared = attach_published(first, root=root)
+        assert broker.refcount(first_handle) == 2
+
+        # The publisher is done with the year, but this process still reads it.
+        broker.release(first_handle)
+        broker.release(first_handle)
+        assert broker.refcount(first_handle) == 1
+        income = shared.arrays["employment_income"]["2026"]
+
+        # Looking up the next year drops the last reference to the first.
+        assert attach_published(second, root=root) is not None
+        assert shared._ref is None
+        assert not first_handle.segment_dir.exists()
+        np.testing.assert_array_equal(income, _h5_arrays(first)["employment_income"])
+        assert broker.refcount(second_handle) == 2
+    assert attach_published(first, root=root) is None
+
+
+def _segment_sha(handle) -> str:
+    return hashlib.sha256((handle.segment_dir / "data.bin").read_bytes()).hexdigest()
+
+
+def test_policyengine_dataset_serves_the_shared_views(tmp_path) -> None:
+    pytest.importorskip("policyengine_core")
+    dataset = write_policyengine_input_h5(tmp_path / "2026.h5", 50, year=2026)
+
+    with DatasetBroker(tmp_path / "shm") as broker:
+        handle = broker.publish(dataset)
+        with attach(handle) as shared:
+            loaded = shared.policyengine_dataset().load_dataset()
+            for variable, periods in shared.arrays.items():
+                assert loaded[variable]["2026"] is periods["2026"]
+                assert np.shares_memory(loaded[variable]["2026"], periods["2026"])
+
+
+def test_dataset_microsimulation_reads_the_shared_copy_without_writing(
+    tmp_path, monkeypatch
+) -> None:
+    pytest.importorskip("policyengine_us")
+    engine = pytest.importorskip("src.engine")
+    monkeypatch.setattr(engine, "_require_certified_runtime", lambda: None)
+    dataset = write_policyengine_input_h5(tmp_path / "2026.h5", 50, year=2026)
+    root = tmp_path / "shm"
+    monkeypatch.setenv(BROKER_DIR_ENV, str(root))
+
+    with DatasetBroker() as broker:
+        handle = broker.publish(dataset)
+        before = _segment_sha(handle)
+        simulation = engine.dataset_microsimulation(dataset)
+        shared = attach_published(dataset)
+
+        assert simulation.dataset.name == f"shared_{handle.key}"
+        np.testing.assert_array_equal(
+            simulation.calculate("employment_income", 2026).values,
+            shared.arrays["employment_income"]["2026"],
+        )
+        simulation.calculate("income_tax", 2026)
+        assert not shared.arrays["employment_income"]["2026"].flags.writeable
+        assert _segment_sha(handle) == before
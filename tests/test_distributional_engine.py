@@ -0,0 +1,128 @@
+"""The vectorized distributional engine must reproduce the merge-based
+decile records exactly, whatever order the reform households arrive in."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.distributional import (
+    BaselineDeciles,
+    YearJob,
+    decile_records,
+    read_household_net_income,
+    run_years,
+)
+
+
+def _merge_reference(baseline: BaselineDeciles, reform: pd.DataFrame) -> list[dict]:
+    frame = pd.DataFrame(
+        {
+            "household_id": baseline.household_id,
+            "baseline_net_income": baseline.net_income,
+            "weight": baseline.weights,
+            "decile": baseline.decile,
+        }
+    )
+    merged = frame.merge(reform, on="household_id", how="inner", validate="one_to_one")
+    merged["change"] = merged["household_net_income"] - merged["baseline_net_income"]
+    rows = []
+    for decile in range(1, 11):
+        group = merged.loc[merged["decile"] == decile]
+        if group.empty:
+            rows.append(
+                {
+                    "decile": decile,
+                    "avg_change": 0.0,
+                    "pct_change": None,
+                    "total_change_billions": 0.0,
+                }
+            )
+            continue
+        total_change = float((group["change"] * group["weight"]).sum())
+        total_baseline = float((group["baseline_net_income"] * group["weight"]).sum())
+        avg_change = float(np.average(group["change"], weights=group["weight"]))
+        rows.append(
+            {
+                "decile": decile,
+                "avg_change": round(avg_change, 2),
+                "pct_change": round(100.0 * total_change / total_baseline, 3)
+                if total_baseline > 0
+                else None,
+                "total_change_billions": round(total_change / 1e9, 3),
+            }
+        )
+    return rows
+
+
+def _baseline(size: int = 200, seed: int = 0) -> BaselineDeciles:
+    rng = np.random.default_rng(seed)
+    return BaselineDeciles.from_arrays(
+        rng.permutation(np.arange(10, 10 + size) * 7),
+        rng.normal(60_000, 40_000, size),
+        rng.uniform(100, 2_000, size),
+        np.repeat(np.arange(1, 11), size // 10),
+    )
+
+
+def test_decile_records_match_merge_for_shuffled_partial_reform() -> None:
+    baseline = _baseline()
+    rng = np.random.default_rng(1)
+    keep = rng.permutation(len(baseline.household_id))[:150]
+    reform = pd.DataFrame(
+        {
+            "household_id": np.append(baseline.household_id[keep], [3, 5]),
+            "household_net_income": rng.normal(60_000, 40_000, 152),
+        }
+    )
+
+    records = decile_records(
+        baseline,
+        reform["household_id"].to_numpy(),
+        reform["household_net_income"].to_numpy(),
+    )
+
+    assert records == _merge_reference(baseline, reform)
+
+
+def test_align_rejects_duplicate_reform_households() -> None:
+    baseline = _baseline(size=20)
+    ids = baseline.household_id.copy()
+    ids[1] = ids[0]
+
+    with pytest.raises(ValueError, match="not unique"):
+        baseline.align(ids)
+
+
+def test_run_years_reads_two_columns_and_keeps_year_order(tmp_path) -> None:
+    baseline = _baseline(size=50)
+    scenarios = {}
+    for year in (2030, 2026):
+        path = tmp_path / f"{year}.h5"
+        pd.DataFrame(
+            {
+                "household_id": baseline.household_id[::-1],
+                "household_net_income": baseline.net_income[::-1] + year,
+                "household_weight": 1.0,
+            }
+        ).to_hdf(path, key="household", format="table")
+        scenarios[year] = path
+
+    assert list(read_household_net_income(scenarios[2030]).columns) == [
+        "household_id",
+        "household_net_income",
+    ]
+    jobs = [
+        YearJob(
+            year=year,
+            load_baseline=lambda _year: baseline,
+            scenarios={"option1": scenarios[year], "option2": tmp_path / "none.h5"},
+        )
+        for year in (2030, 2026)
+    ]
+    results = list(run_years(jobs, workers=1))
+
+    assert [result.year for result in results] == [2030, 2026]
+    assert results[0].missing == ("option2",)
+    assert results[1].records["option1"][0]["avg_change"] == 2026.0
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src import dataset_broker
+from src.dataset_broker import BROKER_DIR_ENV
+from src.elasticity_monte_carlo import (
+    DRAWS_NAME,
+    ElasticityPrior,
+    MonteCarloPlan,
+    YearInputs,
+    elasticity_draw,
+    read_draws,
+    run_monte_carlo,
+)
+
+PERIOD = "2024-01-01.2100-12-31"
+ROOT = "gov.simulation.labor_supply_responses.elasticities"
+POINT = {
+    f"{ROOT}.income": {PERIOD: -0.05},
+    f"{ROOT}.substitution.by_position_and_decile.primary.1": {PERIOD: 0.31},
+    f"{ROOT}.substitution.by_position_and_decile.primary.2": {PERIOD: 0.28},
+    f"{ROOT}.substitution.by_position_and_decile.secondary": {PERIOD: 0.27},
+}
+PRIORS = (
+    ElasticityPrior(f"{ROOT}.income", "normal", sd=0.5),
+    ElasticityPrior(f"{ROOT}.substitution", "uniform", low=0.5, high=1.5),
+)
+
+
+def _plan(draws: int = 4) -> MonteCarloPlan:
+    return MonteCarloPlan(
+        reforms=("option1", "option2"),
+        years=(2030, 2050),
+        draws=draws,
+        seed=7,
+        priors=PRIORS,
+    )
+
+
+def _prepare(plan, year, dataset, samples_dir) -> YearInputs:
+    return YearInputs(
+        year=year,
+        dataset=__file__,
+        baseline={"revenue": 1000.0 + year},
+        sample={"samples_dir": samples_dir},
+    )
+
+
+def _score(task) -> dict:
+    substitution = task.elasticities[
+        f"{ROOT}.substitution.by_position_and_decile.secondary"
+    ][PERIOD]
+    return {
+        "reform_name": task.reform,
+        "year": task.year,
+        "revenue_impact": -100.0 * substitution - task.year,
+        "tob_total_impact": task.baseline["revenue"] * substitution,
+    }
+
+
+def _prepare_shared(plan, year, dataset, samples_dir) -> YearInputs:
+    return YearInputs(
+        year=year, dataset=dataset, baseline={"revenue": 1000.0}, sample={}
+    )
+
+
+def _fail(task) -> dict:
+    raise AssertionError(f"{task.year}/{task.reform}/{task.draw} was rescored")
+
+
+def test_draws_are_deterministic_and_shared_within_a_prior():
+    first = elasticity_draw(3, seed=7, priors=PRIORS, point=POINT)
+    again = elasticity_draw(3, seed=7, priors=PRIORS, point=POINT)
+    other = elasticity_draw(4, seed=7, priors=PRIORS, point=POINT)
+    point = elasticity_draw(0, seed=7, priors=PRIORS, point=POINT)
+
+    assert first == again
+    assert first != other
+    assert point == POINT
+    ratios = {
+        first[path][PERIOD] / POINT[path][PERIOD]
+        for path in POINT
+        if ".substitution." in path
+    }
+    assert max(ratios) - min(ratios) < 1e-12
+    assert 0.5 <= ratios.pop() <= 1.5
+
+
+def test_priors_must_match_distinct_parameters():
+    with pytest.raises(ValueError, match="matches no elasticity"):
+        elasticity_draw(
+            1,
+            seed=0,
+            priors=(ElasticityPrior(f"{ROOT}.missing", "normal", sd=0.1),),
+            point=POINT,
+        )
+    with pytest.raises(ValueError, match="matched by both"):
+        elasticity_draw(
+            1,
+            seed=0,
+            priors=(*PRIORS, ElasticityPrior(ROOT, "normal", sd=0.1)),
+            point=POINT,
+        )
+    with pytest.raises(ValueError, match="unknown distribution"):
+        ElasticityPrior(ROOT, "cauchy")
+    with pytest.raises(ValueError, match="no per-draw behavioral dict"):
+        MonteCarloPlan(reforms=("reverse_roth",), years=(2030,), draws=1)
+
+
+def test_run_reports_bands_and_resumes_without_rescoring(tmp_path: Path):
+    bands = run_monte_carlo(
+        _plan(),
+        tmp_path,
+        dataset_for_year=str,
+        point=POINT,
+        prepare=_prepare,
+        score=_score,
+    )
+
+    assert len(read_draws(tmp_path)) == 2 * 2 * 5
+    assert bands[["reform_name", "year"]].values.tolist() == [
+        ["option1", 2030],
+        ["option1", 2050],
+        ["option2", 2030],
+        ["option2", 2050],
+    ]
+    row = bands.iloc[0]
+    assert row["draws"] == 4
+    assert row["point_revenue_impact"] == pytest.approx(-27.0 - 2030)
+    assert (
+        row["revenue_impact_p5"]
+        <= row["revenue_impact_p50"]
+        <= row["revenue_impact_p95"]
+    )
+    assert json.loads((tmp_path / "baselines" / "2030.json").read_text())[
+        "baseline"
+    ] == {"revenue": 3030.0}
+
+    again = run_monte_carlo(
+        _plan(), tmp_path, dataset_for_year=str, point=POINT, prepare=_fail, score=_fail
+    )
+    assert again.equals(bands)
+
+
+def test_more_draws_extend_a_run_and_other_changes_are_refused(tmp_path: Path):
+    run_monte_carlo(
+        _plan(2),
+        tmp_path,
+        dataset_for_year=str,
+        point=POINT,
+        prepare=_prepare,
+        score=_score,
+    )
+    with (tmp_path / DRAWS_NAME).open("a", encoding="utf-8") as sink:
+        sink.write('{"torn": ')
+
+    extended = run_monte_carlo(
+        _plan(4),
+        tmp_path,
+        dataset_for_year=str,
+        point=POINT,
+        prepare=_prepare,
+        score=_score,
+    )
+    fresh = run_monte_carlo(
+        _plan(4),
+        tmp_path / "fresh",
+        dataset_for_year=str,
+        point=POINT,
+        prepare=_prepare,
+        score=_score,
+        workers=2,
+    )
+
+    assert extended.equals(fresh)
+    with pytest.raises(ValueError, match="use a new output directory"):
+        run_monte_carlo(
+            MonteCarloPlan(reforms=("option1",), years=(2030,), draws=4, seed=8),
+            tmp_path,
+            point=POINT,
+            prepare=_prepare,
+            score=_score,
+        )
+
+
+def test_shared_year_datasets_are_released_after_their_last_draw(
+    tmp_path: Path, monkeypatch
+):
+    from src.synthetic_datasets import write_policyengine_input_h5
+
+    datasets = {
+        year: str(write_policyengine_input_h5(tmp_path / f"{year}.h5", 20, year=year))
+        for year in (2030, 2050)
+    }
+    root = tmp_path / "shm"
+    monkeypatch.setenv(BROKER_DIR_ENV, str(root))
+    released: list[tuple[int, int]] = []
+    release = dataset_broker.DatasetBroker.release
+
+    def recording_release(broker, handle):
+        year = int(handle.time_period)
+        recorded = [r for r in read_draws(tmp_path / "run") if r["year"] == year]
+        released.append((year, len(recorded)))
+        release(broker, handle)
+
+    monkeypatch.setattr(dataset_broker.DatasetBroker, "release", recording_release)
+
+    run_monte_carlo(
+        _plan(2),
+        tmp_path / "run",
+        dataset_for_year=datasets.__getitem__,
+        point=POINT,
+        prepare=_prepare_shared,
+        score=_score,
+        workers=2,
+        share_datasets=True,
+    )
+
+    # Each year goes once all 2 reforms x 3 draws of it are on disk.
+    assert sorted(released) == [(2030, 6), (2050, 6)]
+    assert list(root.iterdir()) == []
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.fiscal_summary import (
+    discount_factors_from_rates,
+    load_discount_factors,
+    summarize_panel,
+)
+
+
+def _panel() -> pd.DataFrame:
+    rows = []
+    for scoring_type in ("static", "behavioral"):
+        for year in (2026, 2027, 2036):
+            rows.append(
+                {
+                    "year": year,
+                    "reform_name": "option3",
+                    "scoring_type": scoring_type,
+                    "revenue_impact": 10.0,
+                    "baseline_tob_oasdi": 3.0,
+                    "baseline_tob_medicare_hi": 1.0,
+                    "tob_oasdi_impact": 4.0,
+                    "tob_medicare_hi_impact": 4.0,
+                    "oasdi_net_impact": 0.0,
+                    "hi_net_impact": 0.0,
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def test_discount_factors_compound_per_fund():
+    factors = discount_factors_from_rates([2027, 2026], [10.0, 0.0], [0.0, 25.0])
+
+    assert factors.years.tolist() == [2026, 2027]
+    assert factors.oasdi.tolist() == pytest.approx([1.0, 1 / 1.1])
+    assert factors.hi.tolist() == pytest.approx([0.8, 0.8])
+
+
+def test_discount_factor_lookup_rejects_uncovered_years():
+    factors = discount_factors_from_rates([2026], [1.0], [1.0])
+
+    with pytest.raises(KeyError, match="2030"):
+        factors.at([2026, 2030])
+
+
+def test_summarize_panel_covers_every_scoring_type_and_mode():
+    factors = discount_factors_from_rates(
+        [2026, 2027, 2036], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]
+    )
+    summary = summarize_panel(_panel(), factors)
+
+    assert len(summary) == 2 * 4
+    row = summary.set_index(["scoring_type", "allocation_mode"]).loc[
+        ("static", "baselineShares")
+    ]
+    assert row["ten_year_nominal_billions"] == pytest.approx(20.0)
+    assert row["pv75_oasdi_billions"] == pytest.approx(22.5)
+    assert row["pv75_medicare_hi_billions"] == pytest.approx(7.5)
+    assert row["pv75_total_billions"] == pytest.approx(30.0)
+
+
+def test_rate_shift_lowers_present_values():
+    base = load_discount_factors()
+    shifted = load_discount_factors(rate_shift_pct=1.0)
+
+    assert np.all(shifted.oasdi < base.oasdi)
+    assert np.all(shifted.hi < base.hi)
+
+
+def test_summary_cube_stacks_discount_scenarios():
+    from src.fiscal_summary import split_panel, summary_cube
+
+    grid = [
+        discount_factors_from_rates([2026, 2027, 2036], [rate] * 3, [rate] * 3)
+        for rate in (0.0, 100.0)
+    ]
+    groups, cube = summary_cube(split_panel(_panel(), ("currentLaw",)), grid)
+
+    assert groups.columns.tolist() == ["reform_name", "scoring_type", "allocation_mode"]
+    assert cube.shape == (2, 2, 5)
+    assert cube[0, 0, 0] == cube[0, 1, 0] == pytest.approx(20.0)
+    assert cube[0, 1, 1] == pytest.approx(cube[0, 0, 1] * (0.5 + 0.25 + 0.125) / 3)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.h5_precision import PrecisionPolicy, apply_precision_policy
+from src.reform_full_h5_worker import save_complete_microsimulation_h5
+from tests.test_reform_full_h5_worker import _TEST_VARIABLES_BY_ENTITY, _Simulation
+
+
+def _tax_units(rows: int = 5_000) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "tax_unit_id": np.arange(rows),
+            "tax_unit_weight": rng.uniform(50.0, 5_000.0, rows),
+            "income_tax": rng.normal(12_000.0, 30_000.0, rows),
+            "eitc": rng.integers(0, 7_000, rows),
+        }
+    )
+
+
+def test_float32_policy_downcasts_money_and_keeps_exact_columns() -> None:
+    frames = {"tax_unit": _tax_units()}
+    original = frames["tax_unit"].copy()
+    policy = PrecisionPolicy.named("float32")
+
+    report = apply_precision_policy(frames, policy)
+
+    table = frames["tax_unit"]
+    assert table["income_tax"].dtype == np.float32
+    assert table["tax_unit_weight"].dtype == np.float64
+    assert table["eitc"].dtype == original["eitc"].dtype
+    np.testing.assert_array_equal(table["tax_unit_id"], original["tax_unit_id"])
+    (income_tax,) = [
+        record for record in report["columns"] if record["variable"] == "income_tax"
+    ]
+    assert income_tax["passed"]
+    assert income_tax["weight"] == "tax_unit_weight"
+    assert income_tax["absolute_error"] <= income_tax["tolerance"]
+    assert income_tax["weighted_total_float64"] == pytest.approx(
+        float(np.dot(original["tax_unit_weight"], original["income_tax"]))
+    )
+    assert report["float32_column_count"] == 1
+    assert [record["variable"] for record in report["kept_float64"]] == ["eitc"]
+    assert report["bytes_saved"] == 4 * len(table)
+
+
+def test_columns_outside_tolerance_or_range_stay_float64() -> None:
+    frames = {
+        "household": pd.DataFrame(
+            {
+                "household_weight": [1.0, 1.0],
+                "household_net_income": [0.1, 0.2],
+                "household_tax": [1e39, 1.0],
+            }
+        )
+    }
+    strict = PrecisionPolicy(
+        "strict",
+        frozenset({"household_net_income", "household_tax", "household_weight"}),
+        relative_tolerance=0.0,
+        absolute_tolerance=0.0,
+    )
+
+    report = apply_precision_policy(frames, strict)
+
+    assert set(frames["household"].dtypes.astype(str)) == {"float64"}
+    reasons = {
+        record["variable"]: record.get("reason") for record in report["kept_float64"]
+    }
+    assert reasons == {
+        "household_weight": "ID and weight columns stay exact",
+        "household_net_income": None,
+        "household_tax": "float32 overflows a finite value",
+    }
+    assert report["float32_column_count"] == 0
+    with pytest.raises(ValueError, match="Unknown full-H5 precision policy"):
+        PrecisionPolicy.named("float16")
+
+
+def test_saved_h5_stores_policy_columns_as_float32(tmp_path) -> None:
+    output = tmp_path / "scenario.h5"
+
+    metadata = save_complete_microsimulation_h5(
+        _Simulation(),
+        output,
+        year=2075,
+        fail_on_empty_entity=False,
+        variables_by_entity=_TEST_VARIABLES_BY_ENTITY,
+        precision_policy=PrecisionPolicy.named("float32"),
+    )
+
+    with pd.HDFStore(output, mode="r") as store:
+        household = store["household"]
+        tax_unit = store["tax_unit"]
+    assert household["household_net_income"].dtype == np.float32
+    assert household["household_weight"].dtype == np.float64
+    assert tax_unit["income_tax"].dtype == np.float32
+    assert metadata["precision"]["policy"]["name"] == "float32"
+    assert metadata["precision"]["float32_column_count"] == 2
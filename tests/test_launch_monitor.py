@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import json
+import threading
+import time
+
+from src.launch_monitor import (
+    EVENT_SCHEMA,
+    ProgressStream,
+    RetryPolicy,
+    ThreadedCellExecutor,
+    run_cells,
+    validate_cell_result,
+)
+
+
+class FunctionTimeoutError(Exception):
+    pass
+
+
+class _Call:
+    def __init__(self, object_id: str):
+        self.object_id = object_id
+        self.release = asyncio.Event()
+        self.cancelled = False
+
+
+class _FakeExecutor:
+    """Local stand-in for Modal: each cell follows a scripted list of outcomes.
+
+    An outcome is a result dict, an exception to raise, or ``"hang"`` to block
+    until cancelled.
+    """
+
+    def __init__(self, script: dict[str, list]):
+        self.script = {cell: list(outcomes) for cell, outcomes in script.items()}
+        self.running = 0
+        self.peak_running = 0
+        self.started: list[tuple[str, int]] = []
+        self.calls: list[_Call] = []
+
+    async def start(self, cell: str, attempt: int) -> _Call:
+        self.started.append((cell, attempt))
+        call = _Call(f"fc-{len(self.started)}")
+        call.outcome = self.script[cell].pop(0)
+        self.calls.append(call)
+        self.running += 1
+        self.peak_running = max(self.peak_running, self.running)
+        return call
+
+    async def wait(self, handle: _Call) -> dict:
+        try:
+            if handle.outcome == "hang":
+                await handle.release.wait()
+            await asyncio.sleep(0.01)
+            if isinstance(handle.outcome, Exception):
+                raise handle.outcome
+            return handle.outcome
+        finally:
+            self.running -= 1
+
+    async def cancel(self, handle: _Call) -> None:
+        handle.cancelled = True
+
+
+def _result(sha: str = "abc") -> dict:
+    return {
+        "full_reform_output_h5_saved": True,
+        "output_h5_sha256": sha,
+        "output_h5_size_bytes": 10,
+        "expected_schema_validation": {"validated": True},
+        "object_store": {"validation": {"scenario_h5_expected_sha256": sha}},
+        "object_store_post_upload_validation": {"validated": True},
+        "duration_seconds": 1.0,
+    }
+
+
+def _run(cells, executor, stream, **kwargs):
+    return asyncio.run(run_cells(cells, executor, stream=stream, **kwargs))
+
+
+def test_cells_run_under_the_cap_and_stream_each_state(tmp_path):
+    cells = [f"year={year}/reform=option1/scoring=static" for year in range(2030, 2035)]
+    executor = _FakeExecutor({cell: [_result()] for cell in cells})
+    lines: list[str] = []
+    log = tmp_path / "progress.jsonl"
+    stream = ProgressStream(log, total=len(cells), echo=lines.append)
+
+    outcomes = _run(cells, executor, stream, max_in_flight=2)
+
+    assert executor.peak_running == 2
+    assert {outcome.state for outcome in outcomes.values()} == {"validated"}
+    events = [json.loads(line) for line in log.read_text().splitlines()]
+    assert {event["schema"] for event in events} == {EVENT_SCHEMA}
+    assert [event["state"] for event in events if event["cell"] == cells[0]] == [
+        "queued",
+        "running",
+        "uploaded",
+        "validated",
+    ]
+    assert len(lines) == len(events)
+    assert lines[-1].startswith("[5/5 done; 5 validated]")
+
+
+def test_retry_policy_respawns_infrastructure_errors_only(tmp_path):
+    executor = _FakeExecutor(
+        {
+            "preempted": [FunctionTimeoutError("container lost"), _result()],
+            "broken": [ValueError("bad reform"), _result()],
+            "unvalidated": [{**_result(), "object_store_post_upload_validation": None}],
+        }
+    )
+    stream = ProgressStream(tmp_path / "progress.jsonl", total=3, echo=None)
+
+    outcomes = _run(
+        list(executor.script),
+        executor,
+        stream,
+        max_in_flight=3,
+        retry_policy=RetryPolicy(max_attempts=2, backoff_seconds=0),
+    )
+
+    assert (outcomes["preempted"].state, outcomes["preempted"].attempts) == (
+        "validated",
+        2,
+    )
+    assert [
+        event["state"] for event in stream.events if event["cell"] == "preempted"
+    ] == ["queued", "running", "retrying", "running", "uploaded", "validated"]
+    assert (outcomes["broken"].state, outcomes["broken"].attempts) == ("failed", 1)
+    assert outcomes["broken"].error == "ValueError: bad reform"
+    assert outcomes["unvalidated"].state == "failed"
+    assert outcomes["unvalidated"].problems == ["object-store upload was not read back"]
+
+
+def test_fail_fast_cancels_running_calls_and_leaves_queued_cells(tmp_path):
+    executor = _FakeExecutor(
+        {
+            "fails": [RuntimeError("worker crashed")],
+            "long": ["hang"],
+            "queued": [_result()],
+        }
+    )
+    stream = ProgressStream(None, total=3, echo=None)
+
+    outcomes = _run(
+        ["long", "fails", "queued"], executor, stream, max_in_flight=2, fail_fast=True
+    )
+
+    assert {cell: outcome.state for cell, outcome in outcomes.items()} == {
+        "long": "cancelled",
+        "fails": "failed",
+        "queued": "cancelled",
+    }
+    assert [cell for cell, _ in executor.started] == ["long", "fails"]
+    assert executor.calls[0].cancelled
+    assert outcomes["queued"].attempts == 0
+
+
+class _BlockingCall:
+    """Thread-blocking handle shaped like a Modal function call."""
+
+    def __init__(self, object_id: str, outcome):
+        self.object_id = object_id
+        self.outcome = outcome
+        self.released = threading.Event()
+
+    def get(self) -> dict:
+        if self.outcome == "hang":
+            # Bounded so a regression fails the test instead of hanging it.
+            self.released.wait(timeout=30)
+            raise RuntimeError("cancelled")
+        time.sleep(0.05)
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+    def cancel(self) -> None:
+        self.released.set()
+
+
+def _blocking_executor(
+    script: dict, max_in_flight: int
+) -> tuple[ThreadedCellExecutor, list[_BlockingCall]]:
+    calls: list[_BlockingCall] = []
+
+    def spawn(cell: str, attempt: int) -> _BlockingCall:
+        call = _BlockingCall(f"fc-{len(calls) + 1}", script[cell])
+        calls.append(call)
+        return call
+
+    return ThreadedCellExecutor(spawn, max_in_flight), calls
+
+
+def test_fail_fast_cancels_blocking_calls_beyond_the_default_pool(tmp_path):
+    script = {f"long-{index}": "hang" for index in range(5)}
+    script["fails"] = RuntimeError("worker crashed")
+    executor, calls = _blocking_executor(script, max_in_flight=len(script))
+    stream = ProgressStream(None, total=len(script), echo=None)
+
+    async def launch():
+        # Every get() could sit on asyncio's default pool; keep it tiny so a
+        # cancel routed there would queue behind them.
+        default_pool = ThreadPoolExecutor(max_workers=1)
+        asyncio.get_running_loop().set_default_executor(default_pool)
+        try:
+            return await asyncio.wait_for(
+                run_cells(
+                    list(script),
+                    executor,
+                    stream=stream,
+                    max_in_flight=len(script),
+                    fail_fast=True,
+                ),
+                timeout=10,
+            )
+        finally:
+            executor.close()
+
+    started = time.monotonic()
+    outcomes = asyncio.run(launch())
+
+    assert time.monotonic() - started < 10
+    assert outcomes["fails"].state == "failed"
+    assert {outcome.state for cell, outcome in outcomes.items() if cell != "fails"} == {
+        "cancelled"
+    }
+    assert all(call.released.is_set() for call in calls if call.outcome == "hang")
+
+
+def test_validate_cell_result_flags_mismatched_upload() -> None:
+    assert validate_cell_result(_result()) == []
+    mismatched = _result()
+    mismatched["object_store"]["validation"]["scenario_h5_expected_sha256"] = "other"
+    assert validate_cell_result(mismatched) == [
+        "uploaded H5 SHA-256 does not match the worker's"
+    ]
+    assert validate_cell_result(None) == ["worker returned no metadata"]
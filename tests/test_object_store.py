@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+import hashlib
+from io import BytesIO
+import json
+from pathlib import Path
+import threading
+
+import pytest
+
+from src import object_store
+from src.object_store import (
+    ArtifactCache,
+    ArtifactRequest,
+    ObjectListing,
+    ObjectStoreReader,
+)
+
+
+class FakeS3Client:
+    """Thread-safe in-process stand-in for the boto3 S3 calls the reader uses."""
+
+    def __init__(self, page_size: int = 2):
+        self.objects: dict[tuple[str, str], bytes] = {}
+        self.page_size = page_size
+        self.get_calls: list[str] = []
+        self._lock = threading.Lock()
+
+    def put(self, bucket: str, key: str, payload: object) -> None:
+        self.objects[(bucket, key)] = json.dumps(payload).encode("utf-8")
+
+    def _etag(self, body: bytes) -> str:
+        return f'"{hashlib.md5(body).hexdigest()}"'
+
+    def list_objects_v2(self, *, Bucket, Prefix, ContinuationToken=None):
+        keys = sorted(
+            key
+            for bucket, key in self.objects
+            if bucket == Bucket and key.startswith(Prefix)
+        )
+        start = int(ContinuationToken or 0)
+        page = keys[start : start + self.page_size]
+        truncated = start + self.page_size < len(keys)
+        return {
+            "Contents": [
+                {
+                    "Key": key,
+                    "ETag": self._etag(self.objects[(Bucket, key)]),
+                    "Size": len(self.objects[(Bucket, key)]),
+                }
+                for key in page
+            ],
+            "IsTruncated": truncated,
+            "NextContinuationToken": str(start + self.page_size) if truncated else None,
+        }
+
+    def get_object(self, *, Bucket, Key):
+        with self._lock:
+            self.get_calls.append(Key)
+        body = self.objects[(Bucket, Key)]
+        return {"Body": BytesIO(body), "ETag": self._etag(body)}
+
+
+def _cell_prefix(run: str, year: int, reform: str) -> str:
+    return f"crfb/reform_full_h5/{run}/reform_full_h5/year={year}/reform={reform}"
+
+
+def _populate(client: FakeS3Client, run: str = "run-a") -> None:
+    for year, reform in ((2026, "option1"), (2030, "option2"), (2035, "option3")):
+        prefix = _cell_prefix(run, year, reform)
+        client.put(
+            "bucket",
+            f"{prefix}/complete.json",
+            {
+                "metadata_key": f"{prefix}/metadata.json",
+                "scenario_sha256": f"sha-{year}",
+                "validation": {"scenario_head": {"content_length": 10}},
+            },
+        )
+        client.put(
+            "bucket",
+            f"{prefix}/metadata.json",
+            {"year": year, "reform_id": reform, "duration_seconds": 60.0},
+        )
+        client.objects[("bucket", f"{prefix}/scenario.h5")] = b"h5"
+
+
+def test_list_paginates_and_filters_suffixes():
+    client = FakeS3Client(page_size=2)
+    _populate(client)
+    reader = ObjectStoreReader(client)
+
+    listings = reader.list("bucket", "crfb/", suffixes=("/complete.json",))
+
+    assert [listing.key.rsplit("/", 1)[-1] for listing in listings] == [
+        "complete.json"
+    ] * 3
+    assert reader.stats["list_requests"] == 5
+    assert all(listing.etag.startswith('"') for listing in listings)
+
+
+def test_etag_cache_skips_unchanged_objects(tmp_path: Path):
+    client = FakeS3Client()
+    _populate(client)
+    listings = ObjectStoreReader(client).list(
+        "bucket", "crfb/", suffixes=("/complete.json",)
+    )
+
+    first = ObjectStoreReader(client, cache_dir=tmp_path).get_json_many(listings)
+    warm = ObjectStoreReader(client, cache_dir=tmp_path)
+    second = warm.get_json_many(listings)
+
+    assert first == second
+    assert len(client.get_calls) == 3
+    assert warm.stats == {"get_requests": 0, "cache_hits": 3, "list_requests": 0}
+
+
+def test_etag_cache_refetches_changed_objects(tmp_path: Path):
+    client = FakeS3Client()
+    _populate(client)
+    key = f"{_cell_prefix('run-a', 2026, 'option1')}/metadata.json"
+    reader = ObjectStoreReader(client, cache_dir=tmp_path)
+    listing = next(item for item in reader.list("bucket", "crfb/") if item.key == key)
+    reader.get_json("bucket", key, etag=listing.etag)
+
+    client.put("bucket", key, {"year": 2026, "duration_seconds": 99.0})
+    changed = next(item for item in reader.list("bucket", "crfb/") if item.key == key)
+
+    assert reader.get_json("bucket", key, etag=changed.etag)["duration_seconds"] == 99.0
+    assert client.get_calls.count(key) == 2
+
+
+def test_get_json_many_reports_per_key_errors():
+    client = FakeS3Client()
+    _populate(client)
+    reader = ObjectStoreReader(client, max_workers=4)
+
+    payloads = reader.get_json_many(
+        [
+            ("bucket", f"{_cell_prefix('run-a', 2026, 'option1')}/metadata.json"),
+            ObjectListing(bucket="bucket", key="missing.json", etag="", size=0),
+        ]
+    )
+
+    assert (
+        payloads[f"{_cell_prefix('run-a', 2026, 'option1')}/metadata.json"]["year"]
+        == 2026
+    )
+    assert isinstance(payloads["missing.json"], KeyError)
+
+
+def test_list_many_keeps_prefix_association():
+    client = FakeS3Client()
+    _populate(client, run="run-a")
+    _populate(client, run="run-b")
+    reader = ObjectStoreReader(client)
+
+    by_prefix = reader.list_many(
+        "bucket",
+        ["crfb/reform_full_h5/run-b/", "crfb/reform_full_h5/run-a/"],
+        suffixes=("/complete.json",),
+    )
+
+    assert list(by_prefix) == [
+        "crfb/reform_full_h5/run-b/",
+        "crfb/reform_full_h5/run-a/",
+    ]
+    assert all(
+        "/run-b/" in item.key for item in by_prefix["crfb/reform_full_h5/run-b/"]
+    )
+
+
+def test_reader_rejects_empty_worker_pool():
+    with pytest.raises(ValueError, match="max_workers"):
+        ObjectStoreReader(FakeS3Client(), max_workers=0)
+
+
+def test_cost_estimator_collects_metadata_through_reader(tmp_path: Path):
+    from scripts.estimate_full_h5_modal_cost import collect_completed_metadata
+
+    client = FakeS3Client()
+    _populate(client)
+
+    records = collect_completed_metadata(
+        client, bucket="bucket", prefix="crfb/", cache_dir=tmp_path
+    )
+    collect_completed_metadata(
+        client, bucket="bucket", prefix="crfb/", cache_dir=tmp_path
+    )
+
+    assert sorted(record["year"] for record in records) == [2026, 2030, 2035]
+    assert {record["output_h5_size_bytes"] for record in records} == {10}
+    assert len(client.get_calls) == 6
+
+
+def test_live_status_scan_records_completed_cells(monkeypatch, tmp_path: Path):
+    import scripts.build_live_modeling_dashboard_data as live
+
+    client = FakeS3Client()
+    _populate(client)
+    client.objects[
+        ("bucket", f"{_cell_prefix('run-a', 2040, 'option4')}/complete.json")
+    ] = b"not json"
+    monkeypatch.setenv("CRFB_R2_BUCKET", "bucket")
+    monkeypatch.setenv("CRFB_R2_OBJECT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(live, "_r2_client_from_env", lambda: client)
+    monkeypatch.setattr(live, "_run_prefixes_from_manifests", lambda _glob: ["run-a"])
+
+    records = live._scan_r2_completion_records(submission_glob="unused")
+
+    assert records[("option1", 2026)]["output_h5_sha256"] == "sha-2026"
+    assert records[("option1", 2026)]["run_prefix"] == "run-a"
+    assert records[("option1", 2026)]["metadata_uri"].endswith(
+        "year=2026/reform=option1/metadata.json"
+    )
+    assert records[("option4", 2040)]["reform_h5_status"] == "complete"
+    assert records[("option4", 2040)]["output_h5_sha256"] == ""
+
+
+def _artifact(client: FakeS3Client, key: str, payload: bytes) -> ArtifactRequest:
+    client.objects[("bucket", key)] = payload
+    return ArtifactRequest(
+        bucket="bucket", key=key, expected_sha256=hashlib.sha256(payload).hexdigest()
+    )
+
+
+def test_artifact_cache_serves_warm_files_without_hashing(monkeypatch, tmp_path):
+    client = FakeS3Client()
+    requests = [_artifact(client, f"run/{n}/scenario.h5", b"x" * n) for n in (3, 5)]
+    ArtifactCache(client, tmp_path).fetch_many(requests)
+    assert len(client.get_calls) == 2
+
+    def fail_hash(path):
+        raise AssertionError(f"re-hashed {path}")
+
+    monkeypatch.setattr(object_store, "_file_sha256", fail_hash)
+    warm = ArtifactCache(client, tmp_path)
+    paths = warm.fetch_many(requests)
+
+    assert [path.read_bytes() for path in paths] == [b"xxx", b"xxxxx"]
+    assert warm.stats["hits"] == 2
+    assert len(client.get_calls) == 2
+
+
+def test_artifact_cache_refetches_when_stat_or_sha_changes(tmp_path: Path):
+    client = FakeS3Client()
+    request = _artifact(client, "run/scenario.h5", b"original")
+    cache = ArtifactCache(client, tmp_path)
+    path = cache.fetch(request)
+    path.write_bytes(b"tampered")
+
+    assert cache.fetch(request).read_bytes() == b"original"
+    replaced = _artifact(client, "run/scenario.h5", b"replacement")
+    assert cache.fetch(replaced).read_bytes() == b"replacement"
+    assert cache.stats["downloads"] == 3
+
+
+def test_artifact_cache_adopts_preexisting_files_once(tmp_path: Path):
+    client = FakeS3Client()
+    request = _artifact(client, "run/scenario.h5", b"legacy")
+    legacy = tmp_path / "bucket" / "run" / "scenario.h5"
+    legacy.parent.mkdir(parents=True)
+    legacy.write_bytes(b"legacy")
+
+    cache = ArtifactCache(client, tmp_path)
+    cache.fetch_many([request])
+
+    assert cache.stats["adopted"] == 1
+    assert client.get_calls == []
+    assert ArtifactCache(client, tmp_path).fetch(request) == legacy
+
+
+def test_artifact_cache_adopts_unpinned_files_without_downloading(tmp_path: Path):
+    client = FakeS3Client()
+    client.objects[("bucket", "run/scenario.h5")] = b"remote"
+    request = ArtifactRequest(bucket="bucket", key="run/scenario.h5")
+    legacy = tmp_path / "bucket" / "run" / "scenario.h5"
+    legacy.parent.mkdir(parents=True)
+    legacy.write_bytes(b"legacy")
+
+    cache = ArtifactCache(client, tmp_path)
+    assert cache.fetch(request).read_bytes() == b"legacy"
+    assert cache.fetch(request) == legacy
+
+    assert cache.stats == {"hits": 1, "adopted": 1, "downloads": 0, "evictions": 0}
+    assert client.get_calls == []
+
+
+def test_artifact_cache_rejects_sha_mismatch(tmp_path: Path):
+    client = FakeS3Client()
+    client.objects[("bucket", "run/scenario.h5")] = b"corrupt"
+    request = ArtifactRequest(
+        bucket="bucket", key="run/scenario.h5", expected_sha256="0"
+    )
+
+    with pytest.raises(RuntimeError, match="SHA mismatch"):
+        ArtifactCache(client, tmp_path).fetch(request)
+    assert not (tmp_path / "bucket" / "run" / "scenario.h5").exists()
+    assert list((tmp_path / "bucket" / "run").iterdir()) == []
+
+
+def test_artifact_cache_evicts_least_recently_used(tmp_path: Path):
+    client = FakeS3Client()
+    first, second, third = (
+        _artifact(client, f"run/{name}/scenario.h5", name.encode() * 4)
+        for name in ("a", "b", "c")
+    )
+    cache = ArtifactCache(client, tmp_path, max_bytes=8, max_workers=1)
+    cache.fetch_many([first])
+    cache.fetch_many([second])
+    cache.fetch_many([first])
+    cache.fetch_many([third])
+
+    assert cache.stats["evictions"] == 1
+    assert not cache.path_for("bucket", second.key).exists()
+    assert cache.path_for("bucket", first.key).exists()
+    index = json.loads((tmp_path / "index.json").read_text(encoding="utf-8"))
+    assert sorted(index["entries"]) == [
+        f"bucket/{first.key}",
+        f"bucket/{third.key}",
+    ]
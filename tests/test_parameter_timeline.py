@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src import dashboard_baseline_assumptions as assumptions
+from src.parameter_timeline import parameter_timeline, verify_timeline
+
+
+class FakeParameter:
+    """The slice of policyengine-core's ``Parameter`` the timeline reads."""
+
+    def __init__(self, name: str, breakpoints: dict[str, object], uprating=None):
+        self.name = name
+        self.metadata = {"uprating": uprating or "gov.irs.uprating"}
+        self.values_list = sorted(
+            (
+                SimpleNamespace(instant_str=instant, value=value)
+                for instant, value in breakpoints.items()
+            ),
+            key=lambda at_instant: at_instant.instant_str,
+            reverse=True,
+        )
+
+    def __call__(self, instant: str):
+        for at_instant in self.values_list:
+            if at_instant.instant_str <= instant:
+                return at_instant.value
+        return None
+
+
+def _uprated(name: str, base: float, growth: float, start: int = 2020):
+    return FakeParameter(
+        name,
+        {
+            f"{year}-01-01": round(base * (1 + growth) ** (year - start), 2)
+            for year in range(start, 2101)
+        }
+        | {f"{start + 3}-07-01": -1.0},
+    )
+
+
+def test_timeline_matches_calls_between_and_before_breakpoints():
+    parameter = FakeParameter(
+        "gov.test.flag",
+        {"2030-01-01": 1.0, "2030-06-01": 2.0, "2041-01-01": True, "2050-01-02": "x"},
+    )
+    years = list(range(2025, 2061))
+
+    values = parameter_timeline(parameter, years)
+
+    assert values == [parameter(f"{year}-01-01") for year in years]
+    assert values[:5] == [None] * 5
+    verify_timeline(parameter, years, values)
+    with pytest.raises(ValueError, match="direct call gives"):
+        verify_timeline(parameter, years, [None, *values[1:-1], 0.0])
+    assert parameter_timeline(lambda instant: instant[:4], [2026, 2027]) == [
+        "2026",
+        "2027",
+    ]
+
+
+def _parameters():
+    def leaves(prefix, count, base):
+        return [
+            _uprated(f"{prefix}.{i}", base * (i + 1), 0.02 + 0.001 * i)
+            for i in range(count)
+        ]
+
+    roots = {
+        "thresholds": leaves("gov.irs.income.bracket.thresholds", 3, 10_000),
+        "standard": leaves("gov.irs.deductions.standard.amount", 2, 14_000),
+        "aged": leaves("gov.irs.deductions.standard.aged_or_blind.amount", 1, 1_500),
+        "cg": leaves("gov.irs.capital_gains.thresholds", 2, 40_000),
+        "amt_brackets": leaves("gov.irs.income.amt.brackets", 1, 200_000),
+        "amt_amount": leaves("gov.irs.income.amt.exemption.amount", 1, 80_000),
+        "amt_phase": leaves("gov.irs.income.amt.exemption.phase_out.start", 1, 600_000),
+        "amt_limit": leaves("gov.irs.income.amt.exemption.separate_limit", 1, 50_000),
+    }
+    # The same parameter listed under two roots is reported once.
+    roots["standard"].append(roots["thresholds"][0])
+    node = SimpleNamespace
+    gov = node(
+        irs=node(
+            uprating=_uprated("gov.irs.uprating", 300.0, 0.025),
+            income=node(
+                bracket=node(thresholds=roots["thresholds"]),
+                amt=node(
+                    brackets=roots["amt_brackets"],
+                    exemption=node(
+                        amount=roots["amt_amount"],
+                        phase_out=node(start=roots["amt_phase"]),
+                        separate_limit=roots["amt_limit"],
+                    ),
+                ),
+            ),
+            deductions=node(
+                standard=node(
+                    amount=roots["standard"],
+                    aged_or_blind=node(amount=roots["aged"]),
+                )
+            ),
+            capital_gains=node(thresholds=roots["cg"]),
+        ),
+        ssa=node(nawi=_uprated("gov.ssa.nawi", 60_000.0, 0.037)),
+    )
+    module = SimpleNamespace(
+        iter_updatable_parameters=lambda root, uprating_parameter: list(root)
+    )
+    return module, node(gov=gov)
+
+
+def test_indexed_tables_match_per_call_lookups():
+    module, parameters = _parameters()
+
+    long, summary, growth = assumptions.build_indexed_parameter_tables(
+        module, parameters, verify=True
+    )
+
+    names = list(dict.fromkeys(long["parameter_name"]))
+    assert len(names) == 12
+    assert len(long) == 12 * 75
+    leaf = {
+        parameter.name: parameter
+        for root in assumptions._group_roots(parameters)
+        for parameter in root[2]
+    }
+    expected = [
+        float(leaf[row.parameter_name](f"{row.year}-01-01"))
+        for row in long.itertuples(index=False)
+    ]
+    np.testing.assert_array_equal(long["value"].to_numpy(), expected)
+    assert long.groupby("parameter_name").year.apply(list).map(len).eq(75).all()
+
+    row = summary.set_index("parameter_name").loc[names[0]]
+    parameter = leaf[names[0]]
+    for year in assumptions.SPOTLIGHT_YEARS:
+        assert row[f"value_{year}"] == float(parameter(f"{year}-01-01"))
+    assert row["growth_2026_to_2100_pct"] == pytest.approx(
+        (float(parameter("2100-01-01")) / float(parameter("2026-01-01")) - 1) * 100
+    )
+    assert row["parameter_label"] == assumptions._short_parameter_label(names[0])
+
+    uprating = parameters.gov.irs.uprating
+    nawi = parameters.gov.ssa.nawi
+    by_year = growth.set_index("year")
+    assert (
+        by_year.loc[2030, "growth_rate_pct"]
+        == (float(uprating("2030-01-01")) / float(uprating("2029-01-01")) - 1) * 100
+    )
+    assert (
+        by_year.loc[2035, "growth_rate_pct"]
+        == (float(nawi("2034-01-01")) / float(nawi("2033-01-01")) - 1) * 100
+    )
+    assert by_year.loc[2035, "indexing_source"] == "SSA Trustees average-wage growth"
+    assert by_year.loc[2034, "indexing_source"] == "PolicyEngine default IRS uprating"
+
+
+def test_reform_baseline_values_fall_back_for_unresolvable_names():
+    _, parameters = _parameters()
+
+    values = assumptions._parameter_values(
+        parameters, "gov.irs.uprating", assumptions.YEAR_RANGE
+    )
+
+    assert values == [
+        assumptions._parameter_value(parameters, "gov.irs.uprating", year)
+        for year in assumptions.YEAR_RANGE
+    ]
+    assert assumptions._parameter_values(
+        parameters, "gov.irs.missing.rate", [2026, 2027]
+    ) == [None, None]
@@ -16,6 +16,7 @@ from src.projection import (
     load_population_age_targets,
     load_tob_targets,
     solve_earnings_scale,
+    solve_earnings_scale_with_info,
     target_source_provenance,
 )
 
@@ -139,6 +140,41 @@ def test_entropy_audit_reports_concentration():
     assert audit["max_weight_ratio"] >= 1.0
 
 
+def test_entropy_warm_start_from_adjacent_year_saves_iterations():
+    A, _, base = _toy_problem()
+    # A strong tilt, like the far-horizon age reweight, where the
+    # least-squares start is poor and the previous year's dual is not.
+    targets = A.T @ base * np.array([1.6, 0.7, 1.3, 0.8, 1.5])
+    _, previous = calibrate_entropy_constraints(A, targets, base)
+    next_targets = targets * np.array([1.01, 1.0, 0.99, 1.0, 1.02])
+
+    cold, cold_info = calibrate_entropy_constraints(A, next_targets, base)
+    warm, warm_info = calibrate_entropy_constraints(
+        A, next_targets, base, initial_dual=previous["dual"]
+    )
+
+    assert cold_info["start"] == "least_squares"
+    assert warm_info["start"] == "warm"
+    assert warm_info["iterations"] < cold_info["iterations"]
+    np.testing.assert_allclose(warm, cold, rtol=1e-8)
+
+
+def test_entropy_ignores_unhelpful_or_mismatched_warm_starts():
+    A, targets, base = _toy_problem()
+    _, cold_info = calibrate_entropy_constraints(A, targets, base)
+
+    _, far_info = calibrate_entropy_constraints(
+        A, targets, base, initial_dual=np.full(A.shape[1], 50.0)
+    )
+    _, short_info = calibrate_entropy_constraints(
+        A, targets, base, initial_dual=np.zeros(A.shape[1] - 1)
+    )
+
+    assert far_info["start"] == short_info["start"] == "least_squares"
+    assert far_info["warm_start_offered"]
+    assert far_info["iterations"] == cold_info["iterations"]
+
+
 def test_entropy_raises_on_infeasible_targets():
     A, targets, base = _toy_problem()
     bad = targets.copy()
@@ -210,6 +246,29 @@ def test_earnings_scale_se_income_uses_remaining_cap_room():
     assert taxable == pytest.approx(180_000.0, rel=1e-6)
 
 
+def test_earnings_scale_warm_start_matches_cold_with_fewer_evaluations():
+    rng = np.random.default_rng(5)
+    wages = rng.uniform(10_000, 300_000, 5_000)
+    se = rng.uniform(0, 50_000, 5_000)
+    weights = np.full(5_000, 50.0)
+    problem = dict(
+        gross_wages=wages,
+        taxable_self_employment=se,
+        weights=weights,
+        cap=176_100.0,
+        payroll_target=float((np.minimum(wages, 176_100.0) * weights).sum()) * 1.3,
+    )
+    cold, cold_info = solve_earnings_scale_with_info(**problem)
+    warm, warm_info = solve_earnings_scale_with_info(**problem, initial=cold * 1.01)
+    far, _ = solve_earnings_scale_with_info(**problem, initial=cold * 8)
+
+    assert cold == solve_earnings_scale(**problem)
+    assert warm == pytest.approx(cold, rel=1e-12)
+    assert far == pytest.approx(cold, rel=1e-12)
+    assert warm_info["start"] == "warm"
+    assert warm_info["evaluations"] < cold_info["evaluations"]
+
+
 def test_earnings_scale_raises_when_target_unreachable():
     wages = np.array([150_000.0])
     se = np.array([0.0])
@@ -108,6 +108,7 @@ def test_allocation_rule_sets_mirror_python():
     assert ts_set("baselineShareOptions") == rules["baselineShareOptions"]
     assert ts_set("netImpactOptions") == rules["netImpactOptions"]
     assert ts_set("directBranchingOptions") == rules["directBranchingOptions"]
+    assert ts_set("generalFundToOasdiOptions") == rules["generalFundToOasdiOptions"]
 
 
 def test_export_data_vintage_matches_contract():
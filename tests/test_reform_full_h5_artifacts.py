@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import base64
+import hashlib
 from io import BytesIO
 from pathlib import Path
 
@@ -328,6 +330,124 @@ def test_object_store_validation_rejects_metadata_sha_mismatch(tmp_path: Path):
         )
 
 
+class ChunkedBody(BytesIO):
+    def __init__(self, payload: bytes, reads: list[int]):
+        super().__init__(payload)
+        self.reads = reads
+
+    def read(self, size: int | None = -1) -> bytes:
+        if size is None or size < 0:
+            raise AssertionError("object bodies must be streamed in chunks")
+        self.reads.append(size)
+        return super().read(size)
+
+
+class MultipartFakeObjectStoreClient(FakeObjectStoreClient):
+    def __init__(self, *, fail_part: int | None = None):
+        super().__init__()
+        self.fail_part = fail_part
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.aborted: list[str] = []
+        self.part_checksums: list[str] = []
+        self.body_reads: list[int] = []
+
+    def get_object(self, *, Bucket: str, Key: str) -> dict:
+        return {"Body": ChunkedBody(self.objects[(Bucket, Key)], self.body_reads)}
+
+    def create_multipart_upload(self, *, Bucket, Key, ContentType, ChecksumAlgorithm):
+        del Bucket, Key, ContentType
+        assert ChecksumAlgorithm == "SHA256"
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, *, Bucket, Key, UploadId, PartNumber, Body, ChecksumSHA256):
+        del Bucket, Key
+        if PartNumber == self.fail_part:
+            raise RuntimeError("part upload failed")
+        expected = base64.b64encode(hashlib.sha256(Body).digest()).decode("ascii")
+        assert ChecksumSHA256 == expected
+        self.part_checksums.append(ChecksumSHA256)
+        self.uploads[UploadId][PartNumber] = Body
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(
+        self, *, Bucket, Key, UploadId, MultipartUpload, IfNoneMatch
+    ):
+        assert IfNoneMatch == "*"
+        if (Bucket, Key) in self.objects:
+            raise RuntimeError("precondition failed")
+        parts = self.uploads.pop(UploadId)
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        assert numbers == sorted(parts)
+        self.objects[(Bucket, Key)] = b"".join(parts[number] for number in numbers)
+
+    def abort_multipart_upload(self, *, Bucket, Key, UploadId):
+        del Bucket, Key
+        self.uploads.pop(UploadId, None)
+        self.aborted.append(UploadId)
+
+
+def _multipart_kwargs(tmp_path: Path, client) -> dict:
+    h5_path = tmp_path / "scenario.h5"
+    metadata_path = tmp_path / "metadata.json"
+    _write_full_h5(h5_path)
+    metadata_path.write_text('{"ok": true}\n', encoding="utf-8")
+    return {
+        "client": client,
+        "bucket": "bucket",
+        "scenario_path": h5_path,
+        "metadata_path": metadata_path,
+        "scenario_key": "run/scenario.h5",
+        "metadata_key": "run/metadata.json",
+        "completion_key": "run/complete.json",
+        "multipart_threshold_bytes": 4096,
+        "part_size_bytes": 4096,
+        "max_concurrency": 2,
+    }
+
+
+def test_object_store_upload_streams_large_scenario_as_multipart(tmp_path: Path):
+    client = MultipartFakeObjectStoreClient()
+    kwargs = _multipart_kwargs(tmp_path, client)
+    h5_path = kwargs["scenario_path"]
+
+    result = upload_artifact_pair_to_object_store(**kwargs)
+
+    upload = result["scenario_upload"]
+    assert upload["method"] == "multipart"
+    assert upload["part_count"] == -(-h5_path.stat().st_size // 4096)
+    assert len(client.part_checksums) == upload["part_count"]
+    assert client.objects[("bucket", "run/scenario.h5")] == h5_path.read_bytes()
+    assert result["scenario_sha256"] == file_sha256(h5_path)
+    assert result["completion_sha256"] is not None
+    assert client.body_reads and all(size > 0 for size in client.body_reads)
+    assert upload_artifact_pair_to_object_store(**kwargs)["validated"] is True
+
+
+def test_object_store_multipart_upload_aborts_on_part_failure(tmp_path: Path):
+    client = MultipartFakeObjectStoreClient(fail_part=2)
+    kwargs = _multipart_kwargs(tmp_path, client)
+
+    with pytest.raises(RuntimeError, match="part upload failed"):
+        upload_artifact_pair_to_object_store(**kwargs)
+
+    assert client.aborted == ["upload-0"]
+    assert ("bucket", "run/scenario.h5") not in client.objects
+
+
+def test_object_store_multipart_upload_rejects_different_existing_object(
+    tmp_path: Path,
+):
+    client = MultipartFakeObjectStoreClient()
+    kwargs = _multipart_kwargs(tmp_path, client)
+    client.objects[("bucket", "run/scenario.h5")] = b"someone else"
+
+    with pytest.raises(RuntimeError, match="already exists with different content"):
+        upload_artifact_pair_to_object_store(**kwargs)
+    assert client.uploads == {}
+
+
 def test_inspect_entity_table_h5_records_required_weights(tmp_path: Path):
     h5_path = tmp_path / "scenario.h5"
     _write_full_h5(h5_path)
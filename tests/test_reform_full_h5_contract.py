@@ -8,6 +8,7 @@ import threading
 import pytest
 
 from src.reform_full_h5_contract import (
+    BATCH_SIGNING_KEY_ENV,
     ApprovalGuardError,
     LocalFileLockApprovalStore,
     R2ConditionalApprovalStore,
@@ -573,3 +574,167 @@ def test_r2_reservation_consumption_is_idempotent_for_modal_retry(tmp_path: Path
             reservation_token=token,
             store=store,
         )
+
+
+class ThreadSafeFakeR2Client(FakeR2Client):
+    """A local S3 stand-in whose conditional puts are atomic across threads."""
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self.put_count = 0
+
+    def put_object(self, **kwargs) -> None:
+        with self._lock:
+            self.put_count += 1
+            super().put_object(**kwargs)
+
+
+def _panel_ledger(tmp_path: Path, cells: list[ReformCell]) -> Path:
+    ledger_path = _approved_ledger(tmp_path)
+    ledger = load_ledger(ledger_path)
+    ledger.update(
+        {
+            "approved_worker_sha": "worker-sha",
+            "approved_cells": [cell.to_ledger() for cell in cells],
+            "allowed_paid_call_count": len(cells),
+        }
+    )
+    write_ledger(ledger_path, ledger)
+    return ledger_path
+
+
+def _reserve_batch(ledger_path: Path, cells, store, **kwargs):
+    return submitter_consume_and_reserve(
+        ledger_path=ledger_path,
+        requested_cells=cells,
+        launch_mode="test",
+        worker_entrypoint=WORKER_ENTRYPOINT,
+        worker_sha="worker-sha",
+        submit_command="submit --one",
+        code_bundle_sha="bundle-sha",
+        durable_storage_target="r2://bucket/prefix",
+        approval_nonce="nonce-1",
+        consumed_by="pytest",
+        store=store,
+        batch=True,
+        **kwargs,
+    )
+
+
+def _verify_batch(ledger_path: Path, cell, token, store, **kwargs):
+    return worker_verify_reserved_call(
+        ledger_path=ledger_path,
+        cell=cell,
+        launch_mode="test",
+        worker_entrypoint=WORKER_ENTRYPOINT,
+        worker_sha="worker-sha",
+        code_bundle_sha="bundle-sha",
+        durable_storage_target="r2://bucket/prefix",
+        approval_nonce="nonce-1",
+        reservation_token=token,
+        store=store,
+        **kwargs,
+    )
+
+
+def test_batch_reserves_a_large_panel_in_one_conditional_write(tmp_path: Path):
+    cells = [
+        ReformCell(year, f"option{n}") for year in range(2026, 2046) for n in range(10)
+    ]
+    ledger_path = _panel_ledger(tmp_path, cells)
+    client = ThreadSafeFakeR2Client()
+    store = R2ConditionalApprovalStore(client=client, bucket="bucket", prefix="store")
+
+    reservations = _reserve_batch(ledger_path, cells, store)
+
+    assert client.put_count == 1
+    ledger = load_ledger(ledger_path)
+    assert ledger["paid_call_count_consumed"] == 200
+    assert ledger["reservation_batch_sha256"]
+    assert ledger["reservation_batch_signature"] is None
+    first, second = reservations[0], reservations[1]
+    _verify_batch(ledger_path, first.cell, first.token, store)
+    assert client.put_count == 2
+    # A retried container re-verifies the same token.
+    _verify_batch(ledger_path, first.cell, first.token, store)
+    with pytest.raises(ApprovalGuardError, match="not in the batch manifest"):
+        _verify_batch(ledger_path, second.cell, first.token, store)
+
+
+def test_batch_manifest_signature_and_ledger_binding_fail_closed(tmp_path: Path):
+    cells = [ReformCell(2075, "option10"), ReformCell(2076, "option10")]
+    ledger_path = _panel_ledger(tmp_path, cells)
+    store = LocalFileLockApprovalStore(tmp_path / "store")
+    (reservation, _) = _reserve_batch(ledger_path, cells, store, signing_key=b"key")
+
+    with pytest.raises(ApprovalGuardError, match="SIGNING_KEY"):
+        _verify_batch(ledger_path, reservation.cell, reservation.token, store)
+    with pytest.raises(ApprovalGuardError, match="signature is invalid"):
+        _verify_batch(
+            ledger_path, reservation.cell, reservation.token, store, signing_key=b"x"
+        )
+    _verify_batch(
+        ledger_path, reservation.cell, reservation.token, store, signing_key=b"key"
+    )
+
+    ledger = load_ledger(ledger_path)
+    ledger["reservation_batch_sha256"] = "0" * 64
+    write_ledger(ledger_path, ledger)
+    with pytest.raises(ApprovalGuardError, match="does not match the ledger"):
+        _verify_batch(
+            ledger_path, reservation.cell, reservation.token, store, signing_key=b"key"
+        )
+
+
+def test_unsigned_batch_fails_closed_when_a_signing_key_is_available(
+    tmp_path: Path, monkeypatch
+):
+    cells = [ReformCell(2075, "option10"), ReformCell(2076, "option10")]
+    ledger_path = _panel_ledger(tmp_path, cells)
+    store = LocalFileLockApprovalStore(tmp_path / "store")
+    (reservation, _) = _reserve_batch(ledger_path, cells, store)
+
+    with pytest.raises(ApprovalGuardError, match="not signed"):
+        _verify_batch(
+            ledger_path, reservation.cell, reservation.token, store, signing_key=b"key"
+        )
+    monkeypatch.setenv(BATCH_SIGNING_KEY_ENV, "key")
+    with pytest.raises(ApprovalGuardError, match="not signed"):
+        _verify_batch(ledger_path, reservation.cell, reservation.token, store)
+
+
+@pytest.mark.parametrize("backend", ["local", "s3"])
+def test_concurrent_batch_submitters_allow_exactly_one_success(
+    tmp_path: Path, backend: str
+):
+    cells = [ReformCell(year, "option10") for year in range(2026, 2076)]
+    ledger_path = _panel_ledger(tmp_path, cells)
+    if backend == "local":
+        store = LocalFileLockApprovalStore(tmp_path / "store")
+    else:
+        store = R2ConditionalApprovalStore(
+            client=ThreadSafeFakeR2Client(), bucket="bucket", prefix="store"
+        )
+    barrier = threading.Barrier(4)
+    results: list[object] = []
+
+    def attempt() -> None:
+        barrier.wait()
+        try:
+            results.append(_reserve_batch(ledger_path, cells, store))
+        except ApprovalGuardError:
+            results.append("blocked")
+
+    threads = [threading.Thread(target=attempt) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    winners = [result for result in results if result != "blocked"]
+    assert len(winners) == 1 and len(results) == 4
+    (winner,) = winners
+    ledger = load_ledger(ledger_path)
+    assert ledger["reservation_token_hashes"] == [r.token_hash for r in winner]
+    _verify_batch(ledger_path, winner[-1].cell, winner[-1].token, store)
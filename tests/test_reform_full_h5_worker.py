@@ -19,6 +19,7 @@ from src.reform_full_h5_worker import (
     validate_baseline_dataset_against_manifest,
     validate_object_store_target_matches_approval,
 )
+from src.stage_profiler import StageProfiler
 
 
 class _Entity:
@@ -114,6 +115,28 @@ def test_save_complete_microsimulation_h5_writes_entity_tables(tmp_path: Path):
     assert manifest["entities"]["household"]["required_weight_column_present"] is True
 
 
+def test_save_complete_microsimulation_h5_profiles_each_variable(tmp_path: Path):
+    profiler = StageProfiler()
+
+    save_complete_microsimulation_h5(
+        _Simulation(),
+        tmp_path / "scenario.h5",
+        year=2075,
+        fail_on_empty_entity=False,
+        variables_by_entity=_TEST_VARIABLES_BY_ENTITY,
+        profiler=profiler,
+    )
+    profile = profiler.to_dict()
+
+    assert sorted(item["variable"] for item in profile["variables"]) == sorted(
+        name for names in _TEST_VARIABLES_BY_ENTITY.values() for name in names
+    )
+    assert {item["stage"] for item in profile["stages"]} == {
+        "write_output_h5",
+        "output_h5_sha256",
+    }
+
+
 def test_behavioral_scoring_uses_behavioral_reform(monkeypatch):
     marker = object()
 
@@ -379,7 +379,7 @@ def test_dashboard_exposes_balanced_fix_as_baseline_scenario_not_allocation_mode
     assert '"ssSolvent"' in shell
     assert 'baselineScenario === "currentLaw"' in shell
     assert "type BaselineScenario" in data_loader
-    assert '"/data/balanced_fix_results.csv"' in data_loader
+    assert 'loadResultRows("ss_solvent"' in data_loader
     assert "solvent_general_fund_impact" in data_loader
 
 
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import results_store
+from src.results_store import (
+    RESULTS_SCHEMA,
+    ResultsStore,
+    content_vintage,
+    load_results,
+    normalize_results,
+    read_results_csv,
+    results_csv_bytes,
+    write_results_store,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+RESULTS_CSV = REPO_ROOT / "results.csv"
+
+
+def _panel() -> pd.DataFrame:
+    rows = []
+    for scoring_type in ("static", "behavioral"):
+        for reform in ("option1", "option2"):
+            for year in (2026, 2027, 2028):
+                rows.append(
+                    {
+                        "year": year,
+                        "reform_name": reform,
+                        "baseline_tax_assumption_active": "False"
+                        if year == 2026
+                        else "",
+                        "revenue_impact": -float(year - 2000),
+                        "scoring_type": scoring_type,
+                        "source": "exact_full_h5" if year != 2027 else None,
+                    }
+                )
+    return pd.DataFrame(rows)
+
+
+def test_committed_results_csv_loads_with_schema_dtypes():
+    frame = read_results_csv(RESULTS_CSV)
+
+    for column, dtype in RESULTS_SCHEMA.items():
+        assert str(frame[column].dtype) == dtype, column
+    assert frame["baseline_tax_assumption_active"].isna().any()
+    assert set(frame["scoring_type"]) == {"static", "behavioral"}
+
+
+def test_csv_export_round_trips_typed_frame():
+    frame = read_results_csv(RESULTS_CSV)
+
+    reread = read_results_csv(io.BytesIO(results_csv_bytes(frame)))
+
+    pd.testing.assert_frame_equal(reread, frame, atol=1e-9)
+
+
+def test_load_results_filters_csv_rows_and_columns():
+    frame = load_results(
+        RESULTS_CSV,
+        scoring_types=("static",),
+        reforms=("option1",),
+        years=range(2026, 2036),
+        columns=("year", "revenue_impact"),
+    )
+
+    assert list(frame.columns) == ["year", "revenue_impact"]
+    assert frame["year"].tolist() == list(range(2026, 2036))
+    assert frame["revenue_impact"].dtype == "float64"
+
+
+def test_normalize_results_rejects_bad_frames():
+    with pytest.raises(ValueError, match="missing required columns"):
+        normalize_results(pd.DataFrame({"year": [2026]}))
+    with pytest.raises(ValueError, match="non-boolean"):
+        normalize_results(
+            pd.DataFrame(
+                {
+                    "year": [2026],
+                    "reform_name": ["option1"],
+                    "baseline_tax_assumption_active": ["maybe"],
+                }
+            )
+        )
+    with pytest.raises(KeyError, match="no columns"):
+        load_results(RESULTS_CSV, columns=("not_a_column",))
+
+
+def test_store_round_trips_and_prunes_partitions(tmp_path: Path):
+    panel = _panel()
+
+    vintage = write_results_store(panel, tmp_path, metadata={"note": "test"})
+    store = ResultsStore(tmp_path)
+    manifest = store.manifest()
+
+    assert vintage == content_vintage(normalize_results(panel))
+    assert store.vintages() == [vintage]
+    assert [p["path"] for p in manifest["partitions"]][:2] == [
+        "scoring_type=static/reform_name=option1.npz",
+        "scoring_type=static/reform_name=option2.npz",
+    ]
+    assert manifest["metadata"] == {"note": "test"}
+    pd.testing.assert_frame_equal(store.query(), normalize_results(panel))
+
+    sliced = store.query(
+        scoring_types=("behavioral",),
+        reforms=("option2",),
+        years=(2027, 2028),
+        columns=("year", "revenue_impact"),
+    )
+    assert list(sliced.columns) == ["year", "revenue_impact"]
+    assert sliced["year"].tolist() == [2027, 2028]
+    pd.testing.assert_frame_equal(
+        load_results(tmp_path, scoring_types=("behavioral",), reforms=("option2",)),
+        store.query(scoring_types=("behavioral",), reforms=("option2",)),
+    )
+
+
+def test_store_vintages_are_content_addressed(tmp_path: Path):
+    panel = _panel()
+
+    first = write_results_store(panel, tmp_path)
+    again = write_results_store(panel, tmp_path)
+    panel.loc[0, "revenue_impact"] = 1.0
+    changed = write_results_store(panel, tmp_path)
+
+    assert first == again
+    assert changed != first
+    assert sorted(ResultsStore(tmp_path).vintages()) == sorted([first, changed])
+    latest = json.loads((tmp_path / "latest.json").read_text(encoding="utf-8"))
+    assert latest == {"vintage": changed}
+    exported = ResultsStore(tmp_path).export_csv(
+        tmp_path / "results.csv", vintage=first
+    )
+    assert exported.read_bytes() == results_csv_bytes(normalize_results(_panel()))
+
+
+def test_store_partitions_load_without_pickle(tmp_path: Path):
+    panel = _panel()
+    panel["note"] = ["x", None] * (len(panel) // 2)
+
+    vintage = write_results_store(panel, tmp_path)
+    manifest = ResultsStore(tmp_path).manifest()
+    partition = tmp_path / vintage / manifest["partitions"][0]["path"]
+
+    with np.load(partition, allow_pickle=False) as archive:
+        assert archive["year"].dtype == np.int64
+        assert archive["baseline_tax_assumption_active"].dtype == bool
+        assert archive["source"].dtype.kind == "U"
+        assert archive[f"source{results_store.MISSING_SUFFIX}"].tolist() == [
+            False,
+            True,
+            False,
+        ]
+    frame = ResultsStore(tmp_path).query()
+    assert frame["baseline_tax_assumption_active"].dtype == "boolean"
+    assert frame["source"].dtype == "string"
+    assert frame["note"].isna().tolist() == panel["note"].isna().tolist()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+from src import runtime_fingerprint
+from src.runtime_config import _policyengine_us_package_tree_sha256
+from src.runtime_fingerprint import (
+    CACHE_ENV,
+    _subprocess_freeze_lines,
+    cached_tree_sha256,
+    pip_freeze,
+)
+
+
+def _legacy_tree_sha256(package_dir: Path) -> str:
+    digest = hashlib.sha256()
+    for file_path in sorted(package_dir.rglob("*")):
+        if not file_path.is_file() or "__pycache__" in file_path.parts:
+            continue
+        contents = file_path.read_bytes()
+        digest.update(file_path.relative_to(package_dir).as_posix().encode())
+        digest.update(b"\0" + str(len(contents)).encode() + b"\0" + contents + b"\0")
+    return digest.hexdigest()
+
+
+def _package(root: Path) -> Path:
+    package_dir = root / "policyengine_us"
+    (package_dir / "parameters" / "gov").mkdir(parents=True)
+    (package_dir / "__pycache__").mkdir()
+    (package_dir / "__init__.py").write_text("VERSION = '1'\n")
+    (package_dir / "parameters" / "gov" / "rate.yaml").write_text("values: 1\n")
+    (package_dir / "__pycache__" / "x.pyc").write_bytes(b"ignored")
+    return package_dir
+
+
+def test_tree_hash_is_unchanged_and_reused_until_a_file_changes(
+    tmp_path: Path, monkeypatch
+):
+    package_dir = _package(tmp_path / "site")
+    monkeypatch.setenv(CACHE_ENV, str(tmp_path / "cache.json"))
+
+    first = _policyengine_us_package_tree_sha256(tmp_path / "site")
+    assert first == _legacy_tree_sha256(package_dir)
+
+    files = [(path, path.name) for path in sorted(package_dir.rglob("*.yaml"))]
+    calls = []
+
+    def compute() -> str:
+        calls.append(1)
+        return "fresh"
+
+    key = package_dir / "parameters"
+    assert cached_tree_sha256(key, files, compute) == "fresh"
+    assert cached_tree_sha256(key, files, compute) == "fresh"
+    assert len(calls) == 1
+    assert _policyengine_us_package_tree_sha256(tmp_path / "site") == first
+
+    rate = package_dir / "parameters" / "gov" / "rate.yaml"
+    rate.write_text("values: 2\n")
+    os.utime(rate, ns=(1, 1))
+    changed = _policyengine_us_package_tree_sha256(tmp_path / "site")
+    assert changed != first
+    assert changed == _legacy_tree_sha256(package_dir)
+    assert cached_tree_sha256(key, files, compute) == "fresh"
+    assert len(calls) == 2
+
+
+def test_disabled_or_unwritable_cache_still_hashes(tmp_path: Path, monkeypatch):
+    package_dir = _package(tmp_path / "site")
+    monkeypatch.setenv(CACHE_ENV, "")
+    assert runtime_fingerprint.default_cache_path() is None
+    assert _policyengine_us_package_tree_sha256(
+        tmp_path / "site"
+    ) == _legacy_tree_sha256(package_dir)
+
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    monkeypatch.setenv(CACHE_ENV, str(blocker / "cache.json"))
+    assert _policyengine_us_package_tree_sha256(
+        tmp_path / "site"
+    ) == _legacy_tree_sha256(package_dir)
+
+
+def test_pip_freeze_matches_pip_and_is_computed_once():
+    frozen = pip_freeze()
+
+    assert frozen["available"]
+    payload = "\n".join(frozen["packages"]) + "\n"
+    assert frozen["sha256"] == hashlib.sha256(payload.encode()).hexdigest()
+    assert frozen["packages"] == _subprocess_freeze_lines()
+    assert pip_freeze() == frozen
+    assert runtime_fingerprint._freeze_lines.cache_info().hits >= 1
@@ -0,0 +1,60 @@
+"""Guard the precomputed discount-rate / allocation-mode sensitivity cube."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from scripts.build_headline_summary import build as build_headline_summary
+from scripts.build_sensitivity_cube import build, load
+
+
+def test_committed_cube_matches_regeneration():
+    committed, index = load()
+    regenerated, axes = build(rate_shifts_pct=tuple(index["labels"]["rate_shift_pct"]))
+
+    assert index["labels"] == axes
+    assert list(committed.shape) == list(regenerated.shape)
+    np.testing.assert_allclose(
+        committed,
+        regenerated.astype(np.float32),
+        rtol=1e-6,
+        atol=1e-3,
+        equal_nan=True,
+        err_msg="stale; rerun scripts/build_sensitivity_cube.py",
+    )
+
+
+def test_unshifted_default_slice_matches_headline_summary():
+    cube, index = load()
+    labels = index["labels"]
+    scoring = labels["scoring_type"].index("static")
+    mode = labels["allocation_mode"].index("baselineShares")
+    shift = labels["rate_shift_pct"].index(0.0)
+    for record in build_headline_summary():
+        if record["baseline_scenario"] != "scheduled_benefits":
+            continue
+        reform = labels["reform"].index(record["reform"])
+        for position, measure in enumerate(labels["measure"]):
+            assert cube[reform, scoring, mode, shift, position] == pytest.approx(
+                record[measure], rel=1e-6, abs=1e-2
+            ), (record["reform"], measure)
+
+
+def test_higher_rates_shrink_long_run_present_values():
+    cube, index = load()
+    labels = index["labels"]
+    reform = labels["reform"].index("option1")
+    scoring = labels["scoring_type"].index("static")
+    total = labels["measure"].index("pv75_total_billions")
+    series = cube[reform, scoring, :, :, total]
+
+    assert np.all(np.diff(np.abs(series), axis=1) < 0)
+
+
+def test_static_only_reforms_have_no_behavioral_cells():
+    cube, index = load()
+    labels = index["labels"]
+    behavioral = labels["scoring_type"].index("behavioral")
+
+    assert np.isnan(cube[labels["reform"].index("magi100"), behavioral]).all()
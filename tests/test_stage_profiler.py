@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from scripts.rank_full_h5_profiles import load_local_metadata, rank_profiles
+from src.stage_profiler import PROFILE_SCHEMA, StageProfiler
+
+
+def test_profiler_records_nested_stages_and_variables():
+    profiler = StageProfiler()
+    with profiler.stage("save_complete_microsimulation_h5"):
+        with profiler.variable("income_tax", "tax_unit"):
+            sum(range(1000))
+        with profiler.stage("write_output_h5"):
+            pass
+
+    profile = profiler.to_dict()
+
+    assert profile["schema"] == PROFILE_SCHEMA
+    stages = {item["stage"]: item for item in profile["stages"]}
+    assert stages["write_output_h5"]["parent"] == "save_complete_microsimulation_h5"
+    assert stages["save_complete_microsimulation_h5"]["parent"] is None
+    (variable,) = profile["variables"]
+    assert variable["variable"] == "income_tax"
+    assert variable["parent"] == "save_complete_microsimulation_h5"
+    assert variable["wall_seconds"] >= 0
+    assert variable["cpu_seconds"] >= 0
+    assert variable["peak_rss_bytes"] is None or variable["peak_rss_bytes"] > 0
+    json.dumps(profile)
+
+
+def test_profiler_marks_failed_measurements():
+    profiler = StageProfiler()
+    with pytest.raises(KeyError):
+        with profiler.variable("missing", "person"):
+            raise KeyError("missing")
+
+    assert profiler.variables[0]["failed"] is True
+
+
+def _metadata(year: int, reform: str, variable_seconds: dict[str, float]) -> dict:
+    return {
+        "year": year,
+        "reform_id": reform,
+        "profile": {
+            "schema": PROFILE_SCHEMA,
+            "total_wall_seconds": sum(variable_seconds.values()) + 5.0,
+            "peak_rss_bytes": 1000 * year,
+            "stages": [
+                {
+                    "stage": "write_output_h5",
+                    "parent": "save_complete_microsimulation_h5",
+                    "failed": False,
+                    "wall_seconds": 1.0,
+                    "cpu_seconds": 1.0,
+                    "peak_rss_bytes": 10,
+                    "rss_growth_bytes": 0,
+                },
+                {
+                    "stage": "save_complete_microsimulation_h5",
+                    "parent": None,
+                    "failed": False,
+                    "wall_seconds": 4.0,
+                    "cpu_seconds": 3.0,
+                    "peak_rss_bytes": 10,
+                    "rss_growth_bytes": 5,
+                },
+            ],
+            "variables": [
+                {
+                    "variable": name,
+                    "entity": "tax_unit",
+                    "parent": "save_complete_microsimulation_h5",
+                    "failed": False,
+                    "wall_seconds": seconds,
+                    "cpu_seconds": seconds,
+                    "peak_rss_bytes": 10,
+                    "rss_growth_bytes": 1,
+                }
+                for name, seconds in variable_seconds.items()
+            ],
+        },
+    }
+
+
+def test_rank_profiles_orders_variables_and_stages_across_cells(tmp_path: Path):
+    records = [
+        _metadata(2026, "option1", {"income_tax": 3.0, "snap": 1.0}),
+        _metadata(2030, "option2", {"income_tax": 2.0, "snap": 4.0}),
+        {"year": 2035, "reform_id": "option3", "duration_seconds": 9.0},
+    ]
+    for index, record in enumerate(records):
+        path = tmp_path / f"cell-{index}" / "metadata.json"
+        path.parent.mkdir()
+        path.write_text(json.dumps(record), encoding="utf-8")
+
+    ranking = rank_profiles(load_local_metadata(tmp_path), top=5)
+
+    assert ranking["metadata_records"] == 3
+    assert ranking["profiled_records"] == 2
+    assert [item["variable"] for item in ranking["variables"]] == ["income_tax", "snap"]
+    assert ranking["variables"][0]["total_wall_seconds"] == pytest.approx(5.0)
+    assert ranking["variables"][1]["max_wall_seconds"] == pytest.approx(4.0)
+    assert [item["stage"] for item in ranking["top_level_stages"]] == [
+        "save_complete_microsimulation_h5"
+    ]
+    assert len(ranking["stages"]) == 2
+    assert ranking["max_cell_peak_rss_bytes"] == 2030 * 1000
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from scripts.run_benchmarks import find_regressions, run_benchmarks
+from src.projection import calibrate_entropy_constraints
+from src.reform_full_h5_artifacts import inspect_entity_table_h5
+from src.synthetic_datasets import (
+    entropy_calibration_problem,
+    synthetic_population,
+    write_full_output_h5,
+    write_policyengine_input_h5,
+)
+
+
+def test_synthetic_population_is_deterministic():
+    first = synthetic_population(50, seed=7)
+    second = synthetic_population(50, seed=7)
+
+    pd.testing.assert_frame_equal(first.person, second.person)
+    np.testing.assert_array_equal(first.household_weight, second.household_weight)
+    assert not synthetic_population(50, seed=8).person.equals(first.person)
+    assert first.person["household"].nunique() == 50
+    assert first.person.groupby("household")["is_tax_unit_head"].sum().eq(1).all()
+
+
+def test_full_output_h5_has_aggregator_columns(tmp_path: Path):
+    path = write_full_output_h5(
+        tmp_path / "scenario.h5", 40, extra_columns_per_entity=3
+    )
+    manifest = inspect_entity_table_h5(path)
+
+    assert manifest["entities"]["household"]["rows"] == 40
+    for entity in ("person", "tax_unit", "household"):
+        assert manifest["entities"][entity]["required_weight_column_present"]
+    assert {
+        "income_tax",
+        "tob_revenue_oasdi",
+        "tob_revenue_medicare_hi",
+        "tax_unit_social_security",
+    } <= set(manifest["entities"]["tax_unit"]["columns"])
+    rewritten = write_full_output_h5(
+        tmp_path / "again.h5", 40, extra_columns_per_entity=3
+    )
+    assert inspect_entity_table_h5(rewritten)["schema_hash"] == manifest["schema_hash"]
+
+
+def test_policyengine_input_h5_uses_variable_period_layout(tmp_path: Path):
+    import h5py
+
+    path = write_policyengine_input_h5(tmp_path / "input.h5", 30, year=2026)
+
+    with h5py.File(path, "r") as store:
+        assert list(store["person_id"]) == ["2026"]
+        people = len(store["person_id/2026"])
+        assert len(store["person_household_id/2026"]) == people
+        assert len(store["household_weight/2026"]) == 30
+    assert Path(f"{path}.metadata.json").exists()
+
+
+def test_entropy_calibration_problem_is_solvable():
+    A, targets, weights = entropy_calibration_problem(300)
+    calibrated, info = calibrate_entropy_constraints(A, targets, weights)
+
+    assert (calibrated > 0).all()
+    assert info["max_constraint_pct_error"] < 1e-4
+
+
+def test_benchmark_run_flags_regressions(tmp_path: Path):
+    run = run_benchmarks(
+        names=["calibrate_entropy_constraints"],
+        sizes=["small"],
+        repeats=1,
+        dataset_dir=tmp_path,
+    )
+    (result,) = run["results"]
+    assert result["status"] == "ok"
+
+    fast = {"results": [{**result, "median_seconds": 0.001}]}
+    slow_run = {"results": [{**result, "median_seconds": 1.0}]}
+    assert find_regressions(slow_run, fast)[0]["benchmark"] == (
+        "calibrate_entropy_constraints"
+    )
+    assert (
+        find_regressions(fast, {"results": [{**result, "median_seconds": 1.0}]}) == []
+    )
+    # Sub-noise-floor slowdowns are not regressions even at a large ratio.
+    tiny = {"results": [{**result, "median_seconds": 0.002}]}
+    assert find_regressions(tiny, fast) == []
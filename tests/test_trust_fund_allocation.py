@@ -133,3 +133,86 @@ def test_split_revenue_impacts_handles_non_positive_baseline_total():
     assert revenue_impact == 100.0
     assert oasdi_impact == 0.0
     assert hi_impact == 0.0
+
+
+def _allocation_frame():
+    import pandas as pd
+
+    return pd.DataFrame(
+        [
+            {
+                "reform_name": reform_name,
+                "revenue_impact": 100.0,
+                "baseline_tob_oasdi": 60.0,
+                "baseline_tob_medicare_hi": 40.0,
+                "tob_oasdi_impact": 30.0,
+                "tob_medicare_hi_impact": 50.0,
+                "oasdi_net_impact": 25.0,
+                "hi_net_impact": 75.0,
+            }
+            for reform_name in ("option1", "option3", "option5", "option7", "option12")
+        ]
+    )
+
+
+def test_split_revenue_frame_matches_scalar_split():
+    from src.trust_fund_allocation import split_revenue_frame
+
+    frame = _allocation_frame()
+    for mode in ("baselineShares", "currentLaw"):
+        split = split_revenue_frame(frame, allocation_mode=mode)
+        for index, row in frame.iterrows():
+            expected = split_revenue_impacts(row, allocation_mode=mode)
+            actual = split.loc[
+                index, ["revenue_impact", "oasdi_impact", "hi_impact"]
+            ].tolist()
+            assert actual == list(expected), (row["reform_name"], mode)
+
+
+def test_split_revenue_frame_keeps_statutory_residual_in_general_fund():
+    from src.trust_fund_allocation import split_revenue_frame
+
+    split = split_revenue_frame(_allocation_frame(), allocation_mode="currentLaw")
+    general_fund = dict(
+        zip(_allocation_frame()["reform_name"], split["general_fund_impact"])
+    )
+
+    assert general_fund["option7"] == 20.0
+    assert general_fund["option3"] == 0.0
+    assert general_fund["option12"] == 0.0
+
+
+def test_split_revenue_frame_folds_reverse_roth_general_fund_into_oasdi():
+    import pandas as pd
+
+    from src.trust_fund_allocation import split_revenue_frame
+
+    frame = pd.DataFrame(
+        [
+            {
+                "reform_name": "reverse_roth",
+                "revenue_impact": -100.0,
+                "baseline_tob_oasdi": 60.0,
+                "baseline_tob_medicare_hi": 40.0,
+                "tob_oasdi_impact": 5.0,
+                "tob_medicare_hi_impact": 10.0,
+                "oasdi_net_impact": 0.0,
+                "hi_net_impact": 0.0,
+            }
+        ]
+    )
+    row = split_revenue_frame(frame, allocation_mode="baselineShares").iloc[0]
+
+    assert row["oasdi_impact"] == -110.0
+    assert row["hi_impact"] == 10.0
+    assert row["general_fund_impact"] == 0.0
+
+
+def test_split_revenue_frame_single_fund_overrides_use_native_revenue():
+    from src.trust_fund_allocation import split_revenue_frame
+
+    split = split_revenue_frame(_allocation_frame(), allocation_mode="allHi")
+
+    assert split["oasdi_impact"].eq(0.0).all()
+    assert split["hi_impact"].tolist() == [100.0, 100.0, 100.0, 100.0, 100.0]
+    assert split["general_fund_impact"].eq(0.0).all()
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.vintage_attribution import (
+    age_band_labels,
+    attribute_vintages,
+    match_positions,
+    segment_table,
+)
+
+
+def _write_vintage(
+    path,
+    *,
+    tax_unit_ids,
+    weights,
+    income_tax,
+    ages,
+    deciles=(3, 9),
+    filing_status=None,
+):
+    # Two households; tax unit k holds person k and lives in household k % 2.
+    person = pd.DataFrame(
+        {
+            "person_id": np.arange(len(tax_unit_ids)),
+            "tax_unit_id": tax_unit_ids,
+            "household_id": [10 + unit % 2 for unit in tax_unit_ids],
+            "age": ages,
+            "is_adult": [age >= 18 for age in ages],
+        }
+    )
+    tax_unit = pd.DataFrame(
+        {
+            "tax_unit_id": tax_unit_ids,
+            "tax_unit_weight": weights,
+            "income_tax": income_tax,
+        }
+    )
+    if filing_status is not None:
+        tax_unit["filing_status"] = filing_status
+    household = pd.DataFrame(
+        {
+            "household_id": [10, 11],
+            "household_weight": [1.0, 1.0],
+            "household_income_decile": list(deciles),
+        }
+    )
+    with pd.HDFStore(path, mode="w") as store:
+        store.put("person", person, format="table")
+        store.put("tax_unit", tax_unit, format="table")
+        store.put("household", household, format="table")
+    return path
+
+
+def test_match_positions_handles_missing_and_repeated_ids() -> None:
+    positions = match_positions(np.array([5, 1, 5, 9]), np.array([1, 5, 7]))
+
+    assert positions.tolist() == [1, 0, 1, -1]
+    with pytest.raises(ValueError, match="duplicate"):
+        match_positions(np.array([1]), np.array([2, 2]))
+
+
+def test_age_bands_cover_missing_ages() -> None:
+    labels = age_band_labels(np.array([3.0, 25.0, 70.0, 90.0, np.nan]))
+
+    assert labels.tolist() == ["0-24", "25-34", "65-74", "75+", "unknown"]
+
+
+def test_components_and_segments_sum_to_the_aggregate_delta(tmp_path) -> None:
+    source = _write_vintage(
+        tmp_path / "from.h5",
+        tax_unit_ids=[0, 1, 2, 3],
+        weights=[100.0, 200.0, 50.0, 10.0],
+        income_tax=[1_000.0, 2_000.0, 500.0, 40.0],
+        ages=[30, 70, 45, 19],
+    )
+    # Unit 3 drops out, unit 4 appears, unit 1 is reweighted, unit 0 pays more.
+    target = _write_vintage(
+        tmp_path / "to.h5",
+        tax_unit_ids=[4, 2, 1, 0],
+        weights=[20.0, 50.0, 250.0, 100.0],
+        income_tax=[300.0, 500.0, 2_000.0, 1_200.0],
+        ages=[80, 45, 70, 30],
+    )
+
+    attributions, summary = attribute_vintages(
+        source, target, variables=["income_tax", "missing_variable"], top_units=2
+    )
+    (income_tax,) = attributions
+
+    assert income_tax.delta == pytest.approx(651_000 - 525_400)
+    assert income_tax.components == pytest.approx(
+        {
+            "value_change": 100.0 * 200.0,
+            "weight_change": 50.0 * 2_000.0,
+            "entered": 20.0 * 300.0,
+            "exited": -10.0 * 40.0,
+        }
+    )
+    segments = segment_table(attributions)
+    for _, group in segments.groupby("dimension"):
+        assert group["total"].sum() == pytest.approx(income_tax.delta)
+    by_age = segments[segments["dimension"] == "age_band"].set_index("segment")
+    assert by_age.loc["65-74", "weight_change"] == pytest.approx(100_000.0)
+    assert by_age.loc["75+", "entered"] == pytest.approx(6_000.0)
+    by_decile = segments[segments["dimension"] == "income_decile"].set_index("segment")
+    assert set(by_decile.index) == {"3", "9"}
+    filing = segments[segments["dimension"] == "filing_status"]
+    assert set(filing["segment"]) == {"adults=1"}
+    assert summary["filing_status_source"]["from"] == "tax_unit_adults"
+    assert summary["skipped_variables"] == [
+        {"variable": "missing_variable", "reason": "missing from a vintage"}
+    ]
+    assert income_tax.top_units["unit_id"].tolist() == [1, 0]
+
+
+def test_tables_are_read_in_row_chunks(tmp_path, monkeypatch) -> None:
+    source = _write_vintage(
+        tmp_path / "from.h5",
+        tax_unit_ids=[0, 1, 2, 3],
+        weights=[100.0, 200.0, 50.0, 10.0],
+        income_tax=[1_000.0, 2_000.0, 500.0, 40.0],
+        ages=[30, 70, 45, 19],
+    )
+    target = _write_vintage(
+        tmp_path / "to.h5",
+        tax_unit_ids=[4, 2, 1, 0],
+        weights=[20.0, 50.0, 250.0, 100.0],
+        income_tax=[300.0, 500.0, 2_000.0, 1_200.0],
+        ages=[80, 45, 70, 30],
+    )
+    whole_attributions, whole = attribute_vintages(source, target)
+
+    reads: list[tuple[str, int | None, int | None]] = []
+    select = pd.HDFStore.select
+
+    def recording_select(store, key, *args, **kwargs):
+        reads.append((key, kwargs.get("start"), kwargs.get("stop")))
+        return select(store, key, *args, **kwargs)
+
+    monkeypatch.setattr(pd.HDFStore, "select", recording_select)
+    chunked_attributions, chunked = attribute_vintages(source, target, chunk_rows=3)
+
+    assert chunked["variables"] == whole["variables"]
+    pd.testing.assert_frame_equal(
+        segment_table(chunked_attributions), segment_table(whole_attributions)
+    )
+    column_reads = [(key, start, stop) for key, start, stop in reads if stop]
+    assert column_reads
+    assert all(stop - start <= 3 for _, start, stop in column_reads)
+    # ids, weights and income_tax come from one pass over each tax-unit table.
+    assert [read for read in column_reads if read[0] == "tax_unit"] == [
+        ("tax_unit", 0, 3),
+        ("tax_unit", 3, 6),
+    ] * 2